@@ -0,0 +1 @@
+"""Benchmarks of paka.cmark (run with ``python -m benchmarks``)."""
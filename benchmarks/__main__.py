@@ -0,0 +1,138 @@
+"""Run benchmarks, or compare results with baseline.
+
+Run all benchmarks and save results::
+
+    $ python -m benchmarks run -o results.json
+
+Compare results with stored baseline (exit status is non-zero if
+there are statistically significant regressions)::
+
+    $ python -m benchmarks compare baseline.json results.json
+
+"""
+
+import re
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+
+from paka import cmark
+
+from benchmarks import cases, corpora, stats
+
+
+def _measure(func, repeat, min_time, max_time):
+    timer = timeit.Timer(func)
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    number = max(1, int(min_time / max(elapsed, 1e-9)))
+    if elapsed * number * repeat > max_time:
+        repeat = max(3, int(max_time / (elapsed * number)))
+    return [
+        sample / number
+        for sample in timer.repeat(repeat=repeat, number=number)]
+
+
+def _run(args):
+    pattern = re.compile(args.filter) if args.filter else None
+    results = {}
+    for case in cases.get_cases(corpora.get_corpora(quick=args.quick)):
+        if pattern and not pattern.search(case.name):
+            continue
+        func, teardown = case.setup()
+        try:
+            samples = _measure(
+                func, args.repeat, args.min_time, args.max_time)
+        finally:
+            if teardown is not None:
+                teardown()
+        results[case.name] = {"samples": samples, "unit": "s"}
+        print("{:60} {:12.6f} ms".format(
+            case.name, stats.median(samples) * 1000), flush=True)
+    data = {
+        "meta": {
+            "python": platform.python_implementation() + " " + (
+                platform.python_version()),
+            "platform": platform.platform(),
+            "cmark": cmark.get_version(),
+            "quick": args.quick,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z")},
+        "benchmarks": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=1, sort_keys=True)
+    return 0
+
+
+def _compare(args):
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)["benchmarks"]
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)["benchmarks"]
+    regressions = 0
+    for name in sorted(set(baseline) & set(current)):
+        old = baseline[name]["samples"]
+        new = current[name]["samples"]
+        change = stats.median(new) / stats.median(old) - 1
+        if stats.mann_whitney_greater(new, old) < args.alpha and (
+                change > args.threshold):
+            status = "REGRESSION"
+            regressions += 1
+        elif stats.mann_whitney_greater(old, new) < args.alpha and (
+                -change > args.threshold):
+            status = "improvement"
+        else:
+            status = ""
+        print("{:60} {:+8.1%} {}".format(name, change, status))
+    for name in sorted(set(baseline) ^ set(current)):
+        print("{:60} {:>8} {}".format(
+            name, "", "only in " + (
+                "baseline" if name in baseline else "current")))
+    print("{} regression(s)".format(regressions))
+    return 1 if regressions else 0
+
+
+def main():
+    """Parse command line arguments and run command."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    run = subparsers.add_parser("run", help="run benchmarks")
+    run.add_argument("-o", "--output", help="path of JSON results")
+    run.add_argument(
+        "--quick", action="store_true",
+        help="use smaller corpora (for smoke runs)")
+    run.add_argument(
+        "-k", "--filter", help="run only cases matching regex")
+    run.add_argument(
+        "--repeat", type=int, default=10, help="number of samples")
+    run.add_argument(
+        "--min-time", type=float, default=0.05,
+        help="minimum duration of single sample, in seconds")
+    run.add_argument(
+        "--max-time", type=float, default=10,
+        help="desired maximum duration of single case, in seconds")
+    run.set_defaults(func=_run)
+
+    compare = subparsers.add_parser(
+        "compare", help="compare results with baseline")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument(
+        "--alpha", type=float, default=0.01, help="significance level")
+    compare.add_argument(
+        "--threshold", type=float, default=0.05,
+        help="ignore changes of median smaller than this (0.05 is 5%%)")
+    compare.set_defaults(func=_compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Event loop latency under mixed load of tiny and huge documents.
+
+Ticker coroutine sleeps for 1 ms in loop and records how late it is
+woken up, while many tiny documents and some huge ones are converted
+concurrently, either with blocking :py:func:`paka.cmark.to_html` or
+with :py:func:`paka.cmark.aio.to_html`::
+
+    $ python -m benchmarks.aio_latency
+
+"""
+
+import time
+import asyncio
+import argparse
+
+from paka import cmark
+from paka.cmark import aio
+
+from benchmarks import corpora, stats
+
+
+TICK = 0.001
+
+
+async def _ticker(lags, stop):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - started - TICK)
+
+
+async def _convert(use_aio, text):
+    if use_aio:
+        return await aio.to_html(text)
+    await asyncio.sleep(0)
+    return cmark.to_html(text)
+
+
+async def _run(use_aio, tiny, huge, requests):
+    lags = []
+    stop = asyncio.Event()
+    ticker = asyncio.ensure_future(_ticker(lags, stop))
+    await asyncio.sleep(TICK * 10)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _convert(use_aio, huge if index % 50 == 0 else tiny)
+        for index in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+    return elapsed, sorted(lags)
+
+
+def main(args=None):
+    """Print event loop lag percentiles for blocking and async calls."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument(
+        "--huge-size", type=int, default=4 * 1024 * 1024,
+        help="size (in bytes) of huge documents")
+    args = parser.parse_args(args)
+    tiny = corpora.TINY
+    huge = corpora.make_huge(args.huge_size)
+    for name, use_aio in (("blocking", False), ("aio", True)):
+        elapsed, lags = asyncio.run(_run(use_aio, tiny, huge, args.requests))
+        print("{:10} total {:8.1f} ms   lag median {:7.3f} ms   "
+              "p99 {:7.3f} ms   max {:7.3f} ms".format(
+                  name, elapsed * 1000, stats.median(lags) * 1000,
+                  lags[int(len(lags) * 0.99)] * 1000, lags[-1] * 1000))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
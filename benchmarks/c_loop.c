@@ -0,0 +1,77 @@
+/* In-process C loop for ffi_overhead benchmark: parses and renders
+ * file as HTML many times with cmark only (no Python involved) and
+ * prints mean time of each phase in nanoseconds:
+ *
+ *     c_loop FILE ITERATIONS OPTIONS
+ *
+ * Output is "parse render free" on single line.
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include "cmark.h"
+
+static double S_now(void) {
+  struct timespec ts;
+
+  clock_gettime(CLOCK_MONOTONIC, &ts);
+  return ts.tv_sec * 1e9 + ts.tv_nsec;
+}
+
+int main(int argc, char *argv[]) {
+  FILE *file;
+  char *buffer, *html;
+  long size;
+  int i, iterations, options;
+  double started, parse = 0, render = 0, release = 0;
+  cmark_node *document;
+
+  if (argc != 4) {
+    fprintf(stderr, "Usage: c_loop FILE ITERATIONS OPTIONS\n");
+    return 2;
+  }
+  iterations = atoi(argv[2]);
+  options = atoi(argv[3]);
+
+  file = fopen(argv[1], "rb");
+  if (file == NULL) {
+    perror(argv[1]);
+    return 1;
+  }
+  fseek(file, 0, SEEK_END);
+  size = ftell(file);
+  fseek(file, 0, SEEK_SET);
+  buffer = malloc(size + 1);
+  if (buffer == NULL || fread(buffer, 1, size, file) != (size_t)size) {
+    fprintf(stderr, "can not read %s\n", argv[1]);
+    return 1;
+  }
+  fclose(file);
+
+  // Warm up (page faults of allocator, caches).
+  document = cmark_parse_document(buffer, size, options);
+  free(cmark_render_html(document, options));
+  cmark_node_free(document);
+
+  for (i = 0; i < iterations; i++) {
+    started = S_now();
+    document = cmark_parse_document(buffer, size, options);
+    parse += S_now() - started;
+
+    started = S_now();
+    html = cmark_render_html(document, options);
+    render += S_now() - started;
+
+    started = S_now();
+    free(html);
+    cmark_node_free(document);
+    release += S_now() - started;
+  }
+
+  printf("%.1f %.1f %.1f\n", parse / iterations, render / iterations,
+         release / iterations);
+  free(buffer);
+  return 0;
+}
@@ -0,0 +1,122 @@
+"""Benchmark cases: functions (with options) applied to corpora."""
+
+import collections
+
+from paka import cmark
+from paka.cmark import lowlevel
+
+
+# Benchmark case: "setup" is called right before measurement and returns
+# pair of function to measure and function to call after measurement
+# (or None).
+Case = collections.namedtuple("Case", "name setup")
+
+# High-level functions and sets of options they are benchmarked with.
+HIGHLEVEL = (
+    (cmark.to_html, (
+        {}, {"breaks": True}, {"breaks": "hard"}, {"smart": True},
+        {"sourcepos": True}, {"safe": False})),
+    (cmark.to_xml, ({}, {"smart": True}, {"sourcepos": True})),
+    (cmark.to_commonmark, (
+        {}, {"breaks": True}, {"breaks": "hard"}, {"smart": True},
+        {"width": 80})),
+    (cmark.to_man, ({}, {"breaks": True}, {"smart": True}, {"width": 80})),
+    (cmark.to_latex, ({}, {"breaks": True}, {"smart": True}, {"width": 80})))
+
+# Functions that only make sense for short texts.
+HIGHLEVEL_SHORT = (
+    (cmark.to_html_inline, ({}, {"smart": True})),)
+
+
+def _simple_case(name, func):
+    return Case(name, lambda: (func, None))
+
+
+def _format_name(corpus, func_name, kwargs):
+    name = corpus.name + "/" + func_name
+    if kwargs:
+        name += "[" + ",".join(
+            "{}={}".format(key, value)
+            for key, value in sorted(kwargs.items())) + "]"
+    return name
+
+
+def _highlevel_case(corpus, func, kwargs):
+    text = corpus.text
+    return _simple_case(
+        _format_name(corpus, func.__name__, kwargs),
+        lambda: func(text, **kwargs))
+
+
+def _iter_walk(root):
+    """Visit all nodes with iterator."""
+    iter_ = lowlevel.iter_new(root)
+    try:
+        while lowlevel.iter_next(iter_) != lowlevel.EVENT_DONE:
+            lowlevel.node_get_type(lowlevel.iter_get_node(iter_))
+    finally:
+        lowlevel.iter_free(iter_)
+
+
+def _node_walk(node):
+    """Visit all nodes with first child / next / parent navigation."""
+    root = node
+    while node is not None:
+        lowlevel.node_get_type(node)
+        child = lowlevel.node_first_child(node)
+        if child is not None:
+            node = child
+            continue
+        while node is not None and node != root:
+            next_node = lowlevel.node_next(node)
+            if next_node is not None:
+                node = next_node
+                break
+            node = lowlevel.node_parent(node)
+        else:
+            break
+
+
+def _lowlevel_cases(corpus):
+    text = corpus.text
+    text_bytes = lowlevel.text_to_c(text)
+
+    def _parse_document():
+        lowlevel.node_free(lowlevel.parse_document(
+            text_bytes, len(text_bytes), lowlevel.OPT_DEFAULT))
+
+    def _walk(walker):
+        def _setup():
+            root = lowlevel.parse_document(
+                text_bytes, len(text_bytes), lowlevel.OPT_DEFAULT)
+            return (lambda: walker(root)), (lambda: lowlevel.node_free(root))
+        return _setup
+
+    yield _simple_case(
+        corpus.name + "/lowlevel.parse_document", _parse_document)
+    yield Case(corpus.name + "/lowlevel.iter_walk", _walk(_iter_walk))
+    yield Case(corpus.name + "/lowlevel.node_walk", _walk(_node_walk))
+
+
+def get_cases(corpora):
+    """Yield cases for all functions and options over corpora."""
+    for corpus in corpora:
+        for func, variants in HIGHLEVEL:
+            for kwargs in variants:
+                yield _highlevel_case(corpus, func, kwargs)
+        if corpus.name == "tiny":
+            for func, variants in HIGHLEVEL_SHORT:
+                for kwargs in variants:
+                    yield _highlevel_case(corpus, func, kwargs)
+        text = corpus.text
+        yield _simple_case(
+            corpus.name + "/excerpt[max_chars=300]",
+            lambda text=text: cmark.excerpt(text, 300))
+        yield _simple_case(
+            corpus.name + "/Document.to_html",
+            lambda text=text: cmark.Document(text).to_html())
+        yield _simple_case(
+            corpus.name + "/render_into",
+            lambda text=text, buf=bytearray(): cmark.render_into(text, buf))
+        for case in _lowlevel_cases(corpus):
+            yield case
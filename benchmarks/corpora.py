@@ -0,0 +1,138 @@
+"""Corpora (deterministically generated documents) for benchmarks."""
+
+import os
+import random
+import collections
+from html.entities import html5
+
+
+# Absolute path of dir with corpora files.
+CORPORA_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "corpora")
+
+# CommonMark spec, copied from cmark repo by scripts/update-cmark-src.py.
+SPEC_PATH = os.path.join(CORPORA_DIR, "spec.txt")
+
+TINY = "Fix *race* in `watcher` init, see [#123](https://example.org/123)"
+
+LOG_LINE = (
+    "2024-01-01T12:00:00Z INFO worker[1234]: processed request "
+    "id=42 path=/api/v1/items?limit=10 status=200 took=12ms\n")
+
+MARKUP_LINE = (
+    "if (a < b && c > d) { printf(\"<%s>\", \"&amp;\"); }\n")
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do "
+    "eiusmod tempor incididunt ut labore et dolore magna aliqua "
+    "проверка текста ünïcödé").split()
+
+Corpus = collections.namedtuple("Corpus", "name text")
+
+
+def _sentence(rnd, words=12):
+    return " ".join(rnd.choice(WORDS) for _ in range(words))
+
+
+def _inline(rnd):
+    return rnd.choice((
+        "*{}*", "**{}**", "`{}`", "[{}](https://example.org/{})",
+        "\"{}\" -- {}...", "{}  \n{}", "<span>{}</span>")).format(
+            rnd.choice(WORDS), rnd.choice(WORDS))
+
+
+def _paragraph(rnd):
+    parts = []
+    for _ in range(rnd.randint(2, 6)):
+        parts.append(_sentence(rnd, rnd.randint(4, 12)))
+        parts.append(_inline(rnd))
+    return " ".join(parts) + ".\n"
+
+
+def make_readme(seed=0, sections=8):
+    """Return README-like document (about 8 KB for 8 sections)."""
+    rnd = random.Random(seed)
+    blocks = ["# Project " + rnd.choice(WORDS) + "\n", _paragraph(rnd)]
+    for section in range(sections):
+        blocks.append("## Section {}\n".format(section))
+        blocks.append(_paragraph(rnd))
+        blocks.append("".join(
+            "* " + _sentence(rnd, 5) + " " + _inline(rnd) + "\n"
+            for _ in range(rnd.randint(2, 5))))
+        blocks.append("```python\n" + "".join(
+            "value = compute({!r}) < {}\n".format(rnd.choice(WORDS), i)
+            for i in range(rnd.randint(2, 8))) + "```\n")
+        blocks.append("> " + _paragraph(rnd))
+    return "\n".join(blocks)
+
+
+def make_code_heavy(size):
+    """Return document of fenced code blocks (logs and markup)."""
+    block = "```\n" + LOG_LINE * 50 + "```\n\n```c\n" + MARKUP_LINE * 50
+    block += "```\n\nSome text between blocks.\n\n"
+    return block * (size // len(block) + 1)
+
+
+def make_entity_heavy(size, seed=0):
+    """Return text dense with named and numeric entities."""
+    rnd = random.Random(seed)
+    names = sorted(name for name in html5 if name.endswith(";"))
+    words = []
+    length = 0
+    while length < size:
+        word = rnd.choice((
+            "&" + rnd.choice(names), "&amp;", "&nbsp;", "&#8212;", "x"))
+        words.append(word)
+        length += len(word) + 1
+        if len(words) % 200 == 0:
+            words.append("\n\n")
+    return " ".join(words)
+
+
+def make_huge(size, seed=0):
+    """Return big document made of many README-like parts."""
+    parts = []
+    length = 0
+    part_seed = seed
+    while length < size:
+        part = make_readme(seed=part_seed)
+        parts.append(part)
+        length += len(part) + 1
+        part_seed += 1
+        if part_seed - seed >= 64:
+            # Reuse parts for speed, contents are varied enough.
+            break
+    text = "\n".join(parts)
+    return text * (size // len(text) + 1)
+
+
+def load_spec():
+    """Return CommonMark spec.
+
+    Missing spec is an error (not skipped silently), so that results
+    of benchmark runs always cover the same corpora.
+
+    """
+    if not os.path.exists(SPEC_PATH):
+        raise FileNotFoundError(
+            "CommonMark spec is missing: " + SPEC_PATH + " (copy it from "
+            "test/spec.txt of cmark repo, e.g. with "
+            "scripts/update-cmark-src.py)")
+    with open(SPEC_PATH, "rb") as file:
+        return file.read().decode("utf-8")
+
+
+def get_corpora(quick=False):
+    """Return list of corpora.
+
+    With ``quick`` big corpora are made smaller (for smoke runs).
+
+    """
+    mib = 1024 * 1024
+    return [
+        Corpus("tiny", TINY),
+        Corpus("readme", make_readme()),
+        Corpus("spec", load_spec()),
+        Corpus("code", make_code_heavy(mib // 16 if quick else mib)),
+        Corpus("entities", make_entity_heavy(mib // 16 if quick else mib)),
+        Corpus("huge", make_huge(mib if quick else 50 * mib))]
@@ -0,0 +1,35 @@
+"""Benchmark of named entity decoding (``houdini_unescape_ent``).
+
+Renders entity-dense documents (like ones converted from HTML)
+and reports throughput::
+
+    $ python -m benchmarks.entities
+
+"""
+
+import timeit
+import argparse
+
+from paka import cmark
+
+from benchmarks import corpora
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=1024 * 1024)
+    parser.add_argument("--number", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = corpora.make_entity_heavy(args.size)
+    timer = timeit.Timer(lambda: cmark.to_html(text))
+    seconds = min(timer.repeat(repeat=args.repeat, number=args.number))
+    seconds /= args.number
+    print("entities {:10.3f} ms {:10.1f} MiB/s".format(
+        seconds * 1000, len(text) / seconds / 1024 / 1024))
+
+
+if __name__ == "__main__":
+    main()
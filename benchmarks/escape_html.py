@@ -0,0 +1,46 @@
+"""Microbenchmark of HTML escaping (``houdini_escape_html``).
+
+Renders code-heavy documents (large fenced blocks of logs, where
+escaping dominates render time) and reports throughput::
+
+    $ python -m benchmarks.escape_html
+
+"""
+
+import timeit
+import argparse
+
+from paka import cmark
+
+from benchmarks import corpora
+
+
+def _make_document(line, size):
+    body = line * (size // len(line) + 1)
+    return "```\n" + body + "```\n"
+
+
+def _measure(text, number, repeat):
+    timer = timeit.Timer(lambda: cmark.to_html(text))
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return best, len(text.encode("utf-8")) / best / 1024 / 1024
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=1024 * 1024)
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, line in (
+            ("logs", corpora.LOG_LINE), ("markup", corpora.MARKUP_LINE)):
+        text = _make_document(line, args.size)
+        seconds, throughput = _measure(text, args.number, args.repeat)
+        print("{:8} {:10.3f} ms {:10.1f} MiB/s".format(
+            name, seconds * 1000, throughput))
+
+
+if __name__ == "__main__":
+    main()
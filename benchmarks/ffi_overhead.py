@@ -0,0 +1,184 @@
+"""Breakdown of per-call overhead of bindings compared to pure C.
+
+Builds bundled cmark sources (with the same compiler flags as Python
+extensions) into two local executables: ``cmark`` from ``main.c``
+(reference driver, used to check that output is identical) and
+``c_loop`` from ``c_loop.c`` (in-process loop timing parse, render and
+free with no Python involved). Then times identical inputs of different
+sizes through pure C, through :py:func:`paka.cmark.lowlevel` calls and
+through :py:func:`paka.cmark.to_html`::
+
+    $ python -m benchmarks.ffi_overhead
+
+"""
+
+import os
+import glob
+import time
+import shlex
+import shutil
+import timeit
+import argparse
+import tempfile
+import sysconfig
+import subprocess
+
+from paka import cmark
+from paka.cmark import lowlevel
+from paka.cmark._cmark import ffi, lib
+
+from benchmarks import corpora
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CMARK_SRC_DIR = os.path.join(
+    os.path.dirname(BENCHMARKS_DIR), "paka", "cmark", "cmark_src")
+
+# Has entities_hash.inc (generated by build of extension).
+EXT_SRC_DIR = os.path.join(
+    os.path.dirname(BENCHMARKS_DIR), "paka", "cmark", "ext_src")
+
+SIZES = (64, 1024, 16 * 1024, 256 * 1024, 4 * 1024 * 1024)
+
+OPTIONS = lowlevel.OPT_DEFAULT | lowlevel.OPT_NOBREAKS
+
+PHASES = ("encode", "parse", "render", "ffi.string", "decode", "free")
+
+
+def build(build_dir):
+    """Build ``cmark`` and ``c_loop`` executables, return their paths."""
+    compiler = shlex.split(sysconfig.get_config_var("CC") or "cc")
+    cflags = shlex.split(sysconfig.get_config_var("CFLAGS") or "-O2")
+    objects = []
+    # render_to.c supports streaming renderers added by local patch.
+    for source in sorted(glob.glob(os.path.join(CMARK_SRC_DIR, "*.c"))) + [
+            os.path.join(EXT_SRC_DIR, "render_to.c"),
+            os.path.join(BENCHMARKS_DIR, "c_loop.c")]:
+        obj = os.path.join(
+            build_dir, os.path.splitext(os.path.basename(source))[0] + ".o")
+        subprocess.check_call(compiler + cflags + [
+            "-I", CMARK_SRC_DIR, "-I", EXT_SRC_DIR, "-c", source, "-o", obj])
+        objects.append(obj)
+    executables = []
+    for name, main in (("cmark", "main.o"), ("c_loop", "c_loop.o")):
+        path = os.path.join(build_dir, name)
+        subprocess.check_call(compiler + [
+            obj for obj in objects
+            if os.path.basename(obj) not in {"main.o", "c_loop.o"}] + [
+                os.path.join(build_dir, main), "-o", path])
+        executables.append(path)
+    return executables
+
+
+def _iterations(text, target):
+    started = time.perf_counter()
+    cmark.to_html(text)
+    elapsed = time.perf_counter() - started
+    return max(3, int(target / max(elapsed, 1e-9)))
+
+
+def _best_of(func, repeat=3):
+    results = [func() for _ in range(repeat)]
+    return {key: min(result[key] for result in results) for key in results[0]}
+
+
+def time_c(c_loop, path, iterations):
+    """Return mean times (ns) of parse, render and free in pure C."""
+    output = subprocess.check_output(
+        [c_loop, path, str(iterations), str(OPTIONS)])
+    return dict(zip(("parse", "render", "free"), map(
+        float, output.split())))
+
+
+def time_phases(text, iterations):
+    """Return mean times (ns) of each phase of call through bindings."""
+    perf_counter = time.perf_counter
+    totals = dict.fromkeys(PHASES, 0.0)
+    for _ in range(iterations):
+        started = perf_counter()
+        text_bytes = lowlevel.text_to_c(text)
+        encoded = perf_counter()
+        root = lowlevel.parse_document(text_bytes, len(text_bytes), OPTIONS)
+        parsed = perf_counter()
+        c_string = lowlevel.render_html(root, OPTIONS)
+        rendered = perf_counter()
+        result = ffi.string(c_string)
+        copied = perf_counter()
+        result.decode(lowlevel.ENCODING)
+        decoded = perf_counter()
+        lib.free(c_string)
+        lowlevel.node_free(root)
+        freed = perf_counter()
+        totals["encode"] += encoded - started
+        totals["parse"] += parsed - encoded
+        totals["render"] += rendered - parsed
+        totals["ffi.string"] += copied - rendered
+        totals["decode"] += decoded - copied
+        totals["free"] += freed - decoded
+    return {
+        phase: total / iterations * 1e9
+        for phase, total in totals.items()}
+
+
+def time_calls(text, iterations):
+    """Return mean times (ns) of lowlevel and high-level calls."""
+    text_bytes = lowlevel.text_to_c(text)
+
+    def _lowlevel():
+        lowlevel.text_from_c(
+            lowlevel.markdown_to_html(text_bytes, len(text_bytes), OPTIONS),
+            free=True)
+    return {
+        "lowlevel": min(timeit.repeat(
+            _lowlevel, number=iterations, repeat=3)) / iterations * 1e9,
+        "to_html": min(timeit.repeat(
+            lambda: cmark.to_html(text), number=iterations,
+            repeat=3)) / iterations * 1e9}
+
+
+def main():
+    """Build C executables and print breakdown for each input size."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--target", type=float, default=0.5,
+        help="approximate duration of each measurement, in seconds")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="paka-cmark-ffi-")
+    try:
+        _report(work_dir, args.target)
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def _report(work_dir, target):
+    cmark_exe, c_loop = build(work_dir)
+    huge = corpora.make_huge(max(SIZES))
+    inputs = [("tiny", corpora.TINY)] + [
+        (str(size), huge[:size]) for size in SIZES]
+
+    columns = ("C", "lowlevel", "to_html", "overhead") + PHASES
+    print("{:>8} {:>6}".format("input", "same") + "".join(
+        "{:>11}".format(column) for column in columns) + "   (us/call)")
+    for name, text in inputs:
+        path = os.path.join(work_dir, name + ".md")
+        with open(path, "wb") as file:
+            file.write(lowlevel.text_to_c(text))
+        same = subprocess.check_output(
+            [cmark_exe, "--nobreaks", path]).decode("utf-8") == (
+                cmark.to_html(text))
+        iterations = _iterations(text, target)
+        c_total = sum(_best_of(
+            lambda: time_c(c_loop, path, iterations)).values())
+        calls = time_calls(text, iterations)
+        phases = _best_of(lambda: time_phases(text, iterations))
+        values = [
+            c_total, calls["lowlevel"], calls["to_html"],
+            calls["to_html"] - c_total] + [phases[phase] for phase in PHASES]
+        print("{:>8} {:>6}".format(name, "yes" if same else "NO") + "".join(
+            "{:11.2f}".format(value / 1000) for value in values))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""Timing-guided fuzzer searching for super-linear inputs.
+
+Candidate inputs are patterns of ``prefix * n + middle + suffix * n``
+(this shape covers both repeated and nested constructs). Each pattern
+is built at growing ``n``, parsed with
+:py:func:`~paka.cmark.lowlevel.parse_document` and rendered with every
+``render_*`` function, and growth exponent of time of every phase
+(against input plus output bytes, so that legitimately big output,
+e.g. of nested block quotes, is not mistaken for super-linear time) is
+fitted as in :py:mod:`benchmarks.pathological`.
+Patterns are mutated towards higher exponents; ones confirmed to be
+worse than :py:data:`benchmarks.pathological.MAX_EXPONENT` are
+minimized and appended (as JSON lines) to output file, which can then
+be replayed with ``python -m benchmarks.pathological --findings``::
+
+    $ python -m benchmarks.fuzz --seconds 600
+    $ python -m benchmarks.fuzz --short  # smoke run, e.g. in CI
+
+"""
+
+import json
+import time
+import random
+import argparse
+import collections
+
+from paka.cmark import lowlevel
+
+from benchmarks import corpora
+from benchmarks.pathological import MAX_EXPONENT, fit_exponent
+
+
+Pattern = collections.namedtuple("Pattern", "prefix middle suffix")
+
+Finding = collections.namedtuple("Finding", "pattern phase exponent")
+
+# Longest part of pattern mutations may produce.
+MAX_PART_LENGTH = 48
+
+# Pieces of syntax inserted by mutations.
+TOKENS = (
+    "*", "**", "_", "__", "[", "]", "](", ")", "![", "<", ">", "<!--",
+    "-->", "<?", "?>", "<![CDATA[", "`", "```", "~~~", "\\", "&", "&amp;",
+    "&#", ";", "\"", "'", "(", "<a href=", "http://", "a", " ", "  ",
+    "\t", "\n", "\n\n", "> ", "- ", "* ", "1. ", "    ", "#", "---", "===",
+    "[a]: /u\n", ":", "\x00")
+
+# Hand-written seeds (shapes of previously known pathological inputs).
+SEEDS = (
+    Pattern("*a ", "b", " a*"),
+    Pattern("[", "a", "]"),
+    Pattern("> ", "a", ""),
+    Pattern("[a](", "", ""),
+    Pattern("a_ ", "", ""),
+    Pattern("</", "", ""),
+    Pattern("", "[a]: /u\n\n", "[a] "),
+    Pattern("- ", "a", ""),
+    Pattern("`", "e", ""),
+    )
+
+
+def build(pattern, n):
+    """Return text of pattern repeated n times."""
+    return pattern.prefix * n + pattern.middle + pattern.suffix * n
+
+
+def _render(func, width=None):
+    def _render_phase(root):
+        if width is None:
+            c_string = func(root, lowlevel.OPT_DEFAULT)
+        else:
+            c_string = func(root, lowlevel.OPT_DEFAULT, width)
+        return lowlevel.text_from_c(c_string, free=True)
+    return _render_phase
+
+
+PHASES = (
+    ("render_html", _render(lowlevel.render_html)),
+    ("render_xml", _render(lowlevel.render_xml)),
+    ("render_man", _render(lowlevel.render_man, 0)),
+    ("render_commonmark", _render(lowlevel.render_commonmark, 0)),
+    ("render_latex", _render(lowlevel.render_latex, 0)))
+
+
+def time_phases(text, repeat):
+    """Return mapping of phase name to best time (in seconds) and size.
+
+    Size is number of input bytes plus output bytes of phase (parsing
+    has no output).
+
+    """
+    text_bytes = lowlevel.text_to_c(text)
+    best = collections.defaultdict(lambda: float("inf"))
+    sizes = dict.fromkeys(
+        ["parse_document"] + [name for name, _ in PHASES], len(text_bytes))
+    for _ in range(repeat):
+        started = time.perf_counter()
+        root = lowlevel.parse_document(
+            text_bytes, len(text_bytes), lowlevel.OPT_DEFAULT)
+        best["parse_document"] = min(
+            best["parse_document"], time.perf_counter() - started)
+        try:
+            for name, render in PHASES:
+                started = time.perf_counter()
+                output = render(root)
+                best[name] = min(best[name], time.perf_counter() - started)
+                sizes[name] = len(text_bytes) + len(
+                    lowlevel.text_to_c(output))
+        finally:
+            lowlevel.node_free(root)
+    return {name: (seconds, sizes[name]) for name, seconds in best.items()}
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def measure(pattern, base, steps=3, repeat=3, min_seconds=1e-4,
+            max_seconds=1.0):
+    """Return mapping of phase name to growth exponent of pattern.
+
+    Input sizes (in bytes) are about ``base * 4 ** step``, exponents
+    are fitted against input plus output bytes; growing stops early
+    when any phase takes more than ``max_seconds`` (already slow
+    input must not stall the search). Timings shorter than
+    ``min_seconds`` are dominated by noise and are not fitted.
+
+    """
+    unit = len((pattern.prefix + pattern.suffix).encode("utf-8"))
+    if not unit:
+        return {}
+    points = collections.defaultdict(list)
+    for step in range(steps):
+        text = build(pattern, max(1, base * 4 ** step // unit))
+        timings = time_phases(text, repeat)
+        for name, (seconds, size) in timings.items():
+            if seconds >= min_seconds:
+                points[name].append((size, seconds))
+        if step and max(
+                seconds for seconds, _ in timings.values()) > max_seconds:
+            break
+    return {
+        name: fit_exponent(phase_points)
+        for name, phase_points in points.items()
+        if len(phase_points) > 1}
+
+
+def _worst(exponents):
+    if not exponents:
+        return None, 0.0
+    return max(exponents.items(), key=lambda item: item[1])
+
+
+def _mutate_part(rnd, part, other_parts):
+    operation = rnd.randrange(5)
+    pos = rnd.randint(0, len(part))
+    if operation == 0 or not part:  # insert token
+        part = part[:pos] + rnd.choice(TOKENS) + part[pos:]
+    elif operation == 1:  # delete slice
+        end = rnd.randint(pos, min(len(part), pos + 4))
+        part = part[:pos] + part[end:]
+    elif operation == 2:  # duplicate slice
+        end = rnd.randint(pos, min(len(part), pos + 8))
+        part = part[:end] + part[pos:end] + part[end:]
+    elif operation == 3:  # replace character
+        part = part[:pos] + rnd.choice(TOKENS) + part[pos + 1:]
+    else:  # splice slice of other part
+        other = rnd.choice(other_parts)
+        start = rnd.randint(0, len(other))
+        part = part[:pos] + other[start:start + 8] + part[pos:]
+    return part[:MAX_PART_LENGTH]
+
+
+def mutate(rnd, pattern, splice_texts=()):
+    """Return mutated copy of pattern."""
+    parts = list(pattern)
+    for _ in range(rnd.randint(1, 3)):
+        index = rnd.randrange(len(parts))
+        parts[index] = _mutate_part(
+            rnd, parts[index], parts + list(splice_texts))
+    return Pattern(*parts)
+
+
+def minimize(pattern, is_slow):
+    """Return smallest pattern (by removing chunks) still slow.
+
+    ``is_slow`` is called with candidate pattern and must return
+    boolean.
+
+    """
+    parts = list(pattern)
+    for index in range(len(parts)):
+        chunk = max(1, len(parts[index]) // 2)
+        while chunk:
+            pos = 0
+            while pos < len(parts[index]):
+                part = parts[index]
+                candidate = list(parts)
+                candidate[index] = part[:pos] + part[pos + chunk:]
+                if is_slow(Pattern(*candidate)):
+                    parts = candidate
+                else:
+                    pos += chunk
+            chunk //= 2
+    return Pattern(*parts)
+
+
+def _splice_texts():
+    texts = [corpora.TINY, corpora.LOG_LINE, corpora.MARKUP_LINE]
+    spec = corpora.load_spec()
+    texts.extend(
+        spec[start:start + MAX_PART_LENGTH]
+        for start in range(0, len(spec), len(spec) // 64))
+    return texts
+
+
+def _confirm(pattern, base, threshold):
+    phase, exponent = _worst(measure(
+        pattern, base * 8, steps=3, repeat=5, min_seconds=1e-3))
+    if exponent > threshold:
+        return phase, exponent
+    return None
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def fuzz(rnd, iterations, base, seconds=None, threshold=MAX_EXPONENT,
+         log=None):
+    """Yield findings of fuzzing (confirmed and minimized)."""
+    splice_texts = _splice_texts()
+    population = [(_worst(measure(seed, base))[1], seed) for seed in SEEDS]
+    seen = set(SEEDS)
+    deadline = None if seconds is None else time.monotonic() + seconds
+    for iteration in range(iterations):
+        if deadline is not None and time.monotonic() > deadline:
+            break
+        parent = max(rnd.sample(population, 3))[1]
+        child = mutate(rnd, parent, splice_texts)
+        if child in seen:
+            continue
+        seen.add(child)
+        phase, exponent = _worst(measure(child, base))
+        if log is not None:
+            log(iteration, child, phase, exponent)
+        population.append((exponent, child))
+        population.sort(reverse=True)
+        del population[32:]
+        if exponent <= threshold or not _confirm(child, base, threshold):
+            continue
+        minimal = minimize(
+            child, lambda pattern: bool(_confirm(pattern, base, threshold)))
+        confirmed = _confirm(minimal, base, threshold)
+        if confirmed:
+            yield Finding(minimal, *confirmed)
+
+
+def main(args=None):
+    """Run fuzzer, exit with error if any finding was made."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--short", action="store_true",
+        help="few iterations with small inputs (smoke run)")
+    parser.add_argument("--iterations", type=int, default=None)
+    parser.add_argument(
+        "--seconds", type=float, default=None, help="time budget")
+    parser.add_argument(
+        "--base", type=int, default=None,
+        help="size (in bytes) of smallest input of each pattern")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "-o", "--output", default="fuzz-findings.jsonl",
+        help="file to append findings to")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(args)
+    if args.iterations is None:
+        args.iterations = 50 if args.short else 100000
+    if args.base is None:
+        args.base = 512 if args.short else 2048
+    if args.seed is None:
+        args.seed = random.SystemRandom().randrange(2 ** 32)
+    print("seed: {}".format(args.seed), flush=True)
+
+    def _log(iteration, pattern, phase, exponent):
+        if args.verbose:
+            print("{:6} {:5.2f} {:18} {!r}".format(
+                iteration, exponent, phase, tuple(pattern)), flush=True)
+
+    found = 0
+    for finding in fuzz(
+            random.Random(args.seed), args.iterations, args.base,
+            args.seconds, log=_log):
+        found += 1
+        print("found: {:5.2f} {:18} {!r}".format(
+            finding.exponent, finding.phase, tuple(finding.pattern)),
+            flush=True)
+        with open(args.output, "a") as file:
+            file.write(json.dumps(dict(
+                finding.pattern._asdict(), phase=finding.phase,
+                exponent=round(finding.exponent, 2))) + "\n")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,171 @@
+"""Timing of pathological inputs (ones that used to be super-linear).
+
+Each family of inputs is generated at increasing sizes and rendered
+with :py:func:`~paka.cmark.to_html`, :py:func:`~paka.cmark.to_xml`
+and :py:func:`~paka.cmark.to_commonmark`. Growth exponent ``k`` of
+``time ~ size ** k`` is fitted with least squares in log-log space,
+where size is number of input plus output bytes (some outputs, e.g.
+indented XML of deeply nested block quotes, are inherently bigger than
+inputs). Linear time gives ``k`` close to ``1``, linearithmic one
+is a bit more than that, and quadratic one is close to ``2``::
+
+    $ python -m benchmarks.pathological
+
+"""
+
+import json
+import math
+import time
+import argparse
+import collections
+
+from paka import cmark
+
+
+# Exponent above which case is considered worse than linearithmic.
+MAX_EXPONENT = 1.4
+
+Family = collections.namedtuple("Family", "name make")
+
+FAMILIES = (
+    Family(
+        "nested strong emph",
+        lambda n: "*a **a " * n + "b" + " a** a*" * n),
+    Family("many emph closers with no openers", lambda n: "a_ " * n),
+    Family("many emph openers with no closers", lambda n: "_a " * n),
+    Family("many link closers with no openers", lambda n: "a]" * n),
+    Family("many link openers with no closers", lambda n: "[a" * n),
+    Family("mismatched openers and closers", lambda n: "*a_ " * n),
+    Family(
+        "openers and closers multiple of 3",
+        lambda n: "a**b" + "c* " * n),
+    Family("link openers and emph closers", lambda n: "[ a_" * n),
+    Family("pattern [ (]( repeated", lambda n: "[ (](" * n),
+    Family("pattern ![[]() repeated", lambda n: "![[]()" * n),
+    Family("nested brackets", lambda n: "[" * n + "a" + "]" * n),
+    Family("nested block quotes", lambda n: "> " * n + "a"),
+    Family(
+        "deeply nested lists",
+        lambda n: "".join(
+            "  " * depth + "* a\n" for depth in range(int(n ** 0.5)))),
+    Family(
+        "backticks",
+        lambda n: "".join(
+            "e" + "`" * width for width in range(1, int(n ** 0.5)))),
+    Family("unclosed links A", lambda n: "[a](<b" * n),
+    Family("unclosed links B", lambda n: "[a](b" * n),
+    Family("unclosed comments", lambda n: "</" + "<!--" * n),
+    Family("U+0000 in input", lambda n: "abc\u0000de\u0000" * n),
+    Family(
+        "many link reference definitions",
+        lambda n: "".join(
+            "[{}]: u\n".format(i) for i in range(n)) + "[0] " * (n // 8)),
+    Family(
+        "reference link expansion",
+        lambda n: "[a]: /u\n\n" + "[a] " * n),
+    Family("many emph and links", lambda n: "*[a](b) _c_ " * n),
+    )
+
+FUNCTIONS = (cmark.to_html, cmark.to_xml, cmark.to_commonmark)
+
+Result = collections.namedtuple("Result", "family function sizes exponent")
+
+
+def _time(func, text, repeat):
+    best = None
+    output = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = func(text)
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, len(text) + len(output)
+
+
+def fit_exponent(points):
+    """Return slope of least squares line through log-log points."""
+    logs = [(math.log(size), math.log(max(seconds, 1e-9)))
+            for size, seconds in points]
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / sum(
+        (x - mean_x) ** 2 for x, _ in logs)
+
+
+def measure(family, func, base, steps=4, repeat=3):
+    """Measure family rendered with func at sizes base * 2 ** step."""
+    points = []
+    for step in range(steps):
+        seconds, size = _time(func, family.make(base * 2 ** step), repeat)
+        points.append((size, seconds))
+    return Result(
+        family.name, func.__name__, [size for size, _ in points],
+        fit_exponent(points))
+
+
+def load_findings(path):
+    """Return families of inputs found by :py:mod:`benchmarks.fuzz`.
+
+    Inputs dumped with :py:func:`paka.cmark.dump_slow_inputs` are
+    supported too (such input is repeated to reach size).
+
+    """
+    families = []
+    with open(path) as file:
+        for line in file:
+            if not line.strip():
+                continue
+            finding = json.loads(line)
+            if "text" in finding:
+                # Input kept by paka.cmark.set_slow_hook.
+                families.append(Family(
+                    "slow: " + finding["digest"][:16],
+                    lambda n, text=finding["text"]: text * max(
+                        1, n // max(1, len(text)))))
+                continue
+            families.append(Family(
+                "fuzz: {prefix!r} {middle!r} {suffix!r}".format(**finding),
+                lambda n, f=finding: (
+                    f["prefix"] * n + f["middle"] + f["suffix"] * n)))
+    return families
+
+
+def measure_all(base, steps=4, repeat=3, families=FAMILIES):
+    """Yield results for all families and functions."""
+    for family in families:
+        for func in FUNCTIONS:
+            yield measure(family, func, base, steps, repeat)
+
+
+def main():
+    """Print growth exponents, exit with error if any is too high."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--base", type=int, default=10000,
+        help="size parameter of smallest input of each family")
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--findings", action="append", default=[],
+        help="JSON lines file written by benchmarks.fuzz")
+    args = parser.parse_args()
+
+    families = list(FAMILIES)
+    for path in args.findings:
+        families.extend(load_findings(path))
+    failed = 0
+    for result in measure_all(
+            args.base, args.steps, args.repeat, families):
+        status = ""
+        if result.exponent > MAX_EXPONENT:
+            status = "SUPER-LINEAR"
+            failed += 1
+        print("{:40} {:14} {:>10} {:6.2f} {}".format(
+            result.family, result.function, result.sizes[-1],
+            result.exponent, status), flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
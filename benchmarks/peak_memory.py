@@ -0,0 +1,90 @@
+"""Peak memory of converting huge text, in default and low-memory mode.
+
+Each conversion runs in fresh process; extra memory it needs on top of
+text itself is reported relative to size of text (UTF-8), both as
+measured by :py:mod:`tracemalloc` (Python objects only) and as growth
+of peak resident set size (everything, including tree of nodes and
+buffers of C library)::
+
+    $ python -m benchmarks.peak_memory
+    $ python -m benchmarks.peak_memory --size 8
+
+"""
+
+import sys
+import json
+import argparse
+import resource
+import subprocess
+import tracemalloc
+
+from paka import cmark
+
+from benchmarks import corpora
+
+
+MODES = ("default", "low-memory")
+MIB = 1024 * 1024
+
+
+def _max_rss():
+    # Kilobytes on Linux, bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def measure(mode, size, format_name, traced):
+    """Convert text of size (MiB), return its size and extra peak memory.
+
+    Extra peak memory (in bytes) is measured with :py:mod:`tracemalloc`
+    if ``traced`` is true (it would distort resident set size, so it
+    is not measured at the same time), otherwise from peak RSS.
+
+    """
+    cmark.LOW_MEMORY_THRESHOLD = None if mode == "default" else 0
+    text = corpora.make_huge(size * MIB)
+    func = getattr(cmark, "to_" + format_name)
+    if traced:
+        tracemalloc.start()
+        func(text)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    else:
+        rss_before = _max_rss()
+        func(text)
+        peak = _max_rss() - rss_before
+    return len(text.encode("utf-8")), peak
+
+
+def main(args=None):
+    """Print ratios of extra peak memory to size of text."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--size", type=int, default=100, help="size of text (in MiB)")
+    parser.add_argument(
+        "--format", default="html",
+        choices=("html", "xml", "commonmark", "man", "latex"))
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--traced", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(args)
+    if args.child:
+        print(json.dumps(
+            measure(args.child, args.size, args.format, args.traced)))
+        return 0
+    for mode in MODES:
+        ratios = []
+        for traced in (True, False):
+            text_size, peak = json.loads(subprocess.check_output([
+                sys.executable, "-m", "benchmarks.peak_memory",
+                "--size", str(args.size), "--format", args.format,
+                "--child", mode] + (["--traced"] if traced else [])))
+            ratios.append(peak / text_size)
+        print("{:10} text {:6.1f} MiB   tracemalloc peak {:5.2f}x   "
+              "RSS peak {:5.2f}x".format(
+                  mode, text_size / MIB, ratios[0], ratios[1]))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,56 @@
+"""Throughput of :py:func:`paka.cmark.render_corpus` backends.
+
+Same in-memory corpus is rendered with worker processes, threads and
+(if :py:func:`paka.cmark.corpus.supports_interpreters`) subinterpreters,
+and in current thread for reference::
+
+    $ python -m benchmarks.pools --workers 4
+
+"""
+
+import os
+import time
+import argparse
+
+from paka.cmark import corpus
+
+from benchmarks import corpora
+
+
+def measure(sources, backend, workers, repeat):
+    """Return best time (in seconds) of rendering all sources."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in corpus.render_corpus(
+                sources, workers=workers, backend=backend):
+            pass
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(args=None):
+    """Print documents per second for each backend."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(args)
+    sources = [
+        (index, corpora.make_readme(seed=index % 50))
+        for index in range(args.documents)]
+    runs = [("inline", "processes", 0)]
+    for backend in corpus.BACKENDS:
+        if backend == "interpreters" and not corpus.supports_interpreters():
+            print("interpreters: not supported", flush=True)
+            continue
+        runs.append((backend, backend, args.workers))
+    for name, backend, workers in runs:
+        seconds = measure(sources, backend, workers, args.repeat)
+        print("{:12} {:3} workers {:10.0f} docs/s".format(
+            name, workers, len(sources) / seconds), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
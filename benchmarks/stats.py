@@ -0,0 +1,48 @@
+"""Statistics for comparing benchmark samples (no third-party deps)."""
+
+import math
+
+
+def median(values):
+    """Return median of values."""
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def mann_whitney_greater(current, baseline):
+    """Return p-value of one-sided Mann-Whitney U test.
+
+    Null hypothesis is that ``current`` samples are not greater (that
+    is, slower, if samples are times) than ``baseline`` ones. Normal
+    approximation with tie correction is used.
+
+    """
+    size_a, size_b = len(current), len(baseline)
+    combined = sorted(
+        [(value, 0) for value in current] +
+        [(value, 1) for value in baseline])
+    ranks_a = 0.0
+    tie_term = 0.0
+    start = 0
+    while start < len(combined):
+        end = start
+        while end + 1 < len(combined) and (
+                combined[end + 1][0] == combined[start][0]):
+            end += 1
+        rank = (start + end) / 2.0 + 1
+        ties = end - start + 1
+        tie_term += ties ** 3 - ties
+        ranks_a += rank * sum(
+            1 for _, group in combined[start:end + 1] if group == 0)
+        start = end + 1
+    u_a = ranks_a - size_a * (size_a + 1) / 2.0
+    total = size_a + size_b
+    variance = size_a * size_b / 12.0 * (
+        total + 1 - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z_score = (u_a - size_a * size_b / 2.0 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z_score / math.sqrt(2))
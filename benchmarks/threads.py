@@ -0,0 +1,86 @@
+"""Scaling of :py:func:`paka.cmark.to_html` throughput with threads.
+
+Every thread converts the same documents in loop for fixed time;
+throughput (documents per second, all threads together) is compared
+with that of single thread. On free-threaded builds of CPython (and,
+for large documents, on regular ones, as the GIL is released while C
+library runs) speedup should be close to number of threads, as long as
+there are enough CPUs::
+
+    $ python -m benchmarks.threads
+    $ python3.13t -m benchmarks.threads --threads 1 2 4 8 16
+
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+from paka import cmark
+
+from benchmarks import corpora
+
+
+def measure(texts, threads, seconds):
+    """Return number of documents converted per second by threads."""
+    counts = [0] * threads
+    barrier = threading.Barrier(threads + 1)
+    stop = threading.Event()
+
+    def _run(index):
+        barrier.wait()
+        count = 0
+        while not stop.is_set():
+            for text in texts:
+                cmark.to_html(text)
+            count += len(texts)
+        counts[index] = count
+
+    workers = [
+        threading.Thread(target=_run, args=(index,))
+        for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return sum(counts) / (time.perf_counter() - started)
+
+
+def main(args=None):
+    """Print throughput and speedup for each number of threads."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=None,
+        help="numbers of threads (default: powers of two up to CPUs)")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args(args)
+    cpus = os.cpu_count() or 1
+    if args.threads is None:
+        args.threads = [1]
+        while args.threads[-1] * 2 <= cpus:
+            args.threads.append(args.threads[-1] * 2)
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("cpus: {}, gil: {}".format(
+        cpus, "enabled" if is_gil_enabled else "disabled"), flush=True)
+    for name, texts in (
+            ("tiny", [corpora.TINY] * 100),
+            ("readme", [corpora.make_readme(seed) for seed in range(10)])):
+        baseline = None
+        for threads in args.threads:
+            throughput = measure(texts, threads, args.seconds)
+            if baseline is None:
+                baseline = throughput / threads
+            print("{:8} {:3} threads {:12.0f} docs/s   speedup {:5.2f}".format(
+                name, threads, throughput, throughput / baseline),
+                flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,5832 @@
+#define _CFFI_
+
+/* We try to define Py_LIMITED_API before including Python.h.
+
+   Mess: we can only define it if Py_DEBUG, Py_TRACE_REFS and
+   Py_REF_DEBUG are not defined.  This is a best-effort approximation:
+   we can learn about Py_DEBUG from pyconfig.h, but it is unclear if
+   the same works for the other two macros.  Py_DEBUG implies them,
+   but not the other way around.
+
+   The implementation is messy (issue #350): on Windows, with _MSC_VER,
+   we have to define Py_LIMITED_API even before including pyconfig.h.
+   In that case, we guess what pyconfig.h will do to the macros above,
+   and check our guess after the #include.
+
+   Note that on Windows, with CPython 3.x, you need >= 3.5 and virtualenv
+   version >= 16.0.0.  With older versions of either, you don't get a
+   copy of PYTHON3.DLL in the virtualenv.  We can't check the version of
+   CPython *before* we even include pyconfig.h.  ffi.set_source() puts
+   a ``#define _CFFI_NO_LIMITED_API'' at the start of this file if it is
+   running on Windows < 3.5, as an attempt at fixing it, but that's
+   arguably wrong because it may not be the target version of Python.
+   Still better than nothing I guess.  As another workaround, you can
+   remove the definition of Py_LIMITED_API here.
+
+   See also 'py_limited_api' in cffi/setuptools_ext.py.
+*/
+#if !defined(_CFFI_USE_EMBEDDING) && !defined(Py_LIMITED_API)
+#  ifdef _MSC_VER
+#    if !defined(_DEBUG) && !defined(Py_DEBUG) && !defined(Py_TRACE_REFS) && !defined(Py_REF_DEBUG) && !defined(_CFFI_NO_LIMITED_API)
+#      if !defined(Py_GIL_DISABLED)
+#        define Py_LIMITED_API
+#      else
+#        define Py_LIMITED_API 0x030f0000
+#      endif
+#    endif
+
+#    include <pyconfig.h>
+     /* sanity-check: Py_LIMITED_API will cause crashes if any of these
+        are also defined.  Normally, the Python file PC/pyconfig.h does not
+        cause any of these to be defined, with the exception that _DEBUG
+        causes Py_DEBUG.  Double-check that. */
+#    ifdef Py_LIMITED_API
+#      if defined(Py_DEBUG)
+#        error "pyconfig.h unexpectedly defines Py_DEBUG, but Py_LIMITED_API is set"
+#      endif
+#      if defined(Py_TRACE_REFS)
+#        error "pyconfig.h unexpectedly defines Py_TRACE_REFS, but Py_LIMITED_API is set"
+#      endif
+#      if defined(Py_REF_DEBUG)
+#        error "pyconfig.h unexpectedly defines Py_REF_DEBUG, but Py_LIMITED_API is set"
+#      endif
+#    endif
+#  else
+#    include <pyconfig.h>
+#    if !defined(Py_DEBUG) && !defined(Py_TRACE_REFS) && !defined(Py_REF_DEBUG) && !defined(_CFFI_NO_LIMITED_API)
+#      if !defined(Py_GIL_DISABLED)
+#        define Py_LIMITED_API
+#      else
+#        define Py_LIMITED_API 0x030f0000
+#      endif
+#    endif
+#  endif
+#endif
+
+#include <Python.h>
+#ifdef __cplusplus
+extern "C" {
+#endif
+#include <stddef.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+/* This part is from file 'cffi/parse_c_type.h'.  It is copied at the
+   beginning of C sources generated by CFFI's ffi.set_source(). */
+
+typedef void *_cffi_opcode_t;
+
+#define _CFFI_OP(opcode, arg)   (_cffi_opcode_t)(opcode | (((uintptr_t)(arg)) << 8))
+#define _CFFI_GETOP(cffi_opcode)    ((unsigned char)(uintptr_t)cffi_opcode)
+#define _CFFI_GETARG(cffi_opcode)   (((intptr_t)cffi_opcode) >> 8)
+
+#define _CFFI_OP_PRIMITIVE       1
+#define _CFFI_OP_POINTER         3
+#define _CFFI_OP_ARRAY           5
+#define _CFFI_OP_OPEN_ARRAY      7
+#define _CFFI_OP_STRUCT_UNION    9
+#define _CFFI_OP_ENUM           11
+#define _CFFI_OP_FUNCTION       13
+#define _CFFI_OP_FUNCTION_END   15
+#define _CFFI_OP_NOOP           17
+#define _CFFI_OP_BITFIELD       19
+#define _CFFI_OP_TYPENAME       21
+#define _CFFI_OP_CPYTHON_BLTN_V 23   // varargs
+#define _CFFI_OP_CPYTHON_BLTN_N 25   // noargs
+#define _CFFI_OP_CPYTHON_BLTN_O 27   // O  (i.e. a single arg)
+#define _CFFI_OP_CONSTANT       29
+#define _CFFI_OP_CONSTANT_INT   31
+#define _CFFI_OP_GLOBAL_VAR     33
+#define _CFFI_OP_DLOPEN_FUNC    35
+#define _CFFI_OP_DLOPEN_CONST   37
+#define _CFFI_OP_GLOBAL_VAR_F   39
+#define _CFFI_OP_EXTERN_PYTHON  41
+
+#define _CFFI_PRIM_VOID          0
+#define _CFFI_PRIM_BOOL          1
+#define _CFFI_PRIM_CHAR          2
+#define _CFFI_PRIM_SCHAR         3
+#define _CFFI_PRIM_UCHAR         4
+#define _CFFI_PRIM_SHORT         5
+#define _CFFI_PRIM_USHORT        6
+#define _CFFI_PRIM_INT           7
+#define _CFFI_PRIM_UINT          8
+#define _CFFI_PRIM_LONG          9
+#define _CFFI_PRIM_ULONG        10
+#define _CFFI_PRIM_LONGLONG     11
+#define _CFFI_PRIM_ULONGLONG    12
+#define _CFFI_PRIM_FLOAT        13
+#define _CFFI_PRIM_DOUBLE       14
+#define _CFFI_PRIM_LONGDOUBLE   15
+
+#define _CFFI_PRIM_WCHAR        16
+#define _CFFI_PRIM_INT8         17
+#define _CFFI_PRIM_UINT8        18
+#define _CFFI_PRIM_INT16        19
+#define _CFFI_PRIM_UINT16       20
+#define _CFFI_PRIM_INT32        21
+#define _CFFI_PRIM_UINT32       22
+#define _CFFI_PRIM_INT64        23
+#define _CFFI_PRIM_UINT64       24
+#define _CFFI_PRIM_INTPTR       25
+#define _CFFI_PRIM_UINTPTR      26
+#define _CFFI_PRIM_PTRDIFF      27
+#define _CFFI_PRIM_SIZE         28
+#define _CFFI_PRIM_SSIZE        29
+#define _CFFI_PRIM_INT_LEAST8   30
+#define _CFFI_PRIM_UINT_LEAST8  31
+#define _CFFI_PRIM_INT_LEAST16  32
+#define _CFFI_PRIM_UINT_LEAST16 33
+#define _CFFI_PRIM_INT_LEAST32  34
+#define _CFFI_PRIM_UINT_LEAST32 35
+#define _CFFI_PRIM_INT_LEAST64  36
+#define _CFFI_PRIM_UINT_LEAST64 37
+#define _CFFI_PRIM_INT_FAST8    38
+#define _CFFI_PRIM_UINT_FAST8   39
+#define _CFFI_PRIM_INT_FAST16   40
+#define _CFFI_PRIM_UINT_FAST16  41
+#define _CFFI_PRIM_INT_FAST32   42
+#define _CFFI_PRIM_UINT_FAST32  43
+#define _CFFI_PRIM_INT_FAST64   44
+#define _CFFI_PRIM_UINT_FAST64  45
+#define _CFFI_PRIM_INTMAX       46
+#define _CFFI_PRIM_UINTMAX      47
+#define _CFFI_PRIM_FLOATCOMPLEX 48
+#define _CFFI_PRIM_DOUBLECOMPLEX 49
+#define _CFFI_PRIM_CHAR16       50
+#define _CFFI_PRIM_CHAR32       51
+
+#define _CFFI__NUM_PRIM         52
+#define _CFFI__UNKNOWN_PRIM           (-1)
+#define _CFFI__UNKNOWN_FLOAT_PRIM     (-2)
+#define _CFFI__UNKNOWN_LONG_DOUBLE    (-3)
+
+#define _CFFI__IO_FILE_STRUCT         (-1)
+
+
+struct _cffi_global_s {
+    const char *name;
+    void *address;
+    _cffi_opcode_t type_op;
+    void *size_or_direct_fn;  // OP_GLOBAL_VAR: size, or 0 if unknown
+                              // OP_CPYTHON_BLTN_*: addr of direct function
+};
+
+struct _cffi_getconst_s {
+    unsigned long long value;
+    const struct _cffi_type_context_s *ctx;
+    int gindex;
+};
+
+struct _cffi_struct_union_s {
+    const char *name;
+    int type_index;          // -> _cffi_types, on a OP_STRUCT_UNION
+    int flags;               // _CFFI_F_* flags below
+    size_t size;
+    int alignment;
+    int first_field_index;   // -> _cffi_fields array
+    int num_fields;
+};
+#define _CFFI_F_UNION         0x01   // is a union, not a struct
+#define _CFFI_F_CHECK_FIELDS  0x02   // complain if fields are not in the
+                                     // "standard layout" or if some are missing
+#define _CFFI_F_PACKED        0x04   // for CHECK_FIELDS, assume a packed struct
+#define _CFFI_F_EXTERNAL      0x08   // in some other ffi.include()
+#define _CFFI_F_OPAQUE        0x10   // opaque
+
+struct _cffi_field_s {
+    const char *name;
+    size_t field_offset;
+    size_t field_size;
+    _cffi_opcode_t field_type_op;
+};
+
+struct _cffi_enum_s {
+    const char *name;
+    int type_index;          // -> _cffi_types, on a OP_ENUM
+    int type_prim;           // _CFFI_PRIM_xxx
+    const char *enumerators; // comma-delimited string
+};
+
+struct _cffi_typename_s {
+    const char *name;
+    int type_index;   /* if opaque, points to a possibly artificial
+                         OP_STRUCT which is itself opaque */
+};
+
+struct _cffi_type_context_s {
+    _cffi_opcode_t *types;
+    const struct _cffi_global_s *globals;
+    const struct _cffi_field_s *fields;
+    const struct _cffi_struct_union_s *struct_unions;
+    const struct _cffi_enum_s *enums;
+    const struct _cffi_typename_s *typenames;
+    int num_globals;
+    int num_struct_unions;
+    int num_enums;
+    int num_typenames;
+    const char *const *includes;
+    int num_types;
+    int flags;      /* future extension */
+};
+
+struct _cffi_parse_info_s {
+    const struct _cffi_type_context_s *ctx;
+    _cffi_opcode_t *output;
+    unsigned int output_size;
+    size_t error_location;
+    const char *error_message;
+};
+
+struct _cffi_externpy_s {
+    const char *name;
+    size_t size_of_result;
+    void *reserved1, *reserved2;
+};
+
+#ifdef _CFFI_INTERNAL
+static int parse_c_type(struct _cffi_parse_info_s *info, const char *input);
+static int search_in_globals(const struct _cffi_type_context_s *ctx,
+                             const char *search, size_t search_len);
+static int search_in_struct_unions(const struct _cffi_type_context_s *ctx,
+                                   const char *search, size_t search_len);
+#endif
+
+/* this block of #ifs should be kept exactly identical between
+   c/_cffi_backend.c, cffi/vengine_cpy.py, cffi/vengine_gen.py
+   and cffi/_cffi_include.h */
+#if defined(_MSC_VER)
+# include <malloc.h>   /* for alloca() */
+# if _MSC_VER < 1600   /* MSVC < 2010 */
+   typedef __int8 int8_t;
+   typedef __int16 int16_t;
+   typedef __int32 int32_t;
+   typedef __int64 int64_t;
+   typedef unsigned __int8 uint8_t;
+   typedef unsigned __int16 uint16_t;
+   typedef unsigned __int32 uint32_t;
+   typedef unsigned __int64 uint64_t;
+   typedef __int8 int_least8_t;
+   typedef __int16 int_least16_t;
+   typedef __int32 int_least32_t;
+   typedef __int64 int_least64_t;
+   typedef unsigned __int8 uint_least8_t;
+   typedef unsigned __int16 uint_least16_t;
+   typedef unsigned __int32 uint_least32_t;
+   typedef unsigned __int64 uint_least64_t;
+   typedef __int8 int_fast8_t;
+   typedef __int16 int_fast16_t;
+   typedef __int32 int_fast32_t;
+   typedef __int64 int_fast64_t;
+   typedef unsigned __int8 uint_fast8_t;
+   typedef unsigned __int16 uint_fast16_t;
+   typedef unsigned __int32 uint_fast32_t;
+   typedef unsigned __int64 uint_fast64_t;
+   typedef __int64 intmax_t;
+   typedef unsigned __int64 uintmax_t;
+# else
+#  include <stdint.h>
+# endif
+# if _MSC_VER < 1800   /* MSVC < 2013 */
+#  ifndef __cplusplus
+    typedef unsigned char _Bool;
+#  endif
+# endif
+# define _cffi_float_complex_t   _Fcomplex    /* include <complex.h> for it */
+# define _cffi_double_complex_t  _Dcomplex    /* include <complex.h> for it */
+#else
+# include <stdint.h>
+# if (defined (__SVR4) && defined (__sun)) || defined(_AIX) || defined(__hpux)
+#  include <alloca.h>
+# endif
+# define _cffi_float_complex_t   float _Complex
+# define _cffi_double_complex_t  double _Complex
+#endif
+
+#ifdef __GNUC__
+# define _CFFI_UNUSED_FN  __attribute__((unused))
+#else
+# define _CFFI_UNUSED_FN  /* nothing */
+#endif
+
+#ifdef __cplusplus
+# ifndef _Bool
+   typedef bool _Bool;   /* semi-hackish: C++ has no _Bool; bool is builtin */
+# endif
+#endif
+
+/**********  CPython-specific section  **********/
+#ifndef PYPY_VERSION
+
+
+#define _cffi_from_c_double PyFloat_FromDouble
+#define _cffi_from_c_float PyFloat_FromDouble
+#define _cffi_from_c_long PyLong_FromLong
+#define _cffi_from_c_ulong PyLong_FromUnsignedLong
+#define _cffi_from_c_longlong PyLong_FromLongLong
+#define _cffi_from_c_ulonglong PyLong_FromUnsignedLongLong
+#define _cffi_from_c__Bool PyBool_FromLong
+
+#define _cffi_to_c_double PyFloat_AsDouble
+#define _cffi_to_c_float PyFloat_AsDouble
+
+#define _cffi_from_c_int(x, type)                                        \
+    (((type)-1) > 0 ? /* unsigned */                                     \
+        (sizeof(type) < sizeof(long) ?                                   \
+            PyLong_FromLong((long)x) :                                   \
+         sizeof(type) == sizeof(long) ?                                  \
+            PyLong_FromUnsignedLong((unsigned long)x) :                  \
+            PyLong_FromUnsignedLongLong((unsigned long long)x)) :        \
+        (sizeof(type) <= sizeof(long) ?                                  \
+            PyLong_FromLong((long)x) :                                   \
+            PyLong_FromLongLong((long long)x)))
+
+#define _cffi_to_c_int(o, type)                                          \
+    ((type)(                                                             \
+     sizeof(type) == 1 ? (((type)-1) > 0 ? (type)_cffi_to_c_u8(o)        \
+                                         : (type)_cffi_to_c_i8(o)) :     \
+     sizeof(type) == 2 ? (((type)-1) > 0 ? (type)_cffi_to_c_u16(o)       \
+                                         : (type)_cffi_to_c_i16(o)) :    \
+     sizeof(type) == 4 ? (((type)-1) > 0 ? (type)_cffi_to_c_u32(o)       \
+                                         : (type)_cffi_to_c_i32(o)) :    \
+     sizeof(type) == 8 ? (((type)-1) > 0 ? (type)_cffi_to_c_u64(o)       \
+                                         : (type)_cffi_to_c_i64(o)) :    \
+     (Py_FatalError("unsupported size for type " #type), (type)0)))
+
+#define _cffi_to_c_i8                                                    \
+                 ((int(*)(PyObject *))_cffi_exports[1])
+#define _cffi_to_c_u8                                                    \
+                 ((int(*)(PyObject *))_cffi_exports[2])
+#define _cffi_to_c_i16                                                   \
+                 ((int(*)(PyObject *))_cffi_exports[3])
+#define _cffi_to_c_u16                                                   \
+                 ((int(*)(PyObject *))_cffi_exports[4])
+#define _cffi_to_c_i32                                                   \
+                 ((int(*)(PyObject *))_cffi_exports[5])
+#define _cffi_to_c_u32                                                   \
+                 ((unsigned int(*)(PyObject *))_cffi_exports[6])
+#define _cffi_to_c_i64                                                   \
+                 ((long long(*)(PyObject *))_cffi_exports[7])
+#define _cffi_to_c_u64                                                   \
+                 ((unsigned long long(*)(PyObject *))_cffi_exports[8])
+#define _cffi_to_c_char                                                  \
+                 ((int(*)(PyObject *))_cffi_exports[9])
+#define _cffi_from_c_pointer                                             \
+    ((PyObject *(*)(char *, struct _cffi_ctypedescr *))_cffi_exports[10])
+#define _cffi_to_c_pointer                                               \
+    ((char *(*)(PyObject *, struct _cffi_ctypedescr *))_cffi_exports[11])
+#define _cffi_get_struct_layout                                          \
+    not used any more
+#define _cffi_restore_errno                                              \
+    ((void(*)(void))_cffi_exports[13])
+#define _cffi_save_errno                                                 \
+    ((void(*)(void))_cffi_exports[14])
+#define _cffi_from_c_char                                                \
+    ((PyObject *(*)(char))_cffi_exports[15])
+#define _cffi_from_c_deref                                               \
+    ((PyObject *(*)(char *, struct _cffi_ctypedescr *))_cffi_exports[16])
+#define _cffi_to_c                                                       \
+    ((int(*)(char *, struct _cffi_ctypedescr *, PyObject *))_cffi_exports[17])
+#define _cffi_from_c_struct                                              \
+    ((PyObject *(*)(char *, struct _cffi_ctypedescr *))_cffi_exports[18])
+#define _cffi_to_c_wchar_t                                               \
+    ((_cffi_wchar_t(*)(PyObject *))_cffi_exports[19])
+#define _cffi_from_c_wchar_t                                             \
+    ((PyObject *(*)(_cffi_wchar_t))_cffi_exports[20])
+#define _cffi_to_c_long_double                                           \
+    ((long double(*)(PyObject *))_cffi_exports[21])
+#define _cffi_to_c__Bool                                                 \
+    ((_Bool(*)(PyObject *))_cffi_exports[22])
+#define _cffi_prepare_pointer_call_argument                              \
+    ((Py_ssize_t(*)(struct _cffi_ctypedescr *,                           \
+                    PyObject *, char **))_cffi_exports[23])
+#define _cffi_convert_array_from_object                                  \
+    ((int(*)(char *, struct _cffi_ctypedescr *, PyObject *))_cffi_exports[24])
+#define _CFFI_CPIDX  25
+#define _cffi_call_python                                                \
+    ((void(*)(struct _cffi_externpy_s *, char *))_cffi_exports[_CFFI_CPIDX])
+#define _cffi_to_c_wchar3216_t                                           \
+    ((int(*)(PyObject *))_cffi_exports[26])
+#define _cffi_from_c_wchar3216_t                                         \
+    ((PyObject *(*)(int))_cffi_exports[27])
+#define _CFFI_NUM_EXPORTS 28
+
+struct _cffi_ctypedescr;
+
+static void *_cffi_exports[_CFFI_NUM_EXPORTS];
+
+#define _cffi_type(index)   (                           \
+    assert((((uintptr_t)_cffi_types[index]) & 1) == 0), \
+    (struct _cffi_ctypedescr *)_cffi_types[index])
+
+static PyObject *_cffi_init(const char *module_name, Py_ssize_t version,
+                            const struct _cffi_type_context_s *ctx)
+{
+    PyObject *module, *o_arg, *new_module;
+    void *raw[] = {
+        (void *)module_name,
+        (void *)version,
+        (void *)_cffi_exports,
+        (void *)ctx,
+    };
+
+    module = PyImport_ImportModule("_cffi_backend");
+    if (module == NULL)
+        goto failure;
+
+    o_arg = PyLong_FromVoidPtr((void *)raw);
+    if (o_arg == NULL)
+        goto failure;
+
+    new_module = PyObject_CallMethod(
+        module, (char *)"_init_cffi_1_0_external_module", (char *)"O", o_arg);
+
+    Py_DECREF(o_arg);
+    Py_DECREF(module);
+    return new_module;
+
+  failure:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+#ifdef HAVE_WCHAR_H
+typedef wchar_t _cffi_wchar_t;
+#else
+typedef uint16_t _cffi_wchar_t;   /* same random pick as _cffi_backend.c */
+#endif
+
+_CFFI_UNUSED_FN static uint16_t _cffi_to_c_char16_t(PyObject *o)
+{
+    if (sizeof(_cffi_wchar_t) == 2)
+        return (uint16_t)_cffi_to_c_wchar_t(o);
+    else
+        return (uint16_t)_cffi_to_c_wchar3216_t(o);
+}
+
+_CFFI_UNUSED_FN static PyObject *_cffi_from_c_char16_t(uint16_t x)
+{
+    if (sizeof(_cffi_wchar_t) == 2)
+        return _cffi_from_c_wchar_t((_cffi_wchar_t)x);
+    else
+        return _cffi_from_c_wchar3216_t((int)x);
+}
+
+_CFFI_UNUSED_FN static int _cffi_to_c_char32_t(PyObject *o)
+{
+    if (sizeof(_cffi_wchar_t) == 4)
+        return (int)_cffi_to_c_wchar_t(o);
+    else
+        return (int)_cffi_to_c_wchar3216_t(o);
+}
+
+_CFFI_UNUSED_FN static PyObject *_cffi_from_c_char32_t(unsigned int x)
+{
+    if (sizeof(_cffi_wchar_t) == 4)
+        return _cffi_from_c_wchar_t((_cffi_wchar_t)x);
+    else
+        return _cffi_from_c_wchar3216_t((int)x);
+}
+
+union _cffi_union_alignment_u {
+    unsigned char m_char;
+    unsigned short m_short;
+    unsigned int m_int;
+    unsigned long m_long;
+    unsigned long long m_longlong;
+    float m_float;
+    double m_double;
+    long double m_longdouble;
+};
+
+struct _cffi_freeme_s {
+    struct _cffi_freeme_s *next;
+    union _cffi_union_alignment_u alignment;
+};
+
+_CFFI_UNUSED_FN static int
+_cffi_convert_array_argument(struct _cffi_ctypedescr *ctptr, PyObject *arg,
+                             char **output_data, Py_ssize_t datasize,
+                             struct _cffi_freeme_s **freeme)
+{
+    char *p;
+    if (datasize < 0)
+        return -1;
+
+    p = *output_data;
+    if (p == NULL) {
+        struct _cffi_freeme_s *fp = (struct _cffi_freeme_s *)PyObject_Malloc(
+            offsetof(struct _cffi_freeme_s, alignment) + (size_t)datasize);
+        if (fp == NULL)
+            return -1;
+        fp->next = *freeme;
+        *freeme = fp;
+        p = *output_data = (char *)&fp->alignment;
+    }
+    memset((void *)p, 0, (size_t)datasize);
+    return _cffi_convert_array_from_object(p, ctptr, arg);
+}
+
+_CFFI_UNUSED_FN static void
+_cffi_free_array_arguments(struct _cffi_freeme_s *freeme)
+{
+    do {
+        void *p = (void *)freeme;
+        freeme = freeme->next;
+        PyObject_Free(p);
+    } while (freeme != NULL);
+}
+
+/**********  end CPython-specific section  **********/
+#else
+_CFFI_UNUSED_FN
+static void (*_cffi_call_python_org)(struct _cffi_externpy_s *, char *);
+# define _cffi_call_python  _cffi_call_python_org
+#endif
+
+
+#define _cffi_array_len(array)   (sizeof(array) / sizeof((array)[0]))
+
+#define _cffi_prim_int(size, sign)                                      \
+    ((size) == 1 ? ((sign) ? _CFFI_PRIM_INT8  : _CFFI_PRIM_UINT8)  :    \
+     (size) == 2 ? ((sign) ? _CFFI_PRIM_INT16 : _CFFI_PRIM_UINT16) :    \
+     (size) == 4 ? ((sign) ? _CFFI_PRIM_INT32 : _CFFI_PRIM_UINT32) :    \
+     (size) == 8 ? ((sign) ? _CFFI_PRIM_INT64 : _CFFI_PRIM_UINT64) :    \
+     _CFFI__UNKNOWN_PRIM)
+
+#define _cffi_prim_float(size)                                          \
+    ((size) == sizeof(float) ? _CFFI_PRIM_FLOAT :                       \
+     (size) == sizeof(double) ? _CFFI_PRIM_DOUBLE :                     \
+     (size) == sizeof(long double) ? _CFFI__UNKNOWN_LONG_DOUBLE :       \
+     _CFFI__UNKNOWN_FLOAT_PRIM)
+
+#define _cffi_check_int(got, got_nonpos, expected)      \
+    ((got_nonpos) == (expected <= 0) &&                 \
+     (got) == (unsigned long long)expected)
+
+#ifdef MS_WIN32
+# define _cffi_stdcall  __stdcall
+#else
+# define _cffi_stdcall  /* nothing */
+#endif
+
+#ifdef __cplusplus
+}
+#endif
+
+/************************************************************/
+
+#ifndef CMARK_H
+#define CMARK_H
+
+#include <stdio.h>
+#include <stdbool.h>
+#include <cmark_export.h>
+#include <cmark_version.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/** # NAME
+ *
+ * **cmark** - CommonMark parsing, manipulating, and rendering
+ */
+
+/** # DESCRIPTION
+ *
+ * ## Simple Interface
+ */
+
+/** Convert 'text' (assumed to be a UTF-8 encoded string with length
+ * 'len') from CommonMark Markdown to HTML, returning a null-terminated,
+ * UTF-8-encoded string. It is the caller's responsibility
+ * to free the returned buffer.
+ */
+CMARK_EXPORT
+char *cmark_markdown_to_html(const char *text, size_t len, int options);
+
+/** ## Node Structure
+ */
+
+typedef enum {
+  /* Error status */
+  CMARK_NODE_NONE,
+
+  /* Block */
+  CMARK_NODE_DOCUMENT,
+  CMARK_NODE_BLOCK_QUOTE,
+  CMARK_NODE_LIST,
+  CMARK_NODE_ITEM,
+  CMARK_NODE_CODE_BLOCK,
+  CMARK_NODE_HTML_BLOCK,
+  CMARK_NODE_CUSTOM_BLOCK,
+  CMARK_NODE_PARAGRAPH,
+  CMARK_NODE_HEADING,
+  CMARK_NODE_THEMATIC_BREAK,
+
+  CMARK_NODE_FIRST_BLOCK = CMARK_NODE_DOCUMENT,
+  CMARK_NODE_LAST_BLOCK = CMARK_NODE_THEMATIC_BREAK,
+
+  /* Inline */
+  CMARK_NODE_TEXT,
+  CMARK_NODE_SOFTBREAK,
+  CMARK_NODE_LINEBREAK,
+  CMARK_NODE_CODE,
+  CMARK_NODE_HTML_INLINE,
+  CMARK_NODE_CUSTOM_INLINE,
+  CMARK_NODE_EMPH,
+  CMARK_NODE_STRONG,
+  CMARK_NODE_LINK,
+  CMARK_NODE_IMAGE,
+
+  CMARK_NODE_FIRST_INLINE = CMARK_NODE_TEXT,
+  CMARK_NODE_LAST_INLINE = CMARK_NODE_IMAGE
+} cmark_node_type;
+
+/* For backwards compatibility: */
+#define CMARK_NODE_HEADER CMARK_NODE_HEADING
+#define CMARK_NODE_HRULE CMARK_NODE_THEMATIC_BREAK
+#define CMARK_NODE_HTML CMARK_NODE_HTML_BLOCK
+#define CMARK_NODE_INLINE_HTML CMARK_NODE_HTML_INLINE
+
+typedef enum {
+  CMARK_NO_LIST,
+  CMARK_BULLET_LIST,
+  CMARK_ORDERED_LIST
+} cmark_list_type;
+
+typedef enum {
+  CMARK_NO_DELIM,
+  CMARK_PERIOD_DELIM,
+  CMARK_PAREN_DELIM
+} cmark_delim_type;
+
+typedef struct cmark_node cmark_node;
+typedef struct cmark_parser cmark_parser;
+typedef struct cmark_iter cmark_iter;
+
+/**
+ * ## Custom memory allocator support
+ */
+
+/** Defines the memory allocation functions to be used by CMark
+ * when parsing and allocating a document tree
+ */
+typedef struct cmark_mem {
+  void *(*calloc)(size_t, size_t);
+  void *(*realloc)(void *, size_t);
+  void (*free)(void *);
+} cmark_mem;
+
+/** Returns a pointer to the default memory allocator.
+ */
+CMARK_EXPORT cmark_mem *cmark_get_default_mem_allocator(void);
+
+/**
+ * ## Classifying nodes
+ */
+
+/** Returns true if the node is a block node.
+  */
+CMARK_EXPORT bool cmark_node_is_block(cmark_node *node);
+
+/** Returns true if the node is an inline node.
+  */
+CMARK_EXPORT bool cmark_node_is_inline(cmark_node *node);
+
+/** Returns true if the node is a leaf node (a node that cannot
+    contain children).
+  */
+CMARK_EXPORT bool cmark_node_is_leaf(cmark_node *node);
+
+/**
+ * ## Creating and Destroying Nodes
+ */
+
+/** Creates a new node of type 'type'.  Note that the node may have
+ * other required properties, which it is the caller's responsibility
+ * to assign.
+ */
+CMARK_EXPORT cmark_node *cmark_node_new(cmark_node_type type);
+
+/** Same as `cmark_node_new`, but explicitly listing the memory
+ * allocator used to allocate the node.  Note:  be sure to use the same
+ * allocator for every node in a tree, or bad things can happen.
+ */
+CMARK_EXPORT cmark_node *cmark_node_new_with_mem(cmark_node_type type,
+                                                 cmark_mem *mem);
+
+/** Frees the memory allocated for a node and any children.
+ */
+CMARK_EXPORT void cmark_node_free(cmark_node *node);
+
+/**
+ * ## Tree Traversal
+ */
+
+/** Returns the next node in the sequence after 'node', or NULL if
+ * there is none.
+ */
+CMARK_EXPORT cmark_node *cmark_node_next(cmark_node *node);
+
+/** Returns the previous node in the sequence after 'node', or NULL if
+ * there is none.
+ */
+CMARK_EXPORT cmark_node *cmark_node_previous(cmark_node *node);
+
+/** Returns the parent of 'node', or NULL if there is none.
+ */
+CMARK_EXPORT cmark_node *cmark_node_parent(cmark_node *node);
+
+/** Returns the first child of 'node', or NULL if 'node' has no children.
+ */
+CMARK_EXPORT cmark_node *cmark_node_first_child(cmark_node *node);
+
+/** Returns the last child of 'node', or NULL if 'node' has no children.
+ */
+CMARK_EXPORT cmark_node *cmark_node_last_child(cmark_node *node);
+
+/**
+ * ## Iterator
+ *
+ * An iterator will walk through a tree of nodes, starting from a root
+ * node, returning one node at a time, together with information about
+ * whether the node is being entered or exited.  The iterator will
+ * first descend to a child node, if there is one.  When there is no
+ * child, the iterator will go to the next sibling.  When there is no
+ * next sibling, the iterator will return to the parent (but with
+ * a 'cmark_event_type' of `CMARK_EVENT_EXIT`).  The iterator will
+ * return `CMARK_EVENT_DONE` when it reaches the root node again.
+ * One natural application is an HTML renderer, where an `ENTER` event
+ * outputs an open tag and an `EXIT` event outputs a close tag.
+ * An iterator might also be used to transform an AST in some systematic
+ * way, for example, turning all level-3 headings into regular paragraphs.
+ *
+ *     void
+ *     usage_example(cmark_node *root) {
+ *         cmark_event_type ev_type;
+ *         cmark_iter *iter = cmark_iter_new(root);
+ *
+ *         while ((ev_type = cmark_iter_next(iter)) != CMARK_EVENT_DONE) {
+ *             cmark_node *cur = cmark_iter_get_node(iter);
+ *             // Do something with `cur` and `ev_type`
+ *         }
+ *
+ *         cmark_iter_free(iter);
+ *     }
+ *
+ * Iterators will never return `EXIT` events for leaf nodes, which are nodes
+ * of type:
+ *
+ * * CMARK_NODE_HTML_BLOCK
+ * * CMARK_NODE_THEMATIC_BREAK
+ * * CMARK_NODE_CODE_BLOCK
+ * * CMARK_NODE_TEXT
+ * * CMARK_NODE_SOFTBREAK
+ * * CMARK_NODE_LINEBREAK
+ * * CMARK_NODE_CODE
+ * * CMARK_NODE_HTML_INLINE
+ *
+ * Nodes must only be modified after an `EXIT` event, or an `ENTER` event for
+ * leaf nodes.
+ */
+
+typedef enum {
+  CMARK_EVENT_NONE,
+  CMARK_EVENT_DONE,
+  CMARK_EVENT_ENTER,
+  CMARK_EVENT_EXIT
+} cmark_event_type;
+
+/** Creates a new iterator starting at 'root'.  The current node and event
+ * type are undefined until 'cmark_iter_next' is called for the first time.
+ * The memory allocated for the iterator should be released using
+ * 'cmark_iter_free' when it is no longer needed.
+ */
+CMARK_EXPORT
+cmark_iter *cmark_iter_new(cmark_node *root);
+
+/** Frees the memory allocated for an iterator.
+ */
+CMARK_EXPORT
+void cmark_iter_free(cmark_iter *iter);
+
+/** Advances to the next node and returns the event type (`CMARK_EVENT_ENTER`,
+ * `CMARK_EVENT_EXIT` or `CMARK_EVENT_DONE`).
+ */
+CMARK_EXPORT
+cmark_event_type cmark_iter_next(cmark_iter *iter);
+
+/** Returns the current node.
+ */
+CMARK_EXPORT
+cmark_node *cmark_iter_get_node(cmark_iter *iter);
+
+/** Returns the current event type.
+ */
+CMARK_EXPORT
+cmark_event_type cmark_iter_get_event_type(cmark_iter *iter);
+
+/** Returns the root node.
+ */
+CMARK_EXPORT
+cmark_node *cmark_iter_get_root(cmark_iter *iter);
+
+/** Resets the iterator so that the current node is 'current' and
+ * the event type is 'event_type'.  The new current node must be a
+ * descendant of the root node or the root node itself.
+ */
+CMARK_EXPORT
+void cmark_iter_reset(cmark_iter *iter, cmark_node *current,
+                      cmark_event_type event_type);
+
+/**
+ * ## Accessors
+ */
+
+/** Returns the user data of 'node'.
+ */
+CMARK_EXPORT void *cmark_node_get_user_data(cmark_node *node);
+
+/** Sets arbitrary user data for 'node'.  Returns 1 on success,
+ * 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_set_user_data(cmark_node *node, void *user_data);
+
+/** Returns the type of 'node', or `CMARK_NODE_NONE` on error.
+ */
+CMARK_EXPORT cmark_node_type cmark_node_get_type(cmark_node *node);
+
+/** Like 'cmark_node_get_type', but returns a string representation
+    of the type, or `"<unknown>"`.
+ */
+CMARK_EXPORT
+const char *cmark_node_get_type_string(cmark_node *node);
+
+/** Returns the string contents of 'node', or an empty
+    string if none is set.  Returns NULL if called on a
+    node that does not have string content.
+ */
+CMARK_EXPORT const char *cmark_node_get_literal(cmark_node *node);
+
+/** Sets the string contents of 'node'.  Returns 1 on success,
+ * 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_set_literal(cmark_node *node, const char *content);
+
+/** Returns the heading level of 'node', or 0 if 'node' is not a heading.
+ */
+CMARK_EXPORT int cmark_node_get_heading_level(cmark_node *node);
+
+/* For backwards compatibility */
+#define cmark_node_get_header_level cmark_node_get_heading_level
+#define cmark_node_set_header_level cmark_node_set_heading_level
+
+/** Sets the heading level of 'node', returning 1 on success and 0 on error.
+ */
+CMARK_EXPORT int cmark_node_set_heading_level(cmark_node *node, int level);
+
+/** Returns the list type of 'node', or `CMARK_NO_LIST` if 'node'
+ * is not a list.
+ */
+CMARK_EXPORT cmark_list_type cmark_node_get_list_type(cmark_node *node);
+
+/** Sets the list type of 'node', returning 1 on success and 0 on error.
+ */
+CMARK_EXPORT int cmark_node_set_list_type(cmark_node *node,
+                                          cmark_list_type type);
+
+/** Returns the list delimiter type of 'node', or `CMARK_NO_DELIM` if 'node'
+ * is not a list.
+ */
+CMARK_EXPORT cmark_delim_type cmark_node_get_list_delim(cmark_node *node);
+
+/** Sets the list delimiter type of 'node', returning 1 on success and 0
+ * on error.
+ */
+CMARK_EXPORT int cmark_node_set_list_delim(cmark_node *node,
+                                           cmark_delim_type delim);
+
+/** Returns starting number of 'node', if it is an ordered list, otherwise 0.
+ */
+CMARK_EXPORT int cmark_node_get_list_start(cmark_node *node);
+
+/** Sets starting number of 'node', if it is an ordered list. Returns 1
+ * on success, 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_set_list_start(cmark_node *node, int start);
+
+/** Returns 1 if 'node' is a tight list, 0 otherwise.
+ */
+CMARK_EXPORT int cmark_node_get_list_tight(cmark_node *node);
+
+/** Sets the "tightness" of a list.  Returns 1 on success, 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_set_list_tight(cmark_node *node, int tight);
+
+/** Returns the info string from a fenced code block.
+ */
+CMARK_EXPORT const char *cmark_node_get_fence_info(cmark_node *node);
+
+/** Sets the info string in a fenced code block, returning 1 on
+ * success and 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_set_fence_info(cmark_node *node, const char *info);
+
+/** Returns the URL of a link or image 'node', or an empty string
+    if no URL is set.  Returns NULL if called on a node that is
+    not a link or image.
+ */
+CMARK_EXPORT const char *cmark_node_get_url(cmark_node *node);
+
+/** Sets the URL of a link or image 'node'. Returns 1 on success,
+ * 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_set_url(cmark_node *node, const char *url);
+
+/** Returns the title of a link or image 'node', or an empty
+    string if no title is set.  Returns NULL if called on a node
+    that is not a link or image.
+ */
+CMARK_EXPORT const char *cmark_node_get_title(cmark_node *node);
+
+/** Sets the title of a link or image 'node'. Returns 1 on success,
+ * 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_set_title(cmark_node *node, const char *title);
+
+/** Returns the literal "on enter" text for a custom 'node', or
+    an empty string if no on_enter is set.  Returns NULL if called
+    on a non-custom node.
+ */
+CMARK_EXPORT const char *cmark_node_get_on_enter(cmark_node *node);
+
+/** Sets the literal text to render "on enter" for a custom 'node'.
+    Any children of the node will be rendered after this text.
+    Returns 1 on success 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_set_on_enter(cmark_node *node,
+                                         const char *on_enter);
+
+/** Returns the literal "on exit" text for a custom 'node', or
+    an empty string if no on_exit is set.  Returns NULL if
+    called on a non-custom node.
+ */
+CMARK_EXPORT const char *cmark_node_get_on_exit(cmark_node *node);
+
+/** Sets the literal text to render "on exit" for a custom 'node'.
+    Any children of the node will be rendered before this text.
+    Returns 1 on success 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_set_on_exit(cmark_node *node, const char *on_exit);
+
+/** Returns the line on which 'node' begins.
+ */
+CMARK_EXPORT int cmark_node_get_start_line(cmark_node *node);
+
+/** Returns the column at which 'node' begins.
+ */
+CMARK_EXPORT int cmark_node_get_start_column(cmark_node *node);
+
+/** Returns the line on which 'node' ends.
+ */
+CMARK_EXPORT int cmark_node_get_end_line(cmark_node *node);
+
+/** Returns the column at which 'node' ends.
+ */
+CMARK_EXPORT int cmark_node_get_end_column(cmark_node *node);
+
+/**
+ * ## Tree Manipulation
+ */
+
+/** Unlinks a 'node', removing it from the tree, but not freeing its
+ * memory.  (Use 'cmark_node_free' for that.)
+ */
+CMARK_EXPORT void cmark_node_unlink(cmark_node *node);
+
+/** Inserts 'sibling' before 'node'.  Returns 1 on success, 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_insert_before(cmark_node *node,
+                                          cmark_node *sibling);
+
+/** Inserts 'sibling' after 'node'. Returns 1 on success, 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_insert_after(cmark_node *node, cmark_node *sibling);
+
+/** Replaces 'oldnode' with 'newnode' and unlinks 'oldnode' (but does
+ * not free its memory).
+ * Returns 1 on success, 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_replace(cmark_node *oldnode, cmark_node *newnode);
+
+/** Adds 'child' to the beginning of the children of 'node'.
+ * Returns 1 on success, 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_prepend_child(cmark_node *node, cmark_node *child);
+
+/** Adds 'child' to the end of the children of 'node'.
+ * Returns 1 on success, 0 on failure.
+ */
+CMARK_EXPORT int cmark_node_append_child(cmark_node *node, cmark_node *child);
+
+/** Consolidates adjacent text nodes.
+ */
+CMARK_EXPORT void cmark_consolidate_text_nodes(cmark_node *root);
+
+/**
+ * ## Parsing
+ *
+ * Simple interface:
+ *
+ *     cmark_node *document = cmark_parse_document("Hello *world*", 13,
+ *                                                 CMARK_OPT_DEFAULT);
+ *
+ * Streaming interface:
+ *
+ *     cmark_parser *parser = cmark_parser_new(CMARK_OPT_DEFAULT);
+ *     FILE *fp = fopen("myfile.md", "rb");
+ *     while ((bytes = fread(buffer, 1, sizeof(buffer), fp)) > 0) {
+ *         cmark_parser_feed(parser, buffer, bytes);
+ *         if (bytes < sizeof(buffer)) {
+ *             break;
+ *         }
+ *     }
+ *     document = cmark_parser_finish(parser);
+ *     cmark_parser_free(parser);
+ */
+
+/** Creates a new parser object.
+ */
+CMARK_EXPORT
+cmark_parser *cmark_parser_new(int options);
+
+/** Creates a new parser object with the given memory allocator
+ *
+ * A generalization of `cmark_parser_new`:
+ * ```c
+ * cmark_parser_new(options)
+ * ```
+ * is the same as:
+ * ```c
+ * cmark_parser_new_with_mem(options, cmark_get_default_mem_allocator())
+ * ```
+ */
+CMARK_EXPORT
+cmark_parser *cmark_parser_new_with_mem(int options, cmark_mem *mem);
+
+/** Creates a new parser object with the given node to use as the root
+ * node of the parsed AST.
+ *
+ * When parsing, children are always appended, not prepended; that means
+ * if `root` already has children, the newly-parsed children will appear
+ * after the given children.
+ *
+ * A generalization of `cmark_parser_new_with_mem`:
+ * ```c
+ * cmark_parser_new_with_mem(options, mem)
+ * ```
+ * is approximately the same as:
+ * ```c
+ * cmark_parser_new_with_mem_into_root(options, mem, cmark_node_new(CMARK_NODE_DOCUMENT))
+ * ```
+ *
+ * This is useful for creating a single document out of multiple parsed
+ * document fragments.
+ */
+CMARK_EXPORT
+cmark_parser *cmark_parser_new_with_mem_into_root(
+    int options, cmark_mem *mem, cmark_node *root);
+
+/** Frees memory allocated for a parser object.
+ */
+CMARK_EXPORT
+void cmark_parser_free(cmark_parser *parser);
+
+/** Feeds a string of length 'len' to 'parser'.
+ */
+CMARK_EXPORT
+void cmark_parser_feed(cmark_parser *parser, const char *buffer, size_t len);
+
+/** Finish parsing and return a pointer to a tree of nodes.
+ */
+CMARK_EXPORT
+cmark_node *cmark_parser_finish(cmark_parser *parser);
+
+/** Parse a CommonMark document in 'buffer' of length 'len'.
+ * Returns a pointer to a tree of nodes.  The memory allocated for
+ * the node tree should be released using 'cmark_node_free'
+ * when it is no longer needed.
+ */
+CMARK_EXPORT
+cmark_node *cmark_parse_document(const char *buffer, size_t len, int options);
+
+/** Parse a CommonMark document in file 'f', returning a pointer to
+ * a tree of nodes.  The memory allocated for the node tree should be
+ * released using 'cmark_node_free' when it is no longer needed.
+ */
+CMARK_EXPORT
+cmark_node *cmark_parse_file(FILE *f, int options);
+
+/**
+ * ## Rendering
+ */
+
+/** Render a 'node' tree as XML.  It is the caller's responsibility
+ * to free the returned buffer.
+ */
+CMARK_EXPORT
+char *cmark_render_xml(cmark_node *root, int options);
+
+/** Render a 'node' tree as an HTML fragment.  It is up to the user
+ * to add an appropriate header and footer. It is the caller's
+ * responsibility to free the returned buffer.
+ */
+CMARK_EXPORT
+char *cmark_render_html(cmark_node *root, int options);
+
+/** Render a 'node' tree as a groff man page, without the header.
+ * It is the caller's responsibility to free the returned buffer.
+ */
+CMARK_EXPORT
+char *cmark_render_man(cmark_node *root, int options, int width);
+
+/** Render a 'node' tree as a commonmark document.
+ * It is the caller's responsibility to free the returned buffer.
+ */
+CMARK_EXPORT
+char *cmark_render_commonmark(cmark_node *root, int options, int width);
+
+/** Render a 'node' tree as a LaTeX document.
+ * It is the caller's responsibility to free the returned buffer.
+ */
+CMARK_EXPORT
+char *cmark_render_latex(cmark_node *root, int options, int width);
+
+/**
+ * ## Options
+ */
+
+/** Default options.
+ */
+#define CMARK_OPT_DEFAULT 0
+
+/**
+ * ### Options affecting rendering
+ */
+
+/** Include a `data-sourcepos` attribute on all block elements.
+ */
+#define CMARK_OPT_SOURCEPOS (1 << 1)
+
+/** Render `softbreak` elements as hard line breaks.
+ */
+#define CMARK_OPT_HARDBREAKS (1 << 2)
+
+/** `CMARK_OPT_SAFE` is defined here for API compatibility,
+    but it no longer has any effect. "Safe" mode is now the default:
+    set `CMARK_OPT_UNSAFE` to disable it.
+ */
+#define CMARK_OPT_SAFE (1 << 3)
+
+/** Render raw HTML and unsafe links (`javascript:`, `vbscript:`,
+ * `file:`, and `data:`, except for `image/png`, `image/gif`,
+ * `image/jpeg`, or `image/webp` mime types).  By default,
+ * raw HTML is replaced by a placeholder HTML comment. Unsafe
+ * links are replaced by empty strings.
+ */
+#define CMARK_OPT_UNSAFE (1 << 17)
+
+/** Render `softbreak` elements as spaces.
+ */
+#define CMARK_OPT_NOBREAKS (1 << 4)
+
+/**
+ * ### Options affecting parsing
+ */
+
+/** Legacy option (no effect).
+ */
+#define CMARK_OPT_NORMALIZE (1 << 8)
+
+/** Validate UTF-8 in the input before parsing, replacing illegal
+ * sequences with the replacement character U+FFFD.
+ */
+#define CMARK_OPT_VALIDATE_UTF8 (1 << 9)
+
+/** Convert straight quotes to curly, `---` to em dashes, `--` to en dashes.
+ */
+#define CMARK_OPT_SMART (1 << 10)
+
+/**
+ * ## Version information
+ */
+
+/** The library version as integer for runtime checks. Also available as
+ * macro CMARK_VERSION for compile time checks.
+ *
+ * * Bits 16-23 contain the major version.
+ * * Bits 8-15 contain the minor version.
+ * * Bits 0-7 contain the patchlevel.
+ *
+ * In hexadecimal format, the number 0x010203 represents version 1.2.3.
+ */
+CMARK_EXPORT
+int cmark_version(void);
+
+/** The library version string for runtime checks. Also available as
+ * macro CMARK_VERSION_STRING for compile time checks.
+ */
+CMARK_EXPORT
+const char *cmark_version_string(void);
+
+/** # AUTHORS
+ *
+ * John MacFarlane, Vicent Marti,  K?rlis Ga??is, Nick Wellnhofer.
+ */
+
+#ifndef CMARK_NO_SHORT_NAMES
+#define NODE_DOCUMENT CMARK_NODE_DOCUMENT
+#define NODE_BLOCK_QUOTE CMARK_NODE_BLOCK_QUOTE
+#define NODE_LIST CMARK_NODE_LIST
+#define NODE_ITEM CMARK_NODE_ITEM
+#define NODE_CODE_BLOCK CMARK_NODE_CODE_BLOCK
+#define NODE_HTML_BLOCK CMARK_NODE_HTML_BLOCK
+#define NODE_CUSTOM_BLOCK CMARK_NODE_CUSTOM_BLOCK
+#define NODE_PARAGRAPH CMARK_NODE_PARAGRAPH
+#define NODE_HEADING CMARK_NODE_HEADING
+#define NODE_HEADER CMARK_NODE_HEADER
+#define NODE_THEMATIC_BREAK CMARK_NODE_THEMATIC_BREAK
+#define NODE_HRULE CMARK_NODE_HRULE
+#define NODE_TEXT CMARK_NODE_TEXT
+#define NODE_SOFTBREAK CMARK_NODE_SOFTBREAK
+#define NODE_LINEBREAK CMARK_NODE_LINEBREAK
+#define NODE_CODE CMARK_NODE_CODE
+#define NODE_HTML_INLINE CMARK_NODE_HTML_INLINE
+#define NODE_CUSTOM_INLINE CMARK_NODE_CUSTOM_INLINE
+#define NODE_EMPH CMARK_NODE_EMPH
+#define NODE_STRONG CMARK_NODE_STRONG
+#define NODE_LINK CMARK_NODE_LINK
+#define NODE_IMAGE CMARK_NODE_IMAGE
+#define BULLET_LIST CMARK_BULLET_LIST
+#define ORDERED_LIST CMARK_ORDERED_LIST
+#define PERIOD_DELIM CMARK_PERIOD_DELIM
+#define PAREN_DELIM CMARK_PAREN_DELIM
+#endif
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
+
+#include "paka_cmark.h"
+
+
+/************************************************************/
+
+static void *_cffi_types[] = {
+/*  0 */ _CFFI_OP(_CFFI_OP_FUNCTION, 168), // char *()(char const *, size_t, int)
+/*  1 */ _CFFI_OP(_CFFI_OP_POINTER, 169), // char const *
+/*  2 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28), // size_t
+/*  3 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7), // int
+/*  4 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/*  5 */ _CFFI_OP(_CFFI_OP_FUNCTION, 168), // char *()(cmark_node *, int)
+/*  6 */ _CFFI_OP(_CFFI_OP_POINTER, 171), // cmark_node *
+/*  7 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/*  8 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/*  9 */ _CFFI_OP(_CFFI_OP_FUNCTION, 168), // char *()(cmark_node *, int, int)
+/* 10 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 11 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 12 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 13 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 14 */ _CFFI_OP(_CFFI_OP_FUNCTION, 168), // char *()(cmark_parser *, char const *, size_t, int, size_t)
+/* 15 */ _CFFI_OP(_CFFI_OP_POINTER, 172), // cmark_parser *
+/* 16 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 17 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 18 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 19 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 20 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 21 */ _CFFI_OP(_CFFI_OP_FUNCTION, 1), // char const *()(cmark_node *)
+/* 22 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 23 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 24 */ _CFFI_OP(_CFFI_OP_FUNCTION, 1), // char const *()(void)
+/* 25 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 26 */ _CFFI_OP(_CFFI_OP_FUNCTION, 77), // cmark_delim_type()(cmark_node *)
+/* 27 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 28 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 29 */ _CFFI_OP(_CFFI_OP_FUNCTION, 143), // cmark_event_type()(cmark_iter *)
+/* 30 */ _CFFI_OP(_CFFI_OP_POINTER, 170), // cmark_iter *
+/* 31 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 32 */ _CFFI_OP(_CFFI_OP_FUNCTION, 30), // cmark_iter *()(cmark_node *)
+/* 33 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 34 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 35 */ _CFFI_OP(_CFFI_OP_FUNCTION, 81), // cmark_list_type()(cmark_node *)
+/* 36 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 37 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 38 */ _CFFI_OP(_CFFI_OP_FUNCTION, 6), // cmark_node *()(char const *, size_t, int)
+/* 39 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 40 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 41 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 42 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 43 */ _CFFI_OP(_CFFI_OP_FUNCTION, 6), // cmark_node *()(cmark_iter *)
+/* 44 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 45 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 46 */ _CFFI_OP(_CFFI_OP_FUNCTION, 6), // cmark_node *()(cmark_node *)
+/* 47 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 48 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 49 */ _CFFI_OP(_CFFI_OP_FUNCTION, 6), // cmark_node *()(cmark_node_type)
+/* 50 */ _CFFI_OP(_CFFI_OP_ENUM, 3), // cmark_node_type
+/* 51 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 52 */ _CFFI_OP(_CFFI_OP_FUNCTION, 6), // cmark_node *()(cmark_parser *)
+/* 53 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
+/* 54 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 55 */ _CFFI_OP(_CFFI_OP_FUNCTION, 6), // cmark_node *()(cmark_parser *, char const *, size_t, int, size_t)
+/* 56 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
+/* 57 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 58 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 59 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 60 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 61 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 62 */ _CFFI_OP(_CFFI_OP_FUNCTION, 50), // cmark_node_type()(cmark_node *)
+/* 63 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 64 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 65 */ _CFFI_OP(_CFFI_OP_FUNCTION, 15), // cmark_parser *()(int)
+/* 66 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 67 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 68 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(cmark_node *)
+/* 69 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 70 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 71 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(cmark_node *, char const *)
+/* 72 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 73 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 74 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 75 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(cmark_node *, cmark_delim_type)
+/* 76 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 77 */ _CFFI_OP(_CFFI_OP_ENUM, 0), // cmark_delim_type
+/* 78 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 79 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(cmark_node *, cmark_list_type)
+/* 80 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 81 */ _CFFI_OP(_CFFI_OP_ENUM, 2), // cmark_list_type
+/* 82 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 83 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(cmark_node *, cmark_node *)
+/* 84 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 85 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 86 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 87 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(cmark_node *, int)
+/* 88 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 89 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 90 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 91 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(cmark_node *, int, char const *)
+/* 92 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 93 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 94 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 95 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 96 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(cmark_node *, int, int, size_t, int(*)(void *, char const *, size_t), void *)
+/* 97 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 98 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 99 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 100 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 101 */ _CFFI_OP(_CFFI_OP_POINTER, 126), // int(*)(void *, char const *, size_t)
+/* 102 */ _CFFI_OP(_CFFI_OP_POINTER, 179), // void *
+/* 103 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 104 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(cmark_node *, int, size_t, int(*)(void *, char const *, size_t), void *)
+/* 105 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 106 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 107 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 108 */ _CFFI_OP(_CFFI_OP_NOOP, 101),
+/* 109 */ _CFFI_OP(_CFFI_OP_NOOP, 102),
+/* 110 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 111 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(cmark_parser *, int, size_t, size_t *)
+/* 112 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
+/* 113 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 114 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 115 */ _CFFI_OP(_CFFI_OP_POINTER, 2), // size_t *
+/* 116 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 117 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(int, int, paka_format, int, int, size_t, paka_fd_stats *)
+/* 118 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 119 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 120 */ _CFFI_OP(_CFFI_OP_ENUM, 4), // paka_format
+/* 121 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 122 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 123 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 124 */ _CFFI_OP(_CFFI_OP_POINTER, 173), // paka_fd_stats *
+/* 125 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 126 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // int()(void *, char const *, size_t)
+/* 127 */ _CFFI_OP(_CFFI_OP_NOOP, 102),
+/* 128 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 129 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 130 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 131 */ _CFFI_OP(_CFFI_OP_FUNCTION, 2), // size_t()(char const *)
+/* 132 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 133 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 134 */ _CFFI_OP(_CFFI_OP_FUNCTION, 2), // size_t()(cmark_parser *)
+/* 135 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
+/* 136 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 137 */ _CFFI_OP(_CFFI_OP_FUNCTION, 179), // void()(cmark_iter *)
+/* 138 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 139 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 140 */ _CFFI_OP(_CFFI_OP_FUNCTION, 179), // void()(cmark_iter *, cmark_node *, cmark_event_type)
+/* 141 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 142 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 143 */ _CFFI_OP(_CFFI_OP_ENUM, 1), // cmark_event_type
+/* 144 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 145 */ _CFFI_OP(_CFFI_OP_FUNCTION, 179), // void()(cmark_node *)
+/* 146 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 147 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 148 */ _CFFI_OP(_CFFI_OP_FUNCTION, 179), // void()(cmark_node *, paka_node_stats *)
+/* 149 */ _CFFI_OP(_CFFI_OP_NOOP, 6),
+/* 150 */ _CFFI_OP(_CFFI_OP_POINTER, 176), // paka_node_stats *
+/* 151 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 152 */ _CFFI_OP(_CFFI_OP_FUNCTION, 179), // void()(cmark_parser *)
+/* 153 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
+/* 154 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 155 */ _CFFI_OP(_CFFI_OP_FUNCTION, 179), // void()(cmark_parser *, char const *, size_t)
+/* 156 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
+/* 157 */ _CFFI_OP(_CFFI_OP_NOOP, 1),
+/* 158 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 159 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 160 */ _CFFI_OP(_CFFI_OP_FUNCTION, 179), // void()(cmark_parser *, int, size_t)
+/* 161 */ _CFFI_OP(_CFFI_OP_NOOP, 15),
+/* 162 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 163 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 164 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 165 */ _CFFI_OP(_CFFI_OP_FUNCTION, 179), // void()(void *)
+/* 166 */ _CFFI_OP(_CFFI_OP_NOOP, 102),
+/* 167 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 168 */ _CFFI_OP(_CFFI_OP_POINTER, 169), // char *
+/* 169 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 2), // char
+/* 170 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 4), // cmark_iter
+/* 171 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 5), // cmark_node
+/* 172 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 6), // cmark_parser
+/* 173 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 0), // paka_fd_stats
+/* 174 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 1), // paka_fd_writer
+/* 175 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 2), // paka_memory_writer
+/* 176 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 3), // paka_node_stats
+/* 177 */ _CFFI_OP(_CFFI_OP_ARRAY, 2), // size_t[_cffi_array_len(((paka_node_stats *)0)->node_counts)]
+/* 178 */ (_cffi_opcode_t)(_cffi_array_len(((paka_node_stats *)0)->node_counts)),
+/* 179 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 0), // void
+};
+
+static int _cffi_const_CMARK_NO_DELIM(unsigned long long *o)
+{
+  int n = (CMARK_NO_DELIM) <= 0;
+  *o = (unsigned long long)((CMARK_NO_DELIM) | 0);  /* check that CMARK_NO_DELIM is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_PERIOD_DELIM(unsigned long long *o)
+{
+  int n = (CMARK_PERIOD_DELIM) <= 0;
+  *o = (unsigned long long)((CMARK_PERIOD_DELIM) | 0);  /* check that CMARK_PERIOD_DELIM is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_PAREN_DELIM(unsigned long long *o)
+{
+  int n = (CMARK_PAREN_DELIM) <= 0;
+  *o = (unsigned long long)((CMARK_PAREN_DELIM) | 0);  /* check that CMARK_PAREN_DELIM is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_EVENT_NONE(unsigned long long *o)
+{
+  int n = (CMARK_EVENT_NONE) <= 0;
+  *o = (unsigned long long)((CMARK_EVENT_NONE) | 0);  /* check that CMARK_EVENT_NONE is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_EVENT_DONE(unsigned long long *o)
+{
+  int n = (CMARK_EVENT_DONE) <= 0;
+  *o = (unsigned long long)((CMARK_EVENT_DONE) | 0);  /* check that CMARK_EVENT_DONE is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_EVENT_ENTER(unsigned long long *o)
+{
+  int n = (CMARK_EVENT_ENTER) <= 0;
+  *o = (unsigned long long)((CMARK_EVENT_ENTER) | 0);  /* check that CMARK_EVENT_ENTER is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_EVENT_EXIT(unsigned long long *o)
+{
+  int n = (CMARK_EVENT_EXIT) <= 0;
+  *o = (unsigned long long)((CMARK_EVENT_EXIT) | 0);  /* check that CMARK_EVENT_EXIT is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NO_LIST(unsigned long long *o)
+{
+  int n = (CMARK_NO_LIST) <= 0;
+  *o = (unsigned long long)((CMARK_NO_LIST) | 0);  /* check that CMARK_NO_LIST is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_BULLET_LIST(unsigned long long *o)
+{
+  int n = (CMARK_BULLET_LIST) <= 0;
+  *o = (unsigned long long)((CMARK_BULLET_LIST) | 0);  /* check that CMARK_BULLET_LIST is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_ORDERED_LIST(unsigned long long *o)
+{
+  int n = (CMARK_ORDERED_LIST) <= 0;
+  *o = (unsigned long long)((CMARK_ORDERED_LIST) | 0);  /* check that CMARK_ORDERED_LIST is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_NONE(unsigned long long *o)
+{
+  int n = (CMARK_NODE_NONE) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_NONE) | 0);  /* check that CMARK_NODE_NONE is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_DOCUMENT(unsigned long long *o)
+{
+  int n = (CMARK_NODE_DOCUMENT) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_DOCUMENT) | 0);  /* check that CMARK_NODE_DOCUMENT is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_BLOCK_QUOTE(unsigned long long *o)
+{
+  int n = (CMARK_NODE_BLOCK_QUOTE) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_BLOCK_QUOTE) | 0);  /* check that CMARK_NODE_BLOCK_QUOTE is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_LIST(unsigned long long *o)
+{
+  int n = (CMARK_NODE_LIST) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_LIST) | 0);  /* check that CMARK_NODE_LIST is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_ITEM(unsigned long long *o)
+{
+  int n = (CMARK_NODE_ITEM) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_ITEM) | 0);  /* check that CMARK_NODE_ITEM is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_CODE_BLOCK(unsigned long long *o)
+{
+  int n = (CMARK_NODE_CODE_BLOCK) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_CODE_BLOCK) | 0);  /* check that CMARK_NODE_CODE_BLOCK is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_HTML_BLOCK(unsigned long long *o)
+{
+  int n = (CMARK_NODE_HTML_BLOCK) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_HTML_BLOCK) | 0);  /* check that CMARK_NODE_HTML_BLOCK is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_CUSTOM_BLOCK(unsigned long long *o)
+{
+  int n = (CMARK_NODE_CUSTOM_BLOCK) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_CUSTOM_BLOCK) | 0);  /* check that CMARK_NODE_CUSTOM_BLOCK is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_PARAGRAPH(unsigned long long *o)
+{
+  int n = (CMARK_NODE_PARAGRAPH) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_PARAGRAPH) | 0);  /* check that CMARK_NODE_PARAGRAPH is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_HEADING(unsigned long long *o)
+{
+  int n = (CMARK_NODE_HEADING) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_HEADING) | 0);  /* check that CMARK_NODE_HEADING is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_THEMATIC_BREAK(unsigned long long *o)
+{
+  int n = (CMARK_NODE_THEMATIC_BREAK) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_THEMATIC_BREAK) | 0);  /* check that CMARK_NODE_THEMATIC_BREAK is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_FIRST_BLOCK(unsigned long long *o)
+{
+  int n = (CMARK_NODE_FIRST_BLOCK) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_FIRST_BLOCK) | 0);  /* check that CMARK_NODE_FIRST_BLOCK is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_LAST_BLOCK(unsigned long long *o)
+{
+  int n = (CMARK_NODE_LAST_BLOCK) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_LAST_BLOCK) | 0);  /* check that CMARK_NODE_LAST_BLOCK is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_TEXT(unsigned long long *o)
+{
+  int n = (CMARK_NODE_TEXT) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_TEXT) | 0);  /* check that CMARK_NODE_TEXT is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_SOFTBREAK(unsigned long long *o)
+{
+  int n = (CMARK_NODE_SOFTBREAK) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_SOFTBREAK) | 0);  /* check that CMARK_NODE_SOFTBREAK is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_LINEBREAK(unsigned long long *o)
+{
+  int n = (CMARK_NODE_LINEBREAK) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_LINEBREAK) | 0);  /* check that CMARK_NODE_LINEBREAK is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_CODE(unsigned long long *o)
+{
+  int n = (CMARK_NODE_CODE) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_CODE) | 0);  /* check that CMARK_NODE_CODE is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_HTML_INLINE(unsigned long long *o)
+{
+  int n = (CMARK_NODE_HTML_INLINE) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_HTML_INLINE) | 0);  /* check that CMARK_NODE_HTML_INLINE is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_CUSTOM_INLINE(unsigned long long *o)
+{
+  int n = (CMARK_NODE_CUSTOM_INLINE) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_CUSTOM_INLINE) | 0);  /* check that CMARK_NODE_CUSTOM_INLINE is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_EMPH(unsigned long long *o)
+{
+  int n = (CMARK_NODE_EMPH) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_EMPH) | 0);  /* check that CMARK_NODE_EMPH is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_STRONG(unsigned long long *o)
+{
+  int n = (CMARK_NODE_STRONG) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_STRONG) | 0);  /* check that CMARK_NODE_STRONG is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_LINK(unsigned long long *o)
+{
+  int n = (CMARK_NODE_LINK) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_LINK) | 0);  /* check that CMARK_NODE_LINK is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_IMAGE(unsigned long long *o)
+{
+  int n = (CMARK_NODE_IMAGE) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_IMAGE) | 0);  /* check that CMARK_NODE_IMAGE is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_FIRST_INLINE(unsigned long long *o)
+{
+  int n = (CMARK_NODE_FIRST_INLINE) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_FIRST_INLINE) | 0);  /* check that CMARK_NODE_FIRST_INLINE is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_NODE_LAST_INLINE(unsigned long long *o)
+{
+  int n = (CMARK_NODE_LAST_INLINE) <= 0;
+  *o = (unsigned long long)((CMARK_NODE_LAST_INLINE) | 0);  /* check that CMARK_NODE_LAST_INLINE is an integer */
+  return n;
+}
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_paka_fd_stats(paka_fd_stats *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->bytes_read) | 0);  /* check that 'paka_fd_stats.bytes_read' is an integer */
+  (void)((p->bytes_written) | 0);  /* check that 'paka_fd_stats.bytes_written' is an integer */
+}
+struct _cffi_align_typedef_paka_fd_stats { char x; paka_fd_stats y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_paka_fd_writer(paka_fd_writer *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->fd) | 0);  /* check that 'paka_fd_writer.fd' is an integer */
+  (void)((p->written) | 0);  /* check that 'paka_fd_writer.written' is an integer */
+}
+struct _cffi_align_typedef_paka_fd_writer { char x; paka_fd_writer y; };
+
+static int _cffi_const_PAKA_FORMAT_HTML(unsigned long long *o)
+{
+  int n = (PAKA_FORMAT_HTML) <= 0;
+  *o = (unsigned long long)((PAKA_FORMAT_HTML) | 0);  /* check that PAKA_FORMAT_HTML is an integer */
+  return n;
+}
+
+static int _cffi_const_PAKA_FORMAT_XML(unsigned long long *o)
+{
+  int n = (PAKA_FORMAT_XML) <= 0;
+  *o = (unsigned long long)((PAKA_FORMAT_XML) | 0);  /* check that PAKA_FORMAT_XML is an integer */
+  return n;
+}
+
+static int _cffi_const_PAKA_FORMAT_COMMONMARK(unsigned long long *o)
+{
+  int n = (PAKA_FORMAT_COMMONMARK) <= 0;
+  *o = (unsigned long long)((PAKA_FORMAT_COMMONMARK) | 0);  /* check that PAKA_FORMAT_COMMONMARK is an integer */
+  return n;
+}
+
+static int _cffi_const_PAKA_FORMAT_MAN(unsigned long long *o)
+{
+  int n = (PAKA_FORMAT_MAN) <= 0;
+  *o = (unsigned long long)((PAKA_FORMAT_MAN) | 0);  /* check that PAKA_FORMAT_MAN is an integer */
+  return n;
+}
+
+static int _cffi_const_PAKA_FORMAT_LATEX(unsigned long long *o)
+{
+  int n = (PAKA_FORMAT_LATEX) <= 0;
+  *o = (unsigned long long)((PAKA_FORMAT_LATEX) | 0);  /* check that PAKA_FORMAT_LATEX is an integer */
+  return n;
+}
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_paka_memory_writer(paka_memory_writer *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  { char * *tmp = &p->ptr; (void)tmp; }
+  (void)((p->size) | 0);  /* check that 'paka_memory_writer.size' is an integer */
+  (void)((p->written) | 0);  /* check that 'paka_memory_writer.written' is an integer */
+  { char * *tmp = &p->overflow; (void)tmp; }
+  (void)((p->overflow_capacity) | 0);  /* check that 'paka_memory_writer.overflow_capacity' is an integer */
+}
+struct _cffi_align_typedef_paka_memory_writer { char x; paka_memory_writer y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_paka_node_stats(paka_node_stats *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  { size_t *tmp = &p->node_counts[0]; (void)tmp; }
+  (void)((p->max_depth) | 0);  /* check that 'paka_node_stats.max_depth' is an integer */
+  (void)((p->literal_bytes) | 0);  /* check that 'paka_node_stats.literal_bytes' is an integer */
+  (void)((p->memory) | 0);  /* check that 'paka_node_stats.memory' is an integer */
+}
+struct _cffi_align_typedef_paka_node_stats { char x; paka_node_stats y; };
+
+static struct _cffi_externpy_s _cffi_externpy___paka_write_stream =
+  { "paka.cmark._cmark._paka_write_stream", (int)sizeof(int), 0, 0 };
+
+static int _paka_write_stream(void * a0, char const * a1, size_t a2)
+{
+  char a[24];
+  char *p = a;
+  *(void * *)(p + 0) = a0;
+  *(char const * *)(p + 8) = a1;
+  *(size_t *)(p + 16) = a2;
+  _cffi_call_python(&_cffi_externpy___paka_write_stream, p);
+  return *(int *)p;
+}
+
+static void _cffi_d_cmark_consolidate_text_nodes(cmark_node * x0)
+{
+  cmark_consolidate_text_nodes(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_consolidate_text_nodes(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { cmark_consolidate_text_nodes(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_cmark_consolidate_text_nodes _cffi_d_cmark_consolidate_text_nodes
+#endif
+
+static void _cffi_d_cmark_iter_free(cmark_iter * x0)
+{
+  cmark_iter_free(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_iter_free(PyObject *self, PyObject *arg0)
+{
+  cmark_iter * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_iter *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { cmark_iter_free(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_cmark_iter_free _cffi_d_cmark_iter_free
+#endif
+
+static cmark_event_type _cffi_d_cmark_iter_get_event_type(cmark_iter * x0)
+{
+  return cmark_iter_get_event_type(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_iter_get_event_type(PyObject *self, PyObject *arg0)
+{
+  cmark_iter * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_event_type result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_iter *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_iter_get_event_type(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(143));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_iter_get_event_type _cffi_d_cmark_iter_get_event_type
+#endif
+
+static cmark_node * _cffi_d_cmark_iter_get_node(cmark_iter * x0)
+{
+  return cmark_iter_get_node(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_iter_get_node(PyObject *self, PyObject *arg0)
+{
+  cmark_iter * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_iter *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_iter_get_node(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_iter_get_node _cffi_d_cmark_iter_get_node
+#endif
+
+static cmark_node * _cffi_d_cmark_iter_get_root(cmark_iter * x0)
+{
+  return cmark_iter_get_root(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_iter_get_root(PyObject *self, PyObject *arg0)
+{
+  cmark_iter * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_iter *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_iter_get_root(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_iter_get_root _cffi_d_cmark_iter_get_root
+#endif
+
+static cmark_iter * _cffi_d_cmark_iter_new(cmark_node * x0)
+{
+  return cmark_iter_new(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_iter_new(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_iter * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_iter_new(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(30));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_iter_new _cffi_d_cmark_iter_new
+#endif
+
+static cmark_event_type _cffi_d_cmark_iter_next(cmark_iter * x0)
+{
+  return cmark_iter_next(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_iter_next(PyObject *self, PyObject *arg0)
+{
+  cmark_iter * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_event_type result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_iter *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_iter_next(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(143));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_iter_next _cffi_d_cmark_iter_next
+#endif
+
+static void _cffi_d_cmark_iter_reset(cmark_iter * x0, cmark_node * x1, cmark_event_type x2)
+{
+  cmark_iter_reset(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_iter_reset(PyObject *self, PyObject *args)
+{
+  cmark_iter * x0;
+  cmark_node * x1;
+  cmark_event_type x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "cmark_iter_reset", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_iter *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  if (_cffi_to_c((char *)&x2, _cffi_type(143), arg2) < 0)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { cmark_iter_reset(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_cmark_iter_reset _cffi_d_cmark_iter_reset
+#endif
+
+static char * _cffi_d_cmark_markdown_to_html(char const * x0, size_t x1, int x2)
+{
+  return cmark_markdown_to_html(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_markdown_to_html(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "cmark_markdown_to_html", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_markdown_to_html(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(168));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_markdown_to_html _cffi_d_cmark_markdown_to_html
+#endif
+
+static int _cffi_d_cmark_node_append_child(cmark_node * x0, cmark_node * x1)
+{
+  return cmark_node_append_child(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_append_child(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  cmark_node * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_append_child", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_append_child(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_append_child _cffi_d_cmark_node_append_child
+#endif
+
+static cmark_node * _cffi_d_cmark_node_first_child(cmark_node * x0)
+{
+  return cmark_node_first_child(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_first_child(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_first_child(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_first_child _cffi_d_cmark_node_first_child
+#endif
+
+static void _cffi_d_cmark_node_free(cmark_node * x0)
+{
+  cmark_node_free(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_free(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { cmark_node_free(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_cmark_node_free _cffi_d_cmark_node_free
+#endif
+
+static int _cffi_d_cmark_node_get_end_column(cmark_node * x0)
+{
+  return cmark_node_get_end_column(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_end_column(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_end_column(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_end_column _cffi_d_cmark_node_get_end_column
+#endif
+
+static int _cffi_d_cmark_node_get_end_line(cmark_node * x0)
+{
+  return cmark_node_get_end_line(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_end_line(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_end_line(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_end_line _cffi_d_cmark_node_get_end_line
+#endif
+
+static char const * _cffi_d_cmark_node_get_fence_info(cmark_node * x0)
+{
+  return cmark_node_get_fence_info(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_fence_info(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char const * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_fence_info(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(1));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_fence_info _cffi_d_cmark_node_get_fence_info
+#endif
+
+static int _cffi_d_cmark_node_get_heading_level(cmark_node * x0)
+{
+  return cmark_node_get_heading_level(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_heading_level(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_heading_level(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_heading_level _cffi_d_cmark_node_get_heading_level
+#endif
+
+static cmark_delim_type _cffi_d_cmark_node_get_list_delim(cmark_node * x0)
+{
+  return cmark_node_get_list_delim(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_list_delim(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_delim_type result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_list_delim(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(77));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_list_delim _cffi_d_cmark_node_get_list_delim
+#endif
+
+static int _cffi_d_cmark_node_get_list_start(cmark_node * x0)
+{
+  return cmark_node_get_list_start(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_list_start(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_list_start(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_list_start _cffi_d_cmark_node_get_list_start
+#endif
+
+static int _cffi_d_cmark_node_get_list_tight(cmark_node * x0)
+{
+  return cmark_node_get_list_tight(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_list_tight(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_list_tight(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_list_tight _cffi_d_cmark_node_get_list_tight
+#endif
+
+static cmark_list_type _cffi_d_cmark_node_get_list_type(cmark_node * x0)
+{
+  return cmark_node_get_list_type(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_list_type(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_list_type result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_list_type(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(81));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_list_type _cffi_d_cmark_node_get_list_type
+#endif
+
+static char const * _cffi_d_cmark_node_get_literal(cmark_node * x0)
+{
+  return cmark_node_get_literal(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_literal(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char const * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_literal(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(1));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_literal _cffi_d_cmark_node_get_literal
+#endif
+
+static int _cffi_d_cmark_node_get_start_column(cmark_node * x0)
+{
+  return cmark_node_get_start_column(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_start_column(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_start_column(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_start_column _cffi_d_cmark_node_get_start_column
+#endif
+
+static int _cffi_d_cmark_node_get_start_line(cmark_node * x0)
+{
+  return cmark_node_get_start_line(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_start_line(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_start_line(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_start_line _cffi_d_cmark_node_get_start_line
+#endif
+
+static char const * _cffi_d_cmark_node_get_title(cmark_node * x0)
+{
+  return cmark_node_get_title(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_title(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char const * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_title(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(1));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_title _cffi_d_cmark_node_get_title
+#endif
+
+static cmark_node_type _cffi_d_cmark_node_get_type(cmark_node * x0)
+{
+  return cmark_node_get_type(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_type(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node_type result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_type(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_deref((char *)&result, _cffi_type(50));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_type _cffi_d_cmark_node_get_type
+#endif
+
+static char const * _cffi_d_cmark_node_get_type_string(cmark_node * x0)
+{
+  return cmark_node_get_type_string(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_type_string(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char const * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_type_string(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(1));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_type_string _cffi_d_cmark_node_get_type_string
+#endif
+
+static char const * _cffi_d_cmark_node_get_url(cmark_node * x0)
+{
+  return cmark_node_get_url(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_get_url(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char const * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_get_url(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(1));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_get_url _cffi_d_cmark_node_get_url
+#endif
+
+static int _cffi_d_cmark_node_insert_after(cmark_node * x0, cmark_node * x1)
+{
+  return cmark_node_insert_after(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_insert_after(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  cmark_node * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_insert_after", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_insert_after(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_insert_after _cffi_d_cmark_node_insert_after
+#endif
+
+static int _cffi_d_cmark_node_insert_before(cmark_node * x0, cmark_node * x1)
+{
+  return cmark_node_insert_before(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_insert_before(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  cmark_node * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_insert_before", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_insert_before(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_insert_before _cffi_d_cmark_node_insert_before
+#endif
+
+static cmark_node * _cffi_d_cmark_node_last_child(cmark_node * x0)
+{
+  return cmark_node_last_child(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_last_child(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_last_child(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_last_child _cffi_d_cmark_node_last_child
+#endif
+
+static cmark_node * _cffi_d_cmark_node_new(cmark_node_type x0)
+{
+  return cmark_node_new(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_new(PyObject *self, PyObject *arg0)
+{
+  cmark_node_type x0;
+  cmark_node * result;
+  PyObject *pyresult;
+
+  if (_cffi_to_c((char *)&x0, _cffi_type(50), arg0) < 0)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_new(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_new _cffi_d_cmark_node_new
+#endif
+
+static cmark_node * _cffi_d_cmark_node_next(cmark_node * x0)
+{
+  return cmark_node_next(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_next(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_next(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_next _cffi_d_cmark_node_next
+#endif
+
+static cmark_node * _cffi_d_cmark_node_parent(cmark_node * x0)
+{
+  return cmark_node_parent(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_parent(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_parent(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_parent _cffi_d_cmark_node_parent
+#endif
+
+static int _cffi_d_cmark_node_prepend_child(cmark_node * x0, cmark_node * x1)
+{
+  return cmark_node_prepend_child(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_prepend_child(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  cmark_node * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_prepend_child", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_prepend_child(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_prepend_child _cffi_d_cmark_node_prepend_child
+#endif
+
+static cmark_node * _cffi_d_cmark_node_previous(cmark_node * x0)
+{
+  return cmark_node_previous(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_previous(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_previous(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_previous _cffi_d_cmark_node_previous
+#endif
+
+static int _cffi_d_cmark_node_replace(cmark_node * x0, cmark_node * x1)
+{
+  return cmark_node_replace(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_replace(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  cmark_node * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_replace", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_replace(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_replace _cffi_d_cmark_node_replace
+#endif
+
+static int _cffi_d_cmark_node_set_fence_info(cmark_node * x0, char const * x1)
+{
+  return cmark_node_set_fence_info(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_set_fence_info(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  char const * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_set_fence_info", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_set_fence_info(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_set_fence_info _cffi_d_cmark_node_set_fence_info
+#endif
+
+static int _cffi_d_cmark_node_set_heading_level(cmark_node * x0, int x1)
+{
+  return cmark_node_set_heading_level(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_set_heading_level(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_set_heading_level", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_set_heading_level(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_set_heading_level _cffi_d_cmark_node_set_heading_level
+#endif
+
+static int _cffi_d_cmark_node_set_list_delim(cmark_node * x0, cmark_delim_type x1)
+{
+  return cmark_node_set_list_delim(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_set_list_delim(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  cmark_delim_type x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_set_list_delim", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  if (_cffi_to_c((char *)&x1, _cffi_type(77), arg1) < 0)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_set_list_delim(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_set_list_delim _cffi_d_cmark_node_set_list_delim
+#endif
+
+static int _cffi_d_cmark_node_set_list_start(cmark_node * x0, int x1)
+{
+  return cmark_node_set_list_start(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_set_list_start(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_set_list_start", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_set_list_start(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_set_list_start _cffi_d_cmark_node_set_list_start
+#endif
+
+static int _cffi_d_cmark_node_set_list_tight(cmark_node * x0, int x1)
+{
+  return cmark_node_set_list_tight(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_set_list_tight(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_set_list_tight", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_set_list_tight(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_set_list_tight _cffi_d_cmark_node_set_list_tight
+#endif
+
+static int _cffi_d_cmark_node_set_list_type(cmark_node * x0, cmark_list_type x1)
+{
+  return cmark_node_set_list_type(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_set_list_type(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  cmark_list_type x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_set_list_type", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  if (_cffi_to_c((char *)&x1, _cffi_type(81), arg1) < 0)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_set_list_type(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_set_list_type _cffi_d_cmark_node_set_list_type
+#endif
+
+static int _cffi_d_cmark_node_set_literal(cmark_node * x0, char const * x1)
+{
+  return cmark_node_set_literal(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_set_literal(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  char const * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_set_literal", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_set_literal(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_set_literal _cffi_d_cmark_node_set_literal
+#endif
+
+static int _cffi_d_cmark_node_set_title(cmark_node * x0, char const * x1)
+{
+  return cmark_node_set_title(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_set_title(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  char const * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_set_title", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_set_title(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_set_title _cffi_d_cmark_node_set_title
+#endif
+
+static int _cffi_d_cmark_node_set_url(cmark_node * x0, char const * x1)
+{
+  return cmark_node_set_url(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_set_url(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  char const * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_node_set_url", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_node_set_url(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_node_set_url _cffi_d_cmark_node_set_url
+#endif
+
+static void _cffi_d_cmark_node_unlink(cmark_node * x0)
+{
+  cmark_node_unlink(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_node_unlink(PyObject *self, PyObject *arg0)
+{
+  cmark_node * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { cmark_node_unlink(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_cmark_node_unlink _cffi_d_cmark_node_unlink
+#endif
+
+static cmark_node * _cffi_d_cmark_parse_document(char const * x0, size_t x1, int x2)
+{
+  return cmark_parse_document(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_parse_document(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "cmark_parse_document", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_parse_document(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_parse_document _cffi_d_cmark_parse_document
+#endif
+
+static void _cffi_d_cmark_parser_feed(cmark_parser * x0, char const * x1, size_t x2)
+{
+  cmark_parser_feed(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_parser_feed(PyObject *self, PyObject *args)
+{
+  cmark_parser * x0;
+  char const * x1;
+  size_t x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "cmark_parser_feed", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(15), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_parser *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(15), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { cmark_parser_feed(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_cmark_parser_feed _cffi_d_cmark_parser_feed
+#endif
+
+static cmark_node * _cffi_d_cmark_parser_finish(cmark_parser * x0)
+{
+  return cmark_parser_finish(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_parser_finish(PyObject *self, PyObject *arg0)
+{
+  cmark_parser * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(15), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_parser *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(15), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_parser_finish(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_parser_finish _cffi_d_cmark_parser_finish
+#endif
+
+static void _cffi_d_cmark_parser_free(cmark_parser * x0)
+{
+  cmark_parser_free(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_parser_free(PyObject *self, PyObject *arg0)
+{
+  cmark_parser * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(15), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_parser *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(15), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { cmark_parser_free(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_cmark_parser_free _cffi_d_cmark_parser_free
+#endif
+
+static cmark_parser * _cffi_d_cmark_parser_new(int x0)
+{
+  return cmark_parser_new(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_parser_new(PyObject *self, PyObject *arg0)
+{
+  int x0;
+  cmark_parser * result;
+  PyObject *pyresult;
+
+  x0 = _cffi_to_c_int(arg0, int);
+  if (x0 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_parser_new(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(15));
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_parser_new _cffi_d_cmark_parser_new
+#endif
+
+static char * _cffi_d_cmark_render_commonmark(cmark_node * x0, int x1, int x2)
+{
+  return cmark_render_commonmark(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_render_commonmark(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "cmark_render_commonmark", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_render_commonmark(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(168));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_render_commonmark _cffi_d_cmark_render_commonmark
+#endif
+
+static char * _cffi_d_cmark_render_html(cmark_node * x0, int x1)
+{
+  return cmark_render_html(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_render_html(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_render_html", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_render_html(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(168));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_render_html _cffi_d_cmark_render_html
+#endif
+
+static char * _cffi_d_cmark_render_latex(cmark_node * x0, int x1, int x2)
+{
+  return cmark_render_latex(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_render_latex(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "cmark_render_latex", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_render_latex(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(168));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_render_latex _cffi_d_cmark_render_latex
+#endif
+
+static char * _cffi_d_cmark_render_man(cmark_node * x0, int x1, int x2)
+{
+  return cmark_render_man(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_render_man(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "cmark_render_man", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_render_man(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(168));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_render_man _cffi_d_cmark_render_man
+#endif
+
+static char * _cffi_d_cmark_render_xml(cmark_node * x0, int x1)
+{
+  return cmark_render_xml(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_render_xml(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cmark_render_xml", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_render_xml(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(168));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_render_xml _cffi_d_cmark_render_xml
+#endif
+
+static char const * _cffi_d_cmark_version_string(void)
+{
+  return cmark_version_string();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cmark_version_string(PyObject *self, PyObject *noarg)
+{
+  char const * result;
+  PyObject *pyresult;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cmark_version_string(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(1));
+  return pyresult;
+}
+#else
+#  define _cffi_f_cmark_version_string _cffi_d_cmark_version_string
+#endif
+
+static void _cffi_d_free(void * x0)
+{
+  free(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_free(PyObject *self, PyObject *arg0)
+{
+  void * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(102), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(102), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { free(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_free _cffi_d_free
+#endif
+
+static char * _cffi_d_paka_escape_html(char const * x0, size_t x1, int x2)
+{
+  return paka_escape_html(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_escape_html(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "paka_escape_html", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_escape_html(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(168));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_escape_html _cffi_d_paka_escape_html
+#endif
+
+static char * _cffi_d_paka_markdown_to_html_inline(char const * x0, size_t x1, int x2)
+{
+  return paka_markdown_to_html_inline(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_markdown_to_html_inline(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "paka_markdown_to_html_inline", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_markdown_to_html_inline(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(168));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_markdown_to_html_inline _cffi_d_paka_markdown_to_html_inline
+#endif
+
+static void _cffi_d_paka_node_stats_collect(cmark_node * x0, paka_node_stats * x1)
+{
+  paka_node_stats_collect(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_node_stats_collect(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  paka_node_stats * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "paka_node_stats_collect", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(150), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (paka_node_stats *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(150), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { paka_node_stats_collect(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_paka_node_stats_collect _cffi_d_paka_node_stats_collect
+#endif
+
+static int _cffi_d_paka_node_truncate(cmark_node * x0, int x1, char const * x2)
+{
+  return paka_node_truncate(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_node_truncate(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  char const * x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "paka_node_truncate", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_node_truncate(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_node_truncate _cffi_d_paka_node_truncate
+#endif
+
+static cmark_node * _cffi_d_paka_parse_inline(char const * x0, size_t x1, int x2)
+{
+  return paka_parse_inline(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_parse_inline(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "paka_parse_inline", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_parse_inline(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_parse_inline _cffi_d_paka_parse_inline
+#endif
+
+static size_t _cffi_d_paka_parser_count_references(cmark_parser * x0)
+{
+  return paka_parser_count_references(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_parser_count_references(PyObject *self, PyObject *arg0)
+{
+  cmark_parser * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  size_t result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(15), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_parser *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(15), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_parser_count_references(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_parser_count_references _cffi_d_paka_parser_count_references
+#endif
+
+static int _cffi_d_paka_parser_feed_fd(cmark_parser * x0, int x1, size_t x2, size_t * x3)
+{
+  return paka_parser_feed_fd(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_parser_feed_fd(PyObject *self, PyObject *args)
+{
+  cmark_parser * x0;
+  int x1;
+  size_t x2;
+  size_t * x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "paka_parser_feed_fd", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(15), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_parser *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(15), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(115), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (size_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(115), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_parser_feed_fd(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_parser_feed_fd _cffi_d_paka_parser_feed_fd
+#endif
+
+static char * _cffi_d_paka_parser_markdown_to_html(cmark_parser * x0, char const * x1, size_t x2, int x3, size_t x4)
+{
+  return paka_parser_markdown_to_html(x0, x1, x2, x3, x4);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_parser_markdown_to_html(PyObject *self, PyObject *args)
+{
+  cmark_parser * x0;
+  char const * x1;
+  size_t x2;
+  int x3;
+  size_t x4;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+
+  if (!PyArg_UnpackTuple(args, "paka_parser_markdown_to_html", 5, 5, &arg0, &arg1, &arg2, &arg3, &arg4))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(15), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_parser *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(15), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, int);
+  if (x3 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_parser_markdown_to_html(x0, x1, x2, x3, x4); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(168));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_parser_markdown_to_html _cffi_d_paka_parser_markdown_to_html
+#endif
+
+static cmark_node * _cffi_d_paka_parser_parse(cmark_parser * x0, char const * x1, size_t x2, int x3, size_t x4)
+{
+  return paka_parser_parse(x0, x1, x2, x3, x4);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_parser_parse(PyObject *self, PyObject *args)
+{
+  cmark_parser * x0;
+  char const * x1;
+  size_t x2;
+  int x3;
+  size_t x4;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  cmark_node * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+
+  if (!PyArg_UnpackTuple(args, "paka_parser_parse", 5, 5, &arg0, &arg1, &arg2, &arg3, &arg4))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(15), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_parser *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(15), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, int);
+  if (x3 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_parser_parse(x0, x1, x2, x3, x4); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(6));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_parser_parse _cffi_d_paka_parser_parse
+#endif
+
+static void _cffi_d_paka_parser_reset(cmark_parser * x0, int x1, size_t x2)
+{
+  paka_parser_reset(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_parser_reset(PyObject *self, PyObject *args)
+{
+  cmark_parser * x0;
+  int x1;
+  size_t x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "paka_parser_reset", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(15), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_parser *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(15), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { paka_parser_reset(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_paka_parser_reset _cffi_d_paka_parser_reset
+#endif
+
+static char * _cffi_d_paka_render_commonmark_contents(cmark_node * x0, int x1, int x2)
+{
+  return paka_render_commonmark_contents(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_render_commonmark_contents(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  int x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  char * result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "paka_render_commonmark_contents", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_render_commonmark_contents(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(168));
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_render_commonmark_contents _cffi_d_paka_render_commonmark_contents
+#endif
+
+static int _cffi_d_paka_render_commonmark_to(cmark_node * x0, int x1, int x2, size_t x3, int(* x4)(void *, char const *, size_t), void * x5)
+{
+  return paka_render_commonmark_to(x0, x1, x2, x3, x4, x5);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_render_commonmark_to(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  int x2;
+  size_t x3;
+  int(* x4)(void *, char const *, size_t);
+  void * x5;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+
+  if (!PyArg_UnpackTuple(args, "paka_render_commonmark_to", 6, 6, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = (int(*)(void *, char const *, size_t))_cffi_to_c_pointer(arg4, _cffi_type(101));
+  if (x4 == (int(*)(void *, char const *, size_t))NULL && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(102), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(102), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_render_commonmark_to(x0, x1, x2, x3, x4, x5); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_render_commonmark_to _cffi_d_paka_render_commonmark_to
+#endif
+
+static int _cffi_d_paka_render_fd(int x0, int x1, paka_format x2, int x3, int x4, size_t x5, paka_fd_stats * x6)
+{
+  return paka_render_fd(x0, x1, x2, x3, x4, x5, x6);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_render_fd(PyObject *self, PyObject *args)
+{
+  int x0;
+  int x1;
+  paka_format x2;
+  int x3;
+  int x4;
+  size_t x5;
+  paka_fd_stats * x6;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+
+  if (!PyArg_UnpackTuple(args, "paka_render_fd", 7, 7, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6))
+    return NULL;
+
+  x0 = _cffi_to_c_int(arg0, int);
+  if (x0 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  if (_cffi_to_c((char *)&x2, _cffi_type(120), arg2) < 0)
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, int);
+  if (x3 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, int);
+  if (x4 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x5 = _cffi_to_c_int(arg5, size_t);
+  if (x5 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(124), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (paka_fd_stats *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(124), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_render_fd(x0, x1, x2, x3, x4, x5, x6); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_render_fd _cffi_d_paka_render_fd
+#endif
+
+static int _cffi_d_paka_render_html_to(cmark_node * x0, int x1, size_t x2, int(* x3)(void *, char const *, size_t), void * x4)
+{
+  return paka_render_html_to(x0, x1, x2, x3, x4);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_render_html_to(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  size_t x2;
+  int(* x3)(void *, char const *, size_t);
+  void * x4;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+
+  if (!PyArg_UnpackTuple(args, "paka_render_html_to", 5, 5, &arg0, &arg1, &arg2, &arg3, &arg4))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = (int(*)(void *, char const *, size_t))_cffi_to_c_pointer(arg3, _cffi_type(101));
+  if (x3 == (int(*)(void *, char const *, size_t))NULL && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(102), arg4, (char **)&x4);
+  if (datasize != 0) {
+    x4 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(102), arg4, (char **)&x4,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_render_html_to(x0, x1, x2, x3, x4); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_render_html_to _cffi_d_paka_render_html_to
+#endif
+
+static int _cffi_d_paka_render_latex_to(cmark_node * x0, int x1, int x2, size_t x3, int(* x4)(void *, char const *, size_t), void * x5)
+{
+  return paka_render_latex_to(x0, x1, x2, x3, x4, x5);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_render_latex_to(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  int x2;
+  size_t x3;
+  int(* x4)(void *, char const *, size_t);
+  void * x5;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+
+  if (!PyArg_UnpackTuple(args, "paka_render_latex_to", 6, 6, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = (int(*)(void *, char const *, size_t))_cffi_to_c_pointer(arg4, _cffi_type(101));
+  if (x4 == (int(*)(void *, char const *, size_t))NULL && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(102), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(102), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_render_latex_to(x0, x1, x2, x3, x4, x5); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_render_latex_to _cffi_d_paka_render_latex_to
+#endif
+
+static int _cffi_d_paka_render_man_to(cmark_node * x0, int x1, int x2, size_t x3, int(* x4)(void *, char const *, size_t), void * x5)
+{
+  return paka_render_man_to(x0, x1, x2, x3, x4, x5);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_render_man_to(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  int x2;
+  size_t x3;
+  int(* x4)(void *, char const *, size_t);
+  void * x5;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+
+  if (!PyArg_UnpackTuple(args, "paka_render_man_to", 6, 6, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, int);
+  if (x2 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = (int(*)(void *, char const *, size_t))_cffi_to_c_pointer(arg4, _cffi_type(101));
+  if (x4 == (int(*)(void *, char const *, size_t))NULL && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(102), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(102), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_render_man_to(x0, x1, x2, x3, x4, x5); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_render_man_to _cffi_d_paka_render_man_to
+#endif
+
+static int _cffi_d_paka_render_xml_to(cmark_node * x0, int x1, size_t x2, int(* x3)(void *, char const *, size_t), void * x4)
+{
+  return paka_render_xml_to(x0, x1, x2, x3, x4);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_render_xml_to(PyObject *self, PyObject *args)
+{
+  cmark_node * x0;
+  int x1;
+  size_t x2;
+  int(* x3)(void *, char const *, size_t);
+  void * x4;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+
+  if (!PyArg_UnpackTuple(args, "paka_render_xml_to", 5, 5, &arg0, &arg1, &arg2, &arg3, &arg4))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(6), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (cmark_node *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(6), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = (int(*)(void *, char const *, size_t))_cffi_to_c_pointer(arg3, _cffi_type(101));
+  if (x3 == (int(*)(void *, char const *, size_t))NULL && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(102), arg4, (char **)&x4);
+  if (datasize != 0) {
+    x4 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(102), arg4, (char **)&x4,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_render_xml_to(x0, x1, x2, x3, x4); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_render_xml_to _cffi_d_paka_render_xml_to
+#endif
+
+static int _cffi_d_paka_write_fd(void * x0, char const * x1, size_t x2)
+{
+  return paka_write_fd(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_write_fd(PyObject *self, PyObject *args)
+{
+  void * x0;
+  char const * x1;
+  size_t x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "paka_write_fd", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(102), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(102), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_write_fd(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_write_fd _cffi_d_paka_write_fd
+#endif
+
+static int _cffi_d_paka_write_memory(void * x0, char const * x1, size_t x2)
+{
+  return paka_write_memory(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_paka_write_memory(PyObject *self, PyObject *args)
+{
+  void * x0;
+  char const * x1;
+  size_t x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "paka_write_memory", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(102), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (void *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(102), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = paka_write_memory(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_paka_write_memory _cffi_d_paka_write_memory
+#endif
+
+static size_t _cffi_d_strlen(char const * x0)
+{
+  return strlen(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_strlen(PyObject *self, PyObject *arg0)
+{
+  char const * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  size_t result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(1), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(1), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = strlen(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_strlen _cffi_d_strlen
+#endif
+
+static int _cffi_const_CMARK_OPT_DEFAULT(unsigned long long *o)
+{
+  int n = (CMARK_OPT_DEFAULT) <= 0;
+  *o = (unsigned long long)((CMARK_OPT_DEFAULT) | 0);  /* check that CMARK_OPT_DEFAULT is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_OPT_HARDBREAKS(unsigned long long *o)
+{
+  int n = (CMARK_OPT_HARDBREAKS) <= 0;
+  *o = (unsigned long long)((CMARK_OPT_HARDBREAKS) | 0);  /* check that CMARK_OPT_HARDBREAKS is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_OPT_NOBREAKS(unsigned long long *o)
+{
+  int n = (CMARK_OPT_NOBREAKS) <= 0;
+  *o = (unsigned long long)((CMARK_OPT_NOBREAKS) | 0);  /* check that CMARK_OPT_NOBREAKS is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_OPT_SMART(unsigned long long *o)
+{
+  int n = (CMARK_OPT_SMART) <= 0;
+  *o = (unsigned long long)((CMARK_OPT_SMART) | 0);  /* check that CMARK_OPT_SMART is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_OPT_SOURCEPOS(unsigned long long *o)
+{
+  int n = (CMARK_OPT_SOURCEPOS) <= 0;
+  *o = (unsigned long long)((CMARK_OPT_SOURCEPOS) | 0);  /* check that CMARK_OPT_SOURCEPOS is an integer */
+  return n;
+}
+
+static int _cffi_const_CMARK_OPT_UNSAFE(unsigned long long *o)
+{
+  int n = (CMARK_OPT_UNSAFE) <= 0;
+  *o = (unsigned long long)((CMARK_OPT_UNSAFE) | 0);  /* check that CMARK_OPT_UNSAFE is an integer */
+  return n;
+}
+
+static const struct _cffi_global_s _cffi_globals[] = {
+  { "CMARK_BULLET_LIST", (void *)_cffi_const_CMARK_BULLET_LIST, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_EVENT_DONE", (void *)_cffi_const_CMARK_EVENT_DONE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_EVENT_ENTER", (void *)_cffi_const_CMARK_EVENT_ENTER, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_EVENT_EXIT", (void *)_cffi_const_CMARK_EVENT_EXIT, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_EVENT_NONE", (void *)_cffi_const_CMARK_EVENT_NONE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_BLOCK_QUOTE", (void *)_cffi_const_CMARK_NODE_BLOCK_QUOTE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_CODE", (void *)_cffi_const_CMARK_NODE_CODE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_CODE_BLOCK", (void *)_cffi_const_CMARK_NODE_CODE_BLOCK, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_CUSTOM_BLOCK", (void *)_cffi_const_CMARK_NODE_CUSTOM_BLOCK, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_CUSTOM_INLINE", (void *)_cffi_const_CMARK_NODE_CUSTOM_INLINE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_DOCUMENT", (void *)_cffi_const_CMARK_NODE_DOCUMENT, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_EMPH", (void *)_cffi_const_CMARK_NODE_EMPH, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_FIRST_BLOCK", (void *)_cffi_const_CMARK_NODE_FIRST_BLOCK, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_FIRST_INLINE", (void *)_cffi_const_CMARK_NODE_FIRST_INLINE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_HEADING", (void *)_cffi_const_CMARK_NODE_HEADING, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_HTML_BLOCK", (void *)_cffi_const_CMARK_NODE_HTML_BLOCK, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_HTML_INLINE", (void *)_cffi_const_CMARK_NODE_HTML_INLINE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_IMAGE", (void *)_cffi_const_CMARK_NODE_IMAGE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_ITEM", (void *)_cffi_const_CMARK_NODE_ITEM, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_LAST_BLOCK", (void *)_cffi_const_CMARK_NODE_LAST_BLOCK, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_LAST_INLINE", (void *)_cffi_const_CMARK_NODE_LAST_INLINE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_LINEBREAK", (void *)_cffi_const_CMARK_NODE_LINEBREAK, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_LINK", (void *)_cffi_const_CMARK_NODE_LINK, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_LIST", (void *)_cffi_const_CMARK_NODE_LIST, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_NONE", (void *)_cffi_const_CMARK_NODE_NONE, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_PARAGRAPH", (void *)_cffi_const_CMARK_NODE_PARAGRAPH, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_SOFTBREAK", (void *)_cffi_const_CMARK_NODE_SOFTBREAK, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_STRONG", (void *)_cffi_const_CMARK_NODE_STRONG, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_TEXT", (void *)_cffi_const_CMARK_NODE_TEXT, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NODE_THEMATIC_BREAK", (void *)_cffi_const_CMARK_NODE_THEMATIC_BREAK, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NO_DELIM", (void *)_cffi_const_CMARK_NO_DELIM, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_NO_LIST", (void *)_cffi_const_CMARK_NO_LIST, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_OPT_DEFAULT", (void *)_cffi_const_CMARK_OPT_DEFAULT, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "CMARK_OPT_HARDBREAKS", (void *)_cffi_const_CMARK_OPT_HARDBREAKS, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "CMARK_OPT_NOBREAKS", (void *)_cffi_const_CMARK_OPT_NOBREAKS, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "CMARK_OPT_SMART", (void *)_cffi_const_CMARK_OPT_SMART, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "CMARK_OPT_SOURCEPOS", (void *)_cffi_const_CMARK_OPT_SOURCEPOS, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "CMARK_OPT_UNSAFE", (void *)_cffi_const_CMARK_OPT_UNSAFE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "CMARK_ORDERED_LIST", (void *)_cffi_const_CMARK_ORDERED_LIST, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_PAREN_DELIM", (void *)_cffi_const_CMARK_PAREN_DELIM, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "CMARK_PERIOD_DELIM", (void *)_cffi_const_CMARK_PERIOD_DELIM, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "PAKA_FORMAT_COMMONMARK", (void *)_cffi_const_PAKA_FORMAT_COMMONMARK, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "PAKA_FORMAT_HTML", (void *)_cffi_const_PAKA_FORMAT_HTML, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "PAKA_FORMAT_LATEX", (void *)_cffi_const_PAKA_FORMAT_LATEX, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "PAKA_FORMAT_MAN", (void *)_cffi_const_PAKA_FORMAT_MAN, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "PAKA_FORMAT_XML", (void *)_cffi_const_PAKA_FORMAT_XML, _CFFI_OP(_CFFI_OP_ENUM, -1), (void *)0 },
+  { "_paka_write_stream", (void *)&_cffi_externpy___paka_write_stream, _CFFI_OP(_CFFI_OP_EXTERN_PYTHON, 101), (void *)_paka_write_stream },
+  { "cmark_consolidate_text_nodes", (void *)_cffi_f_cmark_consolidate_text_nodes, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 145), (void *)_cffi_d_cmark_consolidate_text_nodes },
+  { "cmark_iter_free", (void *)_cffi_f_cmark_iter_free, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 137), (void *)_cffi_d_cmark_iter_free },
+  { "cmark_iter_get_event_type", (void *)_cffi_f_cmark_iter_get_event_type, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 29), (void *)_cffi_d_cmark_iter_get_event_type },
+  { "cmark_iter_get_node", (void *)_cffi_f_cmark_iter_get_node, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 43), (void *)_cffi_d_cmark_iter_get_node },
+  { "cmark_iter_get_root", (void *)_cffi_f_cmark_iter_get_root, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 43), (void *)_cffi_d_cmark_iter_get_root },
+  { "cmark_iter_new", (void *)_cffi_f_cmark_iter_new, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 32), (void *)_cffi_d_cmark_iter_new },
+  { "cmark_iter_next", (void *)_cffi_f_cmark_iter_next, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 29), (void *)_cffi_d_cmark_iter_next },
+  { "cmark_iter_reset", (void *)_cffi_f_cmark_iter_reset, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 140), (void *)_cffi_d_cmark_iter_reset },
+  { "cmark_markdown_to_html", (void *)_cffi_f_cmark_markdown_to_html, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 0), (void *)_cffi_d_cmark_markdown_to_html },
+  { "cmark_node_append_child", (void *)_cffi_f_cmark_node_append_child, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 83), (void *)_cffi_d_cmark_node_append_child },
+  { "cmark_node_first_child", (void *)_cffi_f_cmark_node_first_child, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 46), (void *)_cffi_d_cmark_node_first_child },
+  { "cmark_node_free", (void *)_cffi_f_cmark_node_free, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 145), (void *)_cffi_d_cmark_node_free },
+  { "cmark_node_get_end_column", (void *)_cffi_f_cmark_node_get_end_column, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 68), (void *)_cffi_d_cmark_node_get_end_column },
+  { "cmark_node_get_end_line", (void *)_cffi_f_cmark_node_get_end_line, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 68), (void *)_cffi_d_cmark_node_get_end_line },
+  { "cmark_node_get_fence_info", (void *)_cffi_f_cmark_node_get_fence_info, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 21), (void *)_cffi_d_cmark_node_get_fence_info },
+  { "cmark_node_get_heading_level", (void *)_cffi_f_cmark_node_get_heading_level, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 68), (void *)_cffi_d_cmark_node_get_heading_level },
+  { "cmark_node_get_list_delim", (void *)_cffi_f_cmark_node_get_list_delim, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 26), (void *)_cffi_d_cmark_node_get_list_delim },
+  { "cmark_node_get_list_start", (void *)_cffi_f_cmark_node_get_list_start, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 68), (void *)_cffi_d_cmark_node_get_list_start },
+  { "cmark_node_get_list_tight", (void *)_cffi_f_cmark_node_get_list_tight, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 68), (void *)_cffi_d_cmark_node_get_list_tight },
+  { "cmark_node_get_list_type", (void *)_cffi_f_cmark_node_get_list_type, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 35), (void *)_cffi_d_cmark_node_get_list_type },
+  { "cmark_node_get_literal", (void *)_cffi_f_cmark_node_get_literal, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 21), (void *)_cffi_d_cmark_node_get_literal },
+  { "cmark_node_get_start_column", (void *)_cffi_f_cmark_node_get_start_column, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 68), (void *)_cffi_d_cmark_node_get_start_column },
+  { "cmark_node_get_start_line", (void *)_cffi_f_cmark_node_get_start_line, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 68), (void *)_cffi_d_cmark_node_get_start_line },
+  { "cmark_node_get_title", (void *)_cffi_f_cmark_node_get_title, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 21), (void *)_cffi_d_cmark_node_get_title },
+  { "cmark_node_get_type", (void *)_cffi_f_cmark_node_get_type, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 62), (void *)_cffi_d_cmark_node_get_type },
+  { "cmark_node_get_type_string", (void *)_cffi_f_cmark_node_get_type_string, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 21), (void *)_cffi_d_cmark_node_get_type_string },
+  { "cmark_node_get_url", (void *)_cffi_f_cmark_node_get_url, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 21), (void *)_cffi_d_cmark_node_get_url },
+  { "cmark_node_insert_after", (void *)_cffi_f_cmark_node_insert_after, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 83), (void *)_cffi_d_cmark_node_insert_after },
+  { "cmark_node_insert_before", (void *)_cffi_f_cmark_node_insert_before, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 83), (void *)_cffi_d_cmark_node_insert_before },
+  { "cmark_node_last_child", (void *)_cffi_f_cmark_node_last_child, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 46), (void *)_cffi_d_cmark_node_last_child },
+  { "cmark_node_new", (void *)_cffi_f_cmark_node_new, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 49), (void *)_cffi_d_cmark_node_new },
+  { "cmark_node_next", (void *)_cffi_f_cmark_node_next, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 46), (void *)_cffi_d_cmark_node_next },
+  { "cmark_node_parent", (void *)_cffi_f_cmark_node_parent, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 46), (void *)_cffi_d_cmark_node_parent },
+  { "cmark_node_prepend_child", (void *)_cffi_f_cmark_node_prepend_child, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 83), (void *)_cffi_d_cmark_node_prepend_child },
+  { "cmark_node_previous", (void *)_cffi_f_cmark_node_previous, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 46), (void *)_cffi_d_cmark_node_previous },
+  { "cmark_node_replace", (void *)_cffi_f_cmark_node_replace, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 83), (void *)_cffi_d_cmark_node_replace },
+  { "cmark_node_set_fence_info", (void *)_cffi_f_cmark_node_set_fence_info, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 71), (void *)_cffi_d_cmark_node_set_fence_info },
+  { "cmark_node_set_heading_level", (void *)_cffi_f_cmark_node_set_heading_level, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 87), (void *)_cffi_d_cmark_node_set_heading_level },
+  { "cmark_node_set_list_delim", (void *)_cffi_f_cmark_node_set_list_delim, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 75), (void *)_cffi_d_cmark_node_set_list_delim },
+  { "cmark_node_set_list_start", (void *)_cffi_f_cmark_node_set_list_start, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 87), (void *)_cffi_d_cmark_node_set_list_start },
+  { "cmark_node_set_list_tight", (void *)_cffi_f_cmark_node_set_list_tight, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 87), (void *)_cffi_d_cmark_node_set_list_tight },
+  { "cmark_node_set_list_type", (void *)_cffi_f_cmark_node_set_list_type, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 79), (void *)_cffi_d_cmark_node_set_list_type },
+  { "cmark_node_set_literal", (void *)_cffi_f_cmark_node_set_literal, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 71), (void *)_cffi_d_cmark_node_set_literal },
+  { "cmark_node_set_title", (void *)_cffi_f_cmark_node_set_title, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 71), (void *)_cffi_d_cmark_node_set_title },
+  { "cmark_node_set_url", (void *)_cffi_f_cmark_node_set_url, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 71), (void *)_cffi_d_cmark_node_set_url },
+  { "cmark_node_unlink", (void *)_cffi_f_cmark_node_unlink, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 145), (void *)_cffi_d_cmark_node_unlink },
+  { "cmark_parse_document", (void *)_cffi_f_cmark_parse_document, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 38), (void *)_cffi_d_cmark_parse_document },
+  { "cmark_parser_feed", (void *)_cffi_f_cmark_parser_feed, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 155), (void *)_cffi_d_cmark_parser_feed },
+  { "cmark_parser_finish", (void *)_cffi_f_cmark_parser_finish, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 52), (void *)_cffi_d_cmark_parser_finish },
+  { "cmark_parser_free", (void *)_cffi_f_cmark_parser_free, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 152), (void *)_cffi_d_cmark_parser_free },
+  { "cmark_parser_new", (void *)_cffi_f_cmark_parser_new, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 65), (void *)_cffi_d_cmark_parser_new },
+  { "cmark_render_commonmark", (void *)_cffi_f_cmark_render_commonmark, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 9), (void *)_cffi_d_cmark_render_commonmark },
+  { "cmark_render_html", (void *)_cffi_f_cmark_render_html, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 5), (void *)_cffi_d_cmark_render_html },
+  { "cmark_render_latex", (void *)_cffi_f_cmark_render_latex, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 9), (void *)_cffi_d_cmark_render_latex },
+  { "cmark_render_man", (void *)_cffi_f_cmark_render_man, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 9), (void *)_cffi_d_cmark_render_man },
+  { "cmark_render_xml", (void *)_cffi_f_cmark_render_xml, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 5), (void *)_cffi_d_cmark_render_xml },
+  { "cmark_version_string", (void *)_cffi_f_cmark_version_string, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 24), (void *)_cffi_d_cmark_version_string },
+  { "free", (void *)_cffi_f_free, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 165), (void *)_cffi_d_free },
+  { "paka_escape_html", (void *)_cffi_f_paka_escape_html, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 0), (void *)_cffi_d_paka_escape_html },
+  { "paka_markdown_to_html_inline", (void *)_cffi_f_paka_markdown_to_html_inline, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 0), (void *)_cffi_d_paka_markdown_to_html_inline },
+  { "paka_node_stats_collect", (void *)_cffi_f_paka_node_stats_collect, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 148), (void *)_cffi_d_paka_node_stats_collect },
+  { "paka_node_truncate", (void *)_cffi_f_paka_node_truncate, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 91), (void *)_cffi_d_paka_node_truncate },
+  { "paka_parse_inline", (void *)_cffi_f_paka_parse_inline, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 38), (void *)_cffi_d_paka_parse_inline },
+  { "paka_parser_count_references", (void *)_cffi_f_paka_parser_count_references, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 134), (void *)_cffi_d_paka_parser_count_references },
+  { "paka_parser_feed_fd", (void *)_cffi_f_paka_parser_feed_fd, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 111), (void *)_cffi_d_paka_parser_feed_fd },
+  { "paka_parser_markdown_to_html", (void *)_cffi_f_paka_parser_markdown_to_html, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 14), (void *)_cffi_d_paka_parser_markdown_to_html },
+  { "paka_parser_parse", (void *)_cffi_f_paka_parser_parse, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 55), (void *)_cffi_d_paka_parser_parse },
+  { "paka_parser_reset", (void *)_cffi_f_paka_parser_reset, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 160), (void *)_cffi_d_paka_parser_reset },
+  { "paka_render_commonmark_contents", (void *)_cffi_f_paka_render_commonmark_contents, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 9), (void *)_cffi_d_paka_render_commonmark_contents },
+  { "paka_render_commonmark_to", (void *)_cffi_f_paka_render_commonmark_to, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 96), (void *)_cffi_d_paka_render_commonmark_to },
+  { "paka_render_fd", (void *)_cffi_f_paka_render_fd, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 117), (void *)_cffi_d_paka_render_fd },
+  { "paka_render_html_to", (void *)_cffi_f_paka_render_html_to, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 104), (void *)_cffi_d_paka_render_html_to },
+  { "paka_render_latex_to", (void *)_cffi_f_paka_render_latex_to, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 96), (void *)_cffi_d_paka_render_latex_to },
+  { "paka_render_man_to", (void *)_cffi_f_paka_render_man_to, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 96), (void *)_cffi_d_paka_render_man_to },
+  { "paka_render_xml_to", (void *)_cffi_f_paka_render_xml_to, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 104), (void *)_cffi_d_paka_render_xml_to },
+  { "paka_write_fd", (void *)_cffi_f_paka_write_fd, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 126), (void *)_cffi_d_paka_write_fd },
+  { "paka_write_memory", (void *)_cffi_f_paka_write_memory, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 126), (void *)_cffi_d_paka_write_memory },
+  { "strlen", (void *)_cffi_f_strlen, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 131), (void *)_cffi_d_strlen },
+};
+
+static const struct _cffi_field_s _cffi_fields[] = {
+  { "bytes_read", offsetof(paka_fd_stats, bytes_read),
+                  sizeof(((paka_fd_stats *)0)->bytes_read),
+                  _CFFI_OP(_CFFI_OP_NOOP, 2) },
+  { "bytes_written", offsetof(paka_fd_stats, bytes_written),
+                     sizeof(((paka_fd_stats *)0)->bytes_written),
+                     _CFFI_OP(_CFFI_OP_NOOP, 2) },
+  { "fd", offsetof(paka_fd_writer, fd),
+          sizeof(((paka_fd_writer *)0)->fd),
+          _CFFI_OP(_CFFI_OP_NOOP, 3) },
+  { "written", offsetof(paka_fd_writer, written),
+               sizeof(((paka_fd_writer *)0)->written),
+               _CFFI_OP(_CFFI_OP_NOOP, 2) },
+  { "ptr", offsetof(paka_memory_writer, ptr),
+           sizeof(((paka_memory_writer *)0)->ptr),
+           _CFFI_OP(_CFFI_OP_NOOP, 168) },
+  { "size", offsetof(paka_memory_writer, size),
+            sizeof(((paka_memory_writer *)0)->size),
+            _CFFI_OP(_CFFI_OP_NOOP, 2) },
+  { "written", offsetof(paka_memory_writer, written),
+               sizeof(((paka_memory_writer *)0)->written),
+               _CFFI_OP(_CFFI_OP_NOOP, 2) },
+  { "overflow", offsetof(paka_memory_writer, overflow),
+                sizeof(((paka_memory_writer *)0)->overflow),
+                _CFFI_OP(_CFFI_OP_NOOP, 168) },
+  { "overflow_capacity", offsetof(paka_memory_writer, overflow_capacity),
+                         sizeof(((paka_memory_writer *)0)->overflow_capacity),
+                         _CFFI_OP(_CFFI_OP_NOOP, 2) },
+  { "node_counts", offsetof(paka_node_stats, node_counts),
+                   sizeof(((paka_node_stats *)0)->node_counts),
+                   _CFFI_OP(_CFFI_OP_NOOP, 177) },
+  { "max_depth", offsetof(paka_node_stats, max_depth),
+                 sizeof(((paka_node_stats *)0)->max_depth),
+                 _CFFI_OP(_CFFI_OP_NOOP, 2) },
+  { "literal_bytes", offsetof(paka_node_stats, literal_bytes),
+                     sizeof(((paka_node_stats *)0)->literal_bytes),
+                     _CFFI_OP(_CFFI_OP_NOOP, 2) },
+  { "memory", offsetof(paka_node_stats, memory),
+              sizeof(((paka_node_stats *)0)->memory),
+              _CFFI_OP(_CFFI_OP_NOOP, 2) },
+};
+
+static const struct _cffi_struct_union_s _cffi_struct_unions[] = {
+  { "$paka_fd_stats", 173, _CFFI_F_CHECK_FIELDS,
+    sizeof(paka_fd_stats), offsetof(struct _cffi_align_typedef_paka_fd_stats, y), 0, 2 },
+  { "$paka_fd_writer", 174, _CFFI_F_CHECK_FIELDS,
+    sizeof(paka_fd_writer), offsetof(struct _cffi_align_typedef_paka_fd_writer, y), 2, 2 },
+  { "$paka_memory_writer", 175, _CFFI_F_CHECK_FIELDS,
+    sizeof(paka_memory_writer), offsetof(struct _cffi_align_typedef_paka_memory_writer, y), 4, 5 },
+  { "$paka_node_stats", 176, 0,
+    sizeof(paka_node_stats), offsetof(struct _cffi_align_typedef_paka_node_stats, y), 9, 4 },
+  { "cmark_iter", 170, _CFFI_F_OPAQUE,
+    (size_t)-1, -1, -1, 0 /* opaque */ },
+  { "cmark_node", 171, _CFFI_F_OPAQUE,
+    (size_t)-1, -1, -1, 0 /* opaque */ },
+  { "cmark_parser", 172, _CFFI_F_OPAQUE,
+    (size_t)-1, -1, -1, 0 /* opaque */ },
+};
+
+static const struct _cffi_enum_s _cffi_enums[] = {
+  { "$cmark_delim_type", 77, _cffi_prim_int(sizeof(cmark_delim_type), ((cmark_delim_type)-1) <= 0),
+    "CMARK_NO_DELIM,CMARK_PERIOD_DELIM,CMARK_PAREN_DELIM" },
+  { "$cmark_event_type", 143, _cffi_prim_int(sizeof(cmark_event_type), ((cmark_event_type)-1) <= 0),
+    "CMARK_EVENT_NONE,CMARK_EVENT_DONE,CMARK_EVENT_ENTER,CMARK_EVENT_EXIT" },
+  { "$cmark_list_type", 81, _cffi_prim_int(sizeof(cmark_list_type), ((cmark_list_type)-1) <= 0),
+    "CMARK_NO_LIST,CMARK_BULLET_LIST,CMARK_ORDERED_LIST" },
+  { "$cmark_node_type", 50, _cffi_prim_int(sizeof(cmark_node_type), ((cmark_node_type)-1) <= 0),
+    "CMARK_NODE_NONE,CMARK_NODE_DOCUMENT,CMARK_NODE_BLOCK_QUOTE,CMARK_NODE_LIST,CMARK_NODE_ITEM,CMARK_NODE_CODE_BLOCK,"
+    "CMARK_NODE_HTML_BLOCK,CMARK_NODE_CUSTOM_BLOCK,CMARK_NODE_PARAGRAPH,CMARK_NODE_HEADING,CMARK_NODE_THEMATIC_BREAK,"
+    "CMARK_NODE_FIRST_BLOCK,CMARK_NODE_LAST_BLOCK,CMARK_NODE_TEXT,CMARK_NODE_SOFTBREAK,CMARK_NODE_LINEBREAK,"
+    "CMARK_NODE_CODE,CMARK_NODE_HTML_INLINE,CMARK_NODE_CUSTOM_INLINE,CMARK_NODE_EMPH,CMARK_NODE_STRONG,CMARK_NODE_LINK,"
+    "CMARK_NODE_IMAGE,CMARK_NODE_FIRST_INLINE,CMARK_NODE_LAST_INLINE" },
+  { "$paka_format", 120, _cffi_prim_int(sizeof(paka_format), ((paka_format)-1) <= 0),
+    "PAKA_FORMAT_HTML,PAKA_FORMAT_XML,PAKA_FORMAT_COMMONMARK,PAKA_FORMAT_MAN,PAKA_FORMAT_LATEX" },
+};
+
+static const struct _cffi_typename_s _cffi_typenames[] = {
+  { "cmark_delim_type", 77 },
+  { "cmark_event_type", 143 },
+  { "cmark_iter", 170 },
+  { "cmark_list_type", 81 },
+  { "cmark_node", 171 },
+  { "cmark_node_type", 50 },
+  { "cmark_parser", 172 },
+  { "paka_fd_stats", 173 },
+  { "paka_fd_writer", 174 },
+  { "paka_format", 120 },
+  { "paka_memory_writer", 175 },
+  { "paka_node_stats", 176 },
+  { "paka_write_fn", 101 },
+};
+
+static const struct _cffi_type_context_s _cffi_type_context = {
+  _cffi_types,
+  _cffi_globals,
+  _cffi_fields,
+  _cffi_struct_unions,
+  _cffi_enums,
+  _cffi_typenames,
+  125,  /* num_globals */
+  7,  /* num_struct_unions */
+  5,  /* num_enums */
+  13,  /* num_typenames */
+  NULL,  /* no includes */
+  180,  /* num_types */
+  1,  /* flags */
+};
+
+#ifdef __GNUC__
+#  pragma GCC visibility push(default)  /* for -fvisibility= */
+#endif
+
+#ifdef PYPY_VERSION
+PyMODINIT_FUNC
+_cffi_pypyinit__cmark(const void *p[])
+{
+    if (((intptr_t)p[0]) >= 0x0A03) {
+        _cffi_call_python_org = (void(*)(struct _cffi_externpy_s *, char *))p[1];
+    }
+    p[0] = (const void *)0x2601;
+    p[1] = &_cffi_type_context;
+    return NULL;
+}
+#  ifdef _MSC_VER
+     PyMODINIT_FUNC
+     PyInit__cmark(void) { return NULL; }
+#  endif
+#else
+PyMODINIT_FUNC
+PyInit__cmark(void)
+{
+  return _cffi_init("paka.cmark._cmark", 0x2601, &_cffi_type_context);
+}
+#endif
+
+#ifdef __GNUC__
+#  pragma GCC visibility pop
+#endif
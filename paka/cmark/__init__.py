@@ -1,11 +1,33 @@
 """Lightweight `cmark`_ wrapper.
 
+All functions can be called from many threads at once: C library
+keeps no mutable global state, the GIL is released while it runs, and
+global state of this package (metrics, slow hook) is swapped atomically
+or guarded by locks. Free-threaded (no GIL) builds of CPython are not
+tested, and extension module does not declare that it can run without
+the GIL, so importing it there may enable the GIL. Single
+:py:class:`Document` (and its nodes) can be rendered from many threads
+at once too, as rendering does not modify the tree.
+:py:class:`StatsProfile` is not thread-safe (use one per thread).
+
 .. _cmark: https://github.com/commonmark/cmark
 
 """
+# pylint: disable=too-many-lines
+
+import os as _os
+import json as _json
+import zlib as _zlib
+import random as _random
+import hashlib as _hashlib
+import importlib as _importlib
+import threading as _threading
+import collections as _collections
+from time import perf_counter as _perf_counter
 
-from paka.cmark._cmark import ffi as _ffi
-from paka.cmark import lowlevel as _lowlevel
+from paka.cmark._cmark import ffi as _ffi, lib as _lib
+from paka.cmark import lowlevel as _lowlevel, metrics as _metrics
+from paka.cmark.corpus import render_corpus  # noqa: F401
 
 
 # pylint: disable=useless-object-inheritance
@@ -40,6 +62,263 @@ def _add_smart_to_opts(smart, opts):
     return opts
 
 
+SlowCall = _collections.namedtuple(
+    "SlowCall",
+    "entry_point options input_bytes digest parse_seconds render_seconds")
+SlowCall.__doc__ = """Information about slow call passed to slow hook.
+
+Attributes are: name of function (e.g. ``"to_html"``), :ref:`options
+<options>` (as passed to C library), size of input (in bytes of UTF-8),
+SHA-256 hex digest of input, and durations of parse and render phases
+(in seconds).
+
+"""
+
+
+class _SlowHook(object):  # pylint: disable=too-few-public-methods
+    """Threshold, callback and reservoir of slow inputs."""
+
+    def __init__(self, threshold_seconds, callback, keep):
+        self.threshold_seconds = threshold_seconds
+        self.callback = callback
+        self.keep = keep
+        self.inputs = []
+        self._seen = 0
+        self._lock = _threading.Lock()
+        self._random = _random.Random()
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def observe(
+            self, entry_point, opts, text_bytes, parse_seconds,
+            render_seconds):
+        """Report call if any of its phases was too slow."""
+        if max(parse_seconds, render_seconds) <= self.threshold_seconds:
+            return
+        call = SlowCall(
+            entry_point, opts, len(text_bytes),
+            _hashlib.sha256(text_bytes).hexdigest(), parse_seconds,
+            render_seconds)
+        if self.keep:
+            # Reservoir sampling: every slow input seen so far has
+            # the same chance to be kept.
+            with self._lock:
+                self._seen += 1
+                if len(self.inputs) < self.keep:
+                    self.inputs.append((call, text_bytes))
+                else:
+                    index = self._random.randrange(self._seen)
+                    if index < self.keep:
+                        self.inputs[index] = (call, text_bytes)
+        if self.callback is not None:
+            self.callback(call)
+
+
+_slow_hook = None  # pylint: disable=invalid-name
+
+
+# Capacity (in bytes) above which line buffers of reused parsers
+# are freed (so that single huge document does not pin memory).
+_PARSER_BUFFER_LIMIT = 1 << 16
+
+# Parser reused by all calls in thread (it is used only within single
+# C call, so calls can not interleave even when re-entered).
+_parsers = _threading.local()
+
+
+def _free_parser(parser):
+    # Reset parser owns empty document node.
+    _lowlevel.node_free(_lowlevel.parser_finish(parser))
+    _lowlevel.parser_free(parser)
+
+
+def _get_parser():
+    try:
+        return _parsers.parser
+    except AttributeError:
+        parser = _parsers.parser = _ffi.gc(
+            _lowlevel.parser_new(_lowlevel.OPT_DEFAULT), _free_parser)
+        return parser
+
+
+def _parse(text_bytes, length, opts):
+    """Parse document with parser of current thread."""
+    return _lowlevel.parser_parse(
+        _get_parser(), text_bytes, length, opts, _PARSER_BUFFER_LIMIT)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _measure(entry_point, text_bytes, opts, parse, render, *args):
+    """Parse and render, reporting durations of both phases."""
+    started = _perf_counter()
+    root = parse(text_bytes, len(text_bytes), opts)
+    parsed = _perf_counter()
+    try:
+        c_string = render(root, opts, *args)
+    finally:
+        _lowlevel.node_free(root)
+    output_bytes = _ffi.string(c_string)
+    _lib.free(c_string)
+    parse_seconds = parsed - started
+    render_seconds = _perf_counter() - parsed
+    recorder = _metrics._recorder  # pylint: disable=protected-access
+    if recorder is not None:
+        recorder.observe(
+            entry_point, len(text_bytes), len(output_bytes), parse_seconds,
+            render_seconds)
+    slow_hook = _slow_hook
+    if slow_hook is not None:
+        slow_hook.observe(
+            entry_point, opts, text_bytes, parse_seconds, render_seconds)
+    return output_bytes.decode(_lowlevel.ENCODING)
+
+
+def _now():
+    """Return time for metrics, or None if they are not recorded."""
+    # pylint: disable-next=protected-access
+    return None if _metrics._recorder is None else _perf_counter()
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _record(entry_point, input_bytes, output_bytes, started, parsed, ended):
+    """Record call timed with _now (unless metrics were toggled meanwhile)."""
+    recorder = _metrics._recorder  # pylint: disable=protected-access
+    if recorder is not None and None not in (started, parsed, ended):
+        recorder.observe(
+            entry_point, input_bytes, output_bytes, parsed - started,
+            ended - parsed)
+
+
+LOW_MEMORY_THRESHOLD = 1 << 24
+"""Length (in characters) from which text is converted in low-memory mode.
+
+Such text is encoded and fed to parser in slices (instead of being
+encoded whole), tree of nodes is freed before output is decoded, and
+output is decoded straight from C string. For 100 MiB text, memory
+allocated by Python objects at peak drops from about 6 to 4 sizes of
+text (mostly returned string), and peak resident set size from 9--11
+to 8 sizes of text (tree of nodes takes most of it), see
+``python -m benchmarks.peak_memory``. Applies to all functions
+converting text, except :py:func:`to_html_inline`, and not when slow
+hook is set. May be changed (``None`` disables low-memory mode).
+
+"""
+
+# Number of characters encoded and fed to parser at once in low-memory
+# mode.
+_FEED_SLICE_LENGTH = 1 << 20
+
+
+def _is_huge(text):
+    return LOW_MEMORY_THRESHOLD is not None and (
+        len(text) >= LOW_MEMORY_THRESHOLD)
+
+
+def _convert_low_memory(entry_point, text, opts, render, *args):
+    """Parse text fed in slices, render it, and free tree before decoding."""
+    started = _now()
+    input_bytes = 0
+    # Parser of its own (not one of thread), as Python code runs
+    # between feeds.
+    parser = _lowlevel.parser_new(opts)
+    try:
+        for start in range(0, len(text), _FEED_SLICE_LENGTH):
+            text_bytes = _lowlevel.text_to_c(
+                text[start:start + _FEED_SLICE_LENGTH])
+            _lowlevel.parser_feed(parser, text_bytes, len(text_bytes))
+            input_bytes += len(text_bytes)
+            text_bytes = None
+        root = _lowlevel.parser_finish(parser)
+    finally:
+        _lowlevel.parser_free(parser)
+    parsed = _now()
+    try:
+        c_string = render(root, opts, *args)
+    finally:
+        _lowlevel.node_free(root)
+    try:
+        output_bytes = _lib.strlen(c_string)
+        _record(
+            entry_point, input_bytes, output_bytes, started, parsed, _now())
+        return str(_ffi.buffer(c_string, output_bytes), _lowlevel.ENCODING)
+    finally:
+        _lib.free(c_string)
+
+
+def _convert(entry_point, text, opts, render, *args):
+    """Parse text as document and render it."""
+    # Slow hook needs whole input, so low-memory mode is not used.
+    if _slow_hook is None and _is_huge(text):
+        return _convert_low_memory(entry_point, text, opts, render, *args)
+    text_bytes = _lowlevel.text_to_c(text)
+    # pylint: disable-next=protected-access
+    if _metrics._recorder is not None or _slow_hook is not None:
+        return _measure(
+            entry_point, text_bytes, opts, _parse, render, *args)
+    parsed = _parse(text_bytes, len(text_bytes), opts)
+    root = _ffi.gc(parsed, _lowlevel.node_free)
+    return _lowlevel.text_from_c(render(root, opts, *args), free=True)
+
+
+def set_slow_hook(threshold_ms, callback=None, keep=0):
+    """Report calls that take longer than threshold.
+
+    After hook is set, if parse or render phase of call of
+    :py:func:`to_html` (or other function converting text) takes more
+    than ``threshold_ms`` milliseconds, ``callback`` is called with
+    :py:class:`SlowCall` (right after conversion, in the same thread).
+
+    Parameters
+    ----------
+    threshold_ms: float or None
+        Threshold in milliseconds. If None, hook is removed.
+    callback: callable or None
+        Called with :py:class:`SlowCall`.
+    keep: int
+        How many slow inputs to keep for later replay (random sample
+        of all slow inputs, see :py:func:`get_slow_inputs`).
+
+    """
+    global _slow_hook  # pylint: disable=global-statement,invalid-name
+    if threshold_ms is None:
+        _slow_hook = None
+    else:
+        _slow_hook = _SlowHook(threshold_ms / 1000.0, callback, keep)
+
+
+def get_slow_inputs():
+    """Return inputs kept by slow hook (see :py:func:`set_slow_hook`).
+
+    Returns
+    -------
+    list
+        Pairs of :py:class:`SlowCall` and input text.
+
+    """
+    slow_hook = _slow_hook
+    if slow_hook is None:
+        return []
+    return [
+        (call, text_bytes.decode(_lowlevel.ENCODING))
+        for call, text_bytes in list(slow_hook.inputs)]
+
+
+def dump_slow_inputs(file):
+    """Write kept slow inputs to file as JSON lines.
+
+    Lines have ``"text"`` key (and keys of :py:class:`SlowCall`), so
+    the file may be replayed with
+    ``python -m benchmarks.pathological --findings FILE``.
+
+    Parameters
+    ----------
+    file
+        File object opened for writing text.
+
+    """
+    for call, text in get_slow_inputs():
+        file.write(_json.dumps(dict(call._asdict(), text=text)) + "\n")
+
+
 def get_version():
     """Return version of underlying C library.
 
@@ -84,12 +363,125 @@ def to_html(text, breaks=False, safe=True, sourcepos=False, smart=False):
     opts = _add_smart_to_opts(smart, opts)
     if not safe:
         opts |= _lowlevel.OPT_UNSAFE
+    if _is_huge(text):
+        return _convert("to_html", text, opts, _lowlevel.render_html)
     text_bytes = _lowlevel.text_to_c(text)
+    # pylint: disable-next=protected-access
+    if _metrics._recorder is not None or _slow_hook is not None:
+        return _measure(
+            "to_html", text_bytes, opts, _parse, _lowlevel.render_html)
     return _lowlevel.text_from_c(
-        _lowlevel.markdown_to_html(text_bytes, len(text_bytes), opts),
+        _lowlevel.parser_markdown_to_html(
+            _get_parser(), text_bytes, len(text_bytes), opts,
+            _PARSER_BUFFER_LIMIT),
         free=True)
 
 
+def to_html_inline(text, breaks=False, safe=True, smart=False):
+    r"""Convert inline markup to HTML, without block wrappers.
+
+    Block structure is not detected at all: ``text`` is parsed as
+    contents of single paragraph, and output has no ``<p>`` around it.
+    This is faster than :py:func:`to_html` for short strings
+    (titles, table cells, etc.), and for single line of text result is
+    the same as of :py:func:`to_html` without ``<p>`` and ``</p>\n``.
+
+    Parameters
+    ----------
+    text: str
+        Text marked up with `CommonMark <http://commonmark.org>`_
+        inline elements (emphasis, code spans, links, etc.).
+    breaks: bool or LineBreaks
+        How line breaks in text will be rendered. If ``True``,
+        ``"soft"``, or :py:attr:`LineBreaks.soft` -- as newlines
+        (``\n``). If ``False`` -- as spaces. If ``"hard"`` or
+        :py:attr:`LineBreaks.hard` -- as ``<br />``\ s.
+    safe: bool
+        When ``True``, replace raw HTML (that was present in ``text``)
+        with HTML comment.
+    smart: bool
+        Use :py:data:`~paka.cmark.lowlevel.OPT_SMART`.
+
+    Returns
+    -------
+    str
+        HTML
+
+    """
+    opts = _add_smart_to_opts(
+        smart, _add_breaks_to_opts(breaks, _lowlevel.OPT_DEFAULT))
+    if not safe:
+        opts |= _lowlevel.OPT_UNSAFE
+    text_bytes = _lowlevel.text_to_c(text)
+    # pylint: disable-next=protected-access
+    if _metrics._recorder is not None or _slow_hook is not None:
+        return _measure(
+            "to_html_inline", text_bytes, opts, _lowlevel.parse_inline,
+            _lowlevel.render_html)
+    return _lowlevel.text_from_c(
+        _lowlevel.markdown_to_html_inline(text_bytes, len(text_bytes), opts),
+        free=True)
+
+
+_INT_MAX = (1 << 31) - 1
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def excerpt(
+        text, max_chars, ellipsis="\u2026", breaks=False, safe=True,
+        sourcepos=False, smart=False):
+    r"""Convert beginning of markup to HTML.
+
+    Rendering stops after ``max_chars`` visible characters (code points
+    of text, inline code and code blocks), and all elements that were
+    open at that point are closed properly. Nothing that follows is
+    kept (not even thematic breaks, HTML blocks or images).
+
+    Parameters
+    ----------
+    text: str
+        Text marked up with `CommonMark <http://commonmark.org>`_.
+    max_chars: int
+        Maximum number of visible characters in result (negative is
+        the same as ``0``, that is, nothing is rendered unless text is
+        empty).
+    ellipsis: str
+        Appended to last visible text if it was truncated
+        (does not count towards ``max_chars``).
+    breaks: bool or LineBreaks
+        How line breaks in text will be rendered (see :py:func:`to_html`).
+    safe: bool
+        When ``True``, replace raw HTML (that was present in ``text``)
+        with HTML comment.
+    sourcepos: bool
+        If ``True``, add ``data-sourcepos`` attribute to block elements
+        (that is, use ``CMARK_OPT_SOURCEPOS``).
+    smart: bool
+        Use :py:data:`~paka.cmark.lowlevel.OPT_SMART`.
+
+    Returns
+    -------
+    tuple
+        HTML and bool (was text truncated or not).
+
+    """
+    opts = _add_sourcepos_to_opts(
+        sourcepos, _add_breaks_to_opts(breaks, _lowlevel.OPT_DEFAULT))
+    opts = _add_smart_to_opts(smart, opts)
+    if not safe:
+        opts |= _lowlevel.OPT_UNSAFE
+    # C library takes int (and no document has more characters).
+    max_chars = min(max(max_chars, 0), _INT_MAX)
+    truncated = []
+
+    def _truncate_and_render(root, opts):
+        truncated.append(_lowlevel.node_truncate(
+            root, max_chars, _lowlevel.text_to_c(ellipsis)))
+        return _lowlevel.render_html(root, opts)
+    html = _convert("excerpt", text, opts, _truncate_and_render)
+    return html, bool(truncated[0])
+
+
 def to_xml(text, sourcepos=False, smart=False):
     """Convert markup to XML.
 
@@ -111,10 +503,7 @@ def to_xml(text, sourcepos=False, smart=False):
     """
     opts = _add_smart_to_opts(
         smart, _add_sourcepos_to_opts(sourcepos, _lowlevel.OPT_DEFAULT))
-    text_bytes = _lowlevel.text_to_c(text)
-    parsed = _lowlevel.parse_document(text_bytes, len(text_bytes), opts)
-    root = _ffi.gc(parsed, _lowlevel.node_free)
-    return _lowlevel.text_from_c(_lowlevel.render_xml(root, opts), free=True)
+    return _convert("to_xml", text, opts, _lowlevel.render_xml)
 
 
 def to_commonmark(text, breaks=False, width=0, smart=False):
@@ -145,12 +534,8 @@ def to_commonmark(text, breaks=False, width=0, smart=False):
     """
     opts = _add_smart_to_opts(
         smart, _add_breaks_to_opts(breaks, _lowlevel.OPT_DEFAULT))
-    text_bytes = _lowlevel.text_to_c(text)
-    parsed = _lowlevel.parse_document(text_bytes, len(text_bytes), opts)
-    root = _ffi.gc(parsed, _lowlevel.node_free)
-    return _lowlevel.text_from_c(
-        _lowlevel.render_commonmark(root, opts, width),
-        free=True)
+    return _convert(
+        "to_commonmark", text, opts, _lowlevel.render_commonmark, width)
 
 
 def to_man(text, breaks=False, width=0, smart=False):
@@ -181,12 +566,7 @@ def to_man(text, breaks=False, width=0, smart=False):
     """
     opts = _add_smart_to_opts(
         smart, _add_breaks_to_opts(breaks, _lowlevel.OPT_DEFAULT))
-    text_bytes = _lowlevel.text_to_c(text)
-    parsed = _lowlevel.parse_document(text_bytes, len(text_bytes), opts)
-    root = _ffi.gc(parsed, _lowlevel.node_free)
-    return _lowlevel.text_from_c(
-        _lowlevel.render_man(root, opts, width),
-        free=True)
+    return _convert("to_man", text, opts, _lowlevel.render_man, width)
 
 
 def to_latex(text, breaks=False, width=0, smart=False):
@@ -216,9 +596,941 @@ def to_latex(text, breaks=False, width=0, smart=False):
     """
     opts = _add_smart_to_opts(
         smart, _add_breaks_to_opts(breaks, _lowlevel.OPT_DEFAULT))
-    text_bytes = _lowlevel.text_to_c(text)
-    parsed = _lowlevel.parse_document(text_bytes, len(text_bytes), opts)
-    root = _ffi.gc(parsed, _lowlevel.node_free)
-    return _lowlevel.text_from_c(
-        _lowlevel.render_latex(root, opts, width),
-        free=True)
+    return _convert("to_latex", text, opts, _lowlevel.render_latex, width)
+
+
+# Formats of render_into and render_to (and if their low-level render
+# functions take width).
+_RENDER_FORMATS = {
+    "html": False, "xml": False, "commonmark": True, "man": True,
+    "latex": True}
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _render_source(
+        source, format, suffix, extra_args, breaks, safe, sourcepos, smart,
+        width):
+    """Call low-level render function of format on text or node.
+
+    Return its result, size of text (0 for node), and times of start
+    and of end of parsing (see _now).
+
+    """
+    # pylint: disable=redefined-builtin,too-many-locals
+    try:
+        takes_width = _RENDER_FORMATS[format]
+    except KeyError:
+        raise ValueError("unknown format: " + repr(format)) from None
+    render = getattr(_lowlevel, "render_" + format + suffix)
+    args = ((width,) if takes_width else ()) + extra_args
+    if isinstance(source, Node):
+        if sourcepos or smart:
+            raise ValueError(
+                "sourcepos and smart can not be used with parsed nodes")
+        # pylint: disable-next=protected-access
+        opts = _add_breaks_to_opts(breaks, source._opts)
+    else:
+        opts = _add_smart_to_opts(smart, _add_sourcepos_to_opts(
+            sourcepos, _add_breaks_to_opts(breaks, _lowlevel.OPT_DEFAULT)))
+    if not safe:
+        opts |= _lowlevel.OPT_UNSAFE
+    if isinstance(source, Node):
+        started = _now()
+        # pylint: disable-next=protected-access
+        return render(source._c_node, opts, *args), 0, started, started
+    text_bytes = source
+    if not isinstance(text_bytes, bytes):
+        text_bytes = _lowlevel.text_to_c(source)
+    started = _now()
+    root = _parse(text_bytes, len(text_bytes), opts)
+    parsed = _now()
+    try:
+        return render(root, opts, *args), len(text_bytes), started, parsed
+    finally:
+        _lowlevel.node_free(root)
+
+
+# Size (in bytes) of chunks renderer passes to render_into (small, so
+# that they are copied into its buffer while still in CPU cache).
+_RENDER_INTO_CHUNK_SIZE = 1 << 12
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_into(
+        source, buf, format="html", size_hint=0, breaks=False, safe=True,
+        sourcepos=False, smart=False, width=0):
+    # pylint: disable=redefined-builtin,too-many-locals
+    """Render document into reusable buffer, return length of output.
+
+    Renderer writes output (UTF-8) right into ``buf`` in small chunks
+    as it traverses tree of nodes, without building whole output in
+    separate C string and without creating intermediate ``bytes`` and
+    ``str`` objects. Only output that does not fit into ``buf`` is
+    kept aside (and copied once buffer is grown). Buffer is grown only
+    then (and is never shrunk), so reusing the same buffer in loop
+    costs no allocations of Python objects in steady state.
+
+    Parameters
+    ----------
+    source: str, bytes or Node
+        Text marked up with CommonMark (``bytes`` must be UTF-8, and
+        are not copied), or :py:class:`Node` (e.g. :py:class:`Document`)
+        to render.
+    buf: bytearray
+        Buffer to render into (output is in ``buf[:length]``, the
+        rest of it is left as it was).
+    format: str
+        One of ``"html"`` (default), ``"xml"``, ``"commonmark"``,
+        ``"man"`` and ``"latex"``.
+    size_hint: int
+        Expected size of output in bytes: when buffer has to grow,
+        it grows at least to this size.
+    breaks, safe, sourcepos, smart, width
+        As in :py:func:`to_html` and friends (options not applicable
+        to format are ignored). ``sourcepos`` and ``smart`` can not be
+        used with :py:class:`Node` (they are options of parsing).
+
+    Returns
+    -------
+    int
+        Length of output in bytes.
+
+    """
+    if format not in _RENDER_FORMATS:
+        raise ValueError("unknown format: " + repr(format))
+    size = len(buf)
+    writer = _ffi.new("paka_memory_writer *", {"size": size})
+    try:
+        # Buffer can not be resized while it is exported to C, so
+        # export is released right after rendering (even on error).
+        with _ffi.from_buffer(buf) as memory:
+            writer.ptr = memory
+            error, input_bytes, started, parsed = _render_source(
+                source, format, "_to",
+                (_RENDER_INTO_CHUNK_SIZE,
+                 _ffi.addressof(_lib, "paka_write_memory"), writer),
+                breaks, safe, sourcepos, smart, width)
+        writer.ptr = _ffi.NULL
+        if error:
+            raise MemoryError()
+        length = writer.written
+        if length > size:
+            buf += _ffi.buffer(writer.overflow, length - size)
+            buf.extend(bytes(
+                max(length, size_hint, size + size // 2) - length))
+    finally:
+        _lib.free(writer.overflow)
+    _record("render_into", input_bytes, length, started, parsed, _now())
+    return length
+
+
+class _StreamWriter(object):  # pylint: disable=too-few-public-methods
+    """Stream passed to C renderer (as handle), and its first error."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.written = 0
+        self.error = None
+
+
+@_ffi.def_extern()
+def _paka_write_stream(data, buffer, length):
+    writer = _ffi.from_handle(data)
+    try:
+        # Copy, as stream may keep reference to what it was given.
+        writer.stream.write(_ffi.buffer(buffer, length)[:])
+    except BaseException as error:  # pylint: disable=broad-exception-caught
+        writer.error = error
+        return 1
+    writer.written += length
+    return 0
+
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+"""Default size of chunks :py:func:`render_to` writes (in bytes)."""
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_to(
+        stream, source, format="html", chunk_size=DEFAULT_CHUNK_SIZE,
+        breaks=False, safe=True, sourcepos=False, smart=False, width=0):
+    # pylint: disable=redefined-builtin
+    """Render document to stream (or file descriptor) in chunks.
+
+    Renderer passes output on in chunks as it traverses tree of nodes,
+    so whole output is never kept in memory: peak memory is that of
+    tree (and text) plus about ``chunk_size`` (chunk is bigger only if
+    output of single node is).
+
+    Parameters
+    ----------
+    stream
+        Binary stream (object with ``write`` method accepting
+        ``bytes``, e.g. file, :py:class:`gzip.GzipFile`, or response
+        object), or file descriptor (``int``) that is written to
+        without calling Python code (flush stream before passing
+        its file descriptor).
+    source: str, bytes or Node
+        As in :py:func:`render_into`.
+    format: str
+        As in :py:func:`render_into`.
+    chunk_size: int
+        Size (in bytes) of chunks written to stream.
+    breaks, safe, sourcepos, smart, width
+        As in :py:func:`render_into`.
+
+    Returns
+    -------
+    int
+        Number of bytes written.
+
+    """
+    written, input_bytes, started, parsed = _render_to(
+        stream, source, format, chunk_size, breaks, safe, sourcepos, smart,
+        width)
+    _record("render_to", input_bytes, written, started, parsed, _now())
+    return written
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _render_to(
+        stream, source, format, chunk_size, breaks=False, safe=True,
+        sourcepos=False, smart=False, width=0):
+    """Render to stream, return number of bytes written and timing.
+
+    Timing (size of text and times of parsing) is as returned by
+    _render_source.
+
+    """
+    # pylint: disable=redefined-builtin
+    if isinstance(stream, int):
+        writer = _ffi.new("paka_fd_writer *", {"fd": stream})
+        error, input_bytes, started, parsed = _render_source(
+            source, format, "_to",
+            (chunk_size, _ffi.addressof(_lib, "paka_write_fd"), writer),
+            breaks, safe, sourcepos, smart, width)
+        if error:
+            raise OSError(error, _os.strerror(error))
+        return writer.written, input_bytes, started, parsed
+    writer = _StreamWriter(stream)
+    write_fn = _lib._paka_write_stream  # pylint: disable=protected-access
+    _, input_bytes, started, parsed = _render_source(
+        source, format, "_to", (chunk_size, write_fn, _ffi.new_handle(writer)),
+        breaks, safe, sourcepos, smart, width)
+    if writer.error is not None:
+        raise writer.error
+    return writer.written, input_bytes, started, parsed
+
+
+# Window bits of zlib compressors by HTTP content coding.
+_COMPRESSION_WBITS = {
+    "gzip": 16 + _zlib.MAX_WBITS, "deflate": _zlib.MAX_WBITS}
+
+
+class _CompressingStream(object):
+    """Stream compressing data written to it, passing it to write."""
+
+    def __init__(self, compressor, write):
+        self.compressor = compressor
+        self.write_compressed = write
+        self.written = 0
+
+    def _pass(self, compressed):
+        if compressed:
+            self.write_compressed(compressed)
+            self.written += len(compressed)
+
+    def write(self, data):
+        """Compress data."""
+        self._pass(self.compressor.compress(data))
+
+    def close(self):
+        """Pass on what is left in compressor."""
+        self._pass(self.compressor.flush())
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_compressed(
+        source, stream=None, format="html", encoding="gzip",
+        level=_zlib.Z_DEFAULT_COMPRESSION, chunk_size=DEFAULT_CHUNK_SIZE,
+        **options):
+    # pylint: disable=redefined-builtin
+    """Render document compressed with :py:mod:`zlib` (e.g. for HTTP).
+
+    Chunks of output are compressed as renderer produces them (see
+    :py:func:`render_to`), so neither whole uncompressed output nor
+    its copy is ever kept in memory.
+
+    Parameters
+    ----------
+    source: str, bytes or Node
+        As in :py:func:`render_into`.
+    stream
+        Binary stream to write compressed data to, or None to return
+        it as ``bytes``.
+    format: str
+        As in :py:func:`render_into`.
+    encoding: str
+        ``"gzip"`` or ``"deflate"`` (zlib format), as HTTP content
+        codings with these names.
+    level: int
+        Compression level (see :py:func:`zlib.compressobj`).
+    chunk_size: int
+        As in :py:func:`render_to`.
+    options
+        Keyword arguments of :py:func:`render_to` (``breaks``,
+        ``safe``, ``sourcepos``, ``smart`` and ``width``).
+
+    Returns
+    -------
+    bytes or int
+        Compressed data, or number of bytes written to stream.
+
+    """
+    try:
+        wbits = _COMPRESSION_WBITS[encoding]
+    except KeyError:
+        raise ValueError("unknown encoding: " + repr(encoding)) from None
+    chunks = []
+    compressing = _CompressingStream(
+        _zlib.compressobj(level, _zlib.DEFLATED, wbits),
+        chunks.append if stream is None else stream.write)
+    written, input_bytes, started, parsed = _render_to(
+        compressing, source, format, chunk_size, **options)
+    compressing.close()
+    _record(
+        "render_compressed", input_bytes, written, started, parsed, _now())
+    if stream is None:
+        return b"".join(chunks)
+    return compressing.written
+
+
+_XML_PROLOG = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n"
+    "<!DOCTYPE document SYSTEM \"CommonMark.dtd\">\n")
+
+
+class Node(object):
+    """Node of parsed :py:class:`Document`.
+
+    Nodes are not meant to be created directly, they are obtained
+    from :py:class:`Document` (that is a node itself). Node keeps
+    tree it belongs to alive, so it is safe to use node after
+    document object itself is gone.
+
+    Any node may be rendered (as if it was root of the tree),
+    this allows to render fragments (e.g. single list item, or
+    several top-level nodes forming a section under a heading)
+    without parsing document again.
+
+    """
+
+    def __init__(self, root, c_node, opts):
+        """Wrap C node of tree (that is kept alive by ``root``)."""
+        self._root = root
+        self._c_node = c_node
+        self._opts = opts
+
+    def __eq__(self, other):
+        """Check if both objects wrap same C node."""
+        if not isinstance(other, Node):
+            return NotImplemented
+        return self._c_node == other._c_node
+
+    def __ne__(self, other):
+        """Check if objects wrap different C nodes."""
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        """Return hash of wrapped C node."""
+        return hash(int(_ffi.cast("uintptr_t", self._c_node)))
+
+    def __repr__(self):
+        """Return representation with type of node."""
+        return "<" + __name__ + "." + type(self).__name__ + " " + (
+            self.type_string + ">")
+
+    def _wrap(self, c_node):
+        if c_node is None:
+            return None
+        return Node(self._root, c_node, self._opts)
+
+    @property
+    def type(self):
+        """One of :ref:`node types <node_types>`."""
+        return _lowlevel.node_get_type(self._c_node)
+
+    @property
+    def type_string(self):
+        """Type of node as text (e.g. ``"heading"``)."""
+        return _lowlevel.text_from_c(
+            _lowlevel.node_get_type_string(self._c_node))
+
+    @property
+    def is_block(self):
+        """Is node a block (and not inline) one."""
+        return (
+            _lowlevel.NODE_FIRST_BLOCK <= self.type <=
+            _lowlevel.NODE_LAST_BLOCK)
+
+    @property
+    def literal(self):
+        """Literal contents of node (e.g. text of code block), or None."""
+        literal = _lowlevel.node_get_literal(self._c_node)
+        if literal is None:
+            return None
+        return _lowlevel.text_from_c(literal)
+
+    @property
+    def heading_level(self):
+        """Level of heading (``1``–``6``), or ``0`` for non-headings."""
+        return _lowlevel.node_get_heading_level(self._c_node)
+
+    @property
+    def parent(self):
+        """Parent node, or None."""
+        return self._wrap(_lowlevel.node_parent(self._c_node))
+
+    @property
+    def next(self):
+        """Next sibling node, or None."""
+        return self._wrap(_lowlevel.node_next(self._c_node))
+
+    @property
+    def previous(self):
+        """Previous sibling node, or None."""
+        return self._wrap(_lowlevel.node_previous(self._c_node))
+
+    @property
+    def first_child(self):
+        """First child node, or None."""
+        return self._wrap(_lowlevel.node_first_child(self._c_node))
+
+    @property
+    def last_child(self):
+        """Last child node, or None."""
+        return self._wrap(_lowlevel.node_last_child(self._c_node))
+
+    @property
+    def children(self):
+        """List of child nodes."""
+        result = []
+        child = self.first_child
+        while child is not None:
+            result.append(child)
+            child = child.next
+        return result
+
+    def _render(self, render, contents_only, separator=""):
+        if not contents_only:
+            return render(self._c_node)
+        results = []
+        c_node = _lowlevel.node_first_child(self._c_node)
+        while c_node is not None:
+            results.append(render(c_node))
+            c_node = _lowlevel.node_next(c_node)
+        return separator.join(results)
+
+    def to_html(self, breaks=False, safe=True, contents_only=False):
+        r"""Render node (with its children) as HTML.
+
+        Parameters
+        ----------
+        breaks: bool or LineBreaks
+            How line breaks will be rendered (see :py:func:`to_html`).
+        safe: bool
+            When ``True``, replace raw HTML with HTML comment.
+        contents_only: bool
+            If ``True``, omit node itself (e.g. ``<li>`` and ``</li>``
+            of list item) and render only its children.
+
+        Returns
+        -------
+        str
+            HTML
+
+        """
+        opts = _add_breaks_to_opts(breaks, self._opts)
+        if not safe:
+            opts |= _lowlevel.OPT_UNSAFE
+
+        def _render_node(c_node):
+            return _lowlevel.text_from_c(
+                _lowlevel.render_html(c_node, opts), free=True)
+        return self._render(_render_node, contents_only)
+
+    def to_xml(self, contents_only=False):
+        """Render node (with its children) as XML.
+
+        Parameters
+        ----------
+        contents_only: bool
+            If ``True``, omit node itself and render only its children.
+            As result in this case is a fragment (there may be several
+            top-level elements), XML declaration is omitted too.
+
+        Returns
+        -------
+        str
+            XML
+
+        """
+        def _render_node(c_node):
+            xml = _lowlevel.text_from_c(
+                _lowlevel.render_xml(c_node, self._opts), free=True)
+            if contents_only:
+                xml = xml[len(_XML_PROLOG):]
+            return xml
+        return self._render(_render_node, contents_only)
+
+    def to_commonmark(self, breaks=False, width=0, contents_only=False):
+        """Render node (with its children) as CommonMark.
+
+        Parameters
+        ----------
+        breaks: bool or LineBreaks
+            How line breaks will be rendered
+            (see :py:func:`to_commonmark`).
+        width: int
+            Wrap width of output by inserting line breaks (default is
+            ``0``—no wrapping).
+        contents_only: bool
+            If ``True``, omit node itself (e.g. list marker of list
+            item) and render only its children.
+
+        Returns
+        -------
+        str
+            CommonMark
+
+        """
+        opts = _add_breaks_to_opts(breaks, self._opts)
+        # Children are rendered together, as separators between them
+        # depend on siblings (e.g. adjacent lists) and tightness of list.
+        render = (
+            _lowlevel.render_commonmark_contents if contents_only
+            else _lowlevel.render_commonmark)
+        return _lowlevel.text_from_c(
+            render(self._c_node, opts, width), free=True)
+
+
+class Document(Node):
+    """Parsed CommonMark document (and root node of its tree).
+
+    Parsing once and rendering many times (or rendering only parts
+    of document, see :py:class:`Node`) is cheaper than calling
+    :py:func:`to_html` and friends for each output.
+
+    """
+
+    def __init__(self, text, sourcepos=False, smart=False):
+        """Parse text.
+
+        Parameters
+        ----------
+        text: str
+            Text marked up with `CommonMark <http://commonmark.org>`_.
+        sourcepos: bool
+            If ``True``, render with “sourcepos” information
+            (that is, use ``CMARK_OPT_SOURCEPOS``).
+        smart: bool
+            Use :py:data:`~paka.cmark.lowlevel.OPT_SMART`.
+
+        """
+        opts = _add_smart_to_opts(
+            smart, _add_sourcepos_to_opts(sourcepos, _lowlevel.OPT_DEFAULT))
+        text_bytes = _lowlevel.text_to_c(text)
+        started = _now()
+        root, self._references, _ = _parse_counting_references(
+            (text_bytes,), opts)
+        parsed = _now()
+        _record("Document", len(text_bytes), 0, started, parsed, parsed)
+        root = _ffi.gc(root, _lowlevel.node_free)
+        super(Document, self).__init__(  # pylint: disable=super-with-arguments
+            root, root, opts)
+
+    @classmethod
+    def _from_tree(cls, root, references, opts):
+        """Wrap tree parsed elsewhere (instead of parsing text)."""
+        document = cls.__new__(cls)
+        document._references = references
+        root = _ffi.gc(root, _lowlevel.node_free)
+        Node.__init__(document, root, root, opts)
+        return document
+
+    def stats(self):
+        """Return statistics of document.
+
+        Statistics are collected in single pass over the tree (in C),
+        see also :py:class:`StatsProfile` for statistics of many
+        documents.
+
+        Returns
+        -------
+        DocumentStats
+            Statistics.
+
+        """
+        return _make_stats(
+            _lowlevel.node_stats(self._c_node), self._references)
+
+
+def _parse_counting_references(chunks, opts):
+    """Parse chunks of UTF-8, return tree, number of references and size."""
+    size = 0
+    parser = _lowlevel.parser_new(opts)
+    try:
+        for chunk in chunks:
+            _lowlevel.parser_feed(parser, chunk, len(chunk))
+            size += len(chunk)
+        root = _lowlevel.parser_finish(parser)
+        return root, _lowlevel.parser_count_references(parser), size
+    finally:
+        _lowlevel.parser_free(parser)
+
+
+# Magic numbers of compressed formats, with names of modules
+# decompressing them.
+_COMPRESSION_MAGICS = (
+    (b"\x1f\x8b", "gzip"), (b"BZh", "bz2"), (b"\xfd7zXZ\x00", "lzma"))
+
+
+class _PrefixedStream(object):  # pylint: disable=too-few-public-methods
+    """Stream returning prefix (already read from stream) first."""
+
+    def __init__(self, prefix, stream):
+        self.prefix = prefix
+        self.stream = stream
+
+    def read(self, size=-1):
+        """Read up to size bytes (all if size is negative)."""
+        if not self.prefix:
+            return self.stream.read(size)
+        if 0 <= size < len(self.prefix):
+            data, self.prefix = self.prefix[:size], self.prefix[size:]
+            return data
+        data, self.prefix = self.prefix, b""
+        if size < 0:
+            return data + self.stream.read()
+        return data
+
+
+def _iter_decompressed(stream, chunk_size):
+    """Yield chunks of stream, decompressing it if it is compressed."""
+    prefix = b""
+    while len(prefix) < 6:
+        data = stream.read(6 - len(prefix))
+        if not data:
+            break
+        prefix += data
+    stream = _PrefixedStream(prefix, stream)
+    for magic, module_name in _COMPRESSION_MAGICS:
+        if prefix.startswith(magic):
+            stream = _importlib.import_module(module_name).open(stream, "rb")
+            break
+    return iter(lambda: stream.read(chunk_size), b"")
+
+
+def parse_stream(
+        stream, sourcepos=False, smart=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Parse document read from binary stream, that may be compressed.
+
+    Stream compressed with gzip, bzip2 or xz (detected by magic
+    number) is decompressed. Chunks read from stream (and decompressed)
+    are fed to parser right away, so neither whole input nor its
+    ``str`` is kept in memory (only tree of nodes is).
+
+    Parameters
+    ----------
+    stream
+        Binary stream (object with ``read`` method returning
+        ``bytes``) of UTF-8 text marked up with CommonMark.
+    sourcepos, smart
+        As in :py:class:`Document`.
+    chunk_size: int
+        Size (in bytes) of chunks read from stream.
+
+    Returns
+    -------
+    Document
+        Parsed document.
+
+    """
+    started = _now()
+    document, size = _parse_stream(stream, sourcepos, smart, chunk_size)
+    parsed = _now()
+    _record("parse_stream", size, 0, started, parsed, parsed)
+    return document
+
+
+def _parse_stream(stream, sourcepos, smart, chunk_size):
+    """Parse stream, return document and size of (decompressed) input."""
+    opts = _add_smart_to_opts(
+        smart, _add_sourcepos_to_opts(sourcepos, _lowlevel.OPT_DEFAULT))
+    root, references, size = _parse_counting_references(
+        _iter_decompressed(stream, chunk_size), opts)
+    # pylint: disable-next=protected-access
+    return Document._from_tree(root, references, opts), size
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_file(
+        path, stream=None, format="html", chunk_size=DEFAULT_CHUNK_SIZE,
+        breaks=False, safe=True, sourcepos=False, smart=False, width=0):
+    # pylint: disable=redefined-builtin,too-many-locals
+    """Render file, that may be compressed (see :py:func:`parse_stream`).
+
+    Parameters
+    ----------
+    path: str
+        Path of file.
+    stream
+        Binary stream (or file descriptor) to write output to (see
+        :py:func:`render_to`), or None to return output.
+    format: str
+        As in :py:func:`render_into`.
+    chunk_size: int
+        Size (in bytes) of chunks read from file (and written to
+        stream).
+    breaks, safe, sourcepos, smart, width
+        As in :py:func:`render_into`.
+
+    Returns
+    -------
+    str or int
+        Output, or number of bytes written to stream.
+
+    """
+    started = _now()
+    with open(path, "rb") as file:
+        document, input_bytes = _parse_stream(
+            file, sourcepos, smart, chunk_size)
+    parsed = _now()
+    if stream is not None:
+        result = output_bytes = _render_to(
+            stream, document, format, chunk_size, breaks, safe,
+            width=width)[0]
+    else:
+        c_string = _render_source(
+            document, format, "", (), breaks, safe, False, False, width)[0]
+        try:
+            output_bytes = _lib.strlen(c_string)
+            result = str(
+                _ffi.buffer(c_string, output_bytes), _lowlevel.ENCODING)
+        finally:
+            _lib.free(c_string)
+    _record("render_file", input_bytes, output_bytes, started, parsed, _now())
+    return result
+
+
+def parse_fd(fd, sourcepos=False, smart=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Parse document read from file descriptor in C.
+
+    File descriptor is read (until its end) without Python buffering
+    and without holding the GIL, and data is fed to parser right away.
+
+    Parameters
+    ----------
+    fd: int
+        File descriptor of UTF-8 text marked up with CommonMark.
+    sourcepos, smart
+        As in :py:class:`Document`.
+    chunk_size: int
+        Size (in bytes) of reads.
+
+    Returns
+    -------
+    Document
+        Parsed document.
+
+    """
+    opts = _add_smart_to_opts(
+        smart, _add_sourcepos_to_opts(sourcepos, _lowlevel.OPT_DEFAULT))
+    bytes_read = _ffi.new("size_t *")
+    started = _now()
+    parser = _lowlevel.parser_new(opts)
+    try:
+        error = _lowlevel.parser_feed_fd(parser, fd, chunk_size, bytes_read)
+        root = _lowlevel.parser_finish(parser)
+        references = _lowlevel.parser_count_references(parser)
+    finally:
+        _lowlevel.parser_free(parser)
+    if error:
+        _lowlevel.node_free(root)
+        raise OSError(error, _os.strerror(error))
+    parsed = _now()
+    _record("parse_fd", bytes_read[0], 0, started, parsed, parsed)
+    # pylint: disable-next=protected-access
+    return Document._from_tree(root, references, opts)
+
+
+# Formats of render_fd.
+_FD_FORMATS = {
+    "html": _lowlevel.FORMAT_HTML, "xml": _lowlevel.FORMAT_XML,
+    "commonmark": _lowlevel.FORMAT_COMMONMARK,
+    "man": _lowlevel.FORMAT_MAN, "latex": _lowlevel.FORMAT_LATEX}
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_fd(
+        in_fd, out_fd, format="html", chunk_size=DEFAULT_CHUNK_SIZE,
+        breaks=False, safe=True, sourcepos=False, smart=False, width=0):
+    # pylint: disable=redefined-builtin
+    """Convert document read from file descriptor, writing to another one.
+
+    Reading, parsing, rendering and writing (in chunks, see
+    :py:func:`render_to`) are all done by single call of C function
+    that runs without holding the GIL, so converting files from pool
+    of threads involves Python only to open files and start calls.
+
+    Parameters
+    ----------
+    in_fd: int
+        File descriptor to read UTF-8 text marked up with CommonMark
+        from (until its end).
+    out_fd: int
+        File descriptor to write output to.
+    format: str
+        As in :py:func:`render_into`.
+    chunk_size: int
+        Size (in bytes) of reads and of chunks written.
+    breaks, safe, sourcepos, smart, width
+        As in :py:func:`render_into`.
+
+    Returns
+    -------
+    tuple
+        Numbers of bytes read and written.
+
+    """
+    try:
+        c_format = _FD_FORMATS[format]
+    except KeyError:
+        raise ValueError("unknown format: " + repr(format)) from None
+    opts = _add_smart_to_opts(smart, _add_sourcepos_to_opts(
+        sourcepos, _add_breaks_to_opts(breaks, _lowlevel.OPT_DEFAULT)))
+    if not safe:
+        opts |= _lowlevel.OPT_UNSAFE
+    stats = _ffi.new("paka_fd_stats *")
+    started = _now()
+    error = _lowlevel.render_fd(
+        in_fd, out_fd, c_format, opts, width, chunk_size, stats)
+    if error:
+        raise OSError(error, _os.strerror(error))
+    # Phases are not timed apart in C, so whole call counts as render.
+    _record(
+        "render_fd", stats.bytes_read, stats.bytes_written, started, started,
+        _now())
+    return stats.bytes_read, stats.bytes_written
+
+
+DocumentStats = _collections.namedtuple(
+    "DocumentStats",
+    "node_counts nodes max_depth literal_bytes references memory")
+DocumentStats.__doc__ = """Statistics of document.
+
+Attributes are: dict mapping :ref:`node type <node_types>` to number
+of nodes of that type (types without nodes are omitted), total number
+of nodes, maximum nesting depth (document itself has depth of ``0``,
+its children have depth of ``1``, and so on), total size of literals
+(in bytes of UTF-8) of text, code and HTML nodes, number of link
+reference definitions (duplicates included), and estimate of memory
+used by tree (in bytes, not counting allocator overhead).
+
+"""
+
+
+def _make_stats(c_stats, references):
+    node_counts = {}
+    for node_type, count in enumerate(c_stats.node_counts):
+        if count:
+            node_counts[node_type] = count
+    return DocumentStats(
+        node_counts, sum(node_counts.values()), c_stats.max_depth,
+        c_stats.literal_bytes, references, c_stats.memory)
+
+
+class StatsProfile(object):
+    """Aggregate of statistics of many documents.
+
+    Memory used by profile does not depend on number of documents:
+    besides totals and maxima, only power-of-two histograms of
+    per-document values are kept (enough to estimate percentiles
+    when choosing limits for untrusted input).
+
+    Profile is not thread-safe: use separate profile in each thread.
+
+    """
+
+    FIELDS = ("nodes", "max_depth", "literal_bytes", "references", "memory")
+    """Fields of :py:class:`DocumentStats` that are aggregated."""
+
+    def __init__(self):
+        """Create empty profile."""
+        self.documents = 0
+        self.node_counts = _collections.Counter()
+        self.totals = dict.fromkeys(self.FIELDS, 0)
+        self.maxima = dict.fromkeys(self.FIELDS, 0)
+        self._histograms = {
+            field: _collections.Counter() for field in self.FIELDS}
+
+    def add(self, stats):
+        """Add statistics of document (:py:class:`DocumentStats`)."""
+        self.documents += 1
+        self.node_counts.update(stats.node_counts)
+        for field in self.FIELDS:
+            value = getattr(stats, field)
+            self.totals[field] += value
+            if value > self.maxima[field]:
+                self.maxima[field] = value
+            self._histograms[field][value.bit_length()] += 1
+
+    def add_text(self, text, smart=False):
+        """Parse text and add its statistics.
+
+        This is cheaper than creating :py:class:`Document` and calling
+        its :py:meth:`~Document.stats`.
+
+        """
+        root, references, _ = _parse_counting_references(
+            (_lowlevel.text_to_c(text),),
+            _add_smart_to_opts(smart, _lowlevel.OPT_DEFAULT))
+        try:
+            self.add(_make_stats(_lowlevel.node_stats(root), references))
+        finally:
+            _lowlevel.node_free(root)
+
+    def mean(self, field):
+        """Return mean of field over documents (``0.0`` if empty)."""
+        if not self.documents:
+            return 0.0
+        return self.totals[field] / float(self.documents)
+
+    def percentile(self, field, fraction):
+        """Return upper estimate of percentile of field.
+
+        Parameters
+        ----------
+        field: str
+            One of :py:attr:`FIELDS`.
+        fraction: float
+            From ``0`` to ``1`` (e.g. ``0.99`` for 99th percentile).
+
+        Returns
+        -------
+        int
+            Value that at least ``fraction`` of documents do not
+            exceed (upper bound of histogram bucket, but not more
+            than maximum).
+
+        """
+        histogram = self._histograms[field]
+        seen = 0
+        for bits in sorted(histogram):
+            seen += histogram[bits]
+            if seen >= fraction * self.documents:
+                return min((1 << bits) - 1, self.maxima[field])
+        return self.maxima[field]
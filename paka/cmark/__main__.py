@@ -0,0 +1,7 @@
+"""Run command-line converter (see :py:mod:`paka.cmark.cli`)."""
+
+from paka.cmark.cli import main
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
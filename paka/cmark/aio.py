@@ -0,0 +1,224 @@
+"""Asynchronous (:py:mod:`asyncio`) versions of high-level functions.
+
+Coroutine functions here take the same arguments as functions in
+:py:mod:`paka.cmark` (and optional ``timeout``)::
+
+    html = await paka.cmark.aio.to_html(text)
+
+Texts shorter than inline threshold are converted right in event loop
+(it takes microseconds, much less than handing work over to another
+thread would). Longer ones are converted in dedicated pool of threads;
+as C library is called without holding GIL, event loop keeps running
+while documents (even huge ones) are being converted.
+
+Number of conversions submitted to threads is limited: callers that
+exceed the limit wait (without blocking event loop) until some
+conversion finishes, so that bursts of large documents do not pile up
+in unbounded queue. Cancelled (or timed out) call that did not start
+yet is dropped; one that is running can not be interrupted, its result
+is discarded, and its slot is freed only when it finishes (so that the
+limit holds for work actually done by threads).
+
+Defaults suit most servers; they can be changed with
+:py:func:`configure`, or separate :py:class:`Converter` can be used.
+
+"""
+
+import os
+import asyncio
+import weakref
+import functools
+import threading
+import concurrent.futures
+
+from paka import cmark
+
+
+DEFAULT_INLINE_THRESHOLD = 4096
+"""Length (in characters) of text below which it is converted inline."""
+
+
+# pylint: disable=useless-object-inheritance
+class Converter(object):
+    """Converter using its own pool of threads."""
+
+    def __init__(
+            self, inline_threshold=DEFAULT_INLINE_THRESHOLD,
+            max_workers=None, max_concurrency=None):
+        """Create converter (threads are started when first needed).
+
+        Parameters
+        ----------
+        inline_threshold: int
+            Texts shorter than this (in characters) are converted in event
+            loop, without threads. ``0`` to always use threads.
+        max_workers: int or None
+            Number of threads (number of CPUs if None).
+        max_concurrency: int or None
+            Maximum number of conversions submitted to threads at once
+            (per event loop); twice ``max_workers`` if None.
+
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_concurrency is None:
+            max_concurrency = max_workers * 2
+        if max_workers < 1 or max_concurrency < 1:
+            raise ValueError("max_workers and max_concurrency must be >= 1")
+        self.inline_threshold = inline_threshold
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._semaphores_lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="paka-cmark")
+            return self._executor
+
+    def _get_semaphore(self, loop):
+        # Semaphores are bound to event loop, so there is one per loop
+        # (and loops may run in different threads).
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                    self.max_concurrency)
+            return semaphore
+
+    async def _submit(self, func, text, kwargs):
+        loop = asyncio.get_running_loop()
+        semaphore = self._get_semaphore(loop)
+        await semaphore.acquire()
+        try:
+            future = self._get_executor().submit(
+                functools.partial(func, text, **kwargs))
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(
+            functools.partial(_release_threadsafe, loop, semaphore))
+        return await asyncio.wrap_future(future)
+
+    async def run(self, func, text, timeout=None, **kwargs):
+        """Call ``func(text, **kwargs)``, in thread unless text is short.
+
+        Parameters
+        ----------
+        func: callable
+            Function converting text (e.g. :py:func:`paka.cmark.to_html`).
+        text: str
+            Text to convert.
+        timeout: float or None
+            Seconds to wait (including waiting for free slot), after
+            which :py:exc:`asyncio.TimeoutError` is raised.
+
+        """
+        if len(text) < self.inline_threshold:
+            return func(text, **kwargs)
+        if timeout is None:
+            return await self._submit(func, text, kwargs)
+        return await asyncio.wait_for(
+            self._submit(func, text, kwargs), timeout)
+
+    async def to_html(self, text, timeout=None, **kwargs):
+        """Asynchronous :py:func:`paka.cmark.to_html`."""
+        return await self.run(cmark.to_html, text, timeout, **kwargs)
+
+    async def to_html_inline(self, text, timeout=None, **kwargs):
+        """Asynchronous :py:func:`paka.cmark.to_html_inline`."""
+        return await self.run(cmark.to_html_inline, text, timeout, **kwargs)
+
+    async def excerpt(self, text, timeout=None, **kwargs):
+        """Asynchronous :py:func:`paka.cmark.excerpt`."""
+        return await self.run(cmark.excerpt, text, timeout, **kwargs)
+
+    async def to_xml(self, text, timeout=None, **kwargs):
+        """Asynchronous :py:func:`paka.cmark.to_xml`."""
+        return await self.run(cmark.to_xml, text, timeout, **kwargs)
+
+    async def to_commonmark(self, text, timeout=None, **kwargs):
+        """Asynchronous :py:func:`paka.cmark.to_commonmark`."""
+        return await self.run(cmark.to_commonmark, text, timeout, **kwargs)
+
+    async def to_man(self, text, timeout=None, **kwargs):
+        """Asynchronous :py:func:`paka.cmark.to_man`."""
+        return await self.run(cmark.to_man, text, timeout, **kwargs)
+
+    async def to_latex(self, text, timeout=None, **kwargs):
+        """Asynchronous :py:func:`paka.cmark.to_latex`."""
+        return await self.run(cmark.to_latex, text, timeout, **kwargs)
+
+    def close(self, wait=True):
+        """Shut down threads (new ones are started if used again)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def _release_threadsafe(loop, semaphore, _):
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:  # event loop is closed
+        pass
+
+
+_converter = Converter()  # pylint: disable=invalid-name
+
+
+def configure(**kwargs):
+    """Replace default converter with new :py:class:`Converter`.
+
+    Keyword arguments are those of :py:class:`Converter`. Threads of
+    previous default converter are shut down (after finishing
+    conversions already submitted).
+
+    """
+    global _converter  # pylint: disable=global-statement,invalid-name
+    previous, _converter = _converter, Converter(**kwargs)
+    previous.close(wait=False)
+
+
+def get_converter():
+    """Return default :py:class:`Converter`."""
+    return _converter
+
+
+async def to_html(text, timeout=None, **kwargs):
+    """Asynchronous :py:func:`paka.cmark.to_html`."""
+    return await _converter.to_html(text, timeout, **kwargs)
+
+
+async def to_html_inline(text, timeout=None, **kwargs):
+    """Asynchronous :py:func:`paka.cmark.to_html_inline`."""
+    return await _converter.to_html_inline(text, timeout, **kwargs)
+
+
+async def excerpt(text, timeout=None, **kwargs):
+    """Asynchronous :py:func:`paka.cmark.excerpt`."""
+    return await _converter.excerpt(text, timeout, **kwargs)
+
+
+async def to_xml(text, timeout=None, **kwargs):
+    """Asynchronous :py:func:`paka.cmark.to_xml`."""
+    return await _converter.to_xml(text, timeout, **kwargs)
+
+
+async def to_commonmark(text, timeout=None, **kwargs):
+    """Asynchronous :py:func:`paka.cmark.to_commonmark`."""
+    return await _converter.to_commonmark(text, timeout, **kwargs)
+
+
+async def to_man(text, timeout=None, **kwargs):
+    """Asynchronous :py:func:`paka.cmark.to_man`."""
+    return await _converter.to_man(text, timeout, **kwargs)
+
+
+async def to_latex(text, timeout=None, **kwargs):
+    """Asynchronous :py:func:`paka.cmark.to_latex`."""
+    return await _converter.to_latex(text, timeout, **kwargs)
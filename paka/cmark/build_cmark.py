@@ -1,6 +1,7 @@
 """CFFI-based bindings to cmark."""
 
 import os
+import re
 import glob
 import functools
 
@@ -19,12 +20,122 @@ CMARK_SRC_DIR_NAME = "cmark_src"
 # Absolute path of cmark "C sources" dir.
 CMARK_SRC_DIR_PATH = os.path.join(CURRENT_PACKAGE_DIR, CMARK_SRC_DIR_NAME)
 
+# Name of "extension C sources" dir (C code of paka.cmark itself, built
+# on top of cmark internals).
+EXT_SRC_DIR_NAME = "ext_src"
+
+# Absolute path of "extension C sources" dir.
+EXT_SRC_DIR_PATH = os.path.join(CURRENT_PACKAGE_DIR, EXT_SRC_DIR_NAME)
+
 # Contents of cmark.h.
 with open(os.path.join(CMARK_SRC_DIR_PATH, "cmark.h"), "rb") as file:
     CMARK_HEADER = file.read().decode("utf-8")
 CMARK_HEADER = CMARK_HEADER.encode("ascii", "replace").decode("ascii")
 
 
+# Number of buckets and slots of entities perfect hash table (must be
+# powers of two).
+ENTITIES_HASH_BUCKETS = 1024
+ENTITIES_HASH_SLOTS = 4096
+
+_UINT32_MASK = 0xFFFFFFFF
+
+
+def _entity_hash(name, seed):
+    """Hash entity name (must match S_entity_hash in houdini_html_u.c)."""
+    value = 0x811C9DC5 ^ seed
+    for byte in bytearray(name):
+        value = ((value ^ byte) * 0x01000193) & _UINT32_MASK
+    value ^= value >> 16
+    value = (value * 0x85EBCA6B) & _UINT32_MASK
+    value ^= value >> 13
+    value = (value * 0xC2B2AE35) & _UINT32_MASK
+    value ^= value >> 16
+    return value
+
+
+def _read_entity_names(path):
+    with open(path, "rb") as inc_file:
+        source = inc_file.read().decode("ascii")
+
+    def _parse_array(name):
+        match = re.search(name + r"\[\d+\] = \{(.*?)\};", source, re.S)
+        return [
+            int(number, 16)
+            for number in re.findall(r"0x[0-9A-F]+", match.group(1))]
+    entities = _parse_array("cmark_entities")
+    text = bytearray(_parse_array("cmark_entity_text"))
+    return [
+        bytes(text[value & 0x7FFF:(value & 0x7FFF) + ((value >> 15) & 0x1F)])
+        for value in entities]
+
+
+def _make_entities_hash(names):
+    """Find displacements for perfect hash table of entity names.
+
+    Names are distributed into buckets by hash with zero seed, then,
+    starting from largest buckets, seed (displacement) is searched for
+    each bucket such that all its names land in free slots.
+
+    """
+    buckets = [[] for _ in range(ENTITIES_HASH_BUCKETS)]
+    for index, name in enumerate(names):
+        bucket = _entity_hash(name, 0) & (ENTITIES_HASH_BUCKETS - 1)
+        buckets[bucket].append(index)
+    displacements = [0] * ENTITIES_HASH_BUCKETS
+    slots = [-1] * ENTITIES_HASH_SLOTS
+    for bucket in sorted(
+            range(ENTITIES_HASH_BUCKETS),
+            key=lambda bucket: -len(buckets[bucket])):
+        if not buckets[bucket]:
+            break
+        for seed in range(1, 0x10000):
+            taken = [
+                _entity_hash(names[index], seed) &
+                (ENTITIES_HASH_SLOTS - 1)
+                for index in buckets[bucket]]
+            if len(set(taken)) == len(taken) and all(
+                    slots[slot] == -1 for slot in taken):
+                break
+        else:
+            raise RuntimeError("can not build entities perfect hash")
+        displacements[bucket] = seed
+        for index, slot in zip(buckets[bucket], taken):
+            slots[slot] = index
+    return displacements, slots
+
+
+def _format_c_array(c_type, name, values):
+    lines = []
+    for start in range(0, len(values), 12):
+        lines.append("  " + ", ".join(
+            str(value) for value in values[start:start + 12]))
+    return "static const {} {}[{}] = {{\n{}\n}};\n".format(
+        c_type, name, len(values), ",\n".join(lines))
+
+
+def _write_entities_hash():
+    """Generate entities_hash.inc (perfect hash of entities.inc)."""
+    displacements, slots = _make_entities_hash(_read_entity_names(
+        os.path.join(CMARK_SRC_DIR_PATH, "entities.inc")))
+    contents = "".join([
+        "/* Generated from entities.inc by paka/cmark/build_cmark.py */\n\n",
+        "#define ENT_HASH_BUCKETS " + str(ENTITIES_HASH_BUCKETS) + "\n",
+        "#define ENT_HASH_SLOTS " + str(ENTITIES_HASH_SLOTS) + "\n\n",
+        _format_c_array(
+            "uint16_t", "cmark_entity_hash_disp", displacements),
+        "\n",
+        _format_c_array("int16_t", "cmark_entity_hash_slots", slots)])
+    contents = contents.encode("ascii")
+    path = os.path.join(EXT_SRC_DIR_PATH, "entities_hash.inc")
+    if os.path.exists(path):
+        with open(path, "rb") as inc_file:
+            if inc_file.read() == contents:
+                return
+    with open(path, "wb") as inc_file:
+        inc_file.write(contents)
+
+
 _relativize = functools.partial(  # pylint: disable=invalid-name
     os.path.relpath, start=ROOT_DIR)
 
@@ -33,19 +144,22 @@ def _relativize_paths(paths):
     return list(map(_relativize, paths))
 
 
-def _get_sources(exclude):
+def _get_sources(exclude, src_dir_path=CMARK_SRC_DIR_PATH):
     exclude = set(exclude)
     glob_escape = getattr(glob, "escape", lambda s: s)
 
     def _get_sources_paths():
         for path in glob.iglob(
-                os.path.join(glob_escape(CMARK_SRC_DIR_PATH), "*.c")):
+                os.path.join(glob_escape(src_dir_path), "*.c")):
             filename = os.path.basename(path)
             if filename not in exclude:
                 yield path
     return _relativize_paths(sorted(_get_sources_paths()))
 
 
+_write_entities_hash()
+
+
 ffibuilder = FFI()  # pylint: disable=invalid-name
 ffibuilder.cdef("""
 #define CMARK_OPT_DEFAULT ...
@@ -182,14 +296,88 @@ void cmark_parser_feed(cmark_parser *parser, const char *buffer, size_t len);
 cmark_node * cmark_parser_finish(cmark_parser *parser);
 
 void free(void *ptr);
+size_t strlen(const char *s);
+
+
+cmark_node *paka_parse_inline(const char *buffer, size_t len, int options);
+char *paka_markdown_to_html_inline(
+    const char *buffer, size_t len, int options);
+int paka_node_truncate(cmark_node *root, int max_chars, const char *ellipsis);
+typedef struct {
+    size_t node_counts[...];
+    size_t max_depth;
+    size_t literal_bytes;
+    size_t memory;
+} paka_node_stats;
+void paka_node_stats_collect(cmark_node *root, paka_node_stats *stats);
+size_t paka_parser_count_references(cmark_parser *parser);
+void paka_parser_reset(cmark_parser *parser, int options, size_t max_buffer);
+cmark_node *paka_parser_parse(
+    cmark_parser *parser, const char *buffer, size_t len, int options,
+    size_t max_buffer);
+char *paka_parser_markdown_to_html(
+    cmark_parser *parser, const char *buffer, size_t len, int options,
+    size_t max_buffer);
+typedef int (*paka_write_fn)(void *data, const char *buffer, size_t len);
+typedef struct {
+    int fd;
+    size_t written;
+} paka_fd_writer;
+int paka_write_fd(void *data, const char *buffer, size_t len);
+typedef struct {
+    char *ptr;
+    size_t size;
+    size_t written;
+    char *overflow;
+    size_t overflow_capacity;
+} paka_memory_writer;
+int paka_write_memory(void *data, const char *buffer, size_t len);
+int paka_render_html_to(
+    cmark_node *root, int options, size_t chunk_size,
+    paka_write_fn write_fn, void *data);
+int paka_render_xml_to(
+    cmark_node *root, int options, size_t chunk_size,
+    paka_write_fn write_fn, void *data);
+int paka_render_commonmark_to(
+    cmark_node *root, int options, int width, size_t chunk_size,
+    paka_write_fn write_fn, void *data);
+int paka_render_man_to(
+    cmark_node *root, int options, int width, size_t chunk_size,
+    paka_write_fn write_fn, void *data);
+int paka_render_latex_to(
+    cmark_node *root, int options, int width, size_t chunk_size,
+    paka_write_fn write_fn, void *data);
+char *paka_render_commonmark_contents(
+    cmark_node *root, int options, int width);
+extern "Python" int _paka_write_stream(
+    void *data, const char *buffer, size_t len);
+int paka_parser_feed_fd(
+    cmark_parser *parser, int fd, size_t buffer_size, size_t *bytes_read);
+typedef enum {
+    PAKA_FORMAT_HTML,
+    PAKA_FORMAT_XML,
+    PAKA_FORMAT_COMMONMARK,
+    PAKA_FORMAT_MAN,
+    PAKA_FORMAT_LATEX
+} paka_format;
+typedef struct {
+    size_t bytes_read;
+    size_t bytes_written;
+} paka_fd_stats;
+int paka_render_fd(
+    int in_fd, int out_fd, paka_format format, int options, int width,
+    size_t chunk_size, paka_fd_stats *stats);
+char *paka_escape_html(const char *buffer, size_t len, int secure);
 """)
 
 
 ffibuilder.set_source(
     "paka.cmark._cmark",
-    CMARK_HEADER,
-    sources=_get_sources(exclude=["main.c"]),
-    include_dirs=_relativize_paths([CMARK_SRC_DIR_PATH]))
+    CMARK_HEADER + '\n#include "paka_cmark.h"\n',
+    sources=(
+        _get_sources(exclude=["main.c"]) +
+        _get_sources(exclude=[], src_dir_path=EXT_SRC_DIR_PATH)),
+    include_dirs=_relativize_paths([CMARK_SRC_DIR_PATH, EXT_SRC_DIR_PATH]))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,238 @@
+"""Command-line converter (``python -m paka.cmark`` or ``paka-cmark``).
+
+Converts standard input (or single file) to standard output, or files
+and directory trees to directory of outputs. In the latter case work
+is split between worker processes, and inputs that did not change
+since previous run (with the same format, options and version of
+library) are skipped: content hashes of inputs, together with
+fingerprint of format, options and versions, are kept in manifest file
+in output directory.
+
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+from paka import cmark
+from paka.cmark import corpus
+
+
+MANIFEST_NAME = ".paka-cmark-manifest.json"
+"""Name of manifest file (in output directory)."""
+
+# Options of functions rendering formats.
+FORMAT_OPTIONS = {
+    "html": ("breaks", "safe", "sourcepos", "smart"),
+    "xml": ("sourcepos", "smart"),
+    "commonmark": ("breaks", "width", "smart"),
+    "man": ("breaks", "width", "smart"),
+    "latex": ("breaks", "width", "smart")}
+
+
+def _make_parser():
+    parser = argparse.ArgumentParser(
+        prog="paka-cmark",
+        description="Convert CommonMark to other formats.")
+    parser.add_argument(
+        "inputs", nargs="*", metavar="INPUT",
+        help="file or directory (standard input if none)")
+    parser.add_argument(
+        "-t", "--to", default="html", choices=sorted(corpus.FORMATS),
+        help="output format (default: html)")
+    parser.add_argument(
+        "-o", "--output",
+        help="output directory (or file, when converting single file "
+             "or standard input)")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="number of worker processes (default: number of CPUs, "
+             "0 to convert in this process)")
+    parser.add_argument(
+        "--breaks", choices=("soft", "hard"),
+        help="render line breaks as newlines (soft) or as hard breaks")
+    parser.add_argument(
+        "--unsafe", dest="safe", action="store_false", default=None,
+        help="keep raw HTML and dangerous links (html only)")
+    parser.add_argument(
+        "--sourcepos", action="store_true", default=None,
+        help="include source positions (html and xml only)")
+    parser.add_argument(
+        "--smart", action="store_true", default=None,
+        help="use smart punctuation")
+    parser.add_argument(
+        "--width", type=int, default=None,
+        help="wrap width (commonmark, man and latex only)")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="convert all inputs, even unchanged ones")
+    parser.add_argument(
+        "--check", action="store_true",
+        help="only list inputs that need converting (exit status is 1 "
+             "if there are any)")
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="do not print summary")
+    return parser
+
+
+def _get_options(parser, args):
+    options = {}
+    for name in ("breaks", "safe", "sourcepos", "smart", "width"):
+        value = getattr(args, name)
+        if value is None:
+            continue
+        if name not in FORMAT_OPTIONS[args.to]:
+            parser.error(
+                "--" + {"safe": "unsafe"}.get(name, name) +
+                " is not supported by " + args.to)
+        options[name] = value
+    return options
+
+
+def get_fingerprint(format_name, options):
+    """Return fingerprint of format, options and versions."""
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        from importlib import metadata
+        package_version = metadata.version("paka.cmark")
+    except ImportError:  # not installed (e.g. run from source tree)
+        package_version = None
+    return hashlib.sha256(json.dumps(
+        [format_name, sorted(options.items()), cmark.get_version(),
+         package_version]).encode("utf-8")).hexdigest()
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(path):
+    """Return manifest (empty one if file does not exist or is broken)."""
+    try:
+        with open(path, "rb") as file:
+            manifest = json.loads(file.read().decode("utf-8"))
+    except (OSError, ValueError):
+        return {"fingerprint": None, "files": {}}
+    if not isinstance(manifest.get("files"), dict):
+        return {"fingerprint": None, "files": {}}
+    return manifest
+
+
+def _collect_sources(parser, inputs, format_name):
+    """Return sources of inputs, rejecting ones with the same output.
+
+    Sources are keyed by relative path (in manifest and in output
+    directory), so e.g. ``docs/a.md`` and ``blog/a.md`` given as two
+    directories would overwrite each other. The same file given twice
+    is converted once.
+
+    """
+    sources = []
+    by_output = {}
+    for path in inputs:
+        for source in corpus.iter_sources(path):
+            key = os.path.normcase(os.path.splitext(source.relative_path)[0])
+            other = by_output.setdefault(key, source)
+            if other is source:
+                sources.append(source)
+            elif not os.path.samefile(other.path, source.path):
+                parser.error(
+                    "inputs " + other.path + " and " + source.path +
+                    " have the same output " + corpus.output_path(
+                        "", source.relative_path, format_name))
+    return sources
+
+
+def _find_stale(sources, manifest, fingerprint, output_dir, format_name):
+    """Return sources that need converting and hashes of all sources."""
+    same_fingerprint = manifest.get("fingerprint") == fingerprint
+    hashes = {}
+    stale = []
+    for source in sources:
+        digest = hashes[source.relative_path] = _hash_file(source.path)
+        if not (
+                same_fingerprint and
+                manifest["files"].get(source.relative_path) == digest and
+                os.path.exists(corpus.output_path(
+                    output_dir, source.relative_path, format_name))):
+            stale.append(source)
+    return stale, hashes
+
+
+def _convert_stream(args, options):
+    if args.inputs:
+        text = corpus.read_source(args.inputs[0])
+    else:
+        text = sys.stdin.buffer.read().decode(corpus.ENCODING)
+    func = getattr(cmark, corpus.FORMATS[args.to][0])
+    data = func(text, **options).encode(corpus.ENCODING)
+    if args.output:
+        corpus.write_atomic(args.output, data)
+    else:
+        sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+    return 0
+
+
+def _convert_tree(parser, args, options):
+    sources = _collect_sources(parser, args.inputs, args.to)
+    manifest_path = os.path.join(args.output, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+    fingerprint = get_fingerprint(args.to, options)
+    if args.force:
+        manifest = {"fingerprint": None, "files": {}}
+    stale, hashes = _find_stale(
+        sources, manifest, fingerprint, args.output, args.to)
+    if args.check:
+        for source in stale:
+            print(source.path)
+        return 1 if stale else 0
+
+    files = {}
+    if manifest.get("fingerprint") == fingerprint:
+        files = {
+            relative_path: digest
+            for relative_path, digest in manifest["files"].items()
+            if relative_path in hashes}
+    try:
+        results = corpus.render_corpus(
+            stale, format=args.to, workers=args.jobs,
+            output_dir=args.output, **options)
+        for source, _ in zip(stale, results):
+            files[source.relative_path] = hashes[source.relative_path]
+    finally:
+        # Record what was converted even if conversion failed midway.
+        os.makedirs(args.output, exist_ok=True)
+        corpus.write_atomic(manifest_path, json.dumps(
+            {"fingerprint": fingerprint, "files": files},
+            indent=1, sort_keys=True).encode("utf-8"))
+    if not args.quiet:
+        sys.stderr.write(
+            "converted " + str(len(stale)) + ", unchanged " +
+            str(len(sources) - len(stale)) + "\n")
+    return 0
+
+
+def main(argv=None):
+    """Run command-line converter, return exit status."""
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+    options = _get_options(parser, args)
+    for path in args.inputs:
+        if not os.path.exists(path):
+            parser.error("no such file or directory: " + path)
+    many = len(args.inputs) > 1 or any(
+        os.path.isdir(path) for path in args.inputs)
+    if args.output is not None and (many or os.path.isdir(args.output)):
+        return _convert_tree(parser, args, options)
+    if many:
+        parser.error("--output directory is required")
+    if args.check:
+        parser.error("--check requires --output directory")
+    return _convert_stream(args, options)
@@ -470,3 +470,20 @@ char *cmark_render_commonmark(cmark_node *root, int options, int width) {
   }
   return cmark_render(root, options, width, outc, S_render_node);
 }
+
+char *paka_render_commonmark_contents(cmark_node *root, int options,
+                                      int width) {
+  if (options & CMARK_OPT_HARDBREAKS) {
+    width = 0;
+  }
+  return paka_render_contents(root, options, width, outc, S_render_node);
+}
+
+int paka_render_commonmark_to(cmark_node *root, int options, int width,
+                              size_t chunk_size, paka_write_fn write_fn, void *data) {
+  if (options & CMARK_OPT_HARDBREAKS) {
+    width = 0;
+  }
+  return paka_render_to(root, options, width, outc, S_render_node, chunk_size,
+                        write_fn, data);
+}
@@ -1,4 +1,5 @@
 #include <assert.h>
+#include <stdint.h>
 #include <stdio.h>
 #include <string.h>
 
@@ -43,14 +44,53 @@ static const char HTML_ESCAPE_TABLE[] = {
 static const char *HTML_ESCAPES[] = {"",      "&quot;", "&amp;", "&#39;",
                                      "&#47;", "&lt;",   "&gt;"};
 
+static const bufsize_t HTML_ESCAPES_LEN[] = {0, 6, 5, 5, 5, 4, 4};
+
+/**
+ * Word-at-a-time scanning: HAS_BYTE(v, c) is non-zero if and only if
+ * any byte of 64-bit word v equals c (see "Bit Twiddling Hacks",
+ * "Determine if a word has a byte equal to n").
+ */
+#define ONES_64 UINT64_C(0x0101010101010101)
+#define HIGHS_64 UINT64_C(0x8080808080808080)
+#define HAS_ZERO_BYTE(v) (((v) - ONES_64) & ~(v) & HIGHS_64)
+#define HAS_BYTE(v, c) HAS_ZERO_BYTE((v) ^ (ONES_64 * (uint8_t)(c)))
+
+static inline int needs_escape(uint8_t c, int secure) {
+  /* The forward slash and single quote are only escaped in secure mode */
+  return HTML_ESCAPE_TABLE[c] && (secure || (c != '/' && c != '\''));
+}
+
+/* Return position of the first byte at or after i that needs escaping,
+ * or size if there is none. */
+static bufsize_t find_escape(const uint8_t *src, bufsize_t i, bufsize_t size,
+                             int secure) {
+  uint64_t v, found;
+
+  while (i + 8 <= size) {
+    memcpy(&v, src + i, 8);
+    found = HAS_BYTE(v, '&') | HAS_BYTE(v, '<') | HAS_BYTE(v, '>') |
+            HAS_BYTE(v, '"');
+    if (secure)
+      found |= HAS_BYTE(v, '\'') | HAS_BYTE(v, '/');
+    if (found)
+      break;
+    i += 8;
+  }
+
+  while (i < size && !needs_escape(src[i], secure))
+    i++;
+
+  return i;
+}
+
 int houdini_escape_html(cmark_strbuf *ob, const uint8_t *src, bufsize_t size,
                          int secure) {
-  bufsize_t i = 0, org, esc = 0;
+  bufsize_t i = 0, org, esc;
 
   while (i < size) {
     org = i;
-    while (i < size && (esc = HTML_ESCAPE_TABLE[src[i]]) == 0)
-      i++;
+    i = find_escape(src, i, size, secure);
 
     if (i > org)
       cmark_strbuf_put(ob, src + org, i - org);
@@ -59,12 +99,9 @@ int houdini_escape_html(cmark_strbuf *ob, const uint8_t *src, bufsize_t size,
     if (unlikely(i >= size))
       break;
 
-    /* The forward slash is only escaped in secure mode */
-    if ((src[i] == '/' || src[i] == '\'') && !secure) {
-      cmark_strbuf_putc(ob, src[i]);
-    } else {
-      cmark_strbuf_puts(ob, HTML_ESCAPES[esc]);
-    }
+    esc = HTML_ESCAPE_TABLE[src[i]];
+    cmark_strbuf_put(ob, (const unsigned char *)HTML_ESCAPES[esc],
+                     HTML_ESCAPES_LEN[esc]);
 
     i++;
   }
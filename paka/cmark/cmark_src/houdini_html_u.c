@@ -18,41 +18,46 @@
 #define likely(e) __builtin_expect((e), 1)
 #define unlikely(e) __builtin_expect((e), 0)
 
-/* Binary tree lookup code for entities added by JGM */
-
-static const unsigned char *S_lookup(int i, int low, int hi,
-                                     const unsigned char *s, int len,
-                                     bufsize_t *size_out) {
-  int j;
-  uint32_t value = cmark_entities[i];
-  const unsigned char *ent_name = cmark_entity_text + ENT_TEXT_IDX(value);
-  int ent_len = ENT_NAME_SIZE(value);
-  int min_len = len < ent_len ? len : ent_len;
-  int cmp =
-      strncmp((const char *)s, (const char *)ent_name, min_len);
-  if (cmp == 0)
-    cmp = len - ent_len;
-  if (cmp == 0) {
-    *size_out = ENT_REPL_SIZE(value);
-    return ent_name + ent_len;
-  } else if (cmp <= 0 && i > low) {
-    j = i - ((i - low) / 2);
-    if (j == i)
-      j -= 1;
-    return S_lookup(j, low, i - 1, s, len, size_out);
-  } else if (cmp > 0 && i < hi) {
-    j = i + ((hi - i) / 2);
-    if (j == i)
-      j += 1;
-    return S_lookup(j, i + 1, hi, s, len, size_out);
-  } else {
-    return NULL;
+/* Perfect hash lookup of entities: entities_hash.inc is generated from
+ * entities.inc at build time (see paka/cmark/build_cmark.py, which has
+ * the same hash function). Name is looked up with single comparison. */
+
+#include "entities_hash.inc"
+
+static inline uint32_t S_entity_hash(const unsigned char *s, int len,
+                                     uint32_t seed) {
+  uint32_t h = UINT32_C(0x811C9DC5) ^ seed;
+  int i;
+
+  for (i = 0; i < len; i++) {
+    h ^= s[i];
+    h *= UINT32_C(0x01000193);
   }
+  h ^= h >> 16;
+  h *= UINT32_C(0x85EBCA6B);
+  h ^= h >> 13;
+  h *= UINT32_C(0xC2B2AE35);
+  h ^= h >> 16;
+  return h;
 }
 
 static const unsigned char *S_lookup_entity(const unsigned char *s, int len,
                                             bufsize_t *size_out) {
-  return S_lookup(ENT_TABLE_SIZE / 2, 0, ENT_TABLE_SIZE - 1, s, len, size_out);
+  uint32_t disp =
+      cmark_entity_hash_disp[S_entity_hash(s, len, 0) & (ENT_HASH_BUCKETS - 1)];
+  int i =
+      cmark_entity_hash_slots[S_entity_hash(s, len, disp) & (ENT_HASH_SLOTS - 1)];
+  uint32_t value;
+  const unsigned char *ent_name;
+
+  if (i < 0)
+    return NULL;
+  value = cmark_entities[i];
+  ent_name = cmark_entity_text + ENT_TEXT_IDX(value);
+  if ((int)ENT_NAME_SIZE(value) != len || memcmp(s, ent_name, len) != 0)
+    return NULL;
+  *size_out = ENT_REPL_SIZE(value);
+  return ent_name + len;
 }
 
 bufsize_t houdini_unescape_ent(cmark_strbuf *ob, const uint8_t *src,
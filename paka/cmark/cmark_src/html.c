@@ -10,6 +10,7 @@
 #include "buffer.h"
 #include "houdini.h"
 #include "scanners.h"
+#include "paka_stream.h"
 
 #define BUFFER_SIZE 100
 
@@ -343,3 +344,27 @@ char *cmark_render_html(cmark_node *root, int options) {
   cmark_iter_free(iter);
   return result;
 }
+
+int paka_render_html_to(cmark_node *root, int options, size_t chunk_size,
+                        paka_write_fn write_fn, void *data) {
+  cmark_strbuf html = CMARK_BUF_INIT(root->mem);
+  cmark_event_type ev_type;
+  cmark_node *cur;
+  struct render_state state = {&html, NULL};
+  cmark_iter *iter = cmark_iter_new(root);
+  int error = 0;
+
+  while (!error && (ev_type = cmark_iter_next(iter)) != CMARK_EVENT_DONE) {
+    cur = cmark_iter_get_node(iter);
+    S_render_node(cur, ev_type, &state, options);
+    // Last byte is kept, as cr() looks at it.
+    if ((size_t)html.size >= chunk_size)
+      error = paka_strbuf_flush(&html, 1, write_fn, data);
+  }
+  if (!error)
+    error = paka_strbuf_flush(&html, 0, write_fn, data);
+
+  cmark_strbuf_free(&html);
+  cmark_iter_free(iter);
+  return error;
+}
@@ -454,3 +454,9 @@ static int S_render_node(cmark_renderer *renderer, cmark_node *node,
 char *cmark_render_latex(cmark_node *root, int options, int width) {
   return cmark_render(root, options, width, outc, S_render_node);
 }
+
+int paka_render_latex_to(cmark_node *root, int options, int width,
+                         size_t chunk_size, paka_write_fn write_fn, void *data) {
+  return paka_render_to(root, options, width, outc, S_render_node, chunk_size,
+                        write_fn, data);
+}
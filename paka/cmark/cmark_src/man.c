@@ -279,3 +279,9 @@ static int S_render_node(cmark_renderer *renderer, cmark_node *node,
 char *cmark_render_man(cmark_node *root, int options, int width) {
   return cmark_render(root, options, width, S_outc, S_render_node);
 }
+
+int paka_render_man_to(cmark_node *root, int options, int width,
+                       size_t chunk_size, paka_write_fn write_fn, void *data) {
+  return paka_render_to(root, options, width, S_outc, S_render_node, chunk_size,
+                        write_fn, data);
+}
@@ -193,3 +193,99 @@ char *cmark_render(cmark_node *root, int options, int width,
 
   return result;
 }
+
+char *paka_render_contents(cmark_node *root, int options, int width,
+                           void (*outc)(cmark_renderer *, cmark_escaping,
+                                        int32_t, unsigned char),
+                           int (*render_node)(cmark_renderer *renderer,
+                                              cmark_node *node,
+                                              cmark_event_type ev_type,
+                                              int options)) {
+  cmark_mem *mem = root->mem;
+  cmark_strbuf pref = CMARK_BUF_INIT(mem);
+  cmark_strbuf buf = CMARK_BUF_INIT(mem);
+  cmark_node *cur;
+  cmark_event_type ev_type;
+  char *result;
+  cmark_iter *iter = cmark_iter_new(root);
+
+  cmark_renderer renderer = {options,
+                             mem,    &buf,    &pref,      0,      width,
+                             0,      0,       true,       true,   false,
+                             false,  NULL,
+                             outc,   S_cr,    S_blankline, S_out};
+
+  // Same as cmark_render, but events of root itself are skipped, so
+  // that children are rendered together (with separators between them
+  // that depend on their siblings and on tightness of list).
+  while ((ev_type = cmark_iter_next(iter)) != CMARK_EVENT_DONE) {
+    cur = cmark_iter_get_node(iter);
+    if (cur == root)
+      continue;
+    if (!render_node(&renderer, cur, ev_type, options)) {
+      cmark_iter_reset(iter, cur, CMARK_EVENT_EXIT);
+    }
+  }
+
+  if (root->first_child != NULL && cmark_node_is_block(root->first_child)) {
+    if (renderer.buffer->size == 0 || renderer.buffer->ptr[renderer.buffer->size - 1] != '\n') {
+      cmark_strbuf_putc(renderer.buffer, '\n');
+    }
+  }
+
+  result = (char *)cmark_strbuf_detach(renderer.buffer);
+
+  cmark_iter_free(iter);
+  cmark_strbuf_free(renderer.prefix);
+  cmark_strbuf_free(renderer.buffer);
+
+  return result;
+}
+
+int paka_render_to(cmark_node *root, int options, int width,
+                   void (*outc)(cmark_renderer *, cmark_escaping, int32_t,
+                                unsigned char),
+                   int (*render_node)(cmark_renderer *renderer,
+                                      cmark_node *node,
+                                      cmark_event_type ev_type, int options),
+                   size_t chunk_size, paka_write_fn write_fn, void *data) {
+  cmark_mem *mem = root->mem;
+  cmark_strbuf pref = CMARK_BUF_INIT(mem);
+  cmark_strbuf buf = CMARK_BUF_INIT(mem);
+  cmark_node *cur;
+  cmark_event_type ev_type;
+  cmark_iter *iter = cmark_iter_new(root);
+  int error = 0;
+
+  cmark_renderer renderer = {options,
+                             mem,    &buf,    &pref,      0,      width,
+                             0,      0,       true,       true,   false,
+                             false,  NULL,
+                             outc,   S_cr,    S_blankline, S_out};
+
+  while (!error && (ev_type = cmark_iter_next(iter)) != CMARK_EVENT_DONE) {
+    cur = cmark_iter_get_node(iter);
+    if (!render_node(&renderer, cur, ev_type, options)) {
+      cmark_iter_reset(iter, cur, CMARK_EVENT_EXIT);
+    }
+    // last_breakable is offset in buffer (so flush only when there
+    // is none), and S_out looks back at up to two last bytes.
+    if ((size_t)renderer.buffer->size >= chunk_size &&
+        renderer.last_breakable == 0)
+      error = paka_strbuf_flush(renderer.buffer, 2, write_fn, data);
+  }
+
+  if (!error && cmark_node_is_block(root)) {
+    if (renderer.buffer->size == 0 || renderer.buffer->ptr[renderer.buffer->size - 1] != '\n') {
+      cmark_strbuf_putc(renderer.buffer, '\n');
+    }
+  }
+  if (!error)
+    error = paka_strbuf_flush(renderer.buffer, 0, write_fn, data);
+
+  cmark_iter_free(iter);
+  cmark_strbuf_free(renderer.prefix);
+  cmark_strbuf_free(renderer.buffer);
+
+  return error;
+}
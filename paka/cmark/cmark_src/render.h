@@ -9,6 +9,7 @@ extern "C" {
 #include <stdlib.h>
 
 #include "buffer.h"
+#include "paka_stream.h"
 
 typedef enum { LITERAL, NORMAL, TITLE, URL } cmark_escaping;
 
@@ -50,6 +51,22 @@ char *cmark_render(cmark_node *root, int options, int width,
                                       cmark_node *node,
                                       cmark_event_type ev_type, int options));
 
+char *paka_render_contents(cmark_node *root, int options, int width,
+                           void (*outc)(cmark_renderer *, cmark_escaping,
+                                        int32_t, unsigned char),
+                           int (*render_node)(cmark_renderer *renderer,
+                                              cmark_node *node,
+                                              cmark_event_type ev_type,
+                                              int options));
+
+int paka_render_to(cmark_node *root, int options, int width,
+                   void (*outc)(cmark_renderer *, cmark_escaping, int32_t,
+                                unsigned char),
+                   int (*render_node)(cmark_renderer *renderer,
+                                      cmark_node *node,
+                                      cmark_event_type ev_type, int options),
+                   size_t chunk_size, paka_write_fn write_fn, void *data);
+
 #ifdef __cplusplus
 }
 #endif
@@ -7,6 +7,7 @@
 #include "cmark.h"
 #include "node.h"
 #include "buffer.h"
+#include "paka_stream.h"
 
 #define BUFFER_SIZE 100
 #define MAX_INDENT 40
@@ -227,3 +228,29 @@ char *cmark_render_xml(cmark_node *root, int options) {
   cmark_iter_free(iter);
   return result;
 }
+
+int paka_render_xml_to(cmark_node *root, int options, size_t chunk_size,
+                       paka_write_fn write_fn, void *data) {
+  cmark_strbuf xml = CMARK_BUF_INIT(root->mem);
+  cmark_event_type ev_type;
+  cmark_node *cur;
+  struct render_state state = {&xml, 0};
+  cmark_iter *iter = cmark_iter_new(root);
+  int error = 0;
+
+  cmark_strbuf_puts(state.xml, "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n");
+  cmark_strbuf_puts(state.xml,
+                    "<!DOCTYPE document SYSTEM \"CommonMark.dtd\">\n");
+  while (!error && (ev_type = cmark_iter_next(iter)) != CMARK_EVENT_DONE) {
+    cur = cmark_iter_get_node(iter);
+    S_render_node(cur, ev_type, &state, options);
+    if ((size_t)xml.size >= chunk_size)
+      error = paka_strbuf_flush(&xml, 0, write_fn, data);
+  }
+  if (!error)
+    error = paka_strbuf_flush(&xml, 0, write_fn, data);
+
+  cmark_strbuf_free(&xml);
+  cmark_iter_free(iter);
+  return error;
+}
@@ -0,0 +1,464 @@
+"""Rendering of many documents with pool of workers.
+
+By default workers are processes. They read sources themselves (only
+paths travel to them) and never send rendered documents back pickled:
+they either write them directly to output files, or put them (a chunk
+of documents at a time) into :py:mod:`multiprocessing.shared_memory`
+segments, so that only names of segments, offsets and lengths are sent
+back.
+
+Workers can also be threads (C library runs without holding the GIL,
+so they scale for large documents and on free-threaded builds), or
+subinterpreters with their own GILs (see
+:py:func:`supports_interpreters`).
+
+"""
+
+import os
+import time
+import secrets
+import functools
+import collections
+import multiprocessing
+import concurrent.futures
+
+
+FORMATS = {
+    "html": ("to_html", ".html"),
+    "xml": ("to_xml", ".xml"),
+    "commonmark": ("to_commonmark", ".md"),
+    "man": ("to_man", ".man"),
+    "latex": ("to_latex", ".tex")}
+"""Mapping of format name to name of function and output file suffix."""
+
+SUFFIXES = (".md", ".markdown")
+"""Suffixes of files collected from directories."""
+
+ENCODING = "utf-8"
+
+BACKENDS = ("processes", "threads", "interpreters")
+"""Kinds of workers :py:func:`render_corpus` can use."""
+
+
+SourceFile = collections.namedtuple("SourceFile", "path relative_path")
+SourceFile.__doc__ = """Source file and its path relative to root of corpus."""
+
+
+def iter_sources(path, suffixes=SUFFIXES):
+    """Yield :py:class:`SourceFile` for files under ``path``.
+
+    If ``path`` is a file, it is the only one yielded (with its name as
+    relative path). If it is a directory, all files with one of
+    ``suffixes`` are yielded (in sorted order).
+
+    """
+    if not os.path.isdir(path):
+        yield SourceFile(path, os.path.basename(path))
+        return
+    for dir_path, dir_names, file_names in os.walk(path):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            if file_name.endswith(tuple(suffixes)):
+                file_path = os.path.join(dir_path, file_name)
+                yield SourceFile(file_path, os.path.relpath(file_path, path))
+
+
+def output_path(output_dir, relative_path, format_name):
+    """Return path of output file for source with relative path."""
+    base = os.path.splitext(relative_path)[0]
+    return os.path.join(output_dir, base + FORMATS[format_name][1])
+
+
+def write_atomic(path, data):
+    """Write bytes to file, replacing it only when all is written."""
+    dir_path = os.path.dirname(path)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+    tmp_path = path + "." + str(os.getpid()) + ".tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_source(path):
+    """Return text of source file."""
+    with open(path, "rb") as file:
+        return file.read().decode(ENCODING)
+
+
+def _render(format_name, options, path, text):
+    # Imported here as this module is imported by paka.cmark itself.
+    # pylint: disable-next=import-outside-toplevel,cyclic-import
+    from paka import cmark
+
+    if text is None:
+        text = read_source(path)
+    func = getattr(cmark, FORMATS[format_name][0])
+    return func(text, **options).encode(ENCODING)
+
+
+def _render_timed(format_name, options, path, text, stats):
+    """Render document, appending its sizes and duration to stats."""
+    started = time.perf_counter()
+    if text is None:
+        text = read_source(path)
+    data = _render(format_name, options, path, text)
+    seconds = time.perf_counter() - started
+    stats.append((len(text.encode(ENCODING)), len(data), seconds))
+    return data
+
+
+def _render_chunk(task):
+    # pylint: disable=too-many-locals
+    """Render chunk of documents (in worker process).
+
+    Return name of shared memory segment (or None), results, and
+    input size, output size and duration of every document (or None,
+    unless they were asked for).
+
+    """
+    format_name, options, output_dir, segment_name, items, timed = task
+    stats = None
+    render = _render
+    if timed:
+        stats = []
+        render = functools.partial(_render_timed, stats=stats)
+    if output_dir is not None:
+        results = []
+        for index, path, text, relative_path in items:
+            data = render(format_name, options, path, text)
+            out_path = output_path(output_dir, relative_path, format_name)
+            write_atomic(out_path, data)
+            results.append((index, out_path, len(data)))
+        return None, results, stats
+    outputs = [
+        (index, render(format_name, options, path, text))
+        for index, path, text, _ in items]
+    if segment_name is None:
+        return None, outputs, stats
+    return _to_shared_memory(segment_name, outputs) + (stats,)
+
+
+def _create_segment(name, size):
+    """Create shared memory segment that parent process will unlink."""
+    # pylint: disable-next=import-outside-toplevel
+    from multiprocessing import shared_memory
+
+    try:
+        # pylint: disable-next=unexpected-keyword-arg
+        return shared_memory.SharedMemory(
+            name=name, create=True, size=size, track=False)
+    except TypeError:  # Python < 3.13
+        # pylint: disable-next=import-outside-toplevel
+        from multiprocessing import resource_tracker
+
+        segment = shared_memory.SharedMemory(
+            name=name, create=True, size=size)
+        # Otherwise resource tracker of worker would unlink segment
+        # (or complain that it is gone) when worker exits.
+        resource_tracker.unregister(
+            segment._name, "shared_memory")  # pylint: disable=protected-access
+        return segment
+
+
+def _to_shared_memory(name, outputs):
+    size = sum(len(data) for _, data in outputs)
+    segment = _create_segment(name, max(size, 1))
+    try:
+        results = []
+        offset = 0
+        for index, data in outputs:
+            segment.buf[offset:offset + len(data)] = data
+            results.append((index, offset, len(data)))
+            offset += len(data)
+        return segment.name, results
+    finally:
+        segment.close()
+
+
+def _from_shared_memory(name, results):
+    # pylint: disable-next=import-outside-toplevel
+    from multiprocessing import shared_memory
+
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        return [
+            (index, bytes(segment.buf[offset:offset + length]))
+            for index, offset, length in results]
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def _unlink_segment(name):
+    """Unlink shared memory segment, if it was created."""
+    # pylint: disable-next=import-outside-toplevel
+    from multiprocessing import shared_memory
+
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    segment.close()
+    segment.unlink()
+
+
+def _iter_items(sources):
+    """Yield index, key, path, text and relative path of each source."""
+    if isinstance(sources, (str, os.PathLike)):
+        sources = iter_sources(sources)
+    for index, source in enumerate(sources):
+        if isinstance(source, SourceFile):
+            yield index, source.path, source.path, None, source.relative_path
+        elif isinstance(source, tuple):
+            key, text = source
+            yield index, key, None, text, str(key)
+        else:
+            yield index, source, source, None, os.path.basename(source)
+
+
+# pylint: disable-next=useless-object-inheritance,too-few-public-methods
+class _Chunks(object):
+    """Chunks of sources read lazily, and what parent tracks of them.
+
+    Sources are read only as chunks are taken (by pool of workers).
+    Key of source is kept only until its result is taken back, and so
+    is name of shared memory segment of chunk (if it is used). Names
+    of segments are chosen here, not by workers, so that segments of
+    results that are never taken (when caller stops early, or on error)
+    can be unlinked. When documents are written to output directory,
+    their output paths are checked here too (before they are written).
+
+    """
+
+    def __init__(self, sources, chunk_size, use_shared_memory):
+        self.items = _iter_items(sources)
+        self.chunk_size = chunk_size
+        self.keys = {}
+        self.total = None
+        if (hasattr(sources, "__len__") and
+                not isinstance(sources, (str, os.PathLike))):
+            self.total = len(sources)
+        self.segment_prefix = None
+        if use_shared_memory:
+            self.segment_prefix = "pkc" + secrets.token_hex(6) + "_"
+        self.segments = set()
+        self.outputs = {}
+
+    def _check_output(self, index, key, relative_path):
+        """Reject output path that is outside or taken by other source."""
+        path = os.path.normpath(relative_path)
+        if (os.path.isabs(path) or os.path.splitdrive(path)[0] or
+                path.split(os.sep)[0] == os.pardir):
+            raise ValueError(
+                "output path of " + repr(key) + " is outside of output "
+                "directory: " + repr(relative_path))
+        other = self.outputs.setdefault(
+            os.path.normcase(os.path.splitext(path)[0]), (index, key))
+        if other[0] != index:
+            raise ValueError(
+                "sources " + repr(other[1]) + " and " + repr(key) +
+                " have the same output path")
+
+    def _iter_chunks(self, check_outputs):
+        chunk = []
+        count = 0
+        for item in self.items:
+            if check_outputs:
+                self._check_output(item[0], item[1], item[4])
+            self.keys[item[0]] = item[1]
+            chunk.append(item[:1] + item[2:])
+            count += 1
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        self.total = count
+        if chunk:
+            yield chunk
+
+    def iter_tasks(self, format_name, options, output_dir, timed):
+        """Yield tasks of :py:func:`_render_chunk`."""
+        for number, chunk in enumerate(
+                self._iter_chunks(output_dir is not None)):
+            segment_name = None
+            if self.segment_prefix is not None:
+                segment_name = self.segment_prefix + str(number)
+                self.segments.add(segment_name)
+            yield (
+                format_name, options, output_dir, segment_name, chunk,
+                timed)
+
+
+def _recorder():
+    """Return recorder of metrics, or None if they are not recorded."""
+    # Imported here as this module is imported by paka.cmark itself.
+    # pylint: disable-next=import-outside-toplevel,cyclic-import
+    from paka.cmark import metrics
+
+    return metrics._recorder  # pylint: disable=protected-access
+
+
+def _import_cmark():
+    # pylint: disable-next=import-outside-toplevel,cyclic-import,unused-import
+    import paka.cmark  # noqa: F401
+
+
+_interpreters_supported = None  # pylint: disable=invalid-name
+
+
+def supports_interpreters():
+    """Check if documents can be rendered in subinterpreters.
+
+    It requires :py:class:`concurrent.futures.InterpreterPoolExecutor`
+    (Python 3.14+), and extension module of this package being
+    importable in isolated subinterpreters (that depends on version
+    of CFFI it is built with).
+
+    """
+    global _interpreters_supported  # pylint: disable=global-statement
+    if _interpreters_supported is None:
+        executor_class = getattr(
+            concurrent.futures, "InterpreterPoolExecutor", None)
+        if executor_class is None:
+            _interpreters_supported = False
+        else:
+            try:
+                with executor_class(1) as executor:
+                    executor.submit(_import_cmark).result()
+            except Exception:  # pylint: disable=broad-exception-caught
+                _interpreters_supported = False
+            else:
+                _interpreters_supported = True
+    return _interpreters_supported
+
+
+def _make_executor(backend, workers):
+    if backend == "threads":
+        return concurrent.futures.ThreadPoolExecutor(
+            workers, thread_name_prefix="paka-cmark")
+    if not supports_interpreters():
+        raise RuntimeError(
+            "rendering in subinterpreters is not supported (requires "
+            "Python 3.14+ and extension module that can be loaded in "
+            "isolated subinterpreters)")
+    # pylint: disable-next=no-member
+    return concurrent.futures.InterpreterPoolExecutor(workers)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_corpus(
+        sources, format="html", workers=None, output_dir=None,
+        progress=None, chunk_size=32, backend="processes", **options):
+    # pylint: disable=redefined-builtin,too-many-locals
+    """Render many documents using pool of workers.
+
+    Parameters
+    ----------
+    sources
+        Path of directory (all files with one of :py:data:`SUFFIXES`
+        in it are rendered) or of single file, or iterable of sources.
+        Every source is either path of file, :py:class:`SourceFile`,
+        or pair of key and text (for documents that are already in
+        memory; key is used as relative path of output file).
+    format: str
+        One of :py:data:`FORMATS` (``"html"`` by default).
+    workers: int or None
+        Number of workers (number of CPUs if None). With ``0``
+        documents are rendered in current thread.
+    output_dir: str or None
+        If given, workers write rendered documents to files in this
+        directory (keeping relative paths of sources, with suffix of
+        ``format``), replacing them atomically. :py:exc:`ValueError`
+        is raised (as sources are read) for source whose output path
+        is absolute, is outside of this directory, or is the same as
+        of another source.
+    progress: callable or None
+        Called with numbers of done documents and of all documents
+        after each chunk of documents. Sources are read lazily, so
+        number of all documents is None until all sources are read,
+        unless ``sources`` has length (e.g. is list).
+    chunk_size: int
+        Number of documents sent to worker at once.
+    backend: str
+        One of :py:data:`BACKENDS`: worker processes (default),
+        threads, or subinterpreters (:py:exc:`RuntimeError` is raised
+        if they are not supported).
+    options
+        Keyword arguments of function rendering format (e.g.
+        ``safe=False`` for :py:func:`~paka.cmark.to_html`).
+
+    Yields
+    ------
+    tuple
+        Pairs of key of source (its path, or key of in-memory source)
+        and either rendered document (as UTF-8 bytes), or path of
+        output file if ``output_dir`` is given, in order of sources.
+
+    """
+    if format not in FORMATS:
+        raise ValueError("unknown format: " + repr(format))
+    if backend not in BACKENDS:
+        raise ValueError("unknown backend: " + repr(backend))
+    chunks = _Chunks(
+        sources, chunk_size,
+        workers != 0 and backend == "processes" and output_dir is None)
+    tasks = chunks.iter_tasks(
+        format, options, output_dir, _recorder() is not None)
+    results_iter = _map(_render_chunk, tasks, workers, backend)
+    done = 0
+    try:
+        for segment_name, results, stats in results_iter:
+            if segment_name is not None:
+                results = _from_shared_memory(segment_name, results)
+                chunks.segments.discard(segment_name)
+            recorder = _recorder()
+            if stats is not None and recorder is not None:
+                for input_bytes, output_bytes, seconds in stats:
+                    recorder.observe(
+                        "render_corpus", input_bytes, output_bytes, 0.0,
+                        seconds)
+            for result in results:
+                yield chunks.keys.pop(result[0]), result[1]
+            done += len(results)
+            if progress is not None:
+                progress(done, chunks.total)
+    finally:
+        # Pool is stopped first, so that no segments are created after.
+        results_iter.close()
+        for segment_name in list(chunks.segments):
+            _unlink_segment(segment_name)
+
+
+def _map(func, tasks, workers, backend="processes"):
+    """Yield results of tasks in order, taking tasks only as needed."""
+    if workers == 0:
+        for task in tasks:
+            yield func(task)
+        return
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if backend == "processes":
+        # Pool takes tasks only as fast as its pipe to workers accepts
+        # them.
+        with multiprocessing.Pool(workers) as pool:
+            yield from pool.imap(func, tasks)
+        return
+    # Unlike Executor.map, which submits all tasks at once, keep only
+    # few of them in flight.
+    futures = collections.deque()
+    with _make_executor(backend, workers) as executor:
+        try:
+            for task in tasks:
+                futures.append(executor.submit(func, task))
+                if len(futures) > 2 * workers:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,10 @@
+#include "buffer.h"
+#include "houdini.h"
+#include "paka_cmark.h"
+
+char *paka_escape_html(const char *buffer, size_t len, int secure) {
+  cmark_strbuf out = CMARK_BUF_INIT(cmark_get_default_mem_allocator());
+
+  houdini_escape_html(&out, (const uint8_t *)buffer, (bufsize_t)len, secure);
+  return (char *)cmark_strbuf_detach(&out);
+}
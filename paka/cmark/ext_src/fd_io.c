@@ -0,0 +1,88 @@
+#include <errno.h>
+#include <stdlib.h>
+#ifdef _WIN32
+#include <io.h>
+#else
+#include <unistd.h>
+#endif
+
+#include "cmark.h"
+#include "paka_cmark.h"
+
+// Parsing from and rendering to file descriptors, entirely in C.
+
+int paka_parser_feed_fd(cmark_parser *parser, int fd, size_t buffer_size,
+                        size_t *bytes_read) {
+  char *buffer;
+  int error = 0;
+
+  if (buffer_size == 0)
+    buffer_size = 1;
+  buffer = (char *)malloc(buffer_size);
+  if (buffer == NULL)
+    return ENOMEM;
+  for (;;) {
+#ifdef _WIN32
+    int len = _read(fd, buffer, buffer_size > 0x40000000
+                                    ? 0x40000000
+                                    : (unsigned int)buffer_size);
+#else
+    ssize_t len = read(fd, buffer, buffer_size);
+#endif
+    if (len < 0) {
+      if (errno == EINTR)
+        continue;
+      error = errno ? errno : EIO;
+      break;
+    }
+    if (len == 0)
+      break;
+    cmark_parser_feed(parser, buffer, (size_t)len);
+    *bytes_read += (size_t)len;
+  }
+  free(buffer);
+  return error;
+}
+
+static int S_render_to(cmark_node *root, paka_format format, int options,
+                       int width, size_t chunk_size, paka_write_fn write_fn,
+                       void *data) {
+  switch (format) {
+  case PAKA_FORMAT_HTML:
+    return paka_render_html_to(root, options, chunk_size, write_fn, data);
+  case PAKA_FORMAT_XML:
+    return paka_render_xml_to(root, options, chunk_size, write_fn, data);
+  case PAKA_FORMAT_COMMONMARK:
+    return paka_render_commonmark_to(root, options, width, chunk_size,
+                                     write_fn, data);
+  case PAKA_FORMAT_MAN:
+    return paka_render_man_to(root, options, width, chunk_size, write_fn,
+                              data);
+  case PAKA_FORMAT_LATEX:
+    return paka_render_latex_to(root, options, width, chunk_size, write_fn,
+                                data);
+  }
+  return EINVAL;
+}
+
+int paka_render_fd(int in_fd, int out_fd, paka_format format, int options,
+                   int width, size_t chunk_size, paka_fd_stats *stats) {
+  cmark_parser *parser = cmark_parser_new(options);
+  paka_fd_writer writer = {out_fd, 0};
+  cmark_node *root;
+  int error;
+
+  stats->bytes_read = 0;
+  stats->bytes_written = 0;
+  if (parser == NULL)
+    return ENOMEM;
+  error = paka_parser_feed_fd(parser, in_fd, chunk_size, &stats->bytes_read);
+  root = cmark_parser_finish(parser);
+  cmark_parser_free(parser);
+  if (error == 0)
+    error = S_render_to(root, format, options, width, chunk_size,
+                        paka_write_fd, &writer);
+  cmark_node_free(root);
+  stats->bytes_written = writer.written;
+  return error;
+}
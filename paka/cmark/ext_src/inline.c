@@ -0,0 +1,76 @@
+#include <string.h>
+
+#include "cmark.h"
+#include "node.h"
+#include "inlines.h"
+#include "references.h"
+#include "paka_cmark.h"
+
+// Inline-only parsing: skip block structure detection entirely and run
+// the inline parser over the whole buffer, as if it were the contents
+// of a single paragraph.
+
+static int S_is_leading_space(unsigned char c) {
+  return c == ' ' || c == '\t';
+}
+
+cmark_node *paka_parse_inline(const char *buffer, size_t len, int options) {
+  cmark_mem *mem = cmark_get_default_mem_allocator();
+  cmark_reference_map *refmap;
+  cmark_node *container;
+  unsigned char *data;
+  size_t offset = 0;
+  size_t nuls = 0;
+  size_t i;
+
+  // Block parser strips leading whitespace of paragraph lines.
+  while (offset < len && S_is_leading_space((unsigned char)buffer[offset]))
+    offset++;
+  buffer += offset;
+  len -= offset;
+
+  // Custom inline without "on enter"/"on exit" contents renders
+  // as its children only.
+  container = cmark_node_new_with_mem(CMARK_NODE_CUSTOM_INLINE, mem);
+  container->start_line = 1;
+  container->start_column = (int)offset + 1;
+  // Like block parser, replace NUL bytes with U+FFFD (3 bytes each).
+  for (i = 0; i < len; i++)
+    if (buffer[i] == '\0')
+      nuls++;
+  data = (unsigned char *)mem->calloc(len + 2 * nuls + 1, 1);
+  if (nuls == 0) {
+    memcpy(data, buffer, len);
+  } else {
+    unsigned char *out = data;
+
+    for (i = 0; i < len; i++) {
+      if (buffer[i] == '\0') {
+        *out++ = 0xEF;
+        *out++ = 0xBF;
+        *out++ = 0xBD;
+      } else {
+        *out++ = (unsigned char)buffer[i];
+      }
+    }
+  }
+  container->data = data;
+  container->len = (bufsize_t)(len + 2 * nuls);
+
+  refmap = cmark_reference_map_new(mem);
+  cmark_parse_inlines(mem, container, refmap, options);
+  cmark_reference_map_free(refmap);
+
+  mem->free(container->data);
+  container->data = NULL;
+  container->len = 0;
+  return container;
+}
+
+char *paka_markdown_to_html_inline(const char *buffer, size_t len,
+                                   int options) {
+  cmark_node *container = paka_parse_inline(buffer, len, options);
+  char *result = cmark_render_html(container, options);
+  cmark_node_free(container);
+  return result;
+}
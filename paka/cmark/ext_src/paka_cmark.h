@@ -0,0 +1,177 @@
+#ifndef PAKA_CMARK_H
+#define PAKA_CMARK_H
+
+#include <stddef.h>
+
+#include "cmark.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/** Parse 'buffer' as inline content only (no block structure) and
+ * return a container node whose children are the parsed inlines.
+ * The container renders without any wrapper of its own.
+ */
+cmark_node *paka_parse_inline(const char *buffer, size_t len, int options);
+
+/** Convert 'buffer' of inline content to HTML, without any block
+ * wrappers (e.g. no '<p>'). Returned string must be freed.
+ */
+char *paka_markdown_to_html_inline(const char *buffer, size_t len,
+                                   int options);
+
+/** Truncate tree of nodes to 'max_chars' visible characters (code
+ * points of text, inline code and code blocks; line breaks count as
+ * one), removing everything after the cut point (counted or not) and
+ * appending 'ellipsis' (may be NULL) to last kept text. Return 1 if
+ * tree was truncated, 0 otherwise.
+ */
+int paka_node_truncate(cmark_node *root, int max_chars, const char *ellipsis);
+
+/** Number of node types (values of cmark_node_type). */
+#define PAKA_NODE_TYPE_COUNT (CMARK_NODE_LAST_INLINE + 1)
+
+/** Statistics of tree of nodes. */
+typedef struct {
+  size_t node_counts[PAKA_NODE_TYPE_COUNT]; /* indexed by node type */
+  size_t max_depth;                         /* root has depth of 0 */
+  size_t literal_bytes;                     /* of text, code, HTML */
+  size_t memory;                            /* estimate, in bytes */
+} paka_node_stats;
+
+/** Collect statistics of tree of nodes (starting from 'root') into
+ * 'stats', in single pass over the tree.
+ */
+void paka_node_stats_collect(cmark_node *root, paka_node_stats *stats);
+
+/** Return number of link reference definitions seen by 'parser'
+ * (duplicates included). Call before freeing the parser.
+ */
+size_t paka_parser_count_references(cmark_parser *parser);
+
+/** Reset 'parser' after cmark_parser_finish (when tree of nodes belongs
+ * to caller), so that it can parse next document with 'options'.
+ * Line buffers are kept for reuse, unless their capacity exceeds
+ * 'max_buffer' bytes (content buffer is freed by cmark_parser_finish,
+ * and current line buffer too, unless parser is finished by
+ * paka_parser_parse).
+ */
+void paka_parser_reset(cmark_parser *parser, int options, size_t max_buffer);
+
+/** Parse whole 'buffer' with 'parser' (that is new or reset) and return
+ * tree of nodes. Parser is reset (as with paka_parser_reset) and can
+ * be used again; free it with cmark_parser_free after freeing tree
+ * returned by cmark_parser_finish.
+ */
+cmark_node *paka_parser_parse(cmark_parser *parser, const char *buffer,
+                              size_t len, int options, size_t max_buffer);
+
+/** Convert 'buffer' to HTML using 'parser' (as paka_parser_parse does).
+ * Returned string must be freed.
+ */
+char *paka_parser_markdown_to_html(cmark_parser *parser, const char *buffer,
+                                   size_t len, int options,
+                                   size_t max_buffer);
+
+/** Function receiving rendered output in chunks: called with 'data'
+ * given to renderer, must return 0 on success (otherwise rendering is
+ * stopped and the value is returned by renderer).
+ */
+typedef int (*paka_write_fn)(void *data, const char *buffer, size_t len);
+
+/** File descriptor and number of bytes written to it so far. */
+typedef struct {
+  int fd;
+  size_t written;
+} paka_fd_writer;
+
+/** Write function writing to file descriptor of 'data' (pointer to
+ * paka_fd_writer). Return 0 on success, otherwise errno.
+ */
+int paka_write_fd(void *data, const char *buffer, size_t len);
+
+/** Memory (e.g. of bytearray) that output is copied into: first 'size'
+ * bytes of output go to 'ptr', the rest to 'overflow' (allocated as
+ * needed, must be freed). 'written' is size of whole output so far.
+ */
+typedef struct {
+  char *ptr;
+  size_t size;
+  size_t written;
+  char *overflow;
+  size_t overflow_capacity;
+} paka_memory_writer;
+
+/** Write function copying to memory of 'data' (pointer to
+ * paka_memory_writer). Return 0 on success, otherwise ENOMEM.
+ */
+int paka_write_memory(void *data, const char *buffer, size_t len);
+
+/** Render tree of nodes as with cmark_render_html and friends, but
+ * pass output to 'write_fn' in chunks of about 'chunk_size' bytes as
+ * tree is traversed (chunk may be bigger when output of single node
+ * is). Return 0 on success, otherwise value returned by 'write_fn'.
+ */
+int paka_render_html_to(cmark_node *root, int options, size_t chunk_size,
+                        paka_write_fn write_fn, void *data);
+int paka_render_xml_to(cmark_node *root, int options, size_t chunk_size,
+                       paka_write_fn write_fn, void *data);
+int paka_render_commonmark_to(cmark_node *root, int options, int width,
+                              size_t chunk_size, paka_write_fn write_fn,
+                              void *data);
+int paka_render_man_to(cmark_node *root, int options, int width,
+                       size_t chunk_size, paka_write_fn write_fn,
+                       void *data);
+int paka_render_latex_to(cmark_node *root, int options, int width,
+                         size_t chunk_size, paka_write_fn write_fn,
+                         void *data);
+
+/** Render children of 'root' as CommonMark, as they are rendered within
+ * whole tree (but without 'root' itself, e.g. without list marker and
+ * indentation of list item). Returned string must be freed.
+ */
+char *paka_render_commonmark_contents(cmark_node *root, int options,
+                                      int width);
+
+/** Read file descriptor until its end (in reads of 'buffer_size'
+ * bytes), feeding data to 'parser' and adding its size to
+ * 'bytes_read'. Return 0 on success, otherwise errno.
+ */
+int paka_parser_feed_fd(cmark_parser *parser, int fd, size_t buffer_size,
+                        size_t *bytes_read);
+
+/** Formats of paka_render_fd. */
+typedef enum {
+  PAKA_FORMAT_HTML,
+  PAKA_FORMAT_XML,
+  PAKA_FORMAT_COMMONMARK,
+  PAKA_FORMAT_MAN,
+  PAKA_FORMAT_LATEX
+} paka_format;
+
+/** Numbers of bytes read and written by paka_render_fd. */
+typedef struct {
+  size_t bytes_read;
+  size_t bytes_written;
+} paka_fd_stats;
+
+/** Parse document read from 'in_fd' and render it to 'out_fd' (reading
+ * and writing in chunks of 'chunk_size' bytes), setting numbers of
+ * bytes read and written in 'stats' (not adding to its previous
+ * values). Return 0 on success, otherwise errno.
+ */
+int paka_render_fd(int in_fd, int out_fd, paka_format format, int options,
+                   int width, size_t chunk_size, paka_fd_stats *stats);
+
+/** Escape 'buffer' as HTML text the way renderer escapes contents of
+ * text nodes and code ('secure' also escapes "'" and "/"). Returned
+ * string must be freed.
+ */
+char *paka_escape_html(const char *buffer, size_t len, int secure);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,22 @@
+#ifndef PAKA_STREAM_H
+#define PAKA_STREAM_H
+
+#include "buffer.h"
+#include "paka_cmark.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/** Pass contents of 'buf' except last 'keep' bytes to 'write_fn' and
+ * leave only those bytes in 'buf' (renderers look back at them).
+ * Return value returned by 'write_fn' (0 on success).
+ */
+int paka_strbuf_flush(cmark_strbuf *buf, bufsize_t keep,
+                      paka_write_fn write_fn, void *data);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,89 @@
+#include "cmark.h"
+#include "node.h"
+#include "buffer.h"
+#include "parser.h"
+#include "references.h"
+#include "paka_cmark.h"
+
+// Reuse of parser objects: after document is finished (and its tree
+// is taken by caller), parser is reset to state of new one, keeping
+// its line buffers (unless they grew beyond a limit). Content buffer
+// is not kept: finishing block hands its storage to node, and
+// cmark_parser_finish frees whatever is left.
+
+static void S_reuse_buffer(cmark_strbuf *buf, size_t max_buffer) {
+  if ((size_t)buf->asize > max_buffer)
+    cmark_strbuf_free(buf);
+  else
+    cmark_strbuf_clear(buf);
+}
+
+void paka_parser_reset(cmark_parser *parser, int options, size_t max_buffer) {
+  cmark_mem *mem = parser->mem;
+  cmark_reference_map *refmap = parser->refmap;
+  cmark_node *root;
+
+  if (refmap->refs != NULL || refmap->sorted != NULL) {
+    cmark_reference_map_free(refmap);
+    parser->refmap = cmark_reference_map_new(mem);
+  } else {
+    refmap->size = 0;
+    refmap->ref_size = 0;
+    refmap->max_ref_size = 0;
+  }
+
+  S_reuse_buffer(&parser->curline, max_buffer);
+  S_reuse_buffer(&parser->linebuf, max_buffer);
+
+  // Same as document node created by cmark_parser_new.
+  root = cmark_node_new_with_mem(CMARK_NODE_DOCUMENT, mem);
+  root->flags = CMARK_NODE__OPEN;
+  root->start_line = 1;
+  root->start_column = 1;
+  root->end_line = 1;
+
+  parser->root = root;
+  parser->current = root;
+  parser->line_number = 0;
+  parser->offset = 0;
+  parser->column = 0;
+  parser->first_nonspace = 0;
+  parser->first_nonspace_column = 0;
+  parser->thematic_break_kill_pos = 0;
+  parser->indent = 0;
+  parser->blank = false;
+  parser->partially_consumed_tab = false;
+  parser->last_line_length = 0;
+  parser->options = options;
+  parser->last_buffer_ended_with_cr = false;
+  parser->total_size = 0;
+}
+
+cmark_node *paka_parser_parse(cmark_parser *parser, const char *buffer,
+                              size_t len, int options, size_t max_buffer) {
+  cmark_strbuf curline;
+  cmark_node *root;
+
+  parser->options = options;
+  cmark_parser_feed(parser, buffer, len);
+  // cmark_parser_finish frees line buffer, so keep it aside (finishing
+  // uses it only for last line, when it does not end with newline).
+  curline = parser->curline;
+  cmark_strbuf_init(parser->mem, &parser->curline, 0);
+  root = cmark_parser_finish(parser);
+  cmark_strbuf_free(&parser->curline);
+  parser->curline = curline;
+  paka_parser_reset(parser, options, max_buffer);
+  return root;
+}
+
+char *paka_parser_markdown_to_html(cmark_parser *parser, const char *buffer,
+                                   size_t len, int options,
+                                   size_t max_buffer) {
+  cmark_node *root = paka_parser_parse(parser, buffer, len, options,
+                                       max_buffer);
+  char *result = cmark_render_html(root, options);
+
+  cmark_node_free(root);
+  return result;
+}
@@ -0,0 +1,85 @@
+#include <errno.h>
+#include <stdlib.h>
+#include <string.h>
+#ifdef _WIN32
+#include <io.h>
+#else
+#include <unistd.h>
+#endif
+
+#include "buffer.h"
+#include "paka_cmark.h"
+#include "paka_stream.h"
+
+// Support of rendering in chunks (see paka_render_*_to functions in
+// patched renderers of cmark).
+
+int paka_strbuf_flush(cmark_strbuf *buf, bufsize_t keep,
+                      paka_write_fn write_fn, void *data) {
+  bufsize_t len;
+  int error;
+
+  if (buf->size <= keep)
+    return 0;
+  len = buf->size - keep;
+  error = write_fn(data, (const char *)buf->ptr, (size_t)len);
+  cmark_strbuf_drop(buf, len);
+  return error;
+}
+
+int paka_write_fd(void *data, const char *buffer, size_t len) {
+  paka_fd_writer *writer = (paka_fd_writer *)data;
+
+  while (len > 0) {
+#ifdef _WIN32
+    int written = _write(writer->fd, buffer, len > 0x40000000 ? 0x40000000
+                                                      : (unsigned int)len);
+#else
+    ssize_t written = write(writer->fd, buffer, len);
+#endif
+    if (written < 0) {
+      if (errno == EINTR)
+        continue;
+      return errno ? errno : EIO;
+    }
+    buffer += written;
+    len -= (size_t)written;
+    writer->written += (size_t)written;
+  }
+  return 0;
+}
+
+int paka_write_memory(void *data, const char *buffer, size_t len) {
+  paka_memory_writer *writer = (paka_memory_writer *)data;
+  size_t used;
+
+  if (writer->written < writer->size) {
+    size_t fits = writer->size - writer->written;
+
+    if (fits > len)
+      fits = len;
+    memcpy(writer->ptr + writer->written, buffer, fits);
+    writer->written += fits;
+    buffer += fits;
+    len -= fits;
+  }
+  if (len == 0)
+    return 0;
+  used = writer->written - writer->size;
+  if (len > writer->overflow_capacity - used) {
+    size_t capacity = writer->overflow_capacity +
+                      writer->overflow_capacity / 2;
+    char *overflow;
+
+    if (capacity < used + len)
+      capacity = used + len;
+    overflow = (char *)realloc(writer->overflow, capacity);
+    if (overflow == NULL)
+      return ENOMEM;
+    writer->overflow = overflow;
+    writer->overflow_capacity = capacity;
+  }
+  memcpy(writer->overflow + used, buffer, len);
+  writer->written += len;
+  return 0;
+}
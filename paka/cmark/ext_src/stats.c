@@ -0,0 +1,77 @@
+#include <string.h>
+
+#include "cmark.h"
+#include "node.h"
+#include "parser.h"
+#include "references.h"
+#include "paka_cmark.h"
+
+// Statistics of tree of nodes, collected in single pass (without
+// recursion, so deeply nested trees are fine).
+
+static size_t S_strsize(const unsigned char *str) {
+  return str == NULL ? 0 : strlen((const char *)str) + 1;
+}
+
+// Estimate of memory allocated for node (not counting allocator
+// overhead).
+static size_t S_node_memory(cmark_node *node) {
+  size_t size = sizeof(cmark_node);
+
+  if (node->data != NULL)
+    size += (size_t)node->len + 1;
+  switch (node->type) {
+  case CMARK_NODE_CODE_BLOCK:
+    size += S_strsize(node->as.code.info);
+    break;
+  case CMARK_NODE_LINK:
+  case CMARK_NODE_IMAGE:
+    size += S_strsize(node->as.link.url) + S_strsize(node->as.link.title);
+    break;
+  case CMARK_NODE_CUSTOM_BLOCK:
+  case CMARK_NODE_CUSTOM_INLINE:
+    size += S_strsize(node->as.custom.on_enter) +
+            S_strsize(node->as.custom.on_exit);
+    break;
+  default:
+    break;
+  }
+  return size;
+}
+
+void paka_node_stats_collect(cmark_node *root, paka_node_stats *stats) {
+  cmark_node *node = root;
+  size_t depth = 0;
+
+  memset(stats, 0, sizeof(*stats));
+  while (node != NULL) {
+    if (node->type < PAKA_NODE_TYPE_COUNT)
+      stats->node_counts[node->type]++;
+    if (cmark_node_get_literal(node) != NULL)
+      stats->literal_bytes += (size_t)node->len;
+    stats->memory += S_node_memory(node);
+
+    if (node->first_child != NULL) {
+      node = node->first_child;
+      if (++depth > stats->max_depth)
+        stats->max_depth = depth;
+      continue;
+    }
+    while (node != root && node->next == NULL) {
+      node = node->parent;
+      depth--;
+    }
+    if (node == root)
+      break;
+    node = node->next;
+  }
+}
+
+size_t paka_parser_count_references(cmark_parser *parser) {
+  cmark_reference *ref;
+  size_t count = 0;
+
+  for (ref = parser->refmap->refs; ref != NULL; ref = ref->next)
+    count++;
+  return count;
+}
@@ -0,0 +1,118 @@
+#include "cmark.h"
+#include "node.h"
+#include "buffer.h"
+#include "paka_cmark.h"
+
+// Truncation of tree to given number of visible characters (code points
+// of text, code spans and code blocks; line breaks count as one).
+// Everything after the cut point is removed from the tree, so any
+// renderer closes open elements properly.
+
+static int S_is_counted(cmark_node *node) {
+  switch (node->type) {
+  case CMARK_NODE_TEXT:
+  case CMARK_NODE_CODE:
+  case CMARK_NODE_CODE_BLOCK:
+    return 1;
+  default:
+    return 0;
+  }
+}
+
+// Return byte offset of code point number 'count' in 'data' (or 'len'
+// if there are fewer code points than that), decrementing 'count'
+// by number of code points before that offset.
+static bufsize_t S_utf8_offset(const unsigned char *data, bufsize_t len,
+                               int *count) {
+  bufsize_t i;
+
+  for (i = 0; i < len; i++) {
+    if ((data[i] & 0xC0) != 0x80) {
+      if (*count == 0)
+        return i;
+      (*count)--;
+    }
+  }
+  return len;
+}
+
+static void S_free_following(cmark_node *root, cmark_node *node) {
+  cmark_node *next;
+
+  for (; node != NULL && node != root; node = node->parent) {
+    while ((next = node->next) != NULL) {
+      cmark_node_free(next);
+    }
+  }
+}
+
+static void S_free_with_empty_ancestors(cmark_node *root, cmark_node *node) {
+  cmark_node *parent = node->parent;
+
+  cmark_node_free(node);
+  while (parent != NULL && parent != root && parent->first_child == NULL) {
+    node = parent;
+    parent = node->parent;
+    cmark_node_free(node);
+  }
+}
+
+static void S_set_literal(cmark_node *node, bufsize_t len,
+                          const char *ellipsis) {
+  cmark_strbuf buf = CMARK_BUF_INIT(node->mem);
+
+  cmark_strbuf_put(&buf, node->data, len);
+  cmark_strbuf_puts(&buf, ellipsis);
+  cmark_node_set_literal(node, (char *)buf.ptr);
+  cmark_strbuf_free(&buf);
+}
+
+int paka_node_truncate(cmark_node *root, int max_chars,
+                       const char *ellipsis) {
+  cmark_iter *iter = cmark_iter_new(root);
+  cmark_event_type ev_type;
+  cmark_node *cur, *last = NULL, *cut = NULL;
+  bufsize_t keep = 0;
+  int remaining = max_chars > 0 ? max_chars : 0;
+
+  while ((ev_type = cmark_iter_next(iter)) != CMARK_EVENT_DONE) {
+    if (ev_type != CMARK_EVENT_ENTER)
+      continue;
+    cur = cmark_iter_get_node(iter);
+    if (cur == root)
+      continue;
+    // Nothing is kept after limit is reached, not even nodes that are
+    // not counted (e.g. thematic breaks, HTML and images).
+    if (remaining == 0) {
+      cut = cur;
+      keep = 0;
+      break;
+    }
+    if (S_is_counted(cur)) {
+      keep = S_utf8_offset(cur->data, cur->len, &remaining);
+      if (keep < cur->len) {
+        cut = cur;
+        break;
+      }
+      last = cur;
+    } else if (cur->type == CMARK_NODE_SOFTBREAK ||
+               cur->type == CMARK_NODE_LINEBREAK) {
+      remaining--;
+    }
+  }
+  cmark_iter_free(iter);
+
+  if (cut == NULL)
+    return 0;
+
+  S_free_following(root, cut);
+  if (keep > 0) {
+    last = cut;
+  } else {
+    S_free_with_empty_ancestors(root, cut);
+  }
+  if (last != NULL && ellipsis != NULL) {
+    S_set_literal(last, last == cut ? keep : last->len, ellipsis);
+  }
+  return 1;
+}
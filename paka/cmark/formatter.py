@@ -0,0 +1,209 @@
+"""CommonMark formatter (``python -m paka.cmark.formatter``).
+
+Normalizes files in place with :py:func:`~paka.cmark.to_commonmark`
+(like code formatters do), using pool of worker processes. Only files
+whose normalized contents differ are written. Output that changes when
+formatted again (renderer is not idempotent for that input) is
+reported as unstable and never written.
+
+Hashes of normalized contents are cached (together with fingerprint of
+options and versions), so files that were not touched since previous
+run are skipped without parsing.
+
+"""
+
+import os
+import sys
+import json
+import difflib
+import hashlib
+import argparse
+import collections
+
+from paka.cmark import cli, corpus, to_commonmark
+
+
+CACHE_NAME = ".paka-cmark-format-cache.json"
+"""Name of default cache file (in current directory)."""
+
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+CACHED = "cached"
+UNSTABLE = "unstable"
+
+FormatResult = collections.namedtuple("FormatResult", "path status diff")
+FormatResult.__doc__ = """Result of formatting of file.
+
+Attributes are: path of file, status (:py:data:`CHANGED` if file was
+or would be reformatted, :py:data:`UNCHANGED`, :py:data:`CACHED` if it
+was skipped as already formatted, or :py:data:`UNSTABLE`), and unified
+diff (if requested and file is changed, otherwise None).
+
+"""
+
+
+def _hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _format_file(task):
+    """Format single file (in worker process)."""
+    path, options, write, want_diff = task
+    with open(path, "rb") as file:
+        data = file.read()
+    text = data.decode(corpus.ENCODING)
+    formatted = to_commonmark(text, **options)
+    if to_commonmark(formatted, **options) != formatted:
+        return FormatResult(path, UNSTABLE, None), None
+    formatted_data = formatted.encode(corpus.ENCODING)
+    if formatted_data == data:
+        return FormatResult(path, UNCHANGED, None), _hash(data)
+    diff = None
+    if want_diff:
+        diff = "".join(difflib.unified_diff(
+            text.splitlines(True), formatted.splitlines(True),
+            path, path))
+    if write:
+        corpus.write_atomic(path, formatted_data)
+    return FormatResult(path, CHANGED, diff), _hash(formatted_data)
+
+
+def _load_cache(path, fingerprint):
+    if path is None:
+        return {}
+    manifest = cli.load_manifest(path)
+    if manifest.get("fingerprint") != fingerprint:
+        return {}
+    return manifest["files"]
+
+
+def _collect_files(paths):
+    """Return absolute paths of files to format.
+
+    The same file given more than once (directly, or in directories)
+    is formatted once.
+
+    """
+    files = []
+    by_name = {}
+    for path in paths:
+        for source in corpus.iter_sources(path):
+            file_path = os.path.abspath(source.path)
+            others = by_name.setdefault(
+                os.path.normcase(os.path.basename(file_path)), [])
+            if not any(os.path.samefile(other, file_path)
+                       for other in others):
+                others.append(file_path)
+                files.append(file_path)
+    return files
+
+
+# pylint: disable-next=too-many-arguments,too-many-locals
+def format_files(
+        paths, check=False, diff=False, workers=None,
+        cache_path=CACHE_NAME, **options):
+    """Format files, return list of :py:class:`FormatResult`.
+
+    Parameters
+    ----------
+    paths
+        Paths of files or directories (files with one of
+        :py:data:`~paka.cmark.corpus.SUFFIXES` are taken from them).
+    check: bool
+        Do not write files, only find ones that would be reformatted.
+    diff: bool
+        Include unified diffs in results.
+    workers: int or None
+        Number of worker processes (number of CPUs if None, ``0``
+        to format in current process).
+    cache_path: str or None
+        Path of cache of hashes of formatted files (no cache if None).
+    options
+        Keyword arguments of :py:func:`~paka.cmark.to_commonmark`
+        (e.g. ``width=80``).
+
+    """
+    fingerprint = cli.get_fingerprint("commonmark", options)
+    cache = _load_cache(cache_path, fingerprint)
+    files = _collect_files(paths)
+    results = []
+    tasks = []
+    new_cache = {}
+    for path in files:
+        with open(path, "rb") as file:
+            digest = _hash(file.read())
+        if cache.get(path) == digest:
+            results.append(FormatResult(path, CACHED, None))
+            new_cache[path] = digest
+        else:
+            tasks.append((path, options, not check, diff))
+    # pylint: disable-next=protected-access
+    for result, digest in corpus._map(
+            _format_file, tasks, 0 if len(tasks) < 2 else workers):
+        results.append(result)
+        if digest is not None and (result.status == UNCHANGED or not check):
+            new_cache[result.path] = digest
+    if cache_path is not None:
+        # Entries of files not formatted in this run are kept.
+        cache.update(new_cache)
+        corpus.write_atomic(cache_path, json.dumps(
+            {"fingerprint": fingerprint, "files": cache},
+            indent=1, sort_keys=True).encode("utf-8"))
+    positions = {path: position for position, path in enumerate(files)}
+    results.sort(key=lambda result: positions[result.path])
+    return results
+
+
+def main(argv=None):
+    """Run formatter, return exit status."""
+    parser = argparse.ArgumentParser(
+        prog="paka-cmark-format",
+        description="Format CommonMark files in place.")
+    parser.add_argument("paths", nargs="+", metavar="PATH")
+    parser.add_argument(
+        "--width", type=int, default=80, help="wrap width (default: 80)")
+    parser.add_argument("--smart", action="store_true")
+    parser.add_argument(
+        "--check", action="store_true",
+        help="do not write files, exit with 1 if any would be changed")
+    parser.add_argument(
+        "--diff", action="store_true",
+        help="do not write files, print diffs instead (may be combined "
+             "with --check)")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--cache", default=CACHE_NAME)
+    parser.add_argument("--no-cache", dest="cache", action="store_const",
+                        const=None)
+    args = parser.parse_args(argv)
+    for path in args.paths:
+        if not os.path.exists(path):
+            parser.error("no such file or directory: " + path)
+    options = {"width": args.width}
+    if args.smart:
+        options["smart"] = True
+    results = format_files(
+        args.paths, check=args.check or args.diff, diff=args.diff,
+        workers=args.jobs, cache_path=args.cache, **options)
+    counts = collections.Counter(result.status for result in results)
+    for result in results:
+        if result.status == UNSTABLE:
+            sys.stderr.write("unstable (not formatted): " + result.path + "\n")
+        elif result.status == CHANGED:
+            if args.diff:
+                sys.stdout.write(result.diff)
+            elif args.check:
+                sys.stdout.write("would reformat " + result.path + "\n")
+    sys.stderr.write(
+        str(counts[CHANGED]) + (
+            " would be reformatted" if args.check or args.diff
+            else " reformatted") +
+        ", " + str(counts[UNCHANGED]) + " unchanged, " +
+        str(counts[CACHED]) + " cached, " + str(counts[UNSTABLE]) +
+        " unstable\n")
+    if counts[UNSTABLE] or (counts[CHANGED] and args.check):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,6 +8,7 @@ Most members of this module are taken directly from C library,
 but here their names do not have ``cmark_`` or ``CMARK_`` prefixes.
 
 """
+# pylint: disable=too-many-lines
 
 import functools
 
@@ -102,6 +103,17 @@ PERIOD_DELIM = _lib.CMARK_PERIOD_DELIM
 NO_DELIM = _lib.CMARK_NO_DELIM
 """No list delimiter."""
 
+FORMAT_HTML = _lib.PAKA_FORMAT_HTML
+"""HTML (format of :py:func:`render_fd`)."""
+FORMAT_XML = _lib.PAKA_FORMAT_XML
+"""XML."""
+FORMAT_COMMONMARK = _lib.PAKA_FORMAT_COMMONMARK
+"""CommonMark."""
+FORMAT_MAN = _lib.PAKA_FORMAT_MAN
+"""groff man page."""
+FORMAT_LATEX = _lib.PAKA_FORMAT_LATEX
+"""LaTeX."""
+
 
 def _nullable(func):
     """Convert returned cffi's NULL into None."""
@@ -304,6 +316,55 @@ def consolidate_text_nodes(root):
     _lib.cmark_consolidate_text_nodes(root)
 
 
+def node_truncate(root, max_chars, ellipsis=None):
+    """Truncate tree of nodes to given number of visible characters.
+
+    Visible characters are code points of text, inline code and code
+    blocks (line breaks count as one character). Everything after
+    the cut point is freed and removed from the tree (with containers
+    that become empty), so rendered tree has all elements closed.
+
+    Parameters
+    ----------
+    root
+        Root node.
+    max_chars: int
+        Maximum number of visible characters to keep.
+    ellipsis: bytes or None
+        Appended to last kept text if tree was truncated.
+
+        .. hint::
+
+            Use :py:func:`text_to_c` to convert text into bytes.
+
+    :returns: ``1`` if tree was truncated, ``0`` otherwise.
+
+    """
+    if ellipsis is None:
+        ellipsis = _ffi.NULL
+    return _lib.paka_node_truncate(root, max_chars, ellipsis)
+
+
+def node_stats(root):
+    """Collect statistics of tree of nodes in single pass.
+
+    Parameters
+    ----------
+    root
+        Root node.
+
+    :returns: ``paka_node_stats`` struct with ``node_counts`` (array
+        indexed by :ref:`node type <node_types>`), ``max_depth`` (root
+        has depth of ``0``), ``literal_bytes`` (total size of literals
+        of text, code and HTML nodes) and ``memory`` (estimate of bytes
+        allocated for tree).
+
+    """
+    stats = _ffi.new("paka_node_stats *")
+    _lib.paka_node_stats_collect(root, stats)
+    return stats
+
+
 def node_get_type(node):
     """Return type of node.
 
@@ -793,6 +854,87 @@ def parser_finish(parser):
     return _lib.cmark_parser_finish(parser)
 
 
+def parser_count_references(parser):
+    """Return number of link reference definitions seen by parser.
+
+    Duplicate definitions are counted too. Must be called before
+    :py:func:`parser_free`.
+
+    """
+    return _lib.paka_parser_count_references(parser)
+
+
+def parser_reset(parser, options, max_buffer):
+    """Reset finished parser, so that it can parse next document.
+
+    Must be called after :py:func:`parser_finish` (tree of nodes it
+    returned is not freed). Line buffers of parser are kept for reuse,
+    unless their capacity exceeds ``max_buffer`` bytes. Content buffer
+    is not kept (:py:func:`parser_finish` frees it), and neither is
+    buffer of current line, unless parser was finished by
+    :py:func:`parser_parse`.
+
+    """
+    _lib.paka_parser_reset(parser, options, max_buffer)
+
+
+def parser_parse(parser, buffer, length, options, max_buffer):
+    """Parse whole buffer with new or reset parser, return root node.
+
+    Parser is reset afterwards (see :py:func:`parser_reset`), so that
+    it can be reused for next document. Reused parser is freed with
+    ``node_free(parser_finish(parser))`` and ``parser_free(parser)``.
+
+    .. warning::
+
+        Returned tree of nodes must be freed with :py:func:`node_free`.
+
+    """
+    return _lib.paka_parser_parse(parser, buffer, length, options, max_buffer)
+
+
+def parser_feed_fd(parser, fd, buffer_size, bytes_read):
+    """Feed contents of file descriptor (read until its end) to parser.
+
+    File descriptor is read in C (without Python buffering), in reads
+    of ``buffer_size`` bytes.
+
+    Parameters
+    ----------
+    parser
+        Parser object.
+    fd: int
+        File descriptor.
+    buffer_size: int
+        Size of reads (in bytes).
+    bytes_read
+        Pointer to ``size_t`` (e.g. ``ffi.new("size_t *")``), number
+        of bytes read is added to it.
+
+    Returns
+    -------
+    int
+        ``0``, or ``errno`` of failed read.
+
+    """
+    return _lib.paka_parser_feed_fd(parser, fd, buffer_size, bytes_read)
+
+
+def parser_markdown_to_html(parser, buffer, length, options, max_buffer):
+    """Render HTML from CommonMark, parsing with reused parser.
+
+    Same as :py:func:`markdown_to_html`, but uses (and resets) new or
+    reset parser, as :py:func:`parser_parse` does.
+
+    .. warning::
+
+        Returned C string must be freed (see :py:func:`text_from_c`).
+
+    """
+    return _lib.paka_parser_markdown_to_html(
+        parser, buffer, length, options, max_buffer)
+
+
 def markdown_to_html(buffer, length, options):
     """Render HTML from CommonMark.
 
@@ -824,6 +966,66 @@ def markdown_to_html(buffer, length, options):
     return _lib.cmark_markdown_to_html(buffer, length, options)
 
 
+def parse_inline(buffer, length, options):
+    """Parse CommonMark inline content, skipping block structure detection.
+
+    Returned node is a container whose children are inline nodes
+    (as if ``buffer`` was contents of single paragraph); it is rendered
+    without any wrapper of its own.
+
+    .. warning::
+
+        Returned tree of nodes must be freed with :py:func:`node_free`.
+
+    Parameters
+    ----------
+    buffer: bytes
+        CommonMark inline content.
+
+        .. hint::
+
+            Use :py:func:`text_to_c` to convert text into bytes.
+
+    length: int
+        Length of ``buffer``.
+    options
+        See :ref:`options <options>`.
+
+    """
+    return _lib.paka_parse_inline(buffer, length, options)
+
+
+def markdown_to_html_inline(buffer, length, options):
+    """Render CommonMark inline content as HTML, without block wrappers.
+
+    .. hint::
+
+        Use :py:func:`text_from_c` to convert value returned
+        by this function into text.
+
+    .. warning::
+
+        Returned C string must be freed, use `free` parameter
+        of :py:func:`text_from_c` for that.
+
+    Parameters
+    ----------
+    buffer: bytes
+        CommonMark inline content.
+
+        .. hint::
+
+            Use :py:func:`text_to_c` to convert text into bytes.
+
+    length: int
+        Length of ``buffer``.
+    options
+        See :ref:`options <options>`.
+
+    """
+    return _lib.paka_markdown_to_html_inline(buffer, length, options)
+
+
 def render_html(root, options):
     """Render tree of nodes as HTML.
 
@@ -924,6 +1126,32 @@ def render_commonmark(root, options, width):
     return _lib.cmark_render_commonmark(root, options, width)
 
 
+def render_commonmark_contents(root, options, width):
+    """Render children of node as CommonMark (without node itself).
+
+    Children are rendered together, as they are within whole tree
+    (e.g. items of tight list are not separated by blank lines), but
+    without markup of node itself (e.g. list marker and indentation of
+    list item, or ``>`` of block quote).
+
+    .. warning::
+
+        Returned C string must be freed, use `free` parameter
+        of :py:func:`text_from_c` for that.
+
+    Parameters
+    ----------
+    root
+        Node whose children are rendered.
+    options
+        See :ref:`options <options>`.
+    width: int
+        Maximum line width for line wrapping.
+
+    """
+    return _lib.paka_render_commonmark_contents(root, options, width)
+
+
 def render_latex(root, options, width):
     """Render tree of nodes as LaTeX.
 
@@ -950,6 +1178,245 @@ def render_latex(root, options, width):
     return _lib.cmark_render_latex(root, options, width)
 
 
+def render_html_to(root, options, chunk_size, write_fn, data):
+    """Render tree of nodes as HTML, passing output to write function.
+
+    Output is passed to ``write_fn`` in chunks of about ``chunk_size``
+    bytes (bigger only if output of single node is) while tree is
+    traversed, so whole output is never kept in memory.
+
+    Parameters
+    ----------
+    root
+        Root node.
+    options
+        See :ref:`options <options>`.
+    chunk_size: int
+        Size of chunks (in bytes).
+    write_fn
+        C function (``paka_write_fn``) called as
+        ``write_fn(data, buffer, length)`` with each chunk; non-zero
+        value returned by it stops rendering.
+    data
+        Pointer passed to ``write_fn``.
+
+    Returns
+    -------
+    int
+        ``0``, or value returned by ``write_fn`` that stopped rendering.
+
+    """
+    return _lib.paka_render_html_to(
+        root, options, chunk_size, write_fn, data)
+
+
+def render_xml_to(root, options, chunk_size, write_fn, data):
+    """Render tree of nodes as XML, passing output to write function.
+
+    Output is passed to ``write_fn`` in chunks of about ``chunk_size``
+    bytes (bigger only if output of single node is) while tree is
+    traversed, so whole output is never kept in memory.
+
+    Parameters
+    ----------
+    root
+        Root node.
+    options
+        See :ref:`options <options>`.
+    chunk_size: int
+        Size of chunks (in bytes).
+    write_fn
+        C function (``paka_write_fn``) called as
+        ``write_fn(data, buffer, length)`` with each chunk; non-zero
+        value returned by it stops rendering.
+    data
+        Pointer passed to ``write_fn``.
+
+    Returns
+    -------
+    int
+        ``0``, or value returned by ``write_fn`` that stopped rendering.
+
+    """
+    return _lib.paka_render_xml_to(
+        root, options, chunk_size, write_fn, data)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_man_to(root, options, width, chunk_size, write_fn, data):
+    """Render tree of nodes as groff, passing output to write function.
+
+    Output is passed to ``write_fn`` in chunks of about ``chunk_size``
+    bytes (bigger only if output of single node is) while tree is
+    traversed, so whole output is never kept in memory.
+
+    Parameters
+    ----------
+    root
+        Root node.
+    options
+        See :ref:`options <options>`.
+    width: int
+        Maximum line width for line wrapping.
+    chunk_size: int
+        Size of chunks (in bytes).
+    write_fn
+        C function (``paka_write_fn``) called as
+        ``write_fn(data, buffer, length)`` with each chunk; non-zero
+        value returned by it stops rendering.
+    data
+        Pointer passed to ``write_fn``.
+
+    Returns
+    -------
+    int
+        ``0``, or value returned by ``write_fn`` that stopped rendering.
+
+    """
+    return _lib.paka_render_man_to(
+        root, options, width, chunk_size, write_fn, data)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_commonmark_to(root, options, width, chunk_size, write_fn, data):
+    """Render tree of nodes as CommonMark, passing output to write function.
+
+    Output is passed to ``write_fn`` in chunks of about ``chunk_size``
+    bytes (bigger only if output of single node is) while tree is
+    traversed, so whole output is never kept in memory.
+
+    Parameters
+    ----------
+    root
+        Root node.
+    options
+        See :ref:`options <options>`.
+    width: int
+        Maximum line width for line wrapping.
+    chunk_size: int
+        Size of chunks (in bytes).
+    write_fn
+        C function (``paka_write_fn``) called as
+        ``write_fn(data, buffer, length)`` with each chunk; non-zero
+        value returned by it stops rendering.
+    data
+        Pointer passed to ``write_fn``.
+
+    Returns
+    -------
+    int
+        ``0``, or value returned by ``write_fn`` that stopped rendering.
+
+    """
+    return _lib.paka_render_commonmark_to(
+        root, options, width, chunk_size, write_fn, data)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_latex_to(root, options, width, chunk_size, write_fn, data):
+    """Render tree of nodes as LaTeX, passing output to write function.
+
+    Output is passed to ``write_fn`` in chunks of about ``chunk_size``
+    bytes (bigger only if output of single node is) while tree is
+    traversed, so whole output is never kept in memory.
+
+    Parameters
+    ----------
+    root
+        Root node.
+    options
+        See :ref:`options <options>`.
+    width: int
+        Maximum line width for line wrapping.
+    chunk_size: int
+        Size of chunks (in bytes).
+    write_fn
+        C function (``paka_write_fn``) called as
+        ``write_fn(data, buffer, length)`` with each chunk; non-zero
+        value returned by it stops rendering.
+    data
+        Pointer passed to ``write_fn``.
+
+    Returns
+    -------
+    int
+        ``0``, or value returned by ``write_fn`` that stopped rendering.
+
+    """
+    return _lib.paka_render_latex_to(
+        root, options, width, chunk_size, write_fn, data)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_fd(in_fd, out_fd, format, options, width, chunk_size, stats):
+    # pylint: disable=redefined-builtin
+    """Parse contents of file descriptor, render it to another one.
+
+    Everything (reading, parsing, rendering and writing) is done in
+    single call of C function.
+
+    Parameters
+    ----------
+    in_fd: int
+        File descriptor to read document from (until its end).
+    out_fd: int
+        File descriptor to write output to.
+    format: int
+        One of ``FORMAT_*`` constants (e.g. :py:data:`FORMAT_HTML`).
+    options
+        See :ref:`options <options>`.
+    width: int
+        Maximum line width for line wrapping (if format supports it).
+    chunk_size: int
+        Size (in bytes) of reads and of chunks written.
+    stats
+        Pointer to ``paka_fd_stats`` (e.g.
+        ``ffi.new("paka_fd_stats *")``), its ``bytes_read`` and
+        ``bytes_written`` are set (previous values are overwritten,
+        unlike in :py:func:`parser_feed_fd`, which adds to
+        ``bytes_read``).
+
+    Returns
+    -------
+    int
+        ``0``, or ``errno`` of failed read or write.
+
+    """
+    return _lib.paka_render_fd(
+        in_fd, out_fd, format, options, width, chunk_size, stats)
+
+
+def escape_html(buffer, length, secure):
+    """Escape text as HTML, the way renderer escapes text nodes.
+
+    .. hint::
+
+        Use :py:func:`text_from_c` to convert value returned
+        by this function into text.
+
+    .. warning::
+
+        Returned C string must be freed, use `free` parameter
+        of :py:func:`text_from_c` for that.
+
+    Parameters
+    ----------
+    buffer: bytes
+        Text to escape.
+
+        .. hint::
+
+            Use :py:func:`text_to_c` to convert text into bytes.
+
+    length: int
+        Length of ``buffer``.
+    secure: int
+        Non-zero to also escape ``'`` and ``/``.
+
+    """
+    return _lib.paka_escape_html(buffer, length, secure)
+
+
 def text_to_c(text):
     """Convert text to bytes suitable for passing into C functions."""
     return text.encode(ENCODING)
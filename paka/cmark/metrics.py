@@ -0,0 +1,316 @@
+"""Opt-in metrics of high-level functions.
+
+When enabled (with :py:func:`enable`), each call of
+:py:func:`~paka.cmark.to_html` and friends is counted, together with
+its input and output sizes (in bytes of UTF-8) and durations of parse
+and render phases (as histograms). Disabled metrics cost nothing but
+check of single global.
+
+Entry points are recorded under names of functions:
+
+- :py:func:`~paka.cmark.to_html`, :py:func:`~paka.cmark.to_xml`,
+  :py:func:`~paka.cmark.to_commonmark`, :py:func:`~paka.cmark.to_man`,
+  :py:func:`~paka.cmark.to_latex`, :py:func:`~paka.cmark.to_html_inline`
+  and :py:func:`~paka.cmark.excerpt`;
+- :py:func:`~paka.cmark.render_into`, :py:func:`~paka.cmark.render_to`,
+  :py:func:`~paka.cmark.render_compressed` (output size is that of
+  uncompressed output) and :py:func:`~paka.cmark.render_file`; when
+  they render :py:class:`~paka.cmark.Node`, input size and parse
+  phase are zero;
+- :py:func:`~paka.cmark.render_fd` (phases are not timed apart in C,
+  so whole call is counted as render phase);
+- ``"Document"`` (parsing text with :py:class:`~paka.cmark.Document`),
+  :py:func:`~paka.cmark.parse_stream` and
+  :py:func:`~paka.cmark.parse_fd`, which only parse (output size and
+  render phase are zero).
+
+Methods of :py:class:`~paka.cmark.Node` are not recorded. Every
+document rendered by :py:func:`~paka.cmark.render_corpus` is recorded
+(in this process, with any workers) under ``"render_corpus"``, with
+whole time of reading and rendering it in worker counted as render
+phase. Additionally, it is recorded as call of function of format
+(e.g. ``to_html``) where it is rendered: in this process with threads
+(or without workers), but not with worker processes (default) or
+subinterpreters, which have metrics of their own.
+
+Recording is lock-free: every thread records into its own shard,
+and shards are summed when :py:func:`snapshot` is taken (shard of
+thread that has finished is folded into single total). Snapshot can
+be exported in `Prometheus text format
+<https://prometheus.io/docs/instrumenting/exposition_formats/>`_
+with :py:func:`to_prometheus`.
+
+"""
+
+import weakref
+import threading
+from bisect import bisect_left as _bisect_left
+
+
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Default upper bounds of duration histogram buckets (in seconds)."""
+
+PHASES = ("parse", "render")
+"""Phases durations are recorded for."""
+
+
+# pylint: disable=useless-object-inheritance
+class _Series(object):  # pylint: disable=too-few-public-methods
+    """Metrics of single entry point in single shard."""
+
+    __slots__ = (
+        "calls", "input_bytes", "output_bytes", "parse_sum", "render_sum",
+        "parse_counts", "render_counts")
+
+    def __init__(self, buckets_count):
+        self.calls = 0
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.parse_sum = 0.0
+        self.render_sum = 0.0
+        # Counts of buckets, last one is for "+Inf".
+        self.parse_counts = [0] * (buckets_count + 1)
+        self.render_counts = [0] * (buckets_count + 1)
+
+    def add(self, other):
+        """Add metrics of other series to these."""
+        self.calls += other.calls
+        self.input_bytes += other.input_bytes
+        self.output_bytes += other.output_bytes
+        self.parse_sum += other.parse_sum
+        self.render_sum += other.render_sum
+        self.parse_counts = [
+            count + added
+            for count, added in zip(self.parse_counts, other.parse_counts)]
+        self.render_counts = [
+            count + added
+            for count, added in zip(self.render_counts, other.render_counts)]
+
+
+class _ShardOwner(object):  # pylint: disable=too-few-public-methods
+    """Kept only by thread-local storage, so it dies with its thread."""
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard):
+        self.shard = shard
+
+
+class _Recorder(object):
+    """Per-thread shards of metrics."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards = []
+        # Sum of shards of finished threads.
+        self._retired = {}
+        self._shards_lock = threading.Lock()
+
+    def _new_series(self, entry_point):
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            owner = self._local.owner = _ShardOwner(shard)
+            weakref.finalize(owner, self._retire, shard).atexit = False
+            with self._shards_lock:
+                self._shards.append(shard)
+        series = shard[entry_point] = _Series(len(self.buckets))
+        return series
+
+    def _retire(self, shard):
+        """Fold shard of finished thread into retired total."""
+        with self._shards_lock:
+            self._shards.remove(shard)
+            for entry_point, series in shard.items():
+                total = self._retired.get(entry_point)
+                if total is None:
+                    total = self._retired[entry_point] = _Series(
+                        len(self.buckets))
+                total.add(series)
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def observe(
+            self, entry_point, input_bytes, output_bytes, parse_seconds,
+            render_seconds):
+        """Record single call."""
+        try:
+            series = self._local.shard[entry_point]
+        except (AttributeError, KeyError):
+            series = self._new_series(entry_point)
+        series.calls += 1
+        series.input_bytes += input_bytes
+        series.output_bytes += output_bytes
+        series.parse_sum += parse_seconds
+        series.parse_counts[_bisect_left(self.buckets, parse_seconds)] += 1
+        series.render_sum += render_seconds
+        series.render_counts[_bisect_left(self.buckets, render_seconds)] += 1
+
+    def snapshot(self):
+        """Return sum of all shards."""
+        with self._shards_lock:
+            # Retired total is copied while it can not change, so that
+            # shard retired after this is not counted twice.
+            retired = {}
+            for entry_point, series in self._retired.items():
+                retired[entry_point] = _Series(len(self.buckets))
+                retired[entry_point].add(series)
+            shards = [retired] + self._shards
+        result = {}
+        for shard in shards:
+            for entry_point, series in list(shard.items()):
+                total = result.get(entry_point)
+                if total is None:
+                    total = result[entry_point] = {
+                        "calls": 0, "input_bytes": 0, "output_bytes": 0}
+                    for phase in PHASES:
+                        total[phase] = {
+                            "sum": 0.0,
+                            "counts": [0] * (len(self.buckets) + 1)}
+                total["calls"] += series.calls
+                total["input_bytes"] += series.input_bytes
+                total["output_bytes"] += series.output_bytes
+                for phase in PHASES:
+                    total[phase]["sum"] += getattr(series, phase + "_sum")
+                    total[phase]["counts"] = [
+                        count + added for count, added in zip(
+                            total[phase]["counts"],
+                            getattr(series, phase + "_counts"))]
+        for total in result.values():
+            for phase in PHASES:
+                counts = total[phase].pop("counts")
+                total[phase]["count"] = sum(counts)
+                cumulative = 0
+                total[phase]["buckets"] = buckets = []
+                for bound, count in zip(
+                        self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    buckets.append((bound, cumulative))
+        return result
+
+
+_recorder = None  # pylint: disable=invalid-name
+
+# Guards replacing of recorder (read without it).
+_recorder_lock = threading.Lock()
+
+
+def enable(buckets=DEFAULT_BUCKETS):
+    """Start recording metrics (does nothing if already enabled).
+
+    Parameters
+    ----------
+    buckets: tuple
+        Upper bounds of duration histogram buckets (in seconds).
+
+    """
+    global _recorder  # pylint: disable=global-statement,invalid-name
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = _Recorder(buckets)
+
+
+def disable():
+    """Stop recording metrics and discard recorded ones."""
+    global _recorder  # pylint: disable=global-statement,invalid-name
+    with _recorder_lock:
+        _recorder = None
+
+
+def is_enabled():
+    """Check if metrics are being recorded."""
+    return _recorder is not None
+
+
+def reset():
+    """Discard recorded metrics (keeping them enabled if they are)."""
+    global _recorder  # pylint: disable=global-statement,invalid-name
+    with _recorder_lock:
+        if _recorder is not None:
+            _recorder = _Recorder(_recorder.buckets)
+
+
+def snapshot():
+    """Return metrics recorded so far.
+
+    Returns
+    -------
+    dict
+        Mapping of entry point name (e.g. ``"to_html"``) to dict with
+        ``"calls"``, ``"input_bytes"``, ``"output_bytes"`` and
+        per phase (``"parse"`` and ``"render"``) dicts with ``"count"``,
+        ``"sum"`` (in seconds) and ``"buckets"`` (list of pairs of upper
+        bound and cumulative count, last bound is infinity). Empty if
+        metrics are disabled.
+
+    """
+    recorder = _recorder
+    if recorder is None:
+        return {}
+    return recorder.snapshot()
+
+
+def _format_bound(bound):
+    if bound == float("inf"):
+        return "+Inf"
+    return repr(bound)
+
+
+def _format_sample(name, labels, value):
+    return name + "{" + ",".join(
+        label + "=\"" + str(label_value) + "\""
+        for label, label_value in labels) + "} " + str(value)
+
+
+_COUNTERS = (
+    ("calls", "paka_cmark_calls_total", "Number of calls."),
+    ("input_bytes", "paka_cmark_input_bytes_total",
+     "Size of inputs (in bytes of UTF-8)."),
+    ("output_bytes", "paka_cmark_output_bytes_total",
+     "Size of outputs (in bytes of UTF-8)."))
+
+
+def to_prometheus(metrics=None):
+    """Format metrics in Prometheus text format.
+
+    Parameters
+    ----------
+    metrics: dict
+        Result of :py:func:`snapshot` (new snapshot is taken if None).
+
+    Returns
+    -------
+    str
+        Metrics ready to be served from metrics endpoint.
+
+    """
+    if metrics is None:
+        metrics = snapshot()
+    entry_points = sorted(metrics)
+    lines = []
+    for key, name, help_text in _COUNTERS:
+        lines.append("# HELP " + name + " " + help_text)
+        lines.append("# TYPE " + name + " counter")
+        for entry_point in entry_points:
+            lines.append(_format_sample(
+                name, (("entry_point", entry_point),),
+                metrics[entry_point][key]))
+    name = "paka_cmark_duration_seconds"
+    lines.append("# HELP " + name + " Duration of phase of call.")
+    lines.append("# TYPE " + name + " histogram")
+    for entry_point in entry_points:
+        for phase in PHASES:
+            histogram = metrics[entry_point][phase]
+            labels = (("entry_point", entry_point), ("phase", phase))
+            for bound, count in histogram["buckets"]:
+                lines.append(_format_sample(
+                    name + "_bucket",
+                    labels + (("le", _format_bound(bound)),), count))
+            lines.append(_format_sample(
+                name + "_sum", labels, repr(histogram["sum"])))
+            lines.append(_format_sample(
+                name + "_count", labels, histogram["count"]))
+    return "\n".join(lines) + "\n"
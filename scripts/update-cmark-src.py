@@ -8,6 +8,12 @@ import subprocess
 
 DEST_DIR = os.path.abspath("paka/cmark/cmark_src/")
 
+# Dir for CommonMark spec (used as benchmark corpus).
+CORPORA_DIR = os.path.abspath("benchmarks/corpora/")
+
+# Local changes to upstream sources, applied (in order) after copying.
+PATCHES_DIR = os.path.abspath("scripts/cmark-src-patches/")
+
 KEEP = {"LICENSE"}
 
 
@@ -50,6 +56,15 @@ def main():
         if filename.startswith("cmark_"):
             copy(build_src_dir, DEST_DIR, filename=filename)
 
+    # Copy spec from repo/test/.
+    copy(os.path.join(repo, "test"), CORPORA_DIR, filename="spec.txt")
+
+    # Apply local patches.
+    for filename in sorted(os.listdir(PATCHES_DIR)):
+        if filename.endswith(".patch"):
+            run(["git", "apply", os.path.join(PATCHES_DIR, filename)],
+                cwd=os.getcwd())
+
 
 if __name__ == "__main__":
     main()
@@ -17,11 +17,16 @@ setuptools.setup(
         " (CommonMark implementation in C)."),
     long_description=_get_long_description(),
     version="2.4.1",
-    packages=setuptools.find_packages(),
-    setup_requires=["cffi>=1.0.0"],
-    install_requires=["cffi>=1.0.0"],
+    packages=setuptools.find_packages(exclude=["benchmarks*"]),
+    setup_requires=["cffi>=1.12"],
+    install_requires=["cffi>=1.12"],
+    python_requires=">=3.8",
     extras_require={"testing": []},
     cffi_modules=["paka/cmark/build_cmark.py:ffibuilder"],
+    entry_points={
+        "console_scripts": [
+            "paka-cmark = paka.cmark.cli:main",
+            "paka-cmark-format = paka.cmark.formatter:main"]},
     include_package_data=True,
     namespace_packages=["paka"],
     zip_safe=False,
@@ -31,10 +36,8 @@ setuptools.setup(
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: BSD License",
-        "Programming Language :: Python :: 2",
-        "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3 :: Only",
         "Programming Language :: Python :: Implementation :: CPython",
         "Programming Language :: Python :: Implementation :: PyPy"],
     license="BSD",
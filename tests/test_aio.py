@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import asyncio
+import threading
+import unittest
+
+
+class AioTest(unittest.TestCase):
+
+    def setUp(self):
+        from paka import cmark
+        from paka.cmark import aio
+
+        self.cmark = cmark
+        self.mod = aio
+        self.converter = aio.Converter(
+            inline_threshold=100, max_workers=2, max_concurrency=2)
+        self.addCleanup(self.converter.close)
+
+    def run_coroutine(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_functions(self):
+        text = "*Привіт*\nсвіт\n" * 20
+        for name in (
+                "to_html", "to_html_inline", "excerpt", "to_xml",
+                "to_commonmark", "to_man", "to_latex"):
+            kwargs = {"smart": True}
+            if name == "excerpt":
+                kwargs["max_chars"] = 50
+            with self.subTest(name=name):
+                func = getattr(self.cmark, name)
+                for part in (text, text[:10]):
+                    self.assertEqual(
+                        self.run_coroutine(
+                            getattr(self.mod, name)(part, **kwargs)),
+                        func(part, **kwargs))
+                self.assertEqual(
+                    self.run_coroutine(getattr(self.converter, name)(
+                        text, timeout=10, **kwargs)),
+                    func(text, **kwargs))
+
+    def test_inline_threshold(self):
+        def _thread_name(text):
+            return threading.current_thread().name
+
+        main = threading.current_thread().name
+        self.assertEqual(
+            self.run_coroutine(self.converter.run(_thread_name, "a" * 99)),
+            main)
+        self.assertTrue(
+            self.run_coroutine(
+                self.converter.run(_thread_name, "a" * 100)
+                ).startswith("paka-cmark"))
+
+    def test_concurrency_limit(self):
+        release = threading.Event()
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def _block(text):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            release.wait(10)
+            with lock:
+                running[0] -= 1
+            return text
+
+        async def _main():
+            converter = self.mod.Converter(
+                inline_threshold=0, max_workers=4, max_concurrency=2)
+            self.addCleanup(converter.close)
+            tasks = [
+                asyncio.ensure_future(converter.run(_block, str(i)))
+                for i in range(5)]
+            await asyncio.sleep(0.05)
+            self.assertEqual(running, [2, 2])
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        self.assertEqual(
+            self.run_coroutine(_main()), ["0", "1", "2", "3", "4"])
+        self.assertEqual(running, [0, 2])
+
+    def test_timeout_and_cancellation(self):
+        release = threading.Event()
+        started = []
+
+        def _block(text):
+            started.append(text)
+            release.wait(10)
+            return text
+
+        async def _main():
+            converter = self.mod.Converter(
+                inline_threshold=0, max_workers=1, max_concurrency=1)
+            self.addCleanup(converter.close)
+            with self.assertRaises(asyncio.TimeoutError):
+                await converter.run(_block, "a", timeout=0.05)
+            # Slot is still taken by running call, so this one waits.
+            with self.assertRaises(asyncio.TimeoutError):
+                await converter.run(_block, "b", timeout=0.05)
+            waiting = asyncio.ensure_future(converter.run(_block, "c"))
+            await asyncio.sleep(0.05)
+            waiting.cancel()
+            release.set()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiting
+            return await converter.run(_block, "d", timeout=10)
+
+        self.assertEqual(self.run_coroutine(_main()), "d")
+        self.assertEqual(started, ["a", "d"])
+
+    def test_configure(self):
+        default = self.mod.get_converter()
+        self.addCleanup(setattr, self.mod, "_converter", default)
+        self.mod.configure(inline_threshold=0, max_workers=1)
+        converter = self.mod.get_converter()
+        self.addCleanup(converter.close)
+        self.assertIsNot(converter, default)
+        self.assertEqual(
+            (converter.inline_threshold, converter.max_workers,
+             converter.max_concurrency),
+            (0, 1, 2))
+        self.assertEqual(
+            self.run_coroutine(self.mod.to_html("*a*")),
+            "<p><em>a</em></p>\n")
+        with self.assertRaises(ValueError):
+            self.mod.Converter(max_concurrency=0)
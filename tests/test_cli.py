@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import io
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+import contextlib
+import subprocess
+
+
+class CLITest(unittest.TestCase):
+
+    def setUp(self):
+        from paka import cmark
+        from paka.cmark import cli
+
+        self.cmark = cmark
+        self.mod = cli
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.src = os.path.join(self.root, "src")
+        self.out = os.path.join(self.root, "out")
+        os.makedirs(os.path.join(self.src, "sub"))
+        for name, text in (("a.md", "*a*"), ("sub/b.md", "b \"c\"")):
+            self.write(name, text)
+
+    def write(self, name, text):
+        with open(os.path.join(self.src, name), "wb") as file:
+            file.write(text.encode("utf-8"))
+
+    def read_output(self, name):
+        with open(os.path.join(self.out, name), "rb") as file:
+            return file.read().decode("utf-8")
+
+    def run_main(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), \
+                contextlib.redirect_stderr(stderr):
+            try:
+                status = self.mod.main(list(argv))
+            except SystemExit as exc:
+                status = exc.code
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_tree(self):
+        status, _, stderr = self.run_main(
+            self.src, "-o", self.out, "-j", "0", "--smart")
+        self.assertEqual(status, 0)
+        self.assertEqual(stderr, "converted 2, unchanged 0\n")
+        self.assertEqual(self.read_output("a.html"), "<p><em>a</em></p>\n")
+        self.assertEqual(
+            self.read_output(os.path.join("sub", "b.html")),
+            "<p>b “c”</p>\n")
+
+    def test_incremental(self):
+        self.run_main(self.src, "-o", self.out, "-j", "0")
+        status, _, stderr = self.run_main(self.src, "-o", self.out, "-j", "0")
+        self.assertEqual((status, stderr), (0, "converted 0, unchanged 2\n"))
+        self.write("a.md", "_changed_")
+        status, stdout, _ = self.run_main(self.src, "-o", self.out, "--check")
+        self.assertEqual(
+            (status, stdout), (1, os.path.join(self.src, "a.md") + "\n"))
+        status, _, stderr = self.run_main(self.src, "-o", self.out, "-j", "1")
+        self.assertEqual((status, stderr), (0, "converted 1, unchanged 1\n"))
+        self.assertEqual(
+            self.read_output("a.html"), "<p><em>changed</em></p>\n")
+        self.assertEqual(
+            self.run_main(self.src, "-o", self.out, "--check"), (0, "", ""))
+
+    def test_options_change_fingerprint(self):
+        self.run_main(self.src, "-o", self.out, "-j", "0")
+        status, stdout, _ = self.run_main(
+            self.src, "-o", self.out, "--check", "--unsafe")
+        self.assertEqual((status, len(stdout.splitlines())), (1, 2))
+
+    def test_missing_output_is_converted(self):
+        self.run_main(self.src, "-o", self.out, "-j", "0")
+        os.remove(os.path.join(self.out, "a.html"))
+        status, _, stderr = self.run_main(self.src, "-o", self.out, "-j", "0")
+        self.assertEqual(stderr, "converted 1, unchanged 1\n")
+
+    def test_manifest(self):
+        self.run_main(self.src, "-o", self.out, "-j", "0", "-q")
+        with open(os.path.join(self.out, self.mod.MANIFEST_NAME)) as file:
+            manifest = json.load(file)
+        self.assertEqual(
+            sorted(manifest["files"]), ["a.md", os.path.join("sub", "b.md")])
+        self.assertEqual(
+            manifest["fingerprint"], self.mod.get_fingerprint("html", {}))
+
+    def test_single_file_to_output_file(self):
+        out = os.path.join(self.root, "a.tex")
+        status, _, _ = self.run_main(
+            os.path.join(self.src, "a.md"), "-t", "latex", "-o", out)
+        self.assertEqual(status, 0)
+        with open(out, "rb") as file:
+            self.assertEqual(
+                file.read().decode("utf-8"), self.cmark.to_latex("*a*"))
+
+    def test_unsupported_option(self):
+        status, _, stderr = self.run_main("-t", "xml", "--width", "3")
+        self.assertEqual(status, 2)
+        self.assertIn("--width is not supported by xml", stderr)
+
+    def test_colliding_outputs(self):
+        os.makedirs(os.path.join(self.src, "other"))
+        self.write("other/a.markdown", "x")
+        status, _, stderr = self.run_main(
+            self.src, os.path.join(self.src, "other"), "-o", self.out)
+        self.assertEqual(status, 2)
+        self.assertIn("have the same output a.html", stderr)
+        self.assertFalse(os.path.exists(self.out))
+        # The same file given twice is not a collision.
+        status, _, stderr = self.run_main(
+            self.src, os.path.join(self.src, "a.md"), "-o", self.out,
+            "-j", "0")
+        self.assertEqual((status, stderr), (0, "converted 3, unchanged 0\n"))
+
+    def test_tree_requires_output(self):
+        status, _, stderr = self.run_main(self.src)
+        self.assertEqual(status, 2)
+        self.assertIn("--output directory is required", stderr)
+
+    def test_stdin_to_stdout(self):
+        output = subprocess.check_output(
+            [sys.executable, "-m", "paka.cmark", "-t", "commonmark",
+             "--breaks", "hard"],
+            input="a\nб".encode("utf-8"))
+        self.assertEqual(output.decode("utf-8"), "a  \nб\n")
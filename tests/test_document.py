@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import gc
+import textwrap
+import unittest
+
+
+class DocumentTest(unittest.TestCase):
+    SAMPLE = textwrap.dedent("""\
+        # Первый
+
+        Проверяем *CommonMark*.
+
+        * one
+        * two
+
+          more
+
+        ## Second
+
+        Вставляем `код`.
+        """)
+
+    def setUp(self):
+        from paka.cmark import Document, lowlevel, to_commonmark, to_html
+
+        self.doc = Document(self.SAMPLE)
+        self.cls = Document
+        self.lowlevel = lowlevel
+        self.to_html = to_html
+        self.to_commonmark = to_commonmark
+
+    def test_whole_document(self):
+        self.assertEqual(self.doc.to_html(), self.to_html(self.SAMPLE))
+        self.assertEqual(
+            self.doc.to_html(contents_only=True), self.to_html(self.SAMPLE))
+        self.assertEqual(
+            self.doc.to_commonmark(), self.to_commonmark(self.SAMPLE))
+
+    def test_tree(self):
+        children = self.doc.children
+        self.assertEqual(
+            [node.type_string for node in children],
+            ["heading", "paragraph", "list", "heading", "paragraph"])
+        self.assertEqual(children[0].type, self.lowlevel.NODE_HEADING)
+        self.assertEqual(children[0].heading_level, 1)
+        self.assertEqual(children[0].first_child.literal, "Первый")
+        self.assertIsNone(children[0].literal)
+        self.assertEqual(children[0].parent, self.doc)
+        self.assertEqual(children[1].previous, children[0])
+        self.assertEqual(children[0].next, children[1])
+        self.assertEqual(self.doc.last_child, children[-1])
+        self.assertIsNone(self.doc.parent)
+        self.assertIsNone(self.doc.next)
+        self.assertTrue(children[1].is_block)
+        self.assertFalse(children[1].first_child.is_block)
+
+    def test_list_item(self):
+        item = self.doc.children[2].children[1]
+        self.assertEqual(
+            item.to_html(), "<li>\n<p>two</p>\n<p>more</p>\n</li>\n")
+        self.assertEqual(
+            item.to_html(contents_only=True), "<p>two</p>\n<p>more</p>\n")
+        self.assertEqual(
+            item.to_commonmark(contents_only=True), "two\n\nmore\n")
+
+    def test_commonmark_contents_round_trip(self):
+        # Contents of list are its items (markers included), so they
+        # are parsed back as the same list.
+        cases = (
+            ("* a\n* b\n", False),
+            ("* a\n\n  b\n* c\n", False),
+            ("> * a\n>   * b\n> * c\n\n> 1. d\n", True),
+            ("> a\n>\n> ```\n> b\n> ```\n", True))
+        for text, contents_of_contents in cases:
+            with self.subTest(text=text):
+                node = self.cls(text).first_child
+                fragment = node.to_commonmark(contents_only=True)
+                self.assertEqual(
+                    self.to_html(fragment),
+                    node.to_html(contents_only=contents_of_contents))
+        # Adjacent lists are kept apart, as when whole tree is rendered.
+        doc = self.cls("* a\n* b\n- c\n")
+        self.assertEqual(
+            doc.to_commonmark(contents_only=True), doc.to_commonmark())
+
+    def test_section(self):
+        nodes = []
+        node = self.doc.children[3]
+        while node is not None:
+            nodes.append(node)
+            node = node.next
+        self.assertEqual(
+            "".join(node.to_html() for node in nodes),
+            "<h2>Second</h2>\n<p>Вставляем <code>код</code>.</p>\n")
+
+    def test_inline_contents(self):
+        heading = self.doc.children[0]
+        self.assertEqual(heading.to_html(contents_only=True), "Первый")
+        self.assertEqual(heading.to_commonmark(contents_only=True), "Первый")
+        self.assertEqual(
+            heading.to_xml(contents_only=True),
+            "<text xml:space=\"preserve\">Первый</text>\n")
+        self.assertEqual(
+            heading.to_xml(),
+            textwrap.dedent("""\
+                <?xml version="1.0" encoding="UTF-8"?>
+                <!DOCTYPE document SYSTEM "CommonMark.dtd">
+                <heading level="1">
+                  <text xml:space="preserve">Первый</text>
+                </heading>
+                """))
+
+    def test_options(self):
+        doc = self.cls("\"Hi\"\n<b>x</b>", sourcepos=True, smart=True)
+        paragraph = doc.first_child
+        self.assertEqual(
+            paragraph.to_html(),
+            "<p data-sourcepos=\"1:1-2:8\">“Hi” "
+            "<!-- raw HTML omitted -->x<!-- raw HTML omitted --></p>\n")
+        self.assertEqual(
+            paragraph.to_html(breaks="hard", safe=False),
+            "<p data-sourcepos=\"1:1-2:8\">“Hi”<br />\n<b>x</b></p>\n")
+
+    def test_node_outlives_document(self):
+        item = self.doc.children[2].first_child
+        del self.doc
+        gc.collect()
+        self.assertEqual(item.to_html(), "<li>\n<p>one</p>\n</li>\n")
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import unittest
+
+
+class DocumentStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.lowlevel = cmark.lowlevel
+
+    def test_empty(self):
+        stats = self.mod.Document("").stats()
+        self.assertEqual(stats.node_counts, {self.lowlevel.NODE_DOCUMENT: 1})
+        self.assertEqual(stats.nodes, 1)
+        self.assertEqual(stats.max_depth, 0)
+        self.assertEqual(stats.literal_bytes, 0)
+        self.assertEqual(stats.references, 0)
+        self.assertGreater(stats.memory, 0)
+
+    def test_counts(self):
+        stats = self.mod.Document(
+            "# Заголовок\n\n"
+            "* *a* `b`\n"
+            "* [c][r]\n\n"
+            "[r]: /u\n"
+            "[R]: /v\n\n"
+            "```\ncode\n```\n").stats()
+        ll = self.lowlevel
+        self.assertEqual(stats.node_counts, {
+            ll.NODE_DOCUMENT: 1, ll.NODE_HEADING: 1, ll.NODE_LIST: 1,
+            ll.NODE_ITEM: 2, ll.NODE_PARAGRAPH: 2, ll.NODE_TEXT: 4,
+            ll.NODE_EMPH: 1, ll.NODE_CODE: 1, ll.NODE_LINK: 1,
+            ll.NODE_CODE_BLOCK: 1})
+        self.assertEqual(stats.nodes, 15)
+        # document > list > item > paragraph > emph > text
+        self.assertEqual(stats.max_depth, 5)
+        self.assertEqual(
+            stats.literal_bytes,
+            len("Заголовок".encode("utf-8")) + len("a" " " "b" "c" "code\n"))
+        self.assertEqual(stats.references, 2)
+
+    def test_deep_nesting(self):
+        stats = self.mod.Document("> " * 1000 + "a").stats()
+        self.assertEqual(stats.max_depth, 1002)
+        self.assertEqual(
+            stats.node_counts[self.lowlevel.NODE_BLOCK_QUOTE], 1000)
+
+    def test_memory_grows_with_literals(self):
+        small = self.mod.Document("a").stats().memory
+        big = self.mod.Document("a" * 1000).stats().memory
+        self.assertEqual(big - small, 999)
+
+    def test_same_tree_as_parse_document(self):
+        text = "[a]\n\n[a]: /u"
+        self.assertEqual(
+            self.mod.Document(text).to_html(), self.mod.to_html(text))
+
+
+class StatsProfileTest(unittest.TestCase):
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+
+    def test_empty(self):
+        profile = self.mod.StatsProfile()
+        self.assertEqual(profile.documents, 0)
+        self.assertEqual(profile.mean("nodes"), 0.0)
+        self.assertEqual(profile.percentile("nodes", 0.99), 0)
+
+    def test_aggregate(self):
+        profile = self.mod.StatsProfile()
+        texts = ["a", "> " * 9 + "a", "*a*\n\n[r]: /u"]
+        for text in texts:
+            profile.add_text(text)
+        stats = [self.mod.Document(text).stats() for text in texts]
+        self.assertEqual(profile.documents, 3)
+        self.assertEqual(
+            profile.node_counts[self.mod.lowlevel.NODE_TEXT], 3)
+        for field in profile.FIELDS:
+            values = [getattr(item, field) for item in stats]
+            self.assertEqual(profile.totals[field], sum(values))
+            self.assertEqual(profile.maxima[field], max(values))
+        self.assertEqual(profile.mean("references"), 1 / 3.0)
+        self.assertEqual(profile.maxima["max_depth"], 11)
+
+    def test_percentile(self):
+        profile = self.mod.StatsProfile()
+        for depth in range(100):
+            profile.add_text("> " * depth + "a")
+        # Depths are 2..101; 50% of them do not exceed 51 (in [32, 63]).
+        self.assertEqual(profile.percentile("max_depth", 0.5), 63)
+        self.assertEqual(profile.percentile("max_depth", 1.0), 101)
+        self.assertEqual(profile.percentile("max_depth", 0.0), 3)
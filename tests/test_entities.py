@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import unittest
+
+try:
+    from html.entities import html5
+except ImportError:  # pragma: no cover
+    html5 = None
+
+
+def _escape(text):
+    return (
+        text.replace("&", "&amp;").replace("<", "&lt;")
+        .replace(">", "&gt;").replace("\"", "&quot;"))
+
+
+@unittest.skipIf(html5 is None, "html.entities.html5 is not available")
+class EntitiesTest(unittest.TestCase):
+    """Exhaustive test of named entity lookup (perfect hash table)."""
+
+    def setUp(self):
+        from paka.cmark import to_html
+
+        self.func = to_html
+
+    def test_all_entities(self):
+        names = sorted(name for name in html5 if name.endswith(";"))
+        self.assertEqual(len(names), 2125)
+        for name in names:
+            self.assertEqual(
+                self.func("a&{}b".format(name)),
+                "<p>a{}b</p>\n".format(_escape(html5[name])),
+                name)
+
+    def test_unknown_entities(self):
+        for name in (
+                "amp", "ampx;", "AMPx;", "am;", "zz;", "a;", "x" * 31 + ";",
+                "NotNestedGreaterGreaterx;", "nbsp ;", "Nbsp;"):
+            self.assertEqual(
+                self.func("&{}".format(name)),
+                "<p>&amp;{}</p>\n".format(_escape(name)),
+                name)
+
+    def test_entities_in_link(self):
+        self.assertEqual(
+            self.func("[&copy;](/a&amp;b \"&quot;&unknown;\")"),
+            "<p><a href=\"/a&amp;b\" title=\"&quot;&amp;unknown;\">"
+            "©</a></p>\n")
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import random
+import unittest
+
+
+def _reference_escape(text):
+    """Escape text the way byte-by-byte houdini_escape_html does."""
+    return (
+        text.replace("&", "&amp;").replace("<", "&lt;")
+        .replace(">", "&gt;").replace("\"", "&quot;"))
+
+
+class EscapeHTMLTest(unittest.TestCase):
+    """Differential test of word-at-a-time HTML escaping.
+
+    Code blocks are rendered with their contents escaped as is,
+    so rendered code blocks are compared with reference escaping.
+
+    """
+
+    ALPHABET = "aZ0 &<>\"'/é€\t"
+
+    def setUp(self):
+        from paka.cmark import to_html
+
+        self.func = to_html
+
+    def check(self, contents):
+        self.assertEqual(
+            self.func("```\n" + contents + "\n```\n"),
+            "<pre><code>" + _reference_escape(contents + "\n") +
+            "</code></pre>\n")
+
+    def test_no_escapes(self):
+        for length in range(40):
+            self.check("x" * length)
+
+    def test_escape_at_every_position(self):
+        for length in range(1, 40):
+            for pos in range(length):
+                for char in "&<>\"'/":
+                    contents = ["x"] * length
+                    contents[pos] = char
+                    self.check("".join(contents))
+
+    def test_random(self):
+        rnd = random.Random(42)
+        for _ in range(2000):
+            self.check("".join(
+                rnd.choice(self.ALPHABET)
+                for _ in range(rnd.randint(0, 100))))
+
+    def test_long_runs(self):
+        self.check(("0123456789" * 100 + "<") * 10)
+        self.check("&" * 1000)
+
+
+def _reference_escape_secure(text):
+    """Escape text the way houdini_escape_html does in secure mode."""
+    return _reference_escape(text).replace("'", "&#39;").replace(
+        "/", "&#47;")
+
+
+class EscapeHTMLSecureTest(unittest.TestCase):
+    """Differential test of word-at-a-time escaping in secure mode.
+
+    Secure mode (also escaping ``'`` and ``/``) is not reachable
+    through renderers, so escaping function is called directly.
+
+    """
+
+    CHARS = "&<>\"'/"
+
+    def setUp(self):
+        from paka.cmark import lowlevel
+
+        self.lowlevel = lowlevel
+
+    def escape(self, text, secure):
+        buffer = self.lowlevel.text_to_c(text)
+        return self.lowlevel.text_from_c(
+            self.lowlevel.escape_html(buffer, len(buffer), secure),
+            free=True)
+
+    def check(self, text):
+        self.assertEqual(self.escape(text, 1), _reference_escape_secure(text))
+        self.assertEqual(self.escape(text, 0), _reference_escape(text))
+
+    def test_no_escapes(self):
+        for length in range(40):
+            self.check("x" * length)
+
+    def test_escape_at_every_position(self):
+        # Lengths cover several words and every length of tail.
+        for length in range(1, 40):
+            for pos in range(length):
+                for char in self.CHARS:
+                    contents = ["x"] * length
+                    contents[pos] = char
+                    self.check("".join(contents))
+
+    def test_across_word_boundaries(self):
+        for length in range(2, 40):
+            for pos in range(length - 1):
+                for first in self.CHARS:
+                    for second in "'/":
+                        contents = ["x"] * length
+                        contents[pos] = first
+                        contents[pos + 1] = second
+                        self.check("".join(contents))
+
+    def test_unescaped_neighbours(self):
+        # Bytes differing from escapable ones by single bit.
+        for char in "'/":
+            for bit in range(8):
+                other = chr(ord(char) ^ (1 << bit))
+                if other not in self.CHARS and other != "\x00":
+                    self.check((other + "x" * 7) * 3 + char + other * 9)
+
+    def test_non_ascii(self):
+        self.check("é/€'" * 20 + "/")
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import textwrap
+import unittest
+
+
+class ExcerptTest(unittest.TestCase):
+    SAMPLE = textwrap.dedent("""\
+        # Заголовок
+
+        Some *emphasised **strong** text* and `code`.
+        Next line.
+
+        * item one
+        * item two
+
+        ```
+        code block
+        ```
+        """)
+
+    def setUp(self):
+        from paka.cmark import excerpt, to_html
+
+        self.func = excerpt
+        self.to_html = to_html
+
+    def check(self, max_chars, expected, truncated=True, **kwargs):
+        self.assertEqual(
+            self.func(self.SAMPLE, max_chars, **kwargs),
+            (expected, truncated))
+
+    def test_not_truncated(self):
+        self.check(1000, self.to_html(self.SAMPLE), truncated=False)
+        self.assertEqual(self.func("", 0), ("", False))
+
+    def test_nothing_left(self):
+        self.check(0, "")
+        self.check(-1, "")
+
+    def test_cut_in_nested_inlines(self):
+        self.check(
+            20,
+            "<h1>Заголовок</h1>\n<p>Some <em>emphas…</em></p>\n")
+        self.check(
+            28,
+            "<h1>Заголовок</h1>\n"
+            "<p>Some <em>emphasised <strong>str…</strong></em></p>\n")
+
+    def test_cut_at_node_boundary(self):
+        self.check(9, "<h1>Заголовок…</h1>\n")
+
+    def test_cut_in_list(self):
+        self.check(
+            67,
+            "<h1>Заголовок</h1>\n"
+            "<p>Some <em>emphasised <strong>strong</strong> text</em> and "
+            "<code>code</code>. Next line.</p>\n"
+            "<ul>\n<li>item one</li>\n<li>it…</li>\n</ul>\n")
+
+    def test_cut_in_code_block(self):
+        self.check(
+            77,
+            "<h1>Заголовок</h1>\n"
+            "<p>Some <em>emphasised <strong>strong</strong> text</em> and "
+            "<code>code</code>. Next line.</p>\n"
+            "<ul>\n<li>item one</li>\n<li>item two</li>\n</ul>\n"
+            "<pre><code>code…</code></pre>\n")
+
+    def test_ellipsis(self):
+        self.check(3, "<h1>Заг</h1>\n", ellipsis="")
+        self.check(3, "<h1>Заг...</h1>\n", ellipsis="...")
+
+    def test_breaks(self):
+        self.check(
+            49,
+            "<h1>Заголовок</h1>\n"
+            "<p>Some <em>emphasised <strong>strong</strong> text</em> and "
+            "<code>code</code>.<br />\nNe…</p>\n",
+            breaks="hard")
+
+    def test_uncounted_nodes_after_limit(self):
+        cases = (
+            "abc\n\n---\n\nmore",
+            "abc\n\n---\n",
+            "abc\n\n<div>raw</div>\n",
+            "abc\n\n![image](/a.png)\n",
+            "*abc*![image](/a.png)")
+        for text in cases:
+            with self.subTest(text=text):
+                html, truncated = self.func(text, 3, safe=False)
+                self.assertTrue(truncated)
+                self.assertNotIn("<hr", html)
+                self.assertNotIn("raw", html)
+                self.assertNotIn("<img", html)
+                self.assertIn("abc…", html)
+
+    def test_max_chars_out_of_range(self):
+        self.assertEqual(self.func("abc", 1 << 40), ("<p>abc</p>\n", False))
+        self.assertEqual(self.func("abc", -1), ("", True))
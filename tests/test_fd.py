@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+import concurrent.futures
+
+
+class _FdTestCase(unittest.TestCase):
+    TEXT = (
+        "# Заголовок\r\n\r\n\"Текст\" *з* дуже довгим\nрозривом\n\n"
+        "[a]\n\n<b>raw</b>\n\n[a]: /b\n")
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.dir_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir_path)
+        self.path = self.write_source("doc.md", self.TEXT)
+
+    def write_source(self, name, text):
+        path = os.path.join(self.dir_path, name)
+        with open(path, "wb") as file:
+            file.write(text.encode("utf-8"))
+        return path
+
+    def open(self, path, flags=os.O_RDONLY):
+        fd = os.open(path, flags, 0o644)
+        self.addCleanup(os.close, fd)
+        return fd
+
+
+class ParseFdTest(_FdTestCase):
+
+    def test_file(self):
+        for chunk_size in (1, 5, 1 << 16):
+            with self.subTest(chunk_size=chunk_size):
+                document = self.mod.parse_fd(
+                    self.open(self.path), smart=True, chunk_size=chunk_size)
+                self.assertEqual(
+                    document.to_html(),
+                    self.mod.to_html(self.TEXT, smart=True))
+                self.assertEqual(document.stats().references, 1)
+
+    def test_pipe(self):
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        with os.fdopen(write_fd, "wb") as file:
+            file.write(b"*a*")
+        self.assertEqual(
+            self.mod.parse_fd(read_fd, sourcepos=True).to_html(),
+            "<p data-sourcepos=\"1:1-1:3\"><em>a</em></p>\n")
+
+    def test_error(self):
+        fd = os.open(self.path, os.O_RDONLY)
+        os.close(fd)
+        with self.assertRaises(OSError):
+            self.mod.parse_fd(fd)
+
+
+class RenderFdTest(_FdTestCase):
+
+    def render(self, source_path, **kwargs):
+        out_path = source_path + ".out"
+        counts = self.mod.render_fd(
+            self.open(source_path),
+            self.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC),
+            **kwargs)
+        with open(out_path, "rb") as file:
+            data = file.read()
+        self.assertEqual(counts, (os.path.getsize(source_path), len(data)))
+        return data.decode("utf-8")
+
+    def test_formats(self):
+        cases = (
+            ("html", self.mod.to_html, {"breaks": "hard", "safe": False}),
+            ("html", self.mod.to_html, {"sourcepos": True, "smart": True}),
+            ("xml", self.mod.to_xml, {"sourcepos": True}),
+            ("commonmark", self.mod.to_commonmark, {"width": 10}),
+            ("man", self.mod.to_man, {"breaks": True, "width": 10}),
+            ("latex", self.mod.to_latex, {"smart": True}))
+        for format_name, func, kwargs in cases:
+            for chunk_size in (1, 1 << 16):
+                with self.subTest(
+                        format=format_name, chunk_size=chunk_size, **kwargs):
+                    self.assertEqual(
+                        self.render(
+                            self.path, format=format_name,
+                            chunk_size=chunk_size, **kwargs),
+                        func(self.TEXT, **kwargs))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            self.mod.render_fd(0, 1, format="pdf")
+
+    def test_write_error(self):
+        in_fd = self.open(self.path)
+        # Writing to pipe without reader fails (SIGPIPE is ignored).
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, write_fd)
+        os.close(read_fd)
+        with self.assertRaises(OSError):
+            self.mod.render_fd(in_fd, write_fd)
+
+    def test_threads(self):
+        paths = [
+            self.write_source(str(index) + ".md", self.TEXT * index)
+            for index in range(1, 9)]
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            outputs = list(executor.map(self.render, paths))
+        for index, output in enumerate(outputs, 1):
+            self.assertEqual(output, self.mod.to_html(self.TEXT * index))
+
+    def test_stats_reused(self):
+        from paka.cmark import lowlevel
+        from paka.cmark._cmark import ffi
+
+        stats = ffi.new("paka_fd_stats *")
+        for _ in range(2):
+            out_path = self.path + ".out"
+            self.assertEqual(
+                lowlevel.render_fd(
+                    self.open(self.path),
+                    self.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC),
+                    lowlevel.FORMAT_HTML, lowlevel.OPT_DEFAULT, 0, 1 << 16,
+                    stats),
+                0)
+            self.assertEqual(
+                (stats.bytes_read, stats.bytes_written),
+                (os.path.getsize(self.path), os.path.getsize(out_path)))
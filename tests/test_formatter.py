@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import contextlib
+from unittest import mock
+
+
+class FormatterTest(unittest.TestCase):
+    FORMATTED = "# Заголовок\n\n  - a\n  - b\n"
+
+    def setUp(self):
+        from paka.cmark import formatter
+
+        self.mod = formatter
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.cache = os.path.join(self.root, "cache.json")
+        self.src = os.path.join(self.root, "src")
+        os.makedirs(self.src)
+        self.messy = self.write("messy.md", "Заголовок\n===\n\n* a\n* b\n")
+        self.clean = self.write("clean.md", self.FORMATTED)
+
+    def write(self, name, text):
+        path = os.path.join(self.src, name)
+        with open(path, "wb") as file:
+            file.write(text.encode("utf-8"))
+        return path
+
+    def read(self, path):
+        with open(path, "rb") as file:
+            return file.read().decode("utf-8")
+
+    def format(self, **kwargs):
+        kwargs.setdefault("workers", 0)
+        kwargs.setdefault("cache_path", self.cache)
+        return [
+            (os.path.basename(result.path), result.status)
+            for result in self.mod.format_files([self.src], **kwargs)]
+
+    def test_format(self):
+        mtime = os.stat(self.clean).st_mtime_ns
+        self.assertEqual(
+            self.format(workers=2),
+            [("clean.md", self.mod.UNCHANGED), ("messy.md", self.mod.CHANGED)])
+        self.assertEqual(self.read(self.messy), self.FORMATTED)
+        self.assertEqual(os.stat(self.clean).st_mtime_ns, mtime)
+
+    def test_same_file_given_twice(self):
+        sub = os.path.join(self.src, "sub")
+        os.makedirs(sub)
+        other = os.path.join(sub, "messy.md")
+        shutil.copy(self.messy, other)
+        relative = os.path.relpath(self.messy)
+        for workers in (0, 2):
+            with self.subTest(workers=workers):
+                results = self.mod.format_files(
+                    [self.src, relative, self.messy, self.src],
+                    check=True, workers=workers, cache_path=None)
+                self.assertEqual(
+                    [(result.path, result.status) for result in results],
+                    [(self.clean, self.mod.UNCHANGED),
+                     (self.messy, self.mod.CHANGED),
+                     (other, self.mod.CHANGED)])
+
+    def test_cache(self):
+        self.format()
+        self.assertEqual(
+            self.format(),
+            [("clean.md", self.mod.CACHED), ("messy.md", self.mod.CACHED)])
+        self.write("messy.md", "*a*\n")
+        self.assertEqual(
+            self.format(),
+            [("clean.md", self.mod.CACHED), ("messy.md", self.mod.UNCHANGED)])
+        self.assertEqual(
+            self.format(width=10),
+            [("clean.md", self.mod.UNCHANGED),
+             ("messy.md", self.mod.UNCHANGED)])
+
+    def test_check_and_diff(self):
+        results = self.mod.format_files(
+            [self.src], check=True, diff=True, workers=0, cache_path=None)
+        self.assertEqual(results[0].diff, None)
+        self.assertTrue(results[1].diff.startswith("--- " + self.messy))
+        self.assertIn("+# Заголовок\n", results[1].diff)
+        self.assertNotEqual(self.read(self.messy), self.FORMATTED)
+        # Files that would change are not cached as formatted.
+        self.format(check=True)
+        self.assertEqual(
+            self.format(check=True),
+            [("clean.md", self.mod.CACHED), ("messy.md", self.mod.CHANGED)])
+
+    def test_unstable(self):
+        with mock.patch.object(
+                self.mod, "to_commonmark",
+                lambda text, **kwargs: text + "x"):
+            self.assertEqual(
+                self.format(),
+                [("clean.md", self.mod.UNSTABLE),
+                 ("messy.md", self.mod.UNSTABLE)])
+        self.assertEqual(self.read(self.clean), self.FORMATTED)
+
+    def test_main(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), \
+                contextlib.redirect_stderr(stderr):
+            status = self.mod.main(
+                [self.src, "--check", "-j", "0", "--cache", self.cache])
+        self.assertEqual(status, 1)
+        self.assertEqual(
+            stdout.getvalue(), "would reformat " + self.messy + "\n")
+        self.assertEqual(
+            stderr.getvalue(),
+            "1 would be reformatted, 1 unchanged, 0 cached, 0 unstable\n")
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(
+                self.mod.main([self.src, "-j", "0", "--no-cache"]), 0)
+        self.assertEqual(self.read(self.messy), self.FORMATTED)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import random
+import unittest
+
+try:
+    from benchmarks import fuzz
+except ImportError:  # pragma: no cover
+    fuzz = None
+
+
+@unittest.skipIf(fuzz is None, "benchmarks are not importable")
+class FuzzTest(unittest.TestCase):
+
+    def test_build(self):
+        self.assertEqual(
+            fuzz.build(fuzz.Pattern("[", "a", "]"), 3), "[[[a]]]")
+
+    def test_mutate_is_reproducible(self):
+        first, second = (
+            [fuzz.mutate(random.Random(seed), seed_pattern)
+             for seed_pattern in fuzz.SEEDS for seed in range(5)]
+            for _ in range(2))
+        self.assertEqual(first, second)
+        for pattern in first:
+            for part in pattern:
+                self.assertLessEqual(len(part), fuzz.MAX_PART_LENGTH)
+
+    def test_minimize(self):
+        pattern = fuzz.Pattern("ab[cd", "xyz", "e]f")
+        self.assertEqual(
+            fuzz.minimize(
+                pattern,
+                lambda candidate: (
+                    "[" in candidate.prefix and "]" in candidate.suffix)),
+            fuzz.Pattern("[", "", "]"))
+
+    def test_measure_all_phases(self):
+        exponents = fuzz.measure(
+            fuzz.Pattern("*a ", "b", " a*"), 256, steps=2, repeat=1,
+            min_seconds=0)
+        self.assertEqual(
+            sorted(exponents),
+            sorted(["parse_document"] + [name for name, _ in fuzz.PHASES]))
+
+    def test_time_phases_sizes(self):
+        text = fuzz.build(fuzz.Pattern(">", "", "u\n"), 20)
+        timings = fuzz.time_phases(text, 1)
+        self.assertEqual(timings["parse_document"][1], len(text))
+        # Nested block quotes: output grows faster than input.
+        self.assertGreater(timings["render_html"][1], 2 * len(text))
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import unittest
+import tracemalloc
+
+
+class LowMemoryTest(unittest.TestCase):
+    # Longer than slice fed to parser at once, with CRLF line endings
+    # and multi-byte characters on boundaries of slices.
+    TEXT = "# Заголовок\r\n\r\n" + "\"Рядок\" з *наголосом*\r\n" * 50000
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.addCleanup(
+            setattr, cmark, "LOW_MEMORY_THRESHOLD",
+            cmark.LOW_MEMORY_THRESHOLD)
+
+    def convert_both(self, func, text, **kwargs):
+        self.mod.LOW_MEMORY_THRESHOLD = None
+        default = func(text, **kwargs)
+        self.mod.LOW_MEMORY_THRESHOLD = len(text)
+        return default, func(text, **kwargs)
+
+    def test_same_output(self):
+        cases = (
+            (self.mod.to_html, {"smart": True, "sourcepos": True}),
+            (self.mod.to_xml, {}),
+            (self.mod.to_commonmark, {"width": 30}),
+            (self.mod.to_man, {"breaks": True}),
+            (self.mod.to_latex, {}))
+        for func, kwargs in cases:
+            with self.subTest(func=func.__name__):
+                default, low_memory = self.convert_both(
+                    func, self.TEXT, **kwargs)
+                self.assertEqual(low_memory, default)
+
+    def test_excerpt(self):
+        default, low_memory = self.convert_both(
+            self.mod.excerpt, self.TEXT, max_chars=50)
+        self.assertEqual(low_memory, default)
+
+    def test_encoding_error(self):
+        self.mod.LOW_MEMORY_THRESHOLD = 0
+        with self.assertRaises(UnicodeEncodeError):
+            self.mod.to_html(self.TEXT + "\ud800")
+        self.assertEqual(self.mod.to_html("*x*"), "<p><em>x</em></p>\n")
+
+    def test_peak_memory(self):
+        self.mod.LOW_MEMORY_THRESHOLD = 0
+        text = "Рядок з *наголосом*\n" * 100000
+        html_bytes = self.mod.to_html(text).encode("utf-8")
+        peaks = []
+        for func in (lambda: html_bytes.decode("utf-8"),
+                     lambda: self.mod.to_html(text)):
+            tracemalloc.start()
+            try:
+                func()
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+        # Encoded text and copy of output as bytes are not allocated,
+        # so peak is that of decoding output.
+        self.assertLess(peaks[1], peaks[0] * 1.05)
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import io
+import os
+import tempfile
+import threading
+import unittest
+
+
+class MetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        from paka import cmark
+        from paka.cmark import metrics
+
+        self.cmark = cmark
+        self.mod = metrics
+        self.mod.enable()
+        self.addCleanup(self.mod.disable)
+
+    def test_disabled(self):
+        self.mod.disable()
+        self.assertFalse(self.mod.is_enabled())
+        self.cmark.to_html("a")
+        self.assertEqual(self.mod.snapshot(), {})
+
+    def test_counts_and_sizes(self):
+        self.assertTrue(self.mod.is_enabled())
+        self.assertEqual(self.cmark.to_html("*ж*"), "<p><em>ж</em></p>\n")
+        self.cmark.to_html("b")
+        snapshot = self.mod.snapshot()
+        self.assertEqual(list(snapshot), ["to_html"])
+        self.assertEqual(snapshot["to_html"]["calls"], 2)
+        self.assertEqual(snapshot["to_html"]["input_bytes"], 4 + 1)
+        self.assertEqual(snapshot["to_html"]["output_bytes"], 19 + 9)
+        for phase in self.mod.PHASES:
+            histogram = snapshot["to_html"][phase]
+            self.assertEqual(histogram["count"], 2)
+            self.assertGreater(histogram["sum"], 0)
+            self.assertEqual(histogram["buckets"][-1], (float("inf"), 2))
+            self.assertEqual(
+                len(histogram["buckets"]), len(self.mod.DEFAULT_BUCKETS) + 1)
+
+    def test_entry_points(self):
+        self.assertEqual(
+            self.cmark.to_html_inline("*a*"), "<em>a</em>")
+        self.assertEqual(
+            self.cmark.excerpt("abc def", 3), ("<p>abc…</p>\n", True))
+        for func in (
+                self.cmark.to_xml, self.cmark.to_commonmark,
+                self.cmark.to_man, self.cmark.to_latex):
+            func("a")
+        self.assertEqual(
+            sorted(self.mod.snapshot()),
+            ["excerpt", "to_commonmark", "to_html_inline", "to_latex",
+             "to_man", "to_xml"])
+
+    def test_streaming_entry_points(self):
+        text = "*ж*"
+        output = self.cmark.to_html(text).encode("utf-8")
+        self.mod.reset()
+        self.cmark.render_into(text, bytearray())
+        self.cmark.render_to(io.BytesIO(), text)
+        self.cmark.render_compressed(text)
+        self.cmark.Document(text)
+        self.cmark.parse_stream(io.BytesIO(text.encode("utf-8")))
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, "a.md")
+            with open(path, "wb") as file:
+                file.write(text.encode("utf-8"))
+            self.cmark.render_file(path)
+            for func in (self.cmark.parse_fd, self.cmark.render_fd):
+                in_fd = os.open(path, os.O_RDONLY)
+                out_fd = os.open(
+                    os.path.join(dir_path, "a.html"),
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+                try:
+                    if func is self.cmark.parse_fd:
+                        func(in_fd)
+                    else:
+                        func(in_fd, out_fd)
+                finally:
+                    os.close(in_fd)
+                    os.close(out_fd)
+        metrics = self.mod.snapshot()
+        for entry_point in (
+                "render_into", "render_to", "render_compressed",
+                "render_file", "render_fd"):
+            with self.subTest(entry_point=entry_point):
+                self.assertEqual(metrics[entry_point]["calls"], 1)
+                self.assertEqual(metrics[entry_point]["input_bytes"], 4)
+                self.assertEqual(
+                    metrics[entry_point]["output_bytes"], len(output))
+        for entry_point in ("Document", "parse_stream", "parse_fd"):
+            with self.subTest(entry_point=entry_point):
+                self.assertEqual(metrics[entry_point]["input_bytes"], 4)
+                self.assertEqual(metrics[entry_point]["output_bytes"], 0)
+                self.assertEqual(metrics[entry_point]["render"]["sum"], 0.0)
+        # Parsed once, so only its rendering is recorded.
+        self.cmark.render_into(self.cmark.Document(text), bytearray())
+        metrics = self.mod.snapshot()
+        self.assertEqual(metrics["render_into"]["input_bytes"], 4)
+        self.assertEqual(metrics["render_into"]["calls"], 2)
+
+    def test_low_memory(self):
+        expected = self.cmark.to_xml("ж")
+        self.addCleanup(
+            setattr, self.cmark, "LOW_MEMORY_THRESHOLD",
+            self.cmark.LOW_MEMORY_THRESHOLD)
+        self.cmark.LOW_MEMORY_THRESHOLD = 0
+        self.mod.reset()
+        self.assertEqual(self.cmark.to_xml("ж"), expected)
+        metrics = self.mod.snapshot()["to_xml"]
+        self.assertEqual(metrics["calls"], 1)
+        self.assertEqual(metrics["input_bytes"], 2)
+        self.assertEqual(metrics["output_bytes"], len(expected.encode()))
+
+    def test_same_output(self):
+        text = "# Заголовок\n\n* a\n* [b](c)\n"
+        for func in (
+                self.cmark.to_html, self.cmark.to_xml,
+                self.cmark.to_commonmark, self.cmark.to_man,
+                self.cmark.to_latex, self.cmark.to_html_inline):
+            enabled = func(text)
+            self.mod.disable()
+            self.assertEqual(enabled, func(text))
+            self.mod.enable()
+
+    def test_threads(self):
+        def _work():
+            for _ in range(100):
+                self.cmark.to_html("a")
+        threads = [threading.Thread(target=_work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.mod.snapshot()["to_html"]["calls"], 400)
+
+    def test_shards_of_finished_threads(self):
+        def _work():
+            self.cmark.to_html("a")
+            self.cmark.to_xml("b")
+
+        for _ in range(20):
+            thread = threading.Thread(target=_work)
+            thread.start()
+            thread.join()
+        self.assertEqual(len(self.mod._recorder._shards), 0)
+        metrics = self.mod.snapshot()
+        self.assertEqual(metrics["to_html"]["calls"], 20)
+        self.assertEqual(metrics["to_xml"]["parse"]["count"], 20)
+
+    def test_render_corpus(self):
+        sources = [(index, "*ж* " + str(index)) for index in range(10)]
+        with tempfile.TemporaryDirectory() as out:
+            for workers, backend, output_dir in (
+                    (2, "processes", None), (2, "processes", out),
+                    (2, "threads", None), (0, "processes", None)):
+                with self.subTest(
+                        workers=workers, backend=backend,
+                        output_dir=output_dir):
+                    self.mod.reset()
+                    outputs = [
+                        result for _, result in self.cmark.render_corpus(
+                            sources, workers=workers, chunk_size=3,
+                            backend=backend, output_dir=output_dir)]
+                    if output_dir is not None:
+                        outputs = [
+                            os.path.getsize(path) for path in outputs]
+                    else:
+                        outputs = [len(data) for data in outputs]
+                    metrics = self.mod.snapshot()["render_corpus"]
+                    self.assertEqual(metrics["calls"], 10)
+                    self.assertEqual(
+                        metrics["input_bytes"],
+                        sum(len(text.encode("utf-8")) for _, text in sources))
+                    self.assertEqual(
+                        metrics["output_bytes"], sum(outputs))
+                    self.assertEqual(metrics["render"]["count"], 10)
+                    self.assertGreater(metrics["render"]["sum"], 0)
+                    self.assertEqual(metrics["parse"]["sum"], 0)
+
+    def test_render_corpus_disabled(self):
+        self.mod.disable()
+        list(self.cmark.render_corpus([("a", "*a*")], workers=1))
+        self.assertEqual(self.mod.snapshot(), {})
+
+    def test_reset(self):
+        self.cmark.to_html("a")
+        self.mod.reset()
+        self.assertTrue(self.mod.is_enabled())
+        self.assertEqual(self.mod.snapshot(), {})
+
+    def test_buckets(self):
+        self.mod.disable()
+        self.mod.enable(buckets=(10.0, 0.0))
+        self.cmark.to_html("a")
+        self.assertEqual(
+            self.mod.snapshot()["to_html"]["parse"]["buckets"],
+            [(0.0, 0), (10.0, 1), (float("inf"), 1)])
+
+    def test_to_prometheus(self):
+        self.mod.disable()
+        self.mod.enable(buckets=(10.0,))
+        self.cmark.to_xml("a")
+        lines = self.mod.to_prometheus().splitlines()
+        self.assertEqual(lines[:3], [
+            "# HELP paka_cmark_calls_total Number of calls.",
+            "# TYPE paka_cmark_calls_total counter",
+            "paka_cmark_calls_total{entry_point=\"to_xml\"} 1"])
+        self.assertIn(
+            "paka_cmark_input_bytes_total{entry_point=\"to_xml\"} 1", lines)
+        self.assertIn(
+            "# TYPE paka_cmark_duration_seconds histogram", lines)
+        for phase in self.mod.PHASES:
+            labels = "entry_point=\"to_xml\",phase=\"" + phase + "\""
+            self.assertIn(
+                "paka_cmark_duration_seconds_bucket{" + labels +
+                ",le=\"10.0\"} 1", lines)
+            self.assertIn(
+                "paka_cmark_duration_seconds_bucket{" + labels +
+                ",le=\"+Inf\"} 1", lines)
+            self.assertIn(
+                "paka_cmark_duration_seconds_count{" + labels + "} 1", lines)
+
+    def test_to_prometheus_empty(self):
+        self.assertEqual(
+            self.mod.to_prometheus({}).splitlines()[-1],
+            "# TYPE paka_cmark_duration_seconds histogram")
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import io
+import os
+import bz2
+import gzip
+import lzma
+import shutil
+import tempfile
+import unittest
+
+
+class _SlowStream(object):
+    """Stream returning at most few bytes per read."""
+
+    def __init__(self, data):
+        self.stream = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self.stream.read(min(size, 3) if size >= 0 else 3)
+
+
+class ParseStreamTest(unittest.TestCase):
+    TEXT = (
+        "# Заголовок\r\n\r\n\"Текст\" *з*\nрозривом\n\n[a]\n\n"
+        "[a]: /b\n") * 50
+    COMPRESS = (
+        ("plain", lambda data: data), ("gzip", gzip.compress),
+        ("bz2", bz2.compress), ("xz", lzma.compress))
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.func = cmark.parse_stream
+
+    def test_compressions(self):
+        data = self.TEXT.encode("utf-8")
+        expected = self.mod.to_html(self.TEXT, smart=True)
+        for name, compress in self.COMPRESS:
+            for chunk_size in (1, 100, 1 << 16):
+                with self.subTest(compression=name, chunk_size=chunk_size):
+                    document = self.func(
+                        io.BytesIO(compress(data)), smart=True,
+                        chunk_size=chunk_size)
+                    self.assertEqual(document.to_html(), expected)
+                    self.assertEqual(document.stats().references, 50)
+
+    def test_short_reads(self):
+        for name, compress in self.COMPRESS:
+            with self.subTest(compression=name):
+                document = self.func(
+                    _SlowStream(compress(self.TEXT.encode("utf-8"))))
+                self.assertEqual(
+                    document.to_html(), self.mod.to_html(self.TEXT))
+
+    def test_concatenated_gzip(self):
+        data = gzip.compress(b"*a*\n") + gzip.compress(b"b\n")
+        self.assertEqual(
+            self.func(io.BytesIO(data)).to_html(),
+            "<p><em>a</em> b</p>\n")
+
+    def test_empty_and_short(self):
+        self.assertEqual(self.func(io.BytesIO(b"")).to_html(), "")
+        self.assertEqual(
+            self.func(io.BytesIO(b"BZ")).to_html(), "<p>BZ</p>\n")
+
+    def test_sourcepos(self):
+        document = self.func(io.BytesIO(b"a\n"), sourcepos=True)
+        self.assertEqual(
+            document.to_html(), "<p data-sourcepos=\"1:1-1:1\">a</p>\n")
+
+
+class RenderFileTest(unittest.TestCase):
+    TEXT = "# Заголовок\n\n\"Текст\" *з*\nрозривом\n"
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.func = cmark.render_file
+        self.dir_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir_path)
+        self.path = os.path.join(self.dir_path, "doc.md.gz")
+        with gzip.open(self.path, "wb") as file:
+            file.write(self.TEXT.encode("utf-8"))
+
+    def test_formats(self):
+        cases = (
+            ("html", self.mod.to_html, {"breaks": "hard", "smart": True}),
+            ("xml", self.mod.to_xml, {"sourcepos": True}),
+            ("commonmark", self.mod.to_commonmark, {"width": 10}),
+            ("man", self.mod.to_man, {"breaks": True}),
+            ("latex", self.mod.to_latex, {}))
+        for format_name, func, kwargs in cases:
+            with self.subTest(format=format_name):
+                self.assertEqual(
+                    self.func(self.path, format=format_name, **kwargs),
+                    func(self.TEXT, **kwargs))
+
+    def test_stream(self):
+        stream = io.BytesIO()
+        written = self.func(
+            self.path, stream, format="latex", chunk_size=4, smart=True)
+        self.assertEqual(written, len(stream.getvalue()))
+        self.assertEqual(
+            stream.getvalue().decode("utf-8"),
+            self.mod.to_latex(self.TEXT, smart=True))
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from testutils import LowlevelTestCase
+
+
+TEXTS = (
+    "[ref]: /u\n\n[ref]\n",
+    # Reference from previous document must not be visible.
+    "[ref]\n",
+    "# Заголовок\r\n\r\n* a\r* b",
+    "    code\n\n> quote\nlazy",
+    "*a* " * 50000 + "\n\n[x]: /x 'title'\n\n[x]",
+    "no newline at end *emph*",
+    "",
+    "\"smart\" --- quotes\n\n<div>raw</div>\n",
+    )
+
+
+class ParserReuseTest(LowlevelTestCase):
+
+    def setUp(self):
+        super(ParserReuseTest, self).setUp()
+        self.parser = self.mod.parser_new(self.mod.OPT_DEFAULT)
+        self.addCleanup(self.mod.parser_free, self.parser)
+        self.addCleanup(
+            lambda: self.mod.node_free(self.mod.parser_finish(self.parser)))
+
+    def render(self, root, opts):
+        try:
+            return self.mod.text_from_c(
+                self.mod.render_html(root, opts), free=True)
+        finally:
+            self.mod.node_free(root)
+
+    def test_parse(self):
+        options = (
+            self.mod.OPT_DEFAULT, self.mod.OPT_SOURCEPOS,
+            self.mod.OPT_SMART | self.mod.OPT_UNSAFE)
+        for max_buffer in (0, 1 << 16):
+            for opts in options:
+                for text in TEXTS:
+                    text_bytes = self.mod.text_to_c(text)
+                    expected = self.render(self.mod.parse_document(
+                        text_bytes, len(text_bytes), opts), opts)
+                    self.assertEqual(
+                        self.render(self.mod.parser_parse(
+                            self.parser, text_bytes, len(text_bytes), opts,
+                            max_buffer), opts),
+                        expected)
+                    self.assertEqual(
+                        self.mod.text_from_c(
+                            self.mod.parser_markdown_to_html(
+                                self.parser, text_bytes, len(text_bytes),
+                                opts, max_buffer),
+                            free=True),
+                        expected)
+
+    def test_reset_after_finish(self):
+        for text in TEXTS:
+            text_bytes = self.mod.text_to_c(text)
+            self.mod.parser_feed(self.parser, text_bytes, len(text_bytes))
+            root = self.mod.parser_finish(self.parser)
+            self.mod.parser_reset(
+                self.parser, self.mod.OPT_SOURCEPOS, 1 << 16)
+            self.assertEqual(
+                self.render(root, self.mod.OPT_DEFAULT),
+                self.render(self.mod.parse_document(
+                    text_bytes, len(text_bytes), self.mod.OPT_DEFAULT),
+                    self.mod.OPT_DEFAULT))
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import tempfile
+import unittest
+
+try:
+    from benchmarks import pathological
+except ImportError:  # pragma: no cover
+    pathological = None
+
+
+@unittest.skipIf(pathological is None, "benchmarks are not importable")
+class FitExponentTest(unittest.TestCase):
+
+    def test_linear(self):
+        points = [(size, size * 1e-9) for size in (1000, 2000, 4000)]
+        self.assertAlmostEqual(pathological.fit_exponent(points), 1.0)
+
+    def test_quadratic(self):
+        points = [(size, size ** 2 * 1e-12) for size in (1000, 2000, 4000)]
+        self.assertAlmostEqual(pathological.fit_exponent(points), 2.0)
+
+
+@unittest.skipIf(pathological is None, "benchmarks are not importable")
+class FamiliesTest(unittest.TestCase):
+    """Check that inputs are generated and rendered (not timing)."""
+
+    def test_all_families_render(self):
+        for family in pathological.FAMILIES:
+            text = family.make(8)
+            for func in pathological.FUNCTIONS:
+                with self.subTest(family=family.name, func=func.__name__):
+                    self.assertIsInstance(func(text), str)
+
+    def test_load_findings(self):
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w") as file:
+            file.write(json.dumps(
+                {"prefix": "[", "middle": "a", "suffix": "]"}) + "\n\n")
+            file.write(json.dumps({"text": "ab", "digest": "0" * 64}) + "\n")
+        fuzzed, slow = pathological.load_findings(path)
+        self.assertEqual(fuzzed.make(2), "[[a]]")
+        self.assertEqual(slow.name, "slow: " + "0" * 16)
+        self.assertEqual(slow.make(6), "ababab")
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import io
+import gzip
+import zlib
+import unittest
+
+
+class RenderCompressedTest(unittest.TestCase):
+    TEXT = "# Заголовок\n\n\"Текст\" *з*\nрозривом\n\n<b>raw</b>\n" * 200
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.func = cmark.render_compressed
+
+    def test_gzip(self):
+        for chunk_size in (1, 100, 1 << 16):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    gzip.decompress(self.func(
+                        self.TEXT, chunk_size=chunk_size)).decode("utf-8"),
+                    self.mod.to_html(self.TEXT))
+
+    def test_deflate(self):
+        self.assertEqual(
+            zlib.decompress(self.func(
+                self.TEXT, format="latex", encoding="deflate", level=1,
+                width=20, smart=True)).decode("utf-8"),
+            self.mod.to_latex(self.TEXT, width=20, smart=True))
+
+    def test_stream(self):
+        stream = io.BytesIO()
+        written = self.func(
+            self.mod.Document(self.TEXT), stream, format="xml")
+        self.assertEqual(written, len(stream.getvalue()))
+        self.assertEqual(
+            gzip.decompress(stream.getvalue()).decode("utf-8"),
+            self.mod.to_xml(self.TEXT))
+
+    def test_options(self):
+        self.assertEqual(
+            gzip.decompress(self.func(
+                self.TEXT, breaks="hard", safe=False)).decode("utf-8"),
+            self.mod.to_html(self.TEXT, breaks="hard", safe=False))
+
+    def test_unknown_encoding(self):
+        with self.assertRaises(ValueError):
+            self.func(self.TEXT, encoding="br")
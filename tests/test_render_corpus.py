@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class RenderCorpusTest(unittest.TestCase):
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.func = cmark.render_corpus
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.src = os.path.join(self.root, "src")
+        os.makedirs(os.path.join(self.src, "sub"))
+        self.texts = {}
+        for name in ("b.md", "a.md", os.path.join("sub", "c.markdown")):
+            text = "*Документ* " + name
+            self.texts[name] = text
+            with open(os.path.join(self.src, name), "wb") as file:
+                file.write(text.encode("utf-8"))
+        with open(os.path.join(self.src, "skipped.txt"), "w") as file:
+            file.write("not rendered")
+
+    def expected(self, name, func=None, **kwargs):
+        return (func or self.mod.to_html)(
+            self.texts[name], **kwargs).encode("utf-8")
+
+    def test_directory(self):
+        for workers in (0, 2):
+            with self.subTest(workers=workers):
+                self.assertEqual(
+                    list(self.func(self.src, workers=workers)),
+                    [(os.path.join(self.src, name), self.expected(name))
+                     for name in ("a.md", "b.md",
+                                  os.path.join("sub", "c.markdown"))])
+
+    def test_options_and_format(self):
+        path = os.path.join(self.src, "a.md")
+        self.assertEqual(
+            list(self.func([path], format="latex", workers=1, width=5)),
+            [(path, self.expected(
+                "a.md", self.mod.to_latex, width=5))])
+
+    def test_in_memory(self):
+        sources = [("x/one.md", "*1*"), ("two", "2")] * 20
+        self.assertEqual(
+            list(self.func(iter(sources), workers=2, chunk_size=3)),
+            [(key, self.mod.to_html(text).encode("utf-8"))
+             for key, text in sources])
+
+    def test_output_dir(self):
+        out = os.path.join(self.root, "out")
+        result = list(self.func(
+            self.src, format="xml", workers=2, output_dir=out))
+        names = ("a.xml", "b.xml", os.path.join("sub", "c.xml"))
+        self.assertEqual(
+            [path for _, path in result],
+            [os.path.join(out, name) for name in names])
+        with open(os.path.join(out, "sub", "c.xml"), "rb") as file:
+            self.assertEqual(
+                file.read(),
+                self.expected(
+                    os.path.join("sub", "c.markdown"), self.mod.to_xml))
+        self.assertEqual(
+            sorted(os.listdir(out)), ["a.xml", "b.xml", "sub"])
+
+    def test_output_dir_collisions(self):
+        out = os.path.join(self.root, "out")
+        other = os.path.join(self.root, "other")
+        os.makedirs(other)
+        shutil.copy(os.path.join(self.src, "a.md"), other)
+        collisions = (
+            [os.path.join(self.src, "a.md"), os.path.join(other, "a.md")],
+            [("x/a.md", "1"), ("x/a.md", "2")],
+            [("x/a.md", "1"), ("x/./a.markdown", "2")],
+            [os.path.join(self.src, "a.md"), ("a", "2")])
+        for sources in collisions:
+            for workers in (0, 2):
+                with self.subTest(sources=sources, workers=workers):
+                    with self.assertRaises(ValueError):
+                        list(self.func(
+                            sources, workers=workers, output_dir=out))
+        self.assertEqual(
+            len(list(self.func(
+                [("x/a.md", "1"), ("y/a.md", "2"), ("x/b.md", "3")],
+                workers=0, output_dir=out))),
+            3)
+
+    def test_output_dir_escape(self):
+        out = os.path.join(self.root, "out")
+        for key in ("../x.md", "a/../../x.md", os.path.join(self.root, "x")):
+            with self.subTest(key=key):
+                with self.assertRaises(ValueError):
+                    list(self.func([(key, "1")], workers=0, output_dir=out))
+        self.assertFalse(os.path.exists(os.path.join(self.root, "x.html")))
+        self.assertEqual(
+            list(self.func([("a/../x.md", "1")], workers=0, output_dir=out)),
+            [("a/../x.md", os.path.join(out, "a", "..", "x.html"))])
+
+    def test_progress(self):
+        from paka.cmark import corpus
+
+        calls = []
+        list(self.func(
+            self.src, workers=0, chunk_size=2,
+            progress=lambda done, total: calls.append((done, total))))
+        # Directory is listed lazily.
+        self.assertEqual(calls, [(2, None), (3, 3)])
+        del calls[:]
+        list(self.func(
+            list(corpus.iter_sources(self.src)), workers=0, chunk_size=2,
+            progress=lambda done, total: calls.append((done, total))))
+        self.assertEqual(calls, [(2, 3), (3, 3)])
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "needs /dev/shm")
+    def test_shared_memory_unlinked(self):
+        sources = [(index, "абв " * 1000) for index in range(200)]
+        before = set(os.listdir("/dev/shm"))
+        results = self.func(sources, workers=2, chunk_size=1)
+        next(results)
+        # Results of other chunks are still in pool (or being rendered).
+        results.close()
+        self.assertEqual(set(os.listdir("/dev/shm")) - before, set())
+
+        def fail(done, total):
+            raise RuntimeError()
+
+        with self.assertRaises(RuntimeError):
+            list(self.func(sources, workers=2, chunk_size=1, progress=fail))
+        self.assertEqual(set(os.listdir("/dev/shm")) - before, set())
+
+    def test_lazy(self):
+        taken = []
+
+        def iter_sources():
+            for index in range(100):
+                taken.append(index)
+                yield index, "*" + str(index) + "*"
+
+        for workers, backend in ((0, "processes"), (2, "threads")):
+            with self.subTest(workers=workers, backend=backend):
+                del taken[:]
+                results = self.func(
+                    iter_sources(), workers=workers, chunk_size=3,
+                    backend=backend)
+                self.assertEqual(
+                    next(results), (0, self.mod.to_html("*0*").encode()))
+                results.close()
+                self.assertLess(len(taken), 30)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            list(self.func(self.src, format="pdf"))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            list(self.func(self.src, backend="fibers"))
+
+    def test_threads(self):
+        sources = [(index, "*" + str(index) + "*") for index in range(50)]
+        out = os.path.join(self.root, "out")
+        self.assertEqual(
+            list(self.func(
+                sources, format="latex", workers=3, chunk_size=4,
+                backend="threads")),
+            [(key, self.mod.to_latex(text).encode("utf-8"))
+             for key, text in sources])
+        self.assertEqual(
+            list(self.func(
+                self.src, workers=2, output_dir=out, backend="threads")),
+            [(os.path.join(self.src, name),
+              os.path.join(out, os.path.splitext(name)[0] + ".html"))
+             for name in ("a.md", "b.md", os.path.join("sub", "c.markdown"))])
+
+    def test_interpreters(self):
+        from paka.cmark import corpus
+
+        result = self.func(self.src, workers=2, backend="interpreters")
+        if not corpus.supports_interpreters():
+            with self.assertRaises(RuntimeError):
+                list(result)
+            return
+        self.assertEqual(
+            list(result),
+            [(os.path.join(self.src, name), self.expected(name))
+             for name in ("a.md", "b.md", os.path.join("sub", "c.markdown"))])
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import unittest
+
+
+class RenderIntoTest(unittest.TestCase):
+    TEXT = "# Заголовок\n\n\"Текст\" *з*\nрозривом\n\n<b>raw</b>\n"
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.func = cmark.render_into
+
+    def render(self, source, buf=None, **kwargs):
+        if buf is None:
+            buf = bytearray()
+        length = self.func(source, buf, **kwargs)
+        return bytes(buf[:length]).decode("utf-8")
+
+    def test_formats(self):
+        cases = (
+            ("html", self.mod.to_html, {"breaks": "hard", "safe": False}),
+            ("html", self.mod.to_html, {"sourcepos": True, "smart": True}),
+            ("xml", self.mod.to_xml, {"sourcepos": True}),
+            ("commonmark", self.mod.to_commonmark, {"width": 5}),
+            ("man", self.mod.to_man, {"breaks": True}),
+            ("latex", self.mod.to_latex, {"smart": True}))
+        for format_name, func, kwargs in cases:
+            with self.subTest(format=format_name, **kwargs):
+                expected = func(self.TEXT, **kwargs)
+                self.assertEqual(
+                    self.render(self.TEXT, format=format_name, **kwargs),
+                    expected)
+                self.assertEqual(
+                    self.render(
+                        self.TEXT.encode("utf-8"), format=format_name,
+                        **kwargs),
+                    expected)
+
+    def test_node(self):
+        doc = self.mod.Document(self.TEXT, smart=True)
+        self.assertEqual(self.render(doc), doc.to_html())
+        self.assertEqual(
+            self.render(doc.first_child, format="xml"),
+            doc.first_child.to_xml())
+        self.assertEqual(
+            self.render(doc.children[1], format="commonmark", width=5),
+            doc.children[1].to_commonmark(width=5))
+        with self.assertRaises(ValueError):
+            self.func(doc, bytearray(), sourcepos=True)
+
+    def test_buffer_reuse(self):
+        buf = bytearray(b"x" * 100)
+        self.assertEqual(self.func("*a*", buf), 18)
+        self.assertEqual(buf, b"<p><em>a</em></p>\n" + b"x" * 82)
+        # Buffer grows at least to size hint.
+        buf = bytearray()
+        self.assertEqual(self.func("a", buf, size_hint=1000), 9)
+        self.assertEqual(len(buf), 1000)
+        self.assertEqual(self.func("b" * 2000, buf), 2008)
+        self.assertEqual(len(buf), 2008)
+        self.assertEqual(self.func("c", buf), 9)
+        self.assertEqual(len(buf), 2008)
+        self.assertEqual(buf[:9], b"<p>c</p>\n")
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            self.func("a", bytearray(), format="pdf")
+
+    def test_buffer_released_on_error(self):
+        buf = bytearray(b"x")
+        for kwargs in ({"format": "pdf"}, {"sourcepos": True}):
+            with self.subTest(**kwargs):
+                source = self.mod.Document("a")
+                try:
+                    self.func(source, buf, **kwargs)
+                except ValueError as error:
+                    # Exception (and its traceback) is still alive.
+                    self.assertIsNotNone(error.__traceback__)
+                    buf.extend(b"y")
+                else:
+                    self.fail("ValueError not raised")
+        self.assertEqual(buf, b"xyy")
+
+    def test_output_bigger_than_buffer(self):
+        text = "абв *где*\n\n" * 3000
+        expected = self.mod.to_html(text)
+        length = len(expected.encode("utf-8"))
+        for size in (0, 10, 5000, length - 1):
+            with self.subTest(size=size):
+                buf = bytearray(b"x" * size)
+                self.assertEqual(self.render(text, buf), expected)
+                self.assertEqual(len(buf), max(length, size + size // 2))
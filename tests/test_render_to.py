@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import io
+import os
+import gzip
+import tempfile
+import unittest
+
+
+class _ChunkStream(object):
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+
+
+class _FailingStream(object):
+
+    def write(self, data):
+        raise RuntimeError("disk is full")
+
+
+class RenderToTest(unittest.TestCase):
+    TEXT = (
+        "# Заголовок\n\n\"Текст\" *з* дуже довгим\nрозривом і "
+        "[посиланням](http://example.com/)\n\n<b>raw</b>\n\n"
+        "- один\n- два\n\n    код\n\n> цитата\n")
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.func = cmark.render_to
+
+    def render(self, source, **kwargs):
+        stream = io.BytesIO()
+        written = self.func(stream, source, **kwargs)
+        self.assertEqual(written, len(stream.getvalue()))
+        return stream.getvalue().decode("utf-8")
+
+    def test_formats(self):
+        cases = (
+            ("html", self.mod.to_html, {"breaks": "hard", "safe": False}),
+            ("html", self.mod.to_html, {"sourcepos": True, "smart": True}),
+            ("xml", self.mod.to_xml, {"sourcepos": True}),
+            ("commonmark", self.mod.to_commonmark, {"width": 10}),
+            ("commonmark", self.mod.to_commonmark, {"breaks": "hard"}),
+            ("man", self.mod.to_man, {"breaks": True, "width": 10}),
+            ("latex", self.mod.to_latex, {"smart": True, "width": 10}))
+        for format_name, func, kwargs in cases:
+            expected = func(self.TEXT, **kwargs)
+            for chunk_size in (1, 7, 1 << 16):
+                with self.subTest(
+                        format=format_name, chunk_size=chunk_size, **kwargs):
+                    self.assertEqual(
+                        self.render(
+                            self.TEXT, format=format_name,
+                            chunk_size=chunk_size, **kwargs),
+                        expected)
+
+    def test_node(self):
+        document = self.mod.Document(self.TEXT, smart=True)
+        self.assertEqual(
+            self.render(document, format="commonmark", width=20),
+            self.mod.to_commonmark(self.TEXT, smart=True, width=20))
+        with self.assertRaises(ValueError):
+            self.func(io.BytesIO(), document, sourcepos=True)
+
+    def test_bytes(self):
+        self.assertEqual(
+            self.render(self.TEXT.encode("utf-8")),
+            self.mod.to_html(self.TEXT))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            self.func(io.BytesIO(), self.TEXT, format="pdf")
+
+    def test_chunks(self):
+        text = "abc\n\n" * 1000
+        expected = self.mod.to_html(text).encode("utf-8")
+        stream = _ChunkStream()
+        self.func(stream, text, chunk_size=100)
+        self.assertEqual(b"".join(stream.chunks), expected)
+        self.assertTrue(all(isinstance(c, bytes) for c in stream.chunks))
+        self.assertGreater(len(stream.chunks), len(expected) // 200)
+        self.assertTrue(all(len(c) < 200 for c in stream.chunks))
+
+    def test_gzip(self):
+        stream = io.BytesIO()
+        with gzip.GzipFile(fileobj=stream, mode="wb") as gzip_file:
+            self.func(gzip_file, self.TEXT, chunk_size=16)
+        self.assertEqual(
+            gzip.decompress(stream.getvalue()).decode("utf-8"),
+            self.mod.to_html(self.TEXT))
+
+    def test_error(self):
+        with self.assertRaises(RuntimeError):
+            self.func(_FailingStream(), self.TEXT, chunk_size=1)
+
+    def test_fd(self):
+        with tempfile.TemporaryFile() as file:
+            written = self.func(
+                file.fileno(), self.TEXT, format="latex", chunk_size=5)
+            file.seek(0)
+            data = file.read()
+        self.assertEqual(written, len(data))
+        self.assertEqual(data.decode("utf-8"), self.mod.to_latex(self.TEXT))
+
+    def test_fd_error(self):
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        try:
+            with self.assertRaises(OSError):
+                self.func(write_fd, self.TEXT)
+        finally:
+            os.close(read_fd)
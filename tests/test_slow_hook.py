@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import io
+import json
+import hashlib
+import unittest
+
+
+class SlowHookTest(unittest.TestCase):
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.calls = []
+        self.addCleanup(self.mod.set_slow_hook, None)
+
+    def test_called_when_slow(self):
+        self.mod.set_slow_hook(0, self.calls.append)
+        self.assertEqual(self.mod.to_html("*ж*"), "<p><em>ж</em></p>\n")
+        self.assertEqual(self.mod.to_xml("a", sourcepos=True)[:5], "<?xml")
+        first, second = self.calls
+        self.assertEqual(first.entry_point, "to_html")
+        self.assertEqual(
+            first.options,
+            self.mod.lowlevel.OPT_DEFAULT | self.mod.lowlevel.OPT_NOBREAKS)
+        self.assertEqual(first.input_bytes, 4)
+        self.assertEqual(
+            first.digest, hashlib.sha256("*ж*".encode("utf-8")).hexdigest())
+        self.assertGreaterEqual(first.parse_seconds, 0)
+        self.assertGreaterEqual(first.render_seconds, 0)
+        self.assertEqual(second.entry_point, "to_xml")
+        self.assertEqual(second.options, self.mod.lowlevel.OPT_SOURCEPOS)
+
+    def test_not_called_when_fast(self):
+        self.mod.set_slow_hook(60 * 1000, self.calls.append, keep=10)
+        self.mod.to_html("a")
+        self.mod.to_html_inline("a")
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.mod.get_slow_inputs(), [])
+
+    def test_removed(self):
+        self.mod.set_slow_hook(0, self.calls.append, keep=10)
+        self.mod.set_slow_hook(None)
+        self.mod.to_html("a")
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.mod.get_slow_inputs(), [])
+
+    def test_reservoir_is_bounded(self):
+        self.mod.set_slow_hook(0, keep=3)
+        texts = ["текст {}".format(i) for i in range(20)]
+        for text in texts:
+            self.mod.to_commonmark(text)
+        kept = self.mod.get_slow_inputs()
+        self.assertEqual(len(kept), 3)
+        for call, text in kept:
+            self.assertIn(text, texts)
+            self.assertEqual(call.entry_point, "to_commonmark")
+            self.assertEqual(
+                call.digest,
+                hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+    def test_dump_slow_inputs(self):
+        self.mod.set_slow_hook(0, keep=2)
+        self.mod.excerpt("a *b*", 10)
+        file = io.StringIO()
+        self.mod.dump_slow_inputs(file)
+        record = json.loads(file.getvalue())
+        self.assertEqual(record["text"], "a *b*")
+        self.assertEqual(record["entry_point"], "excerpt")
+        self.assertEqual(record["input_bytes"], 5)
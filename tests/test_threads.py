@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import sys
+import threading
+import unittest
+
+
+def _make_texts():
+    texts = []
+    for index in range(32):
+        texts.append(
+            "# Заголовок " + str(index) + "\n\n" +
+            "*em* **strong** `code` [link](/u/" + str(index) + ") " * index +
+            "\n\n> quote\n\n- a\n- b\n\n    code\n\n<div>raw</div>\n" +
+            "[ref]: /ref\n\n[ref] \"smart\" -- dashes...\n")
+    return texts
+
+
+class ThreadsTest(unittest.TestCase):
+    THREADS = 16
+    ROUNDS = 20
+
+    def setUp(self):
+        from paka import cmark
+
+        self.mod = cmark
+        self.texts = _make_texts()
+        # Switch threads often, so that calls interleave (has no
+        # effect on free-threaded builds, where they run in parallel).
+        interval = sys.getswitchinterval()
+        self.addCleanup(sys.setswitchinterval, interval)
+        sys.setswitchinterval(1e-6)
+
+    def render_all(self, text):
+        return (
+            self.mod.to_html(text, smart=True),
+            self.mod.to_html(text, safe=False, sourcepos=True),
+            self.mod.to_html_inline(text),
+            self.mod.excerpt(text, 30),
+            self.mod.to_xml(text),
+            self.mod.to_commonmark(text, width=20),
+            self.mod.to_man(text),
+            self.mod.to_latex(text, breaks="hard"))
+
+    def run_threads(self, func):
+        errors = []
+        barrier = threading.Barrier(self.THREADS)
+
+        def _run(index):
+            try:
+                barrier.wait()
+                for round_index in range(self.ROUNDS):
+                    func(index, round_index)
+            except BaseException as error:
+                errors.append(error)
+
+        threads = [
+            threading.Thread(target=_run, args=(index,))
+            for index in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_functions(self):
+        expected = [self.render_all(text) for text in self.texts]
+
+        def _check(index, round_index):
+            position = (index + round_index) % len(self.texts)
+            self.assertEqual(
+                self.render_all(self.texts[position]), expected[position])
+
+        self.run_threads(_check)
+
+    def test_shared_document(self):
+        doc = self.mod.Document(self.texts[-1], smart=True)
+        expected = (
+            doc.to_html(), doc.to_xml(), doc.to_commonmark(width=10),
+            [child.to_html() for child in doc.children], doc.stats())
+
+        def _check(index, round_index):
+            self.assertEqual(
+                (doc.to_html(), doc.to_xml(), doc.to_commonmark(width=10),
+                 [child.to_html() for child in doc.children], doc.stats()),
+                expected)
+
+        self.run_threads(_check)
+
+    def test_metrics(self):
+        from paka.cmark import metrics
+
+        self.addCleanup(metrics.disable)
+
+        def _render(index, round_index):
+            if index == 0 and round_index == 0:
+                metrics.enable()
+            self.mod.to_html(self.texts[index])
+            metrics.snapshot()
+
+        metrics.enable()
+        self.run_threads(_render)
+        self.assertEqual(
+            metrics.snapshot()["to_html"]["calls"],
+            self.THREADS * self.ROUNDS)
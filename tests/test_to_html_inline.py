@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import unittest
+
+
+class ToHTMLInlineTest(unittest.TestCase):
+    SAMPLE = (
+        "Проверяем *CommonMark*, `код` и "
+        "[другие](https://example.org) [штуки](javascript:pwnd) <b>x</b> "
+        "\"test\" -- test.")
+
+    def setUp(self):
+        from paka.cmark import to_html, to_html_inline
+
+        self.func = to_html_inline
+        self.block_func = to_html
+
+    def check(self, source, expected, **kwargs):
+        self.assertEqual(self.func(source, **kwargs), expected)
+
+    def check_same_as_block(self, source, **kwargs):
+        block_result = self.block_func(source, **kwargs)
+        self.assertTrue(block_result.startswith("<p>"))
+        self.assertTrue(block_result.endswith("</p>\n"))
+        self.check(source, block_result[len("<p>"):-len("</p>\n")], **kwargs)
+
+    def test_empty(self):
+        self.check("", "")
+
+    def test_ascii(self):
+        self.check("Hello, *Noob*!", "Hello, <em>Noob</em>!")
+
+    def test_nul(self):
+        self.check("a\0b", "a\ufffdb")
+        self.check("\0*\0*\0", "\ufffd<em>\ufffd</em>\ufffd")
+        self.check_same_as_block("a\0b `\0` [\0](/\0)")
+
+    def test_same_as_block(self):
+        self.check_same_as_block(self.SAMPLE)
+        self.check_same_as_block(self.SAMPLE, safe=False)
+        self.check_same_as_block(self.SAMPLE, smart=True)
+        self.check_same_as_block("   leading and trailing spaces  ")
+
+    def test_block_structure_is_not_detected(self):
+        self.check("# Not heading", "# Not heading")
+        self.check("* not list", "* not list")
+        self.check("> not quote", "&gt; not quote")
+
+    def test_breaks(self):
+        self.check("Hello,\n*World*!", "Hello, <em>World</em>!")
+        self.check("Hello,\n*World*!", "Hello,\n<em>World</em>!", breaks=True)
+        self.check(
+            "Hello,\n*World*!", "Hello,<br />\n<em>World</em>!",
+            breaks="hard")